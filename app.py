@@ -1,10 +1,20 @@
 from fastapi import FastAPI, HTTPException
+from concurrent.futures import ProcessPoolExecutor
+import os
 from typing import Dict, Any, Optional
 from game_state_manager import GameStateManager
 from game_manager import GameManager
+from persistence_writer import PersistenceWriter
+from storage import create_backend, set_default_backend
 
 app = FastAPI(title="Game Arcade API")
 
+# Select the storage backend (files, sharded or sqlite) before anything is loaded
+storage_backend = create_backend(
+    os.environ.get("ARCADE_STORAGE", "files"), os.environ.get("ARCADE_STORAGE_PATH")
+)
+set_default_backend(storage_backend)
+
 # Initialize state manager
 state_manager = GameStateManager()
 
@@ -52,8 +62,22 @@ async def list_games():
         game.history.deserialize(history_json)
 
 
-# Create game manager instance
-game_manager = GameManager()
+# Moves are persisted by a background group-commit writer. ARCADE_DURABILITY
+# is one of "batch" (fsync per batch), "none" (no fsync) or "move" (write and
+# fsync every move before responding).
+persistence_writer = PersistenceWriter(
+    interval=float(os.environ.get("ARCADE_COMMIT_INTERVAL", 0.05)),
+    durability=os.environ.get("ARCADE_DURABILITY", "batch"),
+)
+
+# Create game manager instance. Live games are kept resident in memory; the
+# registry limits can be tuned through the environment.
+game_manager = GameManager(
+    max_games=int(os.environ.get("ARCADE_REGISTRY_MAX_GAMES", 1024)),
+    max_bytes=int(os.environ.get("ARCADE_REGISTRY_MAX_BYTES", 64 * 1024 * 1024)),
+    ttl_seconds=float(os.environ.get("ARCADE_REGISTRY_TTL_SECONDS", 15 * 60)),
+    writer=persistence_writer,
+)
 
 
 @app.get("/games")
@@ -63,18 +87,22 @@ async def list_games():
 
 
 @app.post("/games/{game_type}/new")
-async def create_new_game(game_type: str):
-    """Create a new game instance"""
-    game_id = game_manager.create_game(game_type)
+def create_new_game(game_type: str, seed: Optional[int] = None):
+    """Create a new game instance. Pass seed to deal a reproducible game."""
+    game_id = game_manager.create_game(game_type, seed=seed)
     return {"game_id": game_id}
 
 
 @app.post("/games/{game_type}/{game_id}/move")
-async def make_move(game_type: str, game_id: str, move_data: Dict[str, Any]):
-    """Make a move in the game"""
-    game = game_manager.get_game(game_type, game_id)
+def make_move(
+    game_type: str, game_id: str, move_data: Dict[str, Any], durable: bool = False
+):
+    """
+    Make a move in the game. Pass durable=true to wait for the move to be synced.
+    A plain def, so FastAPI runs it (and any write and fsync) in its threadpool.
+    """
     try:
-        state = game.make_move(move_data)
+        state = game_manager.make_move(game_type, game_id, move_data, durable=durable)
         return state
     except ValueError as e:
         raise HTTPException(400, str(e))
@@ -87,6 +115,59 @@ async def get_game_state(game_type: str, game_id: str):
     return game.get_game_state()
 
 
+# Equity requests run on a worker thread, so these bound how long one can hold it
+MAX_EQUITY_SAMPLES = 1_000_000
+EQUITY_TIME_LIMIT = 2.0
+MAX_EQUITY_TIME_LIMIT = 10.0
+
+# Large exhaustive equity runs share one bounded process pool, whatever the load
+equity_pool = ProcessPoolExecutor(
+    max_workers=int(os.environ.get("ARCADE_EQUITY_PROCESSES", min(4, os.cpu_count() or 1)))
+)
+
+
+@app.get("/games/poker/{game_id}/equity")
+def get_poker_equity(
+    game_id: str,
+    samples: int = 20000,
+    time_limit: float = EQUITY_TIME_LIMIT,
+):
+    """Win/tie probabilities per seat, enumerated or sampled over the missing board"""
+    if not 1 <= samples <= MAX_EQUITY_SAMPLES:
+        raise HTTPException(400, f"samples must be between 1 and {MAX_EQUITY_SAMPLES}")
+    if not 0 < time_limit <= MAX_EQUITY_TIME_LIMIT:
+        raise HTTPException(400, f"time_limit must be positive and at most {MAX_EQUITY_TIME_LIMIT} seconds")
+    try:
+        game = game_manager.get_game("poker", game_id)
+        return game.equity(samples=samples, time_limit=time_limit, executor=equity_pool)
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+
+
+@app.get("/games/{game_type}/{game_id}/moves")
+async def get_legal_moves(game_type: str, game_id: str):
+    """Every legal move for the current player, for games that enumerate them"""
+    game = game_manager.get_game(game_type, game_id)
+    if not hasattr(game, "legal_moves"):
+        raise HTTPException(404, f"{game_type} does not list legal moves")
+    return {"moves": game.legal_moves()}
+
+
+@app.on_event("startup")
+async def start_persistence_writer():
+    """Start the background group-commit writer"""
+    persistence_writer.start()
+
+
+@app.on_event("shutdown")
+async def flush_games():
+    """Persist games still held in memory by the live registry"""
+    persistence_writer.stop()
+    equity_pool.shutdown()
+    game_manager.registry.clear()
+    storage_backend.close()
+
+
 @app.get("/games/{game_type}/{game_id}/history")
 async def get_game_history(game_type: str, game_id: str):
     """Get game history"""
@@ -1,8 +1,17 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional
 from dataclasses import dataclass
+import functools
 import json
-from pathlib import Path
+import logging
+import random
+import secrets
+import threading
+import time
+
+from storage import StorageBackend, get_default_backend
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -13,68 +22,344 @@ class GameMove:
     timestamp: float
 
 class GameHistory:
-    """Manages game history and state persistence"""
-    def __init__(self, game_id: str = None):
+    """
+    Manages game history and state persistence.
+
+    Histories are stored as an append-only journal in the configured
+    StorageBackend (by default ``game_data/<id>.jsonl``): one JSON line per
+    move, the last line of each write also carrying the current state. The journal starts with a snapshot line and is compacted
+    back into a single snapshot once the number of appended records exceeds
+    both SNAPSHOT_INTERVAL and the number of moves in the previous snapshot, so
+    a move costs O(1) I/O amortized. Loading replays from the last snapshot.
+    Legacy single-document ``<id>.json`` files are still read by the file
+    backends and are migrated to the journal on the next write.
+
+    Snapshots also carry the seed of the game's random stream, so games that
+    draw all their randomness from it can be rebuilt from the seed and the
+    moves alone (see AbstractGame.reset_rng).
+    """
+    SNAPSHOT_INTERVAL = 64
+
+    def __init__(self, game_id: str = None, backend: Optional[StorageBackend] = None):
         self.moves: List[GameMove] = []
         self.current_state: Dict[str, Any] = {}
         self.game_id = game_id
-        self.data_dir = Path("game_data")
-        self.data_dir.mkdir(exist_ok=True)
+        self.seed: Optional[int] = None
+        # Games construct their own histories, so the backend selected at
+        # startup (storage.set_default_backend) is picked up implicitly.
+        self.backend = backend or get_default_backend()
+        # When write_behind is enabled (e.g. by the GameRegistry), add_move only
+        # marks the history dirty and the owner is responsible for calling flush().
+        self.write_behind = False
+        self.dirty = False
+        # Size in bytes of the journal on disk; used as a cheap estimate of the
+        # in-memory footprint of the history.
+        self.persisted_size = 0
+        # Journal bookkeeping: moves already on disk, records appended since the
+        # last snapshot and the number of moves that snapshot contained.
+        self._journaled_moves = 0
+        self._records_since_snapshot = 0
+        self._snapshot_moves = 0
+        self._needs_snapshot = True
+        # Set when the journal no longer replays; it is then never written
+        self.read_only = False
+        # Write-behind histories are flushed from the PersistenceWriter thread
+        self._lock = threading.RLock()
 
     def add_move(self, move: GameMove) -> None:
-        self.moves.append(move)
-        # The game class is responsible for updating its state and then calling
-        # self.history.current_state = self.get_game_state() before or after add_move.
-        # add_move here just records the move and persists.
-        self._persist_to_disk()
+        with self._lock:
+            if self.read_only:
+                raise ValueError(f"Game {self.game_id} is read-only")
+            self.moves.append(move)
+            # The game class is responsible for updating its state and then calling
+            # self.history.current_state = self.get_game_state() before or after add_move.
+            # add_move here just records the move and persists.
+            if self.write_behind:
+                self.dirty = True
+            else:
+                self._persist_to_disk()
+
+    def set_seed(self, seed: int) -> None:
+        """Set the seed and mark the history dirty, so flush() writes it"""
+        with self._lock:
+            self.seed = seed
+            self._needs_snapshot = True
+            self.dirty = True
+
+    def flush(self) -> int:
+        """Persist pending changes if any. Returns the number of bytes written."""
+        with self._lock:
+            if not self.dirty or self.read_only:
+                return 0
+            return self._persist_to_disk()
 
     def get_history(self) -> List[Dict[str, Any]]:
         return [move.__dict__ for move in self.moves]
 
     def serialize(self) -> str:
-        return json.dumps({"moves": self.get_history(), "state": self.current_state, "game_id": self.game_id})
+        return json.dumps({
+            "moves": self.get_history(),
+            "state": self.current_state,
+            "game_id": self.game_id,
+            "seed": self.seed,
+        })
 
     def deserialize(self, data: str) -> None:
         parsed = json.loads(data)
         self.moves = [GameMove(**move) for move in parsed.get("moves", [])]
         self.current_state = parsed.get("state", {})
         self.game_id = parsed.get("game_id", self.game_id) # Restore game_id
+        self.seed = parsed.get("seed")
+        # The move list was replaced wholesale, so the journal must be rewritten
+        self._needs_snapshot = True
 
-    def _get_game_file(self) -> Optional[Path]:
+    def _persist_to_disk(self) -> int:
         if not self.game_id:
-            return None
-        return self.data_dir / f"{self.game_id}.json"
+            return 0
+        if self.read_only:
+            raise ValueError(f"Game {self.game_id} is read-only")
+        with self._lock:
+            return self._write_journal()
 
-    def _persist_to_disk(self) -> None:
-        file_path = self._get_game_file()
-        if not file_path:
-            return
-        with open(file_path, "w") as f:
-            f.write(self.serialize())
+    def _write_journal(self) -> int:
+        pending = len(self.moves) - self._journaled_moves
+        compact_at = max(self.SNAPSHOT_INTERVAL, self._snapshot_moves)
+        if (
+            self._needs_snapshot
+            or pending < 0
+            or self._records_since_snapshot + pending > compact_at
+        ):
+            written = self._write_snapshot()
+        else:
+            written = self._append_records(self.moves[self._journaled_moves:])
+        self.dirty = False
+        return written
+
+    def _write_snapshot(self) -> int:
+        """Compact the journal into a single snapshot record"""
+        snapshot = {"moves": self.get_history(), "state": self.current_state, "game_id": self.game_id}
+        if self.seed is not None:
+            snapshot["seed"] = self.seed
+        data = json.dumps({"snapshot": snapshot}) + "\n"
+        self.backend.replace(self.game_id, data)
+        self._journaled_moves = len(self.moves)
+        self._snapshot_moves = len(self.moves)
+        self._records_since_snapshot = 0
+        self._needs_snapshot = False
+        self.persisted_size = len(data)
+        return len(data)
+
+    def _append_records(self, moves: List[GameMove]) -> int:
+        """Append one record per move; the last record carries the current state"""
+        records = [{"move": move.__dict__} for move in moves] or [{}]
+        records[-1]["state"] = self.current_state
+        data = "".join(json.dumps(record) + "\n" for record in records)
+        self.backend.append(self.game_id, data)
+        self._journaled_moves = len(self.moves)
+        self._records_since_snapshot += len(records)
+        self.persisted_size += len(data)
+        return len(data)
+
+    def _replay_journal(self, journal: str) -> None:
+        """Rebuild moves and state from the last snapshot plus the records after it"""
+        moves: List[GameMove] = []
+        state: Dict[str, Any] = {}
+        seed = None
+        records = 0
+        size = 0
+        needs_snapshot = False
+        for line in journal.splitlines(keepends=True):
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # Torn write at the tail: keep what was replayed so far and
+                # rewrite the journal on the next persist.
+                needs_snapshot = True
+                break
+            size += len(line)
+            if "snapshot" in record:
+                snapshot = record["snapshot"]
+                moves = [GameMove(**move) for move in snapshot.get("moves", [])]
+                state = snapshot.get("state", {})
+                seed = snapshot.get("seed")
+                self._snapshot_moves = len(moves)
+                records = 0
+                continue
+            if "move" in record:
+                moves.append(GameMove(**record["move"]))
+            if "state" in record:
+                state = record["state"]
+            records += 1
+        self.moves = moves
+        self.current_state = state
+        self.seed = seed
+        self._journaled_moves = len(moves)
+        self._records_since_snapshot = records
+        self._needs_snapshot = needs_snapshot
+        self.persisted_size = size
 
     def load_from_disk(self, game_id: str) -> bool:
         self.game_id = game_id # Ensure game_id is set
-        file_path = self._get_game_file()
-        if not file_path or not file_path.exists():
-            self.current_state = {} # Ensure state is clean if no file
+        self.dirty = False
+        journal = self.backend.read(game_id) if game_id else None
+        if not journal:
+            self.current_state = {} # Ensure state is clean if no (or corrupted) data
             self.moves = []
+            self.seed = None
+            self._needs_snapshot = True
             return False
-        with open(file_path, "r") as f:
-            try:
-                self.deserialize(f.read())
-            except json.JSONDecodeError: # Handle cases where file is corrupted
-                self.current_state = {}
-                self.moves = []
-                return False
+        self._replay_journal(journal)
         return True
 
     def delete_from_disk(self) -> None:
-        file_path = self._get_game_file()
-        if file_path and file_path.exists():
-            file_path.unlink()
+        if self.game_id:
+            self.backend.delete(self.game_id)
+
+def _cached_read(func: Callable) -> Callable:
+    """
+    Memoize a read-only game method until the next mutation. Results are keyed
+    by the function itself (plus any positional arguments) so overrides calling
+    super() do not clash.
+    """
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        cache = self.__dict__.get("_state_cache")
+        if cache is None or kwargs or self.__dict__["_state_mutating"]:
+            return func(self, *args, **kwargs)
+        key = (func, args) if args else func
+        if key in cache:
+            result = cache[key]
+        else:
+            self.__dict__["_state_reading"] += 1
+            try:
+                result = func(self, *args)
+            finally:
+                self.__dict__["_state_reading"] -= 1
+            cache[key] = result
+        # Hand out a copy so callers cannot alter the cached state or the game
+        return _copy_state(result)
+    return wrapper
+
+
+def _copy_state(value: Any) -> Any:
+    """Copy the dicts and lists of a JSON-like state; other values are shared"""
+    if isinstance(value, dict):
+        return {key: _copy_state(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_state(item) for item in value]
+    return value
+
+
+def _mutator(func: Callable) -> Callable:
+    """Bypass the read cache while func runs and invalidate it afterwards"""
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if "_state_cache" not in self.__dict__:
+            return func(self, *args, **kwargs)
+        self.__dict__["_state_mutating"] += 1
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            self.__dict__["_state_mutating"] -= 1
+            self.__dict__["_state_cache"].clear()
+    return wrapper
+
 
 class AbstractGame(ABC):
-    """Abstract base class for all games"""
+    """
+    Abstract base class for all games.
+
+    get_game_state, is_game_over and get_winner are memoized per mutation:
+    subclass implementations are wrapped so that repeated reads (e.g. /state
+    polling) are served from a cache. The cache is dropped after make_move,
+    initialize_game and _restore_game_state, and whenever an attribute of the
+    game is reassigned outside of a read. Games that mutate their state in place
+    from other entry points must call invalidate_state_cache().
+    """
+    _CACHED_READS = ("get_game_state", "is_game_over", "get_winner")
+    _MUTATORS = ("make_move", "initialize_game", "_restore_game_state")
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name in cls._CACHED_READS:
+            if name in cls.__dict__:
+                setattr(cls, name, _cached_read(cls.__dict__[name]))
+        for name in cls._MUTATORS:
+            if name in cls.__dict__:
+                setattr(cls, name, _mutator(cls.__dict__[name]))
+
+    def __new__(cls, *args, **kwargs):
+        game = super().__new__(cls)
+        game.__dict__.update(_state_cache={}, _state_mutating=0, _state_reading=0)
+        return game
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        # Attribute writes made by a read (lazy bookkeeping) keep the cache
+        if not self.__dict__.get("_state_reading", 1):
+            self.__dict__["_state_cache"].clear()
+
+    def invalidate_state_cache(self) -> None:
+        """Drop memoized reads after mutating the game outside of make_move"""
+        self.__dict__["_state_cache"].clear()
+
+    def reset_rng(self) -> random.Random:
+        """
+        Restart the game's random stream (self.rng) from the seed in its
+        history, drawing a seed first for a new game. Games call this before
+        dealing and take every random choice from self.rng, so the deal and
+        all later draws follow from the seed and the moves made.
+        """
+        if self.history.seed is None:
+            self.history.set_seed(secrets.randbits(53))  # exact as a JSON number
+        self.rng = random.Random(self.history.seed)
+        return self.rng
+
+    def reseed(self, seed: int) -> None:
+        """Start a game that has no moves yet over from a given seed"""
+        if self.history.moves:
+            raise ValueError("Cannot reseed a game that has moves")
+        self.history.set_seed(seed)
+        self._restore_game_state()
+
+    def _record_move(self, player: Any, move_data: Dict[str, Any]) -> None:
+        """
+        Append a move to the history, unless it is being replayed. Games call
+        this once the move has been applied, so a move that fails part way is
+        never recorded.
+        """
+        if not self.__dict__.get("_replaying"):
+            self.history.add_move(GameMove(str(player), dict(move_data), time.time()))
+
+    def _replay_moves(self) -> None:
+        """
+        Re-apply the recorded moves through make_move after a deal from the
+        seed. If a move no longer applies, the game is rebuilt from the moves
+        before it and loaded read-only, leaving the journal untouched.
+        """
+        failed = None
+        self._replaying = True
+        try:
+            for count, move in enumerate(self.history.moves):
+                try:
+                    self.make_move(move.move_data)
+                except Exception as e:
+                    failed, error = count, e
+                    break
+        finally:
+            self._replaying = False
+        if failed is None:
+            return
+
+        logger.error(
+            "Move %d of %s no longer replays (%s); loading the game read-only",
+            failed, self.game_id, error,
+        )
+        self.history.read_only = True
+        del self.history.moves[failed:]
+        # The failed move may have been half applied, so deal and replay again
+        self._restore_game_state()
+
     def __init__(self, game_id: str):
         self.game_id = game_id
         self.history = GameHistory(game_id)
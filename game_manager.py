@@ -1,15 +1,30 @@
 from typing import Dict, Any, Optional, Type
 from game_abc import AbstractGame
+from game_registry import GameRegistry
+from persistence_writer import PersistenceWriter
 from pathlib import Path
 import importlib
 import json
-import time
+import uuid
 
 
 class GameManager:
-    def __init__(self):
+    def __init__(
+        self,
+        max_games: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl_seconds: Optional[float] = 15 * 60,
+        writer: Optional[PersistenceWriter] = None,
+    ):
         self.game_types = {}
+        self.writer = writer
         self._register_games()
+        self.registry = GameRegistry(
+            self._load_game,
+            max_games=max_games,
+            max_bytes=max_bytes,
+            ttl_seconds=ttl_seconds,
+        )
 
     def _register_games(self):
         """Register all available game types"""
@@ -38,21 +53,61 @@ class GameManager:
                     print(f"Failed to load game {game_name}: {e}")
                     continue
 
-    def create_game(self, game_type: str) -> str:
-        """Create a new game instance"""
+    def create_game(self, game_type: str, seed: Optional[int] = None) -> str:
+        """Create a new game instance, dealt from seed when one is given"""
         if game_type not in self.game_types:
             raise ValueError(f"Invalid game type: {game_type}")
 
         game_class = self.game_types[game_type]
-        game_id = f"{game_type}-{int(time.time())}"
+        # Unique even for games created in the same second
+        game_id = f"{game_type}-{uuid.uuid4().hex}"
         game = game_class(game_id)
+        if seed is not None:
+            game.reseed(seed)
+        # Write the seed now, so the deal survives a restart before the first move
+        game.history.flush()
+        self.registry.put(game_type, game_id, game)
         return game_id
 
     def get_game(self, game_type: str, game_id: str) -> AbstractGame:
-        """Get an existing game instance"""
+        """Get an existing game instance, served from the live registry when resident"""
         if game_type not in self.game_types:
             raise ValueError(f"Invalid game type: {game_type}")
 
+        return self.registry.get(game_type, game_id)
+
+    def make_move(
+        self,
+        game_type: str,
+        game_id: str,
+        move_data: Dict[str, Any],
+        durable: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Apply a move to a live game. The write is handed to the persistence
+        writer (group commit) unless durable is requested, in which case it is
+        written and synced before returning.
+        """
+        game = self.get_game(game_type, game_id)
+        if game.history.read_only:
+            raise ValueError(f"Game {game_id} no longer replays and is read-only")
+        state = game.make_move(move_data)
+        self.registry.mark_dirty(game_type, game_id)
+        if self.writer is not None:
+            self.writer.submit(game.history, durable=durable)
+        elif durable:
+            game.history.flush()
+            game.history.backend.sync([game_id])
+        return state
+
+    def flush(self) -> int:
+        """Persist all pending changes of resident games"""
+        if self.writer is not None:
+            self.writer.flush()
+        return self.registry.flush()
+
+    def _load_game(self, game_type: str, game_id: str) -> AbstractGame:
+        """Registry loader: build a game instance from its persisted history"""
         game_class = self.game_types[game_type]
         return game_class(game_id)
 
@@ -65,3 +120,5 @@ class GameManager:
         """Restore game state from history"""
         game = self.get_game(game_type, game_id)
         game.history.deserialize(history_json)
+        game._restore_game_state()
+        self.registry.mark_dirty(game_type, game_id)
@@ -0,0 +1,176 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+import threading
+import time
+
+from game_abc import AbstractGame
+
+
+RegistryKey = Tuple[str, str]
+
+
+@dataclass
+class RegistryEntry:
+    """A resident game plus the bookkeeping needed for eviction"""
+    game: AbstractGame
+    last_access: float
+    size: int = 0
+
+
+class GameRegistry:
+    """
+    In-memory registry of live game objects keyed by (game_type, game_id).
+
+    Hot games are served straight from memory; cold games are loaded lazily
+    through ``loader``. Entries are evicted in least-recently-used order when
+    ``max_games`` or ``max_bytes`` is exceeded, or once they have been idle for
+    longer than ``ttl_seconds``. Moves are written behind: games handed out by
+    the registry only mark their history dirty, and pending changes are
+    persisted on eviction or by an explicit ``flush()``.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[str, str], AbstractGame],
+        max_games: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl_seconds: Optional[float] = 15 * 60,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.loader = loader
+        self.max_games = max_games
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self._entries: "OrderedDict[RegistryKey, RegistryEntry]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: RegistryKey) -> bool:
+        return key in self._entries
+
+    @property
+    def total_bytes(self) -> int:
+        """Estimated memory held by resident games"""
+        return self._total_bytes
+
+    def get(self, game_type: str, game_id: str) -> AbstractGame:
+        """Return the live game, loading it through the loader on a miss"""
+        key = (game_type, game_id)
+        with self._lock:
+            self._expire()
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.last_access = self.clock()
+                self._entries.move_to_end(key)
+                # Games may replace their history object (e.g. initialize_game)
+                entry.game.history.write_behind = True
+                return entry.game
+            game = self.loader(game_type, game_id)
+            self._insert(key, game)
+            return game
+
+    def put(self, game_type: str, game_id: str, game: AbstractGame) -> None:
+        """Register a freshly created game, persisting any game it replaces"""
+        key = (game_type, game_id)
+        with self._lock:
+            self._remove(key, flush=True)
+            self._insert(key, game)
+
+    def mark_dirty(self, game_type: str, game_id: str) -> None:
+        """Record that a resident game has changed and refresh its size estimate"""
+        with self._lock:
+            entry = self._entries.get((game_type, game_id))
+            if entry is None:
+                return
+            entry.game.history.dirty = True
+            self._resize(entry, self._estimate_size(entry.game))
+            self._enforce_budget()
+
+    def evict(self, game_type: str, game_id: str) -> bool:
+        """Flush and drop a game from memory. Returns True if it was resident."""
+        with self._lock:
+            return self._remove((game_type, game_id), flush=True)
+
+    def discard(self, game_type: str, game_id: str) -> bool:
+        """Drop a game from memory without persisting pending changes"""
+        with self._lock:
+            return self._remove((game_type, game_id), flush=False)
+
+    def flush(self) -> int:
+        """Persist every dirty resident game. Returns the number of games written."""
+        written = 0
+        backends = {}
+        with self._lock:
+            for entry in self._entries.values():
+                history = entry.game.history
+                if history.dirty:
+                    history.flush()
+                    backends[id(history.backend)] = history.backend
+                    self._resize(entry, self._estimate_size(entry.game))
+                    written += 1
+            for backend in backends.values():
+                backend.flush()
+        return written
+
+    def clear(self) -> None:
+        """Flush and evict every resident game"""
+        with self._lock:
+            self.flush()
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def _insert(self, key: RegistryKey, game: AbstractGame) -> None:
+        game.history.write_behind = True
+        entry = RegistryEntry(game=game, last_access=self.clock())
+        self._entries[key] = entry
+        self._resize(entry, self._estimate_size(game))
+        self._enforce_budget()
+
+    def _remove(self, key: RegistryKey, flush: bool) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._total_bytes -= entry.size
+        if flush:
+            entry.game.history.flush()
+        return True
+
+    def _resize(self, entry: RegistryEntry, size: int) -> None:
+        if size <= 0:
+            return
+        self._total_bytes += size - entry.size
+        entry.size = size
+
+    def _expire(self) -> None:
+        """Evict entries idle for longer than the TTL (oldest first)"""
+        if self.ttl_seconds is None:
+            return
+        deadline = self.clock() - self.ttl_seconds
+        while self._entries:
+            key, entry = next(iter(self._entries.items()))
+            if entry.last_access > deadline:
+                break
+            self._remove(key, flush=True)
+
+    def _enforce_budget(self) -> None:
+        """Evict least-recently-used entries until within the configured limits"""
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_games or self._total_bytes > self.max_bytes
+        ):
+            key = next(iter(self._entries))
+            self._remove(key, flush=True)
+
+    @staticmethod
+    def _estimate_size(game: AbstractGame) -> int:
+        """
+        Approximate the memory footprint of a game from its last persisted size.
+        Serializing on every access would defeat the purpose of the registry, so
+        moves made since the last flush are accounted for with a flat per-move cost.
+        """
+        history = game.history
+        return max(history.persisted_size, 256) + 128 * len(history.moves)
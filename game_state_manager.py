@@ -1,15 +1,19 @@
 import json
-from pathlib import Path
 from typing import Dict, Any, Optional
 import time
 
+from storage import FileSystemBackend, StorageBackend, get_default_backend
+
 
 class GameStateManager:
     """Manages game state persistence and retrieval"""
 
-    def __init__(self, data_dir: str = "game_data"):
-        self.data_dir = Path(data_dir)
-        self.data_dir.mkdir(exist_ok=True)
+    def __init__(
+        self, data_dir: Optional[str] = None, backend: Optional[StorageBackend] = None
+    ):
+        if backend is None:
+            backend = FileSystemBackend(data_dir) if data_dir else get_default_backend()
+        self.backend = backend
 
     def create_game(self, game_type: str) -> str:
         """Create a new game instance"""
@@ -45,21 +49,17 @@ class GameStateManager:
         self._save_state(game_id, game_state)
         return game_state
 
-    def _get_file_path(self, game_id: str) -> Path:
-        """Get the file path for a game"""
-        return self.data_dir / f"{game_id}.json"
+    def _get_key(self, game_id: str) -> str:
+        """Get the storage key for a game (kept apart from GameHistory journals)"""
+        return f"{game_id}.meta"
 
     def _load_state(self, game_id: str) -> Dict[str, Any]:
-        """Load game state from disk"""
-        file_path = self._get_file_path(game_id)
-        if not file_path.exists():
+        """Load game state from the storage backend"""
+        data = self.backend.read(self._get_key(game_id))
+        if not data:
             raise ValueError(f"Game {game_id} not found")
-
-        with open(file_path, "r") as f:
-            return json.load(f)
+        return json.loads(data)
 
     def _save_state(self, game_id: str, state: Dict[str, Any]) -> None:
-        """Save game state to disk"""
-        file_path = self._get_file_path(game_id)
-        with open(file_path, "w") as f:
-            json.dump(state, f, indent=2)
+        """Save game state to the storage backend"""
+        self.backend.replace(self._get_key(game_id), json.dumps(state))
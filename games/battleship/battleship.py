@@ -3,7 +3,6 @@ from typing import Dict, Any, Optional, List, Tuple, Set
 import numpy as np
 from enum import Enum
 import time
-import random
 from collections import defaultdict
 
 
@@ -36,6 +35,7 @@ class BattleshipGame(AbstractGame):
 
     def _init_game(self):
         """Initialize a new game"""
+        self.reset_rng()
         self.current_player = 0
         self.phase = "setup"
         self.boards = defaultdict(
@@ -59,12 +59,12 @@ class BattleshipGame(AbstractGame):
 
             while not placed:
                 # Choose random orientation
-                horizontal = random.choice([True, False])
+                horizontal = self.rng.choice([True, False])
 
                 if horizontal:
                     # Choose random position
-                    x = random.randint(0, self.board_size - length)
-                    y = random.randint(0, self.board_size - 1)
+                    x = self.rng.randint(0, self.board_size - length)
+                    y = self.rng.randint(0, self.board_size - 1)
 
                     # Check if position is valid
                     if all(self.boards[player][x + i][y] == 0 for i in range(length)):
@@ -75,8 +75,8 @@ class BattleshipGame(AbstractGame):
                         self.ships[player][ship_type] = ((x, y), length, True)
                 else:
                     # Choose random position
-                    x = random.randint(0, self.board_size - 1)
-                    y = random.randint(0, self.board_size - length)
+                    x = self.rng.randint(0, self.board_size - 1)
+                    y = self.rng.randint(0, self.board_size - length)
 
                     # Check if position is valid
                     if all(self.boards[player][x][y + i] == 0 for i in range(length)):
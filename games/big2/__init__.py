@@ -0,0 +1 @@
+from games.big2.big2 import Big2Game
@@ -1,6 +1,6 @@
 from game_abc import AbstractGame, GameMove, GameHistory
+from games.cards import CardSet, draw, shuffled
 from typing import Dict, Any, Optional, List, Tuple
-import random
 import time
 
 # Define card values
@@ -26,31 +26,22 @@ SUITES = ["♠", "♥", "♦", "♣"]
 ACTIONS = ["hit", "stand", "double", "split"]
 
 
-class Card:
-    def __init__(self, rank: str, suite: str):
-        self.rank = rank
-        self.suite = suite
-        self.face_up = False
-
-    def __str__(self):
-        return f"{self.rank}{self.suite}"
-
-    def __repr__(self):
-        return str(self)
-
-    def to_dict(self) -> Dict[str, Any]:
-        return {"rank": self.rank, "suite": self.suite, "face_up": self.face_up}
+CARDS = CardSet.product(rank=list(CARD_VALUES), suite=SUITES)
+ACE = "A"
 
 
 class Hand:
-    def __init__(self, cards: Optional[List[Card]] = None):
-        self.cards = cards or []
+    def __init__(self, cards: Optional[List[int]] = None):
+        self.cards = cards or []  # card codes
+        self.face_down = set()  # indexes of cards dealt face down
         self.bet = 0
         self.is_split = False
         self.is_double = False
         self.is_surrendered = False
 
-    def add_card(self, card: Card) -> None:
+    def add_card(self, card: int, face_up: bool = True) -> None:
+        if not face_up:
+            self.face_down.add(len(self.cards))
         self.cards.append(card)
 
     def get_value(self) -> int:
@@ -58,11 +49,11 @@ class Hand:
         value = 0
         aces = 0
 
-        for card in self.cards:
-            if card.rank == "A":
+        for face in CARDS.to_faces(self.cards):
+            if face["rank"] == ACE:
                 aces += 1
             else:
-                value += CARD_VALUES[card.rank]
+                value += CARD_VALUES[face["rank"]]
 
         # Handle aces
         for _ in range(aces):
@@ -82,16 +73,22 @@ class Hand:
     def can_split(self) -> bool:
         return (
             len(self.cards) == 2
-            and self.cards[0].rank == self.cards[1].rank
+            and CARDS.faces[self.cards[0]]["rank"] == CARDS.faces[self.cards[1]]["rank"]
             and not self.is_split
         )
 
     def can_double(self) -> bool:
         return len(self.cards) == 2 and not self.is_double
 
+    def card_dicts(self) -> List[Dict[str, Any]]:
+        return [
+            dict(face, face_up=i not in self.face_down)
+            for i, face in enumerate(CARDS.to_faces(self.cards))
+        ]
+
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "cards": [card.to_dict() for card in self.cards],
+            "cards": self.card_dicts(),
             "value": self.get_value(),
             "is_bust": self.is_bust(),
             "is_blackjack": self.is_blackjack(),
@@ -105,7 +102,7 @@ class Hand:
 class BlackjackGame(AbstractGame):
     def __init__(self, game_id: str):
         super().__init__(game_id)
-        self.deck = []
+        self.deck = CARDS.deck()[:0]
         self.player_hands = []
         self.dealer_hand = Hand()
         self.current_hand_idx = 0
@@ -116,6 +113,7 @@ class BlackjackGame(AbstractGame):
 
     def _init_game(self):
         """Initialize a new game"""
+        self.reset_rng()
         self._create_shoe()
         self.player_hands = []
         self.dealer_hand = Hand()
@@ -123,19 +121,13 @@ class BlackjackGame(AbstractGame):
 
     def _create_shoe(self):
         """Create a new shoe with multiple decks"""
-        self.deck = []
-        for _ in range(self.shoe_size):
-            for rank in CARD_VALUES:
-                for suite in SUITES:
-                    self.deck.append(Card(rank, suite))
-        random.shuffle(self.deck)
-
-    def _deal_card(self, face_up: bool = True) -> Card:
+        self.deck = shuffled(CARDS.deck(self.shoe_size), self.rng)
+
+    def _deal_card(self) -> int:
         """Deal a card from the deck"""
-        if not self.deck:
+        if not len(self.deck):
             self._create_shoe()
-        card = self.deck.pop()
-        card.face_up = face_up
+        (card,), self.deck = draw(self.deck)
         return card
 
     def _init_deal(self, bets: List[int]) -> None:
@@ -147,17 +139,17 @@ class BlackjackGame(AbstractGame):
 
         # Deal first card to each player
         for hand in self.player_hands:
-            hand.add_card(self._deal_card(True))
+            hand.add_card(self._deal_card())
 
         # Deal first card to dealer (face down)
-        self.dealer_hand.add_card(self._deal_card(False))
+        self.dealer_hand.add_card(self._deal_card(), face_up=False)
 
         # Deal second card to each player
         for hand in self.player_hands:
-            hand.add_card(self._deal_card(True))
+            hand.add_card(self._deal_card())
 
         # Deal second card to dealer (face up)
-        self.dealer_hand.add_card(self._deal_card(True))
+        self.dealer_hand.add_card(self._deal_card())
 
     def _resolve_hand(self, hand: Hand) -> Dict[str, Any]:
         """Resolve a single hand and determine outcome"""
@@ -189,7 +181,7 @@ class BlackjackGame(AbstractGame):
     def _dealer_play(self) -> None:
         """Play dealer's hand according to standard rules"""
         while self.dealer_hand.get_value() < 17:
-            self.dealer_hand.add_card(self._deal_card(True))
+            self.dealer_hand.add_card(self._deal_card())
 
     def validate_action(self, action: str, hand_idx: int) -> bool:
         """Validate if the action is legal for the current hand"""
@@ -220,7 +212,7 @@ class BlackjackGame(AbstractGame):
         hand = self.player_hands[hand_idx]
 
         if action == "hit":
-            hand.add_card(self._deal_card(True))
+            hand.add_card(self._deal_card())
 
         elif action == "stand":
             self.current_hand_idx += 1
@@ -230,7 +222,7 @@ class BlackjackGame(AbstractGame):
         elif action == "double":
             hand.is_double = True
             hand.bet *= 2
-            hand.add_card(self._deal_card(True))
+            hand.add_card(self._deal_card())
             self.current_hand_idx += 1
             if self.current_hand_idx >= len(self.player_hands):
                 self._dealer_play()
@@ -243,8 +235,8 @@ class BlackjackGame(AbstractGame):
             self.player_hands.insert(hand_idx + 1, new_hand)
 
             # Deal new cards to both hands
-            hand.add_card(self._deal_card(True))
-            new_hand.add_card(self._deal_card(True))
+            hand.add_card(self._deal_card())
+            new_hand.add_card(self._deal_card())
 
             hand.is_split = True
             new_hand.is_split = True
@@ -267,11 +259,11 @@ class BlackjackGame(AbstractGame):
         dealer_visible = (
             self.dealer_hand.cards[1] if len(self.dealer_hand.cards) > 1 else None
         )
-        dealer_value = self.dealer_hand.get_value() if dealer_visible else 0
+        dealer_value = self.dealer_hand.get_value() if dealer_visible is not None else 0
 
         return {
             "dealer": {
-                "visible_card": dealer_visible.to_dict() if dealer_visible else None,
+                "visible_card": self.dealer_hand.card_dicts()[1] if dealer_visible is not None else None,
                 "value": dealer_value,
                 "hand": self.dealer_hand.to_dict(),
             },
@@ -1,25 +1,21 @@
 from game_abc import AbstractGame, GameMove, GameHistory
+from games.cards import CardSet, card_count, draw, hand_mask, shuffled
 from typing import Dict, Any, Optional, List, Tuple, Set
 import numpy as np
 from enum import Enum
 import time
-import random
 from collections import defaultdict
 
 
-class Card:
-    def __init__(self, suit: str, rank: int):
-        self.suit = suit
-        self.rank = rank
+SUITS = ["♠", "♥", "♦", "♣"]
+RANKS = range(2, 15)  # 2-14 (2-A)
+# Rank-major codes, so the four cards of a rank are one nibble of a hand mask
+CARDS = CardSet.product(rank=RANKS, suit=SUITS)
 
-    def __eq__(self, other):
-        return self.rank == other.rank
 
-    def __hash__(self):
-        return hash(self.rank)
-
-    def to_dict(self) -> Dict[str, Any]:
-        return {"suit": self.suit, "rank": self.rank}
+def rank_mask(rank: int) -> int:
+    """Hand mask of the four cards of a rank"""
+    return 0xF << 4 * (rank - RANKS[0])
 
 
 class BSGame(AbstractGame):
@@ -28,50 +24,42 @@ class BSGame(AbstractGame):
         self.num_players = num_players
         self.current_player = 0
         self.current_rank = 2  # Start with 2s
-        self.deck = []
-        self.hands = defaultdict(list)
-        self.discard_pile = []
-        self.last_claim = []
+        # Hands, the pile and the last claim are card bitmasks
+        self.hands = defaultdict(int)
+        self.discard_pile = 0
+        self.last_claim = 0
         self.last_player = None
         self._init_game()
 
     def _init_game(self):
         """Initialize a new game"""
-        self.deck = []
-        self.hands = defaultdict(list)
-        self.discard_pile = []
-        self.last_claim = []
+        self.reset_rng()
+        self.hands = defaultdict(int)
+        self.last_claim = 0
         self.last_player = None
         self.current_player = 0
         self.current_rank = 2
 
-        # Create deck (4 suits, ranks 2-14)
-        suits = ["♠", "♥", "♦", "♣"]
-        for suit in suits:
-            for rank in range(2, 15):  # 2-14 (2-A)
-                self.deck.append(Card(suit, rank))
-        random.shuffle(self.deck)
-
-        # Deal cards
+        # Deal cards evenly
+        deck = shuffled(CARDS.deck(), self.rng)
         for i in range(self.num_players):
-            self.hands[i] = [
-                self.deck.pop() for _ in range(len(self.deck) // self.num_players)
-            ]
+            cards, deck = draw(deck, len(CARDS) // self.num_players)
+            self.hands[i] = hand_mask(cards)
 
         # Place remaining cards in discard pile
-        self.discard_pile = self.deck
+        self.discard_pile = hand_mask(deck.tolist())
 
     def _has_rank(self, player: int, rank: int) -> bool:
         """Check if player has cards of the given rank"""
-        return any(card.rank == rank for card in self.hands[player])
+        return bool(self.hands[player] & rank_mask(rank))
 
     def _call_bs(self, player: int) -> bool:
         """Check if last play was BS"""
-        if not self.last_claim or not self.last_player:
+        if not self.last_claim or self.last_player is None:
             return False
 
         # Check if last player had any cards of the claimed rank
-        return not any(card.rank == self.current_rank for card in self.last_claim)
+        return not self.last_claim & rank_mask(self.current_rank)
 
     def validate_move(self, move_data: Dict[str, Any]) -> bool:
         """Validate if a move is legal"""
@@ -100,15 +88,18 @@ class BSGame(AbstractGame):
                 return False
 
             # Check if cards exist in player's hand
-            hand = self.hands[self.current_player]
-            if not all(Card(card["suit"], card["rank"]) in hand for card in cards):
+            try:
+                played = hand_mask(CARDS.codes(cards))
+            except ValueError:
+                return False
+            if card_count(played) != len(cards) or played & ~self.hands[self.current_player]:
                 return False
 
             return True
 
         elif move_type == "call_bs":
             # Can only call BS if there was a previous play
-            return bool(self.last_claim and self.last_player)
+            return bool(self.last_claim) and self.last_player is not None
 
         return False
 
@@ -120,15 +111,13 @@ class BSGame(AbstractGame):
         move_type = move_data["type"]
 
         if move_type == "play":
-            cards = [Card(card["suit"], card["rank"]) for card in move_data["cards"]]
-            claim = move_data["claim"]
+            cards = hand_mask(CARDS.codes(move_data["cards"]))
 
             # Remove cards from player's hand
-            for card in cards:
-                self.hands[self.current_player].remove(card)
+            self.hands[self.current_player] &= ~cards
 
             # Add cards to discard pile
-            self.discard_pile.extend(cards)
+            self.discard_pile |= cards
 
             # Update game state
             self.last_claim = cards
@@ -145,12 +134,11 @@ class BSGame(AbstractGame):
 
             if is_bs:
                 # Last player takes all cards
-                self.hands[self.last_player].extend(self.discard_pile)
-                self.discard_pile = []
+                self.hands[self.last_player] |= self.discard_pile
             else:
                 # Calling player takes all cards
-                self.hands[self.current_player].extend(self.discard_pile)
-                self.discard_pile = []
+                self.hands[self.current_player] |= self.discard_pile
+            self.discard_pile = 0
 
             # Move to next player
             self.current_player = (self.current_player + 1) % self.num_players
@@ -160,17 +148,11 @@ class BSGame(AbstractGame):
     def get_game_state(self) -> Dict[str, Any]:
         """Get the current game state"""
         return {
-            "hands": {
-                str(k): [card.to_dict() for card in v] for k, v in self.hands.items()
-            },
+            "hands": {str(k): CARDS.mask_faces(v) for k, v in self.hands.items()},
             "current_player": self.current_player,
             "current_rank": self.current_rank,
-            "discard_pile_size": len(self.discard_pile),
-            "last_claim": (
-                [card.to_dict() for card in self.last_claim]
-                if self.last_claim
-                else None
-            ),
+            "discard_pile_size": card_count(self.discard_pile),
+            "last_claim": CARDS.mask_faces(self.last_claim) if self.last_claim else None,
             "last_player": self.last_player,
             "game_over": self.is_game_over(),
             "winner": self.get_winner(),
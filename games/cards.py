@@ -0,0 +1,128 @@
+"""
+Compact card primitives shared by the card games.
+
+A CardSet lists the faces of a deck once, as the dicts the API sends and
+receives ({"suit": "♠", "rank": "A"}, {"color": "red", "value": "7"}, ...),
+and a card is the small int indexing its face. Each game orders its faces to
+suit its own tables (poker's evaluator wants ``rank * 4 + suit``, gin
+rummy's melds ``suit * 13 + rank``), so codes are only meaningful within
+their CardSet.
+
+Decks are NumPy uint8 arrays of codes, shuffled from a seeded Generator or a
+game's random stream, and a hand is an int bitmask with bit c set for card c,
+so membership, union and removal are bit operations and in_mask() tests a
+whole array of cards at once. Serializing cards looks their faces up in the
+table instead of building a dict per card object; the face dicts are shared
+and must not be modified.
+"""
+from itertools import product
+import random
+from typing import Any, Dict, Iterable, List, Sequence, Tuple, Union
+import numpy as np
+
+Face = Dict[str, Any]
+Seed = Union[None, int, np.random.Generator, random.Random]
+
+MAX_FACES = 256  # codes fit a uint8
+
+
+class CardSet:
+    """The faces of a deck, indexed by card code"""
+
+    __slots__ = ("faces", "fields", "_codes")
+
+    def __init__(self, faces: Sequence[Face]):
+        if len(faces) > MAX_FACES:
+            raise ValueError(f"A card set holds at most {MAX_FACES} faces")
+        self.faces: Tuple[Face, ...] = tuple(dict(face) for face in faces)
+        self.fields: Tuple[str, ...] = tuple(dict.fromkeys(k for face in faces for k in face))
+        self._codes = {self._key(face): code for code, face in enumerate(self.faces)}
+
+    @classmethod
+    def product(cls, **axes: Sequence[Any]) -> "CardSet":
+        """Every combination of the axes' values; the first axis varies slowest"""
+        return cls([dict(zip(axes, values)) for values in product(*axes.values())])
+
+    def __add__(self, extra: Sequence[Face]) -> "CardSet":
+        """The set with extra faces (jokers, say) coded after the existing ones"""
+        return CardSet(self.faces + tuple(extra))
+
+    def __len__(self) -> int:
+        return len(self.faces)
+
+    def _key(self, face: Face) -> Tuple[Any, ...]:
+        return tuple(face.get(field) for field in self.fields)
+
+    def code(self, face: Face) -> int:
+        """Card code of a face dict; ValueError if the set has no such card"""
+        try:
+            return self._codes[self._key(face)]
+        except (AttributeError, KeyError, TypeError):
+            raise ValueError(f"Unknown card: {face!r}") from None
+
+    def codes(self, faces: Iterable[Face]) -> List[int]:
+        return [self.code(face) for face in faces]
+
+    def to_faces(self, cards: Iterable[int]) -> List[Face]:
+        """Face dicts of a sequence of codes or of an array"""
+        faces = self.faces
+        return [faces[card] for card in np.asarray(cards).tolist()]
+
+    def mask_faces(self, mask: int) -> List[Face]:
+        """Face dicts of the cards in a hand mask, in code order"""
+        faces = self.faces
+        return [faces[card] for card in cards_of(mask)]
+
+    def deck(self, copies: int = 1) -> np.ndarray:
+        """Every card, copies times over, in code order"""
+        return np.tile(np.arange(len(self.faces), dtype=np.uint8), copies)
+
+
+def rng_for(seed: Seed = None) -> np.random.Generator:
+    """
+    A Generator from a seed, the Generator itself, or one seeded from a game's
+    random.Random stream (AbstractGame.rng)
+    """
+    if isinstance(seed, random.Random):
+        seed = seed.getrandbits(64)
+    return np.random.default_rng(seed)
+
+
+def shuffled(deck: np.ndarray, seed: Seed = None) -> np.ndarray:
+    """A shuffled copy of a deck array"""
+    return rng_for(seed).permutation(deck)
+
+
+def hand_mask(cards: Iterable[int]) -> int:
+    mask = 0
+    for card in cards:
+        mask |= 1 << card
+    return mask
+
+
+def cards_of(mask: int) -> List[int]:
+    """Codes of the cards in a mask, lowest first"""
+    cards = []
+    while mask:
+        low = mask & -mask
+        cards.append(low.bit_length() - 1)
+        mask ^= low
+    return cards
+
+
+def card_count(mask: int) -> int:
+    return bin(mask).count("1")
+
+
+def in_mask(cards: np.ndarray, mask: int) -> np.ndarray:
+    """Which cards of an array are in a hand mask, for sets of up to 64 faces"""
+    bits = np.asarray(cards, dtype=np.uint64)
+    return (np.uint64(mask) >> bits) & np.uint64(1) == 1
+
+
+def draw(deck: np.ndarray, count: int = 1) -> Tuple[List[int], np.ndarray]:
+    """The top count cards of a deck array (its end) and the rest of it"""
+    if count > len(deck):
+        raise ValueError("Not enough cards left in the deck")
+    split = len(deck) - count
+    return deck[split:][::-1].tolist(), deck[:split]
@@ -0,0 +1 @@
+from games.catan.catan import CatanGame
@@ -1,9 +1,23 @@
 from game_abc import AbstractGame, GameMove, GameHistory
+from games.catan.graph import (
+    EDGE_VERTICES,
+    HEX_VERTICES,
+    HEXES,
+    NUM_EDGES,
+    NUM_HEXES,
+    NUM_VERTICES,
+    VERTEX_EDGE_MASK,
+    VERTEX_HEXES,
+    VERTEX_NEIGHBOR_MASK,
+    bits,
+    longest_road,
+    longest_trail,
+    road_component,
+)
 from typing import Dict, Any, Optional, List, Tuple, Set
 import numpy as np
 from enum import Enum
 import time
-import random
 from collections import defaultdict
 
 
@@ -21,152 +35,142 @@ class BuildingType(Enum):
     ROAD = 3
 
 
+RESOURCE_NAMES = [resource.name.lower() for resource in Resource]
+COSTS = {
+    BuildingType.SETTLEMENT: {"wood": 1, "brick": 1, "sheep": 1, "wheat": 1},
+    BuildingType.CITY: {"wheat": 2, "ore": 3},
+    BuildingType.ROAD: {"wood": 1, "brick": 1},
+}
+MIN_LONGEST_ROAD = 5
+MIN_LARGEST_ARMY = 3
+WINNING_POINTS = 10
+
+
 class CatanGame(AbstractGame):
     def __init__(self, game_id: str, num_players: int = 4):
-        super().__init__(game_id)
         self.num_players = num_players
-        self.current_player = 0
-        self.phase = "setup"  # setup, play, end
-        self.resources = defaultdict(int)
-        self.buildings = defaultdict(list)
-        self.roads = defaultdict(list)
-        self.dev_cards = defaultdict(int)
-        self.army_size = defaultdict(int)
-        self.longest_road = defaultdict(int)
-        self.victory_points = defaultdict(int)
-        self.board = self._init_board()
+        super().__init__(game_id)
+
+    def initialize_game(self) -> Dict[str, Any]:
+        """Lay out a new board and start the setup placements"""
+        self._init_game()
+        return self.get_game_state()
+
+    def _restore_game_state(self) -> None:
+        """Deal again from the recorded seed and replay the recorded moves"""
         self._init_game()
+        self._replay_moves()
 
     def _init_board(self):
-        """Initialize the Catan board"""
-        # Create hexagonal grid
-        board = {}
-
-        # Resource distribution
-        resources = [
-            Resource.WOOD,
-            Resource.WOOD,
-            Resource.WOOD,
-            Resource.BRICK,
-            Resource.BRICK,
-            Resource.BRICK,
-            Resource.SHEEP,
-            Resource.SHEEP,
-            Resource.SHEEP,
-            Resource.SHEEP,
-            Resource.WHEAT,
-            Resource.WHEAT,
-            Resource.WHEAT,
-            Resource.WHEAT,
-            Resource.ORE,
-            Resource.ORE,
-            Resource.ORE,
+        """Shuffle the resources and number tokens over the 19 hexes"""
+        resources = (
+            [Resource.WOOD] * 4
+            + [Resource.BRICK] * 3
+            + [Resource.SHEEP] * 4
+            + [Resource.WHEAT] * 4
+            + [Resource.ORE] * 3
+            + [None]  # desert
+        )
+        numbers = [2, 3, 3, 4, 4, 5, 5, 6, 6, 8, 8, 9, 9, 10, 10, 11, 11, 12]
+        self.rng.shuffle(resources)
+        self.rng.shuffle(numbers)
+
+        self.hex_resources: List[Optional[Resource]] = resources
+        self.hex_numbers: List[Optional[int]] = [
+            None if resource is None else numbers.pop() for resource in resources
         ]
-
-        # Number distribution
-        numbers = [2, 12, 3, 3, 4, 4, 5, 5, 6, 6, 8, 8, 9, 9, 10, 10, 11, 11]
-
-        # Place desert
-        board[(0, 0)] = {"resource": None, "number": 7}
-
-        # Place remaining hexes
-        hexes = [(x, y) for x in range(-2, 3) for y in range(-2, 3) if (x, y) != (0, 0)]
-        random.shuffle(hexes)
-
-        for hex_pos in hexes:
-            board[hex_pos] = {"resource": resources.pop(), "number": numbers.pop()}
-
-        return board
+        self.robber = resources.index(None)
+        # Dice total -> hex -> player -> resources produced, kept up to date as
+        # settlements and cities are built
+        self.production: Dict[int, Dict[int, Dict[int, int]]] = {
+            total: {} for total in range(2, 13)
+        }
 
     def _init_game(self):
         """Initialize a new game"""
+        self.reset_rng()
         self.current_player = 0
-        self.phase = "setup"
-
-        # Initialize player resources
-        for i in range(self.num_players):
-            self.resources[i] = {
-                Resource.WOOD: 0,
-                Resource.BRICK: 0,
-                Resource.SHEEP: 0,
-                Resource.WHEAT: 0,
-                Resource.ORE: 0,
-            }
+        self.phase = "setup"  # setup, play, end
+        self._init_board()
+
+        # Occupancy bitsets: bit v of a vertex mask, bit e of an edge mask
+        self.settlements = [0] * self.num_players
+        self.cities = [0] * self.num_players
+        self.roads = [0] * self.num_players
+        self.occupied_vertices = 0
+        self.occupied_edges = 0
+
+        self.resources = {
+            player: {name: 0 for name in RESOURCE_NAMES} for player in range(self.num_players)
+        }
 
         # Initialize development cards
-        dev_cards = [
-            "knight" * 14,
-            "victory_point" * 5,
-            "road_building" * 2,
-            "year_of_plenty" * 2,
-            "monopoly" * 2,
-        ]
-        random.shuffle(dev_cards)
-        self.dev_cards = dev_cards
+        self.dev_cards = (
+            ["knight"] * 14
+            + ["victory_point"] * 5
+            + ["road_building"] * 2
+            + ["year_of_plenty"] * 2
+            + ["monopoly"] * 2
+        )
+        self.rng.shuffle(self.dev_cards)
+        self.free_roads = defaultdict(int)
 
-        # Initialize victory points
+        self.army_size = defaultdict(int)
+        self.largest_army: Optional[int] = None
+        self.road_length = defaultdict(int)
+        self.longest_road: Optional[int] = None
         self.victory_points = defaultdict(int)
 
-        # Set up phase
-        self._setup_phase()
-
-    def _setup_phase(self):
-        """Handle initial placement of settlements and roads"""
-        # First round: clockwise
-        for i in range(self.num_players):
-            player = i
-            # Place settlement
-            self.buildings[player].append(
-                {"type": BuildingType.SETTLEMENT, "position": (0, 0)}
-            )
-            # Place road
-            self.roads[player].append({"position": ((0, 0), (0, 1))})
-
-        # Second round: counterclockwise
-        for i in range(self.num_players - 1, -1, -1):
-            player = i
-            # Place settlement
-            self.buildings[player].append(
-                {"type": BuildingType.SETTLEMENT, "position": (1, 0)}
-            )
-            # Place road
-            self.roads[player].append({"position": ((1, 0), (1, 1))})
+        # Setup: settlement and road per player, forwards then backwards
+        self.setup_order = list(range(self.num_players)) + list(
+            reversed(range(self.num_players))
+        )
+        self.setup_step = 0
+        self.setup_settlement: Optional[int] = None
+        self.rolled = False
+        self.last_roll: Optional[int] = None
+
+    def _building_type(self, value: Any) -> Optional[BuildingType]:
+        if isinstance(value, BuildingType):
+            return value
+        try:
+            return BuildingType[str(value).upper()]
+        except KeyError:
+            return None
+
+    def _opponent_buildings(self, player: int) -> int:
+        return self.occupied_vertices & ~(self.settlements[player] | self.cities[player])
 
     def validate_move(self, move_data: Dict[str, Any]) -> bool:
         """Validate if a move is legal"""
-        if "action" not in move_data:
+        if "action" not in move_data or self.phase == "end":
             return False
 
         action = move_data["action"]
 
+        if self.phase == "setup":
+            return action == "build" and self._is_valid_setup_build(move_data)
+
+        if action == "roll":
+            return not self.rolled
+
+        if action == "end_turn":
+            return self.rolled
+
         if action == "build":
             if "type" not in move_data or "position" not in move_data:
                 return False
 
-            building_type = move_data["type"]
-            position = move_data["position"]
-
-            # Check resources
-            if building_type == BuildingType.SETTLEMENT:
-                required = {
-                    Resource.WOOD: 1,
-                    Resource.BRICK: 1,
-                    Resource.SHEEP: 1,
-                    Resource.WHEAT: 1,
-                }
-            elif building_type == BuildingType.CITY:
-                required = {Resource.WHEAT: 2, Resource.ORE: 3}
-            elif building_type == BuildingType.ROAD:
-                required = {Resource.WOOD: 1, Resource.BRICK: 1}
+            building_type = self._building_type(move_data["type"])
+            if building_type is None or not self.rolled:
+                return False
 
             # Check if player has resources
-            if not all(
-                self.resources[self.current_player][r] >= required[r] for r in required
-            ):
+            if not self._can_afford(building_type):
                 return False
 
             # Check position validity
-            if not self._is_valid_position(position, building_type):
+            if not self._is_valid_position(move_data["position"], building_type):
                 return False
 
             return True
@@ -177,6 +181,8 @@ class CatanGame(AbstractGame):
 
             offer = move_data["offer"]
             request = move_data["request"]
+            if not all(r in RESOURCE_NAMES for r in list(offer) + list(request)):
+                return False
 
             # Check if player has resources to trade
             if not all(
@@ -190,7 +196,76 @@ class CatanGame(AbstractGame):
             if "card" not in move_data:
                 return False
 
+            card = move_data["card"]
+            if card == "knight":
+                return move_data.get("hex", self.robber) in range(NUM_HEXES)
+            if card == "year_of_plenty":
+                chosen = move_data.get("resources", [])
+                return len(chosen) == 2 and all(r in RESOURCE_NAMES for r in chosen)
+            if card == "monopoly":
+                return move_data.get("resource") in RESOURCE_NAMES
+            return card == "road_building"
+
+        return False
+
+    def _can_afford(self, building_type: BuildingType) -> bool:
+        if building_type == BuildingType.ROAD and self.free_roads[self.current_player]:
             return True
+        resources = self.resources[self.current_player]
+        return all(resources[r] >= n for r, n in COSTS[building_type].items())
+
+    def _is_valid_setup_build(self, move_data: Dict[str, Any]) -> bool:
+        """Setup alternates a free settlement and a road touching it"""
+        building_type = self._building_type(move_data.get("type"))
+        position = move_data.get("position")
+        if self.setup_settlement is None:
+            return building_type == BuildingType.SETTLEMENT and self._is_free_vertex(position)
+        return (
+            building_type == BuildingType.ROAD
+            and self._is_free_edge(position)
+            and self.setup_settlement in EDGE_VERTICES[position]
+        )
+
+    def _is_free_vertex(self, vertex: Any) -> bool:
+        """Empty vertex whose neighbours are empty too (the distance rule)"""
+        if not isinstance(vertex, int) or not 0 <= vertex < NUM_VERTICES:
+            return False
+        return not (self.occupied_vertices >> vertex & 1) and not (
+            self.occupied_vertices & VERTEX_NEIGHBOR_MASK[vertex]
+        )
+
+    def _is_free_edge(self, edge: Any) -> bool:
+        if not isinstance(edge, int) or not 0 <= edge < NUM_EDGES:
+            return False
+        return not self.occupied_edges >> edge & 1
+
+    def _is_valid_position(self, position: int, building_type: BuildingType) -> bool:
+        """Check if a vertex (settlement, city) or edge (road) id is valid for building"""
+        player = self.current_player
+
+        if building_type == BuildingType.SETTLEMENT:
+            # Must follow the distance rule and touch one of the player's roads
+            return self._is_free_vertex(position) and bool(
+                self.roads[player] & VERTEX_EDGE_MASK[position]
+            )
+
+        elif building_type == BuildingType.CITY:
+            # Must be on own settlement
+            return isinstance(position, int) and bool(self.settlements[player] >> position & 1)
+
+        elif building_type == BuildingType.ROAD:
+            # Must connect to own building, or own road through a vertex
+            # not taken by another player
+            if not self._is_free_edge(position):
+                return False
+            own = self.settlements[player] | self.cities[player]
+            opponents = self._opponent_buildings(player)
+            for vertex in EDGE_VERTICES[position]:
+                if own >> vertex & 1:
+                    return True
+                if not opponents >> vertex & 1 and self.roads[player] & VERTEX_EDGE_MASK[vertex]:
+                    return True
+            return False
 
         return False
 
@@ -198,39 +273,39 @@ class CatanGame(AbstractGame):
         """Make a move in the game"""
         if not self.validate_move(move_data):
             raise ValueError("Invalid move")
+        player = self.current_player
 
         action = move_data["action"]
 
-        if action == "build":
-            building_type = move_data["type"]
-            position = move_data["position"]
+        if self.phase == "setup":
+            self._setup_build(move_data)
 
-            # Deduct resources
-            if building_type == BuildingType.SETTLEMENT:
-                required = {
-                    Resource.WOOD: 1,
-                    Resource.BRICK: 1,
-                    Resource.SHEEP: 1,
-                    Resource.WHEAT: 1,
-                }
-            elif building_type == BuildingType.CITY:
-                required = {Resource.WHEAT: 2, Resource.ORE: 3}
-            elif building_type == BuildingType.ROAD:
-                required = {Resource.WOOD: 1, Resource.BRICK: 1}
+        elif action == "roll":
+            self.rolled = True
+            self.last_roll = self.rng.randint(1, 6) + self.rng.randint(1, 6)
+            self._produce(self.last_roll)
 
-            for r in required:
-                self.resources[self.current_player][r] -= required[r]
+        elif action == "end_turn":
+            self.rolled = False
+            self.current_player = (player + 1) % self.num_players
 
-            # Add building
-            self.buildings[self.current_player].append(
-                {"type": building_type, "position": position}
-            )
+        elif action == "build":
+            building_type = self._building_type(move_data["type"])
+            position = move_data["position"]
 
-            # Add victory points
-            if building_type == BuildingType.SETTLEMENT:
-                self.victory_points[self.current_player] += 1
-            elif building_type == BuildingType.CITY:
-                self.victory_points[self.current_player] += 2
+            # Deduct resources
+            if building_type == BuildingType.ROAD and self.free_roads[player]:
+                self.free_roads[player] -= 1
+            else:
+                for r, n in COSTS[building_type].items():
+                    self.resources[player][r] -= n
+
+            if building_type == BuildingType.ROAD:
+                self._place_road(player, position)
+            elif building_type == BuildingType.SETTLEMENT:
+                self._place_settlement(player, position)
+            else:
+                self._place_city(player, position)
 
         elif action == "trade":
             offer = move_data["offer"]
@@ -238,81 +313,170 @@ class CatanGame(AbstractGame):
 
             # Deduct offered resources
             for r in offer:
-                self.resources[self.current_player][r] -= offer[r]
+                self.resources[player][r] -= offer[r]
 
             # Add requested resources
             for r in request:
-                self.resources[self.current_player][r] += request[r]
+                self.resources[player][r] += request[r]
 
         elif action == "use_dev_card":
             card = move_data["card"]
             if card == "knight":
-                self.army_size[self.current_player] += 1
+                self.robber = move_data.get("hex", self.robber)
+                self.army_size[player] += 1
+                self._update_largest_army(player)
             elif card == "road_building":
-                self._build_two_roads()
+                self.free_roads[player] += 2
             elif card == "year_of_plenty":
-                self._get_two_resources()
+                for r in move_data["resources"]:
+                    self.resources[player][r] += 1
             elif card == "monopoly":
-                self._take_all_resources()
+                r = move_data["resource"]
+                for other in range(self.num_players):
+                    if other != player:
+                        self.resources[player][r] += self.resources[other][r]
+                        self.resources[other][r] = 0
+
+        self._update_victory_points()
 
         # Check for victory
-        if self.victory_points[self.current_player] >= 10:
+        if self.victory_points[player] >= WINNING_POINTS:
             self.phase = "end"
 
-        # Move to next player
-        self.current_player = (self.current_player + 1) % self.num_players
-
+        self._record_move(player, move_data)
         return self.get_game_state()
 
-    def _is_valid_position(
-        self, position: Tuple[int, int], building_type: BuildingType
-    ) -> bool:
-        """Check if a position is valid for building"""
-        # Check if position is on board
-        if position not in self.board:
-            return False
-
-        # Check if position is adjacent to existing roads/settlements
-        if building_type == BuildingType.SETTLEMENT:
-            # Must be adjacent to own road
-            for road in self.roads[self.current_player]:
-                if position in road["position"]:
-                    return True
-            return False
-
-        elif building_type == BuildingType.CITY:
-            # Must be on own settlement
-            for building in self.buildings[self.current_player]:
-                if (
-                    building["type"] == BuildingType.SETTLEMENT
-                    and building["position"] == position
-                ):
-                    return True
-            return False
-
-        elif building_type == BuildingType.ROAD:
-            # Must connect to own settlement or road
-            for building in self.buildings[self.current_player]:
-                if building["position"] == position:
-                    return True
-            for road in self.roads[self.current_player]:
-                if position in road["position"]:
-                    return True
-            return False
-
-        return False
+    def _setup_build(self, move_data: Dict[str, Any]) -> None:
+        player = self.current_player
+        position = move_data["position"]
+        if self.setup_settlement is None:
+            self._place_settlement(player, position)
+            self.setup_settlement = position
+            if self.setup_step >= self.num_players:
+                # The second settlement yields one of each adjacent resource
+                for hex_id in VERTEX_HEXES[position]:
+                    if self.hex_resources[hex_id] is not None:
+                        self.resources[player][self.hex_resources[hex_id].name.lower()] += 1
+            return
+        self._place_road(player, position)
+        self.setup_settlement = None
+        self.setup_step += 1
+        if self.setup_step == len(self.setup_order):
+            self.phase = "play"
+            self.current_player = 0
+        else:
+            self.current_player = self.setup_order[self.setup_step]
+
+    def _place_settlement(self, player: int, vertex: int) -> None:
+        self.settlements[player] |= 1 << vertex
+        self.occupied_vertices |= 1 << vertex
+        self._add_production(player, vertex)
+
+        # A settlement can cut another player's road in two
+        for other in range(self.num_players):
+            if other != player and bin(self.roads[other] & VERTEX_EDGE_MASK[vertex]).count("1") > 1:
+                self.road_length[other] = longest_road(
+                    self.roads[other], self._opponent_buildings(other)
+                )
+                self._update_longest_road()
+
+    def _place_city(self, player: int, vertex: int) -> None:
+        self.settlements[player] &= ~(1 << vertex)
+        self.cities[player] |= 1 << vertex
+        self._add_production(player, vertex)
+
+    def _place_road(self, player: int, edge: int) -> None:
+        self.roads[player] |= 1 << edge
+        self.occupied_edges |= 1 << edge
+        # Only the network the road joins can have grown
+        blocked = self._opponent_buildings(player)
+        component = road_component(edge, self.roads[player], blocked)
+        length = longest_trail(component, blocked)
+        if length > self.road_length[player]:
+            self.road_length[player] = length
+            self._update_longest_road()
+
+    def _add_production(self, player: int, vertex: int) -> None:
+        """A settlement, or a city upgrade, adds one resource per adjacent hex roll"""
+        for hex_id in VERTEX_HEXES[vertex]:
+            number = self.hex_numbers[hex_id]
+            if number is not None:
+                yields = self.production[number].setdefault(hex_id, defaultdict(int))
+                yields[player] += 1
+
+    def _produce(self, total: int) -> None:
+        for hex_id, yields in self.production.get(total, {}).items():
+            if hex_id == self.robber:
+                continue
+            resource = self.hex_resources[hex_id].name.lower()
+            for player, amount in yields.items():
+                self.resources[player][resource] += amount
+
+    def _update_longest_road(self) -> None:
+        """The card moves to a strictly longer road of at least five"""
+        holder = self.longest_road
+        if holder is not None and self.road_length[holder] < MIN_LONGEST_ROAD:
+            holder = None
+        best = max(self.road_length[p] for p in range(self.num_players))
+        leaders = [p for p in range(self.num_players) if self.road_length[p] == best]
+        if best < MIN_LONGEST_ROAD:
+            holder = None
+        elif holder is None or self.road_length[holder] < best:
+            # A broken road with a tie for the longest sets the card aside
+            holder = leaders[0] if len(leaders) == 1 else None
+        self.longest_road = holder
+
+    def _update_largest_army(self, player: int) -> None:
+        holder = self.largest_army
+        if self.army_size[player] >= MIN_LARGEST_ARMY and (
+            holder is None or self.army_size[player] > self.army_size[holder]
+        ):
+            self.largest_army = player
+
+    def _update_victory_points(self) -> None:
+        for player in range(self.num_players):
+            points = bin(self.settlements[player]).count("1") + 2 * bin(
+                self.cities[player]
+            ).count("1")
+            if self.longest_road == player:
+                points += 2
+            if self.largest_army == player:
+                points += 2
+            self.victory_points[player] = points
 
     def get_game_state(self) -> Dict[str, Any]:
         """Get the current game state"""
         return {
-            "board": self.board,
+            "board": [
+                {
+                    "id": hex_id,
+                    "position": list(HEXES[hex_id]),
+                    "resource": None
+                    if self.hex_resources[hex_id] is None
+                    else self.hex_resources[hex_id].name.lower(),
+                    "number": self.hex_numbers[hex_id],
+                    "vertices": list(HEX_VERTICES[hex_id]),
+                }
+                for hex_id in range(NUM_HEXES)
+            ],
+            "edges": [list(pair) for pair in EDGE_VERTICES],
+            "robber": self.robber,
             "current_player": self.current_player,
             "phase": self.phase,
-            "resources": self.resources,
-            "buildings": self.buildings,
-            "roads": self.roads,
-            "dev_cards": self.dev_cards,
-            "victory_points": self.victory_points,
+            "last_roll": self.last_roll,
+            "resources": {str(p): dict(r) for p, r in self.resources.items()},
+            "buildings": {
+                str(p): [{"type": "settlement", "position": v} for v in bits(self.settlements[p])]
+                + [{"type": "city", "position": v} for v in bits(self.cities[p])]
+                for p in range(self.num_players)
+            },
+            "roads": {
+                str(p): [{"position": e} for e in bits(self.roads[p])]
+                for p in range(self.num_players)
+            },
+            "longest_road": self.longest_road,
+            "largest_army": self.largest_army,
+            "victory_points": {str(p): self.victory_points[p] for p in range(self.num_players)},
             "game_over": self.phase == "end",
             "winner": self.get_winner(),
         }
@@ -0,0 +1,123 @@
+"""
+Catan board graph with integer ids.
+
+The 19 hexes of the standard board (axial coordinates within radius 2) have
+54 corner vertices and 72 edges. Vertices are found from the corners of
+pointy-top hexes in doubled integer coordinates, where the hex (q, r) is
+centred at (2q + r, 3r), and are numbered row by row; edges are numbered by
+their endpoint pair. Besides the adjacency tuples every vertex has bitmasks
+of its neighbouring vertices and of its edges, so ownership of vertices and
+edges can be kept as one int per player and placement rules become a few
+mask tests.
+"""
+from typing import Dict, Iterator, List, Tuple
+
+RADIUS = 2
+# Corners of a hex relative to its centre, clockwise from the top
+_CORNERS = [(0, -2), (1, -1), (1, 1), (0, 2), (-1, 1), (-1, -1)]
+
+
+def _build():
+    hexes = [
+        (q, r)
+        for r in range(-RADIUS, RADIUS + 1)
+        for q in range(-RADIUS, RADIUS + 1)
+        if abs(q + r) <= RADIUS
+    ]
+    corner_points = [
+        [(2 * q + r + dx, 3 * r + dy) for dx, dy in _CORNERS] for q, r in hexes
+    ]
+    points = sorted({p for corners in corner_points for p in corners}, key=lambda p: (p[1], p[0]))
+    vertex_ids = {point: i for i, point in enumerate(points)}
+    hex_vertices = [tuple(vertex_ids[p] for p in corners) for corners in corner_points]
+    edge_pairs = sorted({
+        tuple(sorted((corners[k], corners[(k + 1) % 6])))
+        for corners in hex_vertices
+        for k in range(6)
+    })
+    return hexes, points, hex_vertices, edge_pairs
+
+
+HEXES, VERTEX_POINTS, HEX_VERTICES, EDGE_VERTICES = _build()
+NUM_HEXES = len(HEXES)
+NUM_VERTICES = len(VERTEX_POINTS)
+NUM_EDGES = len(EDGE_VERTICES)
+HEX_IDS: Dict[Tuple[int, int], int] = {position: i for i, position in enumerate(HEXES)}
+
+VERTEX_HEXES: List[Tuple[int, ...]] = [
+    tuple(h for h in range(NUM_HEXES) if v in HEX_VERTICES[h]) for v in range(NUM_VERTICES)
+]
+VERTEX_EDGES: List[Tuple[int, ...]] = [
+    tuple(e for e in range(NUM_EDGES) if v in EDGE_VERTICES[e]) for v in range(NUM_VERTICES)
+]
+VERTEX_NEIGHBORS: List[Tuple[int, ...]] = [
+    tuple(a if b == v else b for a, b in (EDGE_VERTICES[e] for e in VERTEX_EDGES[v]))
+    for v in range(NUM_VERTICES)
+]
+VERTEX_NEIGHBOR_MASK = [sum(1 << n for n in VERTEX_NEIGHBORS[v]) for v in range(NUM_VERTICES)]
+VERTEX_EDGE_MASK = [sum(1 << e for e in VERTEX_EDGES[v]) for v in range(NUM_VERTICES)]
+
+
+def bits(mask: int) -> Iterator[int]:
+    """Indices of the set bits of a mask, lowest first"""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def road_component(edge: int, roads: int, blocked: int) -> int:
+    """
+    Mask of the roads connected to edge. Roads only connect through vertices
+    that are not blocked (by another player's building).
+    """
+    component = 1 << edge
+    pending = [edge]
+    while pending:
+        for vertex in EDGE_VERTICES[pending.pop()]:
+            if blocked >> vertex & 1:
+                continue
+            for neighbor in bits(VERTEX_EDGE_MASK[vertex] & roads & ~component):
+                component |= 1 << neighbor
+                pending.append(neighbor)
+    return component
+
+
+def longest_trail(roads: int, blocked: int) -> int:
+    """
+    Length of the longest trail (no road used twice) in a connected set of
+    roads; a trail may end at a blocked vertex but not pass through it.
+    """
+    best = 0
+
+    def extend(vertex: int, used: int, length: int) -> None:
+        nonlocal best
+        if length > best:
+            best = length
+        if length and blocked >> vertex & 1:
+            return
+        for edge in bits(VERTEX_EDGE_MASK[vertex] & roads & ~used):
+            a, b = EDGE_VERTICES[edge]
+            extend(b if a == vertex else a, used | 1 << edge, length + 1)
+
+    # A longest trail can be taken to end where the network ends, branches
+    # or is blocked; only a plain cycle has no such vertex
+    vertices = {v for e in bits(roads) for v in EDGE_VERTICES[e]}
+    starts = [
+        v for v in vertices
+        if blocked >> v & 1 or bin(VERTEX_EDGE_MASK[v] & roads).count("1") != 2
+    ]
+    for vertex in starts or vertices:
+        extend(vertex, 0, 0)
+    return best
+
+
+def longest_road(roads: int, blocked: int) -> int:
+    """Longest trail over every road network in a mask"""
+    best = 0
+    remaining = roads
+    while remaining:
+        component = road_component((remaining & -remaining).bit_length() - 1, roads, blocked)
+        remaining &= ~component
+        best = max(best, longest_trail(component, blocked))
+    return best
@@ -1,6 +1,9 @@
 from game_abc import AbstractGame, GameMove, GameHistory
+from games.chess.bitboard import BitboardPosition
+from games.zobrist import RepetitionIndex, ZobristTable
 from typing import Dict, Any, Optional, Tuple, List
-import time
+
+ZOBRIST = ZobristTable("chess")
 
 
 class ChessPiece:
@@ -35,16 +38,12 @@ class ChessGame(AbstractGame):
         "q",
         "k",
     ]  # pawn, rook, knight, bishop, queen, king
+    # The bitboard position and everything derived from it are memoized per position
+    _CACHED_READS = AbstractGame._CACHED_READS + ("_position", "_legal_move_list")
 
     def __init__(self, game_id: str):
+        # The board is set up and any recorded moves replayed by _restore_game_state
         super().__init__(game_id)
-        self.board = [[None] * self.BOARD_SIZE for _ in range(self.BOARD_SIZE)]
-        self.current_player = "w"
-        self._init_board()
-        self.en_passant_target = None  # For en passant
-        self.halfmove_clock = 0  # For fifty-move rule
-        self.fullmove_number = 1  # For move counting
-        self._init_game_state()
 
     def initialize_game(self) -> Dict[str, Any]:
         """Initialize a new game instance"""
@@ -54,6 +53,7 @@ class ChessGame(AbstractGame):
         self.en_passant_target = None
         self.halfmove_clock = 0
         self.fullmove_number = 1
+        self._reset_repetitions()
         return self.get_game_state()
         
     def _init_board(self):
@@ -78,362 +78,136 @@ class ChessGame(AbstractGame):
         self.fullmove_number = 1
 
     def _restore_game_state(self):
-        """Restore game state from history"""
-        # Get the latest state from history
-        if self.history_state:
-            latest_move = self.history_state[-1]
-            self.current_player = "b" if latest_move["player"] == "w" else "w"
-
-            # Reconstruct board from moves
-            self.board = [[None] * self.BOARD_SIZE for _ in range(self.BOARD_SIZE)]
-            self.en_passant_target = None
-            self.halfmove_clock = 0
-            self.fullmove_number = 1
+        """Set up the starting position and replay the recorded moves"""
+        self._init_game_state()
+        self._reset_repetitions()
+        self._replay_moves()
 
-            for move in self.history_state:
-                move_data = move["move_data"]
-                piece = ChessPiece(move_data["piece_type"], move_data["color"])
-                piece.has_moved = True
-                self.board[move_data["to_row"]][move_data["to_col"]] = piece
+    def _position(self) -> BitboardPosition:
+        """Bitboard view of self.board, rebuilt once per position (see AbstractGame)"""
+        return BitboardPosition.from_board(self.board)
 
-    def _would_put_king_in_check(self, from_row: int, from_col: int, to_row: int, to_col: int) -> bool:
-        """Check if a move would put the current player's king in check"""
-        # Save the current state
-        piece = self.board[from_row][from_col]
-        target_piece = self.board[to_row][to_col]
-        
-        # Make the move temporarily
-        self.board[to_row][to_col] = piece
-        self.board[from_row][from_col] = None
-        
-        # Check if the current player's king is in check
-        in_check = self._is_in_check(piece.color)
-        
-        # Undo the move
-        self.board[from_row][from_col] = piece
-        self.board[to_row][to_col] = target_piece
-        
-        return in_check
-        
     def _is_in_check(self, color: str) -> bool:
         """Check if the specified color is in check"""
-        king_pos = self._find_king(color)
-        if not king_pos:
-            return False # Should not happen in a valid game
+        return self._position().in_check(color)
 
-        opponent_color = "w" if color == "b" else "b"
-        for row in range(self.BOARD_SIZE):
-            for col in range(self.BOARD_SIZE):
-                piece = self.board[row][col]
-                if piece and piece.color == opponent_color:
-                    if self._can_attack(piece, (row, col), king_pos):
-                        return True
-        return False
+    def _is_square_attacked(self, row: int, col: int, by_color: str) -> bool:
+        """Check if any piece of by_color attacks (row, col)"""
+        return self._position().is_attacked(row * 8 + col, by_color)
 
     def _is_insufficient_material(self) -> bool:
         """Check if there is insufficient material to checkmate"""
-        pieces = []
-        for row in self.board:
-            for piece in row:
-                if piece and piece.piece_type != 'k':  # Count all pieces except kings
-                    pieces.append(piece)
-        
-        # If there are no pieces except kings, it's a draw
-        if not pieces:
-            return True
-            
-        # If there's only one minor piece, it's a draw
-        if len(pieces) == 1 and pieces[0].piece_type in ['b', 'n']:
-            return True
-            
-        # If there are only two bishops on the same color, it's a draw
-        if len(pieces) == 2 and all(p.piece_type == 'b' for p in pieces):
-            # Check if bishops are on the same color
-            bishop1_pos = None
-            bishop2_pos = None
-            for row in range(self.BOARD_SIZE):
-                for col in range(self.BOARD_SIZE):
-                    piece = self.board[row][col]
-                    if piece and piece.piece_type == 'b':
-                        if bishop1_pos is None:
-                            bishop1_pos = (row, col)
-                        else:
-                            bishop2_pos = (row, col)
-            
-            if bishop1_pos and bishop2_pos:
-                # Bishops are on the same color if (row + col) % 2 is the same for both
-                if (bishop1_pos[0] + bishop1_pos[1]) % 2 == (bishop2_pos[0] + bishop2_pos[1]) % 2:
-                    return True
-        
-        return False
+        return self._position().insufficient_material()
 
     def _find_king(self, color: str) -> Optional[Tuple[int, int]]:
         """Find the king's position for the specified color"""
-        for row in range(self.BOARD_SIZE):
-            for col in range(self.BOARD_SIZE):
-                piece = self.board[row][col]
-                if piece and piece.piece_type == "k" and piece.color == color:
-                    return (row, col)
-        return None
-
-    def _can_attack(
-        self, piece: ChessPiece, from_pos: Tuple[int, int], to_pos: Tuple[int, int]
-    ) -> bool:
-        """Check if a piece can attack a position"""
-        # Check if the target position has a piece of the same color
-        target_piece = self.board[to_pos[0]][to_pos[1]]
-        if target_piece and target_piece.color == piece.color:
-            return False
-            
-        # Temporarily remove the target piece to validate the move
-        self.board[to_pos[0]][to_pos[1]] = None
-
-        can_attack = self._validate_piece_move(piece.piece_type, from_pos, to_pos)
-
-        # Restore the target piece
-        self.board[to_pos[0]][to_pos[1]] = target_piece
-        return can_attack
+        square = self._position().king_square(color)
+        return None if square is None else divmod(square, 8)
+
+    def legal_moves(self, color: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        All legal moves for color (default: the player to move), as move_data
+        dicts accepted by make_move. Castling moves carry "castling": True.
+        """
+        color = color or self.current_player
+        moves = []
+        for from_row, from_col, to_row, to_col, castling in self._legal_move_list(color):
+            move = {
+                "from_row": from_row,
+                "from_col": from_col,
+                "to_row": to_row,
+                "to_col": to_col,
+                "player": color,
+            }
+            if castling:
+                move["castling"] = True
+            moves.append(move)
+        return moves
 
     def validate_move(self, move_data: Dict[str, Any]) -> bool:
         """Validate if a move is legal"""
         try:
-            from_row, from_col = move_data['from_row'], move_data['from_col']
-            to_row, to_col = move_data['to_row'], move_data['to_col']
+            from_row, from_col = int(move_data['from_row']), int(move_data['from_col'])
+            to_row, to_col = int(move_data['to_row']), int(move_data['to_col'])
             player = move_data['player']
-            
-            # Check if the move is within the board bounds
-            if not (0 <= from_row < 8 and 0 <= from_col < 8 and 0 <= to_row < 8 and 0 <= to_col < 8):
-                return False
-
-            # Check if there's a piece at the source
-            piece = self.board[from_row][from_col]
-            if not piece:
-                return False
-
-            # Check if it's the player's turn
-            if piece.color != player:
-                return False
-
-            # Special case: Castling
-            if move_data.get('castling', False):
-                if not (piece.piece_type == 'k' and abs(from_col - to_col) == 2):
-                    return False
-                if not self._validate_castling(from_row, from_col, to_row, to_col):
-                    return False
-                return True
-            
-            # Check if the move is valid for the piece type
-            if not self._validate_piece_move(piece.piece_type, (from_row, from_col), (to_row, to_col)):
-                return False
-            
-            # Check if the move would put the king in check
-            would_check = self._would_put_king_in_check(from_row, from_col, to_row, to_col)
-            if would_check:
-                return False
-
-            return True
-            
-        except Exception as e:
-            import traceback
-            traceback.print_exc()
-            return False
-
-    def _validate_castling(
-        self, from_row: int, from_col: int, to_row: int, to_col: int
-    ) -> bool:
-        """Validate castling move"""
-        if from_row != to_row or abs(to_col - from_col) != 2:
+        except (KeyError, TypeError, ValueError):
             return False
 
-        # Check if king has moved
-        if self.board[from_row][from_col].has_moved:
+        # Check if the move is within the board bounds
+        if not (0 <= from_row < 8 and 0 <= from_col < 8 and 0 <= to_row < 8 and 0 <= to_col < 8):
             return False
 
-        # Check if rook has moved
-        rook_col = 0 if to_col < from_col else 7  # Left or right rook
-        rook = self.board[from_row][rook_col]
-        if not rook or rook.piece_type != "r" or rook.has_moved:
-            return False
-
-        # Check if path is clear
-        start_col = min(from_col, to_col) + 1
-        end_col = max(from_col, to_col)
-        for col in range(start_col, end_col):
-            if self.board[from_row][col]:
-                return False
-
-        # Check if king would be in check at any point during castling
-        king = self.board[from_row][from_col]
-        direction = 1 if to_col > from_col else -1
-        
-        # Check the king's current position and the two squares it will pass through
-        for offset in [0, 1, 2]:
-            test_col = from_col + (direction * offset)
-            # Temporarily move the king to the test position
-            self.board[from_row][from_col] = None
-            original_piece = self.board[from_row][test_col]
-            self.board[from_row][test_col] = king
-            
-            # Check if the king would be in check at this position
-            in_check = self._is_in_check(self.current_player)
-            
-            # Move the king back
-            self.board[from_row][from_col] = king
-            self.board[from_row][test_col] = original_piece
-            
-            if in_check:
-                return False
-
-        return True
-
-    def _validate_piece_move(
-        self, piece_type: str, from_pos: Tuple[int, int], to_pos: Tuple[int, int]
-    ) -> bool:
-        """Validate move based on piece type"""
-        from_row, from_col = from_pos
-        to_row, to_col = to_pos
-        
-        # Get the piece being moved
+        # Check if there's a piece of the player at the source
         piece = self.board[from_row][from_col]
-        if not piece:
+        if not piece or piece.color != player:
             return False
-        
-        piece_color = piece.color
 
-        # Check if the destination square is occupied by a friendly piece
-        target_piece = self.board[to_row][to_col]
-        if target_piece and target_piece.color == piece_color:
-            return False
+        move = (from_row, from_col, to_row, to_col, bool(move_data.get('castling', False)))
+        return move in self._legal_move_list(player)
+
+    def _legal_move_list(self, color: str) -> Tuple[Tuple[int, int, int, int, bool], ...]:
+        """
+        Generate all legal moves for color as (from_row, from_col, to_row, to_col,
+        castling) tuples from the bitboard position. Memoized per position.
+        """
+        return self._position().legal_moves(color, self.en_passant_target)
+
+    def _square_key(self, row: int, col: int) -> int:
+        piece = self.board[row][col]
+        return ZOBRIST[(piece.piece_type, piece.color, row, col)] if piece else 0
+
+    def _castling_key(self) -> int:
+        """Zobrist key of the castling rights (unmoved king and rook pairs)"""
+        key = 0
+        for color, row in (("w", 0), ("b", 7)):
+            king = self.board[row][4]
+            if not king or king.piece_type != "k" or king.color != color or king.has_moved:
+                continue
+            for rook_col in (0, 7):
+                rook = self.board[row][rook_col]
+                if rook and rook.piece_type == "r" and rook.color == color and not rook.has_moved:
+                    key ^= ZOBRIST[("castling", color, rook_col)]
+        return key
+
+    def _en_passant_key(self, to_move: str) -> int:
+        """Zobrist key of the en passant file, only if to_move has a pawn that can use it"""
+        if not self.en_passant_target:
+            return 0
+        row, col = self.en_passant_target
+        pawn_row = row - (1 if to_move == "w" else -1)
+        if not 0 <= pawn_row < 8:
+            return 0
+        for pawn_col in (col - 1, col + 1):
+            if 0 <= pawn_col < 8:
+                piece = self.board[pawn_row][pawn_col]
+                if piece and piece.piece_type == "p" and piece.color == to_move:
+                    return ZOBRIST[("en_passant", col)]
+        return 0
+
+    def _state_key(self, to_move: str) -> int:
+        """Zobrist key of everything but the piece placement"""
+        key = self._castling_key() ^ self._en_passant_key(to_move)
+        if to_move == "b":
+            key ^= ZOBRIST["black_to_move"]
+        return key
+
+    def _compute_zobrist_key(self) -> int:
+        """Zobrist key of the current position, computed from scratch"""
+        key = self._state_key(self.current_player)
+        for row in range(self.BOARD_SIZE):
+            for col in range(self.BOARD_SIZE):
+                key ^= self._square_key(row, col)
+        return key
 
-        # Check for piece in the way
-        if piece_type in ["r", "b", "q"]:
-            if not self._check_path_clear(from_pos, to_pos):
-                return False
-
-        if piece_type == "p":  # Pawn
-            direction = 1 if piece_color == "w" else -1
-            start_row = 1 if piece_color == "w" else 6
-
-            # Check for en passant capture first
-            if self.en_passant_target and (to_row, to_col) == self.en_passant_target:
-                # For en passant, the target square is empty, but the captured pawn is on an adjacent file
-                # Check if moving diagonally one square in the correct direction
-                col_diff = abs(from_col - to_col)
-                row_diff = to_row - from_row
-                
-                # For en passant, the row difference should be -1 for white (moving up) and 1 for black (moving down)
-                # because rows increase as we go down the board (0 is the top row, 7 is the bottom row)
-                expected_row_diff = -1 if piece_color == 'w' else 1
-                
-                if col_diff == 1 and row_diff == expected_row_diff:
-                    # The actual captured pawn is on the same rank as the moving pawn, same file as the target
-                    captured_pawn_row = from_row
-                    captured_pawn_col = to_col
-                    
-                    # Check if there's an opponent's pawn that can be captured en passant
-                    if (0 <= captured_pawn_row < 8 and 0 <= captured_pawn_col < 8 and
-                        self.board[captured_pawn_row][captured_pawn_col] and
-                        self.board[captured_pawn_row][captured_pawn_col].piece_type == 'p' and
-                        self.board[captured_pawn_row][captured_pawn_col].color != piece_color):
-                        return True
-        
-            if from_col == to_col:  # Moving forward
-                # Check if destination is occupied
-                if self.board[to_row][to_col] is not None:
-                    return False
-                
-                # Check for valid move distance
-                if abs(to_row - from_row) > 2:
-                    return False
-                if abs(to_row - from_row) == 0:  # Not moving
-                    return False
-                
-                # Check for one square move
-                if (piece_color == "w" and to_row - from_row == 1) or \
-                   (piece_color == "b" and from_row - to_row == 1):
-                    return True
-                
-                # Check for two-square move (only from starting position)
-                if from_row != start_row:
-                    return False
-                
-                # Check if the path is clear (only need to check the square in between)
-                if piece_color == "w" and self.board[from_row + 1][from_col] is not None:
-                    return False
-                if piece_color == "b" and self.board[from_row - 1][from_col] is not None:
-                    return False
-                
-                return True
-                    
-            else:  # Standard capture (not en passant)
-                # Must move diagonally one square
-                if abs(to_col - from_col) != 1 or abs(to_row - from_row) != 1:
-                    return False
-                    
-                # Must capture opponent's piece
-                target = self.board[to_row][to_col]
-                if target is None or target.color == piece_color:
-                    return False
-                    
-                return True
-
-        elif piece_type == "r":  # Rook
-            return from_row == to_row or from_col == to_col
-
-        elif piece_type == "n":  # Knight
-            # Knight moves in an L-shape: 2 squares in one direction and 1 square perpendicular
-            row_diff = abs(to_row - from_row)
-            col_diff = abs(to_col - from_col)
-            return (row_diff == 2 and col_diff == 1) or (row_diff == 1 and col_diff == 2)
-
-        elif piece_type == "b":  # Bishop
-            return abs(to_row - from_row) == abs(to_col - from_col)
-
-        elif piece_type == "q":  # Queen
-            return (
-                abs(to_row - from_row) == abs(to_col - from_col)
-                or from_row == to_row
-                or from_col == to_col
-            )
-
-        elif piece_type == "k":  # King
-            return abs(to_row - from_row) <= 1 and abs(to_col - from_col) <= 1
-
-        return False
-
-    def _check_path_clear(
-        self, from_pos: Tuple[int, int], to_pos: Tuple[int, int]
-    ) -> bool:
-        """Check if path between positions is clear"""
-        from_row, from_col = from_pos
-        to_row, to_col = to_pos
-
-        if from_row == to_row:  # Horizontal
-            start_col = min(from_col, to_col) + 1
-            end_col = max(from_col, to_col)
-            for col in range(start_col, end_col):
-                if self.board[from_row][col]:
-                    return False
-        elif from_col == to_col:  # Vertical
-            start_row = min(from_row, to_row) + 1
-            end_row = max(from_row, to_row)
-            for row in range(start_row, end_row):
-                if self.board[row][from_col]:
-                    return False
-        else:  # Diagonal
-            row_dir = 1 if to_row > from_row else -1
-            col_dir = 1 if to_col > from_col else -1
-
-            row = from_row + row_dir
-            col = from_col + col_dir
-
-            while row != to_row and col != to_col:
-                if self.board[row][col]:
-                    return False
-                row += row_dir
-                col += col_dir
-
-        return True
+    def _reset_repetitions(self) -> None:
+        """Restart repetition tracking from the current position"""
+        self.zobrist_key = self._compute_zobrist_key()
+        self.repetitions = RepetitionIndex()
+        self.repetitions.push(self.zobrist_key)
+
+    def repetition_count(self) -> int:
+        """How many times the current position has occurred (threefold repetition is a draw)"""
+        return self.repetitions.count(self.zobrist_key)
 
     def make_move(self, move_data: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a move and update game state"""
@@ -445,6 +219,15 @@ class ChessGame(AbstractGame):
 
         # Get the piece being moved
         piece = self.board[from_row][from_col]
+
+        # Squares a move can change (castling rook and en passant squares
+        # included); their keys are XORed out now and back in after the move
+        touched = {(from_row, from_col), (to_row, to_col), (from_row, to_col)}
+        touched.update((from_row, rook_col) for rook_col in (0, 3, 5, 7))
+        zobrist_key = self.zobrist_key ^ self._state_key(self.current_player)
+        for row, col in touched:
+            zobrist_key ^= self._square_key(row, col)
+
         piece.has_moved = True
 
         # Handle castling
@@ -474,6 +257,11 @@ class ChessGame(AbstractGame):
         self.board[to_row][to_col] = piece
         self.board[from_row][from_col] = None
 
+        for row, col in touched:
+            zobrist_key ^= self._square_key(row, col)
+        self.zobrist_key = zobrist_key ^ self._state_key("b" if self.current_player == "w" else "w")
+        self.repetitions.push(self.zobrist_key)
+
         # Check for 50-move rule before updating counters
         if self.halfmove_clock >= 50:
             return self.get_game_state()
@@ -487,23 +275,18 @@ class ChessGame(AbstractGame):
         if self.current_player == "b":
             self.fullmove_number += 1
 
-        # Add move to history
-        move = GameMove(
-            player=self.current_player,
-            move_data={
-                "from_row": from_row,
-                "from_col": from_col,
-                "to_row": to_row,
-                "to_col": to_col,
-                "piece_type": piece.piece_type,
-                "color": piece.color,
-                "en_passant": self.en_passant_target,
-                "halfmove_clock": self.halfmove_clock,
-                "fullmove_number": self.fullmove_number,
-            },
-            timestamp=time.time(),
+        # Add move to history, with what it did for readers of the history
+        self._record_move(
+            self.current_player,
+            dict(
+                move_data,
+                piece_type=piece.piece_type,
+                color=piece.color,
+                en_passant=self.en_passant_target,
+                halfmove_clock=self.halfmove_clock,
+                fullmove_number=self.fullmove_number,
+            ),
         )
-        self.history.add_move(move)
 
         # Reset en passant target after the move is complete.
         # This logic is based on the piece that just moved (referenced by 'piece', 'to_row', 'from_row').
@@ -608,140 +391,37 @@ class ChessGame(AbstractGame):
         # Check for 50-move rule
         if self.halfmove_clock >= 50:
             return True
-            
+
         # Check for insufficient material
         if self._is_insufficient_material():
             return True
-            
-        # Check if current player has any legal moves
-        # First, check if the current player's king is in check
-        in_check = self._is_in_check(self.current_player)
-        
-        # Then check for any legal moves
-        for from_row in range(self.BOARD_SIZE):
-            for from_col in range(self.BOARD_SIZE):
-                piece = self.board[from_row][from_col]
-                if piece and piece.color == self.current_player:
-                    for to_row in range(self.BOARD_SIZE):
-                        for to_col in range(self.BOARD_SIZE):
-                            if from_row == to_row and from_col == to_col:
-                                continue
-                                
-                            # Skip if not a valid move for this piece
-                            if not self._validate_piece_move(piece.piece_type, (from_row, from_col), (to_row, to_col)):
-                                continue
-                            
-                            # Make the move
-                            original_piece_at_from = self.board[from_row][from_col]
-                            original_piece_at_to = self.board[to_row][to_col]
-                            
-                            self.board[to_row][to_col] = original_piece_at_from
-                            self.board[from_row][from_col] = None
-                            
-                            # Check if king is in check after the move
-                            still_in_check_after_simulated_move = self._is_in_check(self.current_player)
-                            
-                            # Undo the move
-                            self.board[from_row][from_col] = original_piece_at_from
-                            self.board[to_row][to_col] = original_piece_at_to
-                            
-                            # If this move gets us out of check, it's a legal move
-                            if not still_in_check_after_simulated_move:
-                                return False  # Found a legal move
-        
-        # If we get here, there are no legal moves
-        return True
+
+        # Check for threefold repetition
+        if self.repetition_count() >= 3:
+            return True
+
+        # Checkmate or stalemate: the current player has no legal moves
+        return not self._legal_move_list(self.current_player)
 
     def _is_stalemate(self) -> bool:
         """Check for stalemate"""
-        # Check if current player has any legal moves
-        for row in range(self.BOARD_SIZE):
-            for col in range(self.BOARD_SIZE):
-                piece = self.board[row][col]
-                if piece and piece.color == self.current_player:
-                    for to_row in range(self.BOARD_SIZE):
-                        for to_col in range(self.BOARD_SIZE):
-                            if self.validate_move(
-                                {
-                                    "from_row": row,
-                                    "from_col": col,
-                                    "to_row": to_row,
-                                    "to_col": to_col,
-                                    "player": self.current_player,
-                                }
-                            ):
-                                return False
-        return True
+        return not self._legal_move_list(self.current_player) and not self._is_in_check(self.current_player)
 
     def get_winner(self) -> Optional[str]:
         """Get the winner if game is over"""
         # Check if either king is missing (e.g. captured, though this shouldn't happen before checkmate)
-        white_king_present = any(piece and piece.piece_type == "k" and piece.color == "w" for r in self.board for piece in r)
-        black_king_present = any(piece and piece.piece_type == "k" and piece.color == "b" for r in self.board for piece in r)
-
-        if not white_king_present:
+        if not self._find_king("w"):
             return "b"
-        if not black_king_present:
+        if not self._find_king("b"):
             return "w"
-        
-        # Check for game end conditions based on the current player (whose turn it would be)
-        if self.is_game_over(): # This checks if self.current_player has no legal moves
-            if self._is_in_check(self.current_player):
-                # If current player is in check and has no legal moves, it's checkmate.
-                # The *other* player wins.
-                return "b" if self.current_player == "w" else "w"
-            else:
-                # If current player has no legal moves but is NOT in check, it's stalemate.
-                return None # Draw
-                
-        # Check for other draw conditions that might not be caught by is_game_over (e.g. 50-move, insufficient material)
-        # These are typically checked before determining if a player has legal moves.
-        # However, is_game_over already checks these, so this might be redundant if is_game_over is comprehensive.
-        if self.halfmove_clock >= 50:
-            return None  # Draw
-            
-        if self._is_insufficient_material():
-            return None  # Draw
-            
-        return None # Game is not over, or it's a draw condition not yet handled
-            
+
+        # Checkmate: the current player (whose turn it would be) is in check and
+        # has no legal moves, so the *other* player wins. Stalemate, the 50-move
+        # rule and insufficient material are draws.
+        if self._has_no_legal_moves() and self._is_in_check(self.current_player):
+            return "b" if self.current_player == "w" else "w"
+        return None
+
     def _has_no_legal_moves(self) -> bool:
         """Check if the current player has any legal moves"""
-        for from_row in range(self.BOARD_SIZE):
-            for from_col in range(self.BOARD_SIZE):
-                piece = self.board[from_row][from_col]
-                if piece and piece.color == self.current_player:
-                    # For each piece, check all possible moves
-                    for to_row in range(self.BOARD_SIZE):
-                        for to_col in range(self.BOARD_SIZE):
-                            # Skip if it's the same position
-                            if from_row == to_row and from_col == to_col:
-                                continue
-                            
-                            # Skip if the destination has a piece of the same color
-                            dest_piece = self.board[to_row][to_col]
-                            if dest_piece and dest_piece.color == self.current_player:
-                                continue
-                            
-                            # Check if the move is valid for this piece type
-                            if not self._validate_piece_move(piece.piece_type, (from_row, from_col), (to_row, to_col)):
-                                continue
-                            
-                            # Make a copy of the board to test the move
-                            original_piece = self.board[to_row][to_col]
-                            self.board[to_row][to_col] = piece
-                            self.board[from_row][from_col] = None
-                            
-                            # Check if the king is in check after the move
-                            king_in_check = self._is_in_check(self.current_player)
-                            
-                            # Restore the board
-                            self.board[from_row][from_col] = piece
-                            self.board[to_row][to_col] = original_piece
-                            
-                            # If the move doesn't leave the king in check, it's a legal move
-                            if not king_in_check:
-                                return False
-        
-        # If we get here, no legal moves were found
-        return True
+        return not self._legal_move_list(self.current_player)
@@ -0,0 +1,368 @@
+"""
+Bitboard representation of a chess position.
+
+Squares are numbered ``row * 8 + col`` using the same coordinates as
+``ChessGame.board`` (white starts on rows 0-1 and moves towards row 7). Each
+(color, piece type) pair is a 64-bit integer with one bit per occupied square.
+Knight, king and pawn attacks come from tables precomputed at import time and
+sliding attacks are resolved with ray tables, so attack, check and move
+queries are set operations instead of board scans.
+"""
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+COLORS = ("w", "b")
+PIECE_TYPES = ("p", "n", "b", "r", "q", "k")
+
+ROOK_DIRECTIONS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+BISHOP_DIRECTIONS = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+KNIGHT_OFFSETS = ((2, 1), (1, 2), (-1, 2), (-2, 1), (-2, -1), (-1, -2), (1, -2), (2, -1))
+KING_OFFSETS = ROOK_DIRECTIONS + BISHOP_DIRECTIONS
+PAWN_DIRECTION = {"w": 1, "b": -1}
+PAWN_START_ROW = {"w": 1, "b": 6}
+
+# Light squares: (row + col) odd
+LIGHT_SQUARES = sum(1 << (r * 8 + c) for r in range(8) for c in range(8) if (r + c) % 2)
+
+Move = Tuple[int, int, int, int, bool]
+
+
+def popcount(bb: int) -> int:
+    return bin(bb).count("1")
+
+
+def lsb(bb: int) -> int:
+    """Index of the least significant set bit"""
+    return (bb & -bb).bit_length() - 1
+
+
+def msb(bb: int) -> int:
+    """Index of the most significant set bit"""
+    return bb.bit_length() - 1
+
+
+def squares(bb: int):
+    """Yield the index of every set bit, lowest first"""
+    while bb:
+        low = bb & -bb
+        yield low.bit_length() - 1
+        bb ^= low
+
+
+def _offset_table(offsets: Sequence[Tuple[int, int]]) -> List[int]:
+    table = []
+    for sq in range(64):
+        row, col = divmod(sq, 8)
+        bb = 0
+        for dr, dc in offsets:
+            r, c = row + dr, col + dc
+            if 0 <= r < 8 and 0 <= c < 8:
+                bb |= 1 << (r * 8 + c)
+        table.append(bb)
+    return table
+
+
+def _ray_table(dr: int, dc: int) -> List[int]:
+    table = []
+    for sq in range(64):
+        row, col = divmod(sq, 8)
+        bb = 0
+        r, c = row + dr, col + dc
+        while 0 <= r < 8 and 0 <= c < 8:
+            bb |= 1 << (r * 8 + c)
+            r += dr
+            c += dc
+        table.append(bb)
+    return table
+
+
+KNIGHT_ATTACKS = _offset_table(KNIGHT_OFFSETS)
+KING_ATTACKS = _offset_table(KING_OFFSETS)
+# PAWN_ATTACKS[color][sq]: squares a pawn of color on sq attacks
+PAWN_ATTACKS = {
+    color: _offset_table(((PAWN_DIRECTION[color], -1), (PAWN_DIRECTION[color], 1)))
+    for color in COLORS
+}
+# Rays per direction, with a flag telling whether the direction increases the index
+RAYS = {d: _ray_table(*d) for d in ROOK_DIRECTIONS + BISHOP_DIRECTIONS}
+POSITIVE = {d: d[0] * 8 + d[1] > 0 for d in RAYS}
+
+
+def _between_table() -> List[List[int]]:
+    """BETWEEN[a][b]: squares strictly between two aligned squares (0 if not aligned)"""
+    table = [[0] * 64 for _ in range(64)]
+    for a in range(64):
+        for d, rays in RAYS.items():
+            ray = rays[a]
+            for b in squares(ray):
+                table[a][b] = ray & ~rays[b] & ~(1 << b)
+    return table
+
+
+BETWEEN = _between_table()
+
+
+def ray_attacks(sq: int, occupied: int, directions: Sequence[Tuple[int, int]]) -> int:
+    """Sliding attacks from sq along directions, stopping at the first blocker"""
+    attacks = 0
+    for d in directions:
+        ray = RAYS[d][sq]
+        blockers = ray & occupied
+        if blockers:
+            first = lsb(blockers) if POSITIVE[d] else msb(blockers)
+            ray ^= RAYS[d][first]
+        attacks |= ray
+    return attacks
+
+
+def rook_attacks(sq: int, occupied: int) -> int:
+    return ray_attacks(sq, occupied, ROOK_DIRECTIONS)
+
+
+def bishop_attacks(sq: int, occupied: int) -> int:
+    return ray_attacks(sq, occupied, BISHOP_DIRECTIONS)
+
+
+class BitboardPosition:
+    """Piece placement as one bitboard per (color, piece type) plus a moved mask"""
+
+    def __init__(self):
+        self.pieces: Dict[str, Dict[str, int]] = {
+            color: {piece_type: 0 for piece_type in PIECE_TYPES} for color in COLORS
+        }
+        self.occupancy: Dict[str, int] = {color: 0 for color in COLORS}
+        # Squares whose piece has moved (castling rights)
+        self.moved = 0
+
+    @property
+    def occupied(self) -> int:
+        return self.occupancy["w"] | self.occupancy["b"]
+
+    def put(self, sq: int, piece_type: str, color: str, has_moved: bool = False) -> None:
+        bit = 1 << sq
+        self.pieces[color][piece_type] |= bit
+        self.occupancy[color] |= bit
+        if has_moved:
+            self.moved |= bit
+
+    def piece_at(self, sq: int) -> Optional[Tuple[str, str]]:
+        """(color, piece type) on sq, or None"""
+        bit = 1 << sq
+        for color in COLORS:
+            if self.occupancy[color] & bit:
+                for piece_type, bb in self.pieces[color].items():
+                    if bb & bit:
+                        return color, piece_type
+        return None
+
+    @classmethod
+    def from_board(cls, board: Sequence[Sequence[Any]]) -> "BitboardPosition":
+        """Build from a ChessGame.board grid of ChessPiece objects"""
+        position = cls()
+        for row, cells in enumerate(board):
+            for col, piece in enumerate(cells):
+                if piece is not None:
+                    position.put(row * 8 + col, piece.piece_type, piece.color, piece.has_moved)
+        return position
+
+    @classmethod
+    def from_state(cls, board: Sequence[Sequence[Optional[Dict[str, Any]]]]) -> "BitboardPosition":
+        """Build from the "board" of ChessGame.get_game_state()"""
+        position = cls()
+        for row, cells in enumerate(board):
+            for col, cell in enumerate(cells):
+                if cell is not None:
+                    position.put(row * 8 + col, cell["type"], cell["color"], cell.get("has_moved", False))
+        return position
+
+    def to_state(self) -> List[List[Optional[Dict[str, Any]]]]:
+        """Board in the ChessGame.get_game_state() format"""
+        board: List[List[Optional[Dict[str, Any]]]] = [[None] * 8 for _ in range(8)]
+        for color in COLORS:
+            for piece_type, bb in self.pieces[color].items():
+                for sq in squares(bb):
+                    board[sq // 8][sq % 8] = {
+                        "type": piece_type,
+                        "color": color,
+                        "has_moved": bool(self.moved >> sq & 1),
+                    }
+        return board
+
+    def king_square(self, color: str) -> Optional[int]:
+        kings = self.pieces[color]["k"]
+        return lsb(kings) if kings else None
+
+    def attackers_to(self, sq: int, by_color: str, occupied: Optional[int] = None) -> int:
+        """Bitboard of by_color pieces attacking sq given the occupancy"""
+        if occupied is None:
+            occupied = self.occupied
+        enemy = self.pieces[by_color]
+        other = "b" if by_color == "w" else "w"
+        return (
+            (PAWN_ATTACKS[other][sq] & enemy["p"])
+            | (KNIGHT_ATTACKS[sq] & enemy["n"])
+            | (KING_ATTACKS[sq] & enemy["k"])
+            | (rook_attacks(sq, occupied) & (enemy["r"] | enemy["q"]))
+            | (bishop_attacks(sq, occupied) & (enemy["b"] | enemy["q"]))
+        )
+
+    def is_attacked(self, sq: int, by_color: str, occupied: Optional[int] = None) -> bool:
+        return bool(self.attackers_to(sq, by_color, occupied))
+
+    def in_check(self, color: str) -> bool:
+        king = self.king_square(color)
+        if king is None:
+            return False
+        return self.is_attacked(king, "b" if color == "w" else "w")
+
+    def insufficient_material(self) -> bool:
+        """Only kings, kings plus one minor piece, or two bishops on the same color"""
+        kings = self.pieces["w"]["k"] | self.pieces["b"]["k"]
+        others = self.occupied & ~kings
+        count = popcount(others)
+        if count == 0:
+            return True
+        bishops = self.pieces["w"]["b"] | self.pieces["b"]["b"]
+        knights = self.pieces["w"]["n"] | self.pieces["b"]["n"]
+        if count == 1:
+            return bool(others & (bishops | knights))
+        if count == 2 and others == bishops:
+            return not (bishops & LIGHT_SQUARES) or not (bishops & ~LIGHT_SQUARES)
+        return False
+
+    def pseudo_targets(self, sq: int, piece_type: str, color: str) -> int:
+        """Destinations of the piece on sq, ignoring checks, castling and en passant"""
+        own = self.occupancy[color]
+        occupied = self.occupied
+        if piece_type == "p":
+            enemy = occupied & ~own
+            targets = PAWN_ATTACKS[color][sq] & enemy
+            row, col = divmod(sq, 8)
+            step = row + PAWN_DIRECTION[color]
+            if 0 <= step < 8 and not occupied >> (step * 8 + col) & 1:
+                targets |= 1 << (step * 8 + col)
+                double = step + PAWN_DIRECTION[color]
+                if row == PAWN_START_ROW[color] and 0 <= double < 8 and not occupied >> (double * 8 + col) & 1:
+                    targets |= 1 << (double * 8 + col)
+            return targets
+        if piece_type == "n":
+            return KNIGHT_ATTACKS[sq] & ~own
+        if piece_type == "k":
+            return KING_ATTACKS[sq] & ~own
+        attacks = 0
+        if piece_type in ("r", "q"):
+            attacks |= rook_attacks(sq, occupied)
+        if piece_type in ("b", "q"):
+            attacks |= bishop_attacks(sq, occupied)
+        return attacks & ~own
+
+    def legal_moves(self, color: str, en_passant: Optional[Tuple[int, int]] = None) -> Tuple[Move, ...]:
+        """
+        All legal moves for color as (from_row, from_col, to_row, to_col, castling).
+        Without a king (test setups) every pseudo-legal move is legal.
+        """
+        opponent = "b" if color == "w" else "w"
+        own_pieces = self.pieces[color]
+        occupied = self.occupied
+        king = self.king_square(color)
+        moves: List[Move] = []
+
+        def add(from_sq: int, targets: int, castling: bool = False) -> None:
+            from_row, from_col = divmod(from_sq, 8)
+            for to_sq in squares(targets):
+                moves.append((from_row, from_col, to_sq // 8, to_sq % 8, castling))
+
+        evasion = ~0
+        pinned: Dict[int, int] = {}
+        if king is not None:
+            # King steps, tested with the king lifted off the board so that
+            # sliders attacking through its current square are seen
+            without_king = occupied & ~(1 << king)
+            targets = 0
+            for to_sq in squares(self.pseudo_targets(king, "k", color)):
+                if not self.attackers_to(to_sq, opponent, without_king):
+                    targets |= 1 << to_sq
+            add(king, targets)
+
+            checkers = self.attackers_to(king, opponent)
+            if popcount(checkers) > 1:
+                return tuple(moves)  # Double check: only the king can move
+            if checkers:
+                checker = lsb(checkers)
+                evasion = checkers | BETWEEN[king][checker]
+            else:
+                self._add_castling(king, color, opponent, add)
+            pinned = self._pins(king, color, opponent)
+
+        for piece_type, bb in own_pieces.items():
+            if piece_type == "k" and king is not None:
+                bb &= ~(1 << king)
+            for sq in squares(bb):
+                targets = self.pseudo_targets(sq, piece_type, color) & evasion
+                if sq in pinned:
+                    targets &= pinned[sq]
+                add(sq, targets)
+
+        if en_passant is not None:
+            moves.extend(self._en_passant_moves(color, opponent, king, en_passant))
+        return tuple(moves)
+
+    def _pins(self, king: int, color: str, opponent: str) -> Dict[int, int]:
+        """Map each absolutely pinned piece of color to the squares it may move to"""
+        enemy = self.pieces[opponent]
+        occupied = self.occupied
+        snipers = (rook_attacks(king, 0) & (enemy["r"] | enemy["q"])) | (
+            bishop_attacks(king, 0) & (enemy["b"] | enemy["q"])
+        )
+        pinned = {}
+        for sniper in squares(snipers):
+            blockers = BETWEEN[king][sniper] & occupied
+            if blockers and blockers & (blockers - 1) == 0 and blockers & self.occupancy[color]:
+                pinned[lsb(blockers)] = BETWEEN[king][sniper] | (1 << sniper)
+        return pinned
+
+    def _add_castling(self, king: int, color: str, opponent: str, add) -> None:
+        """Castling moves; the caller guarantees the king is not in check"""
+        if self.moved >> king & 1:
+            return
+        row, col = divmod(king, 8)
+        rooks = self.pieces[color]["r"] & ~self.moved
+        occupied = self.occupied
+        for rook_col, direction in ((7, 1), (0, -1)):
+            to_col = col + 2 * direction
+            rook = row * 8 + rook_col
+            if not 0 <= to_col < 8 or not rooks >> rook & 1:
+                continue
+            if BETWEEN[king][rook] & occupied:
+                continue
+            if any(self.is_attacked(king + direction * step, opponent) for step in (1, 2)):
+                continue
+            add(king, 1 << (row * 8 + to_col), castling=True)
+
+    def _en_passant_moves(
+        self, color: str, opponent: str, king: Optional[int], en_passant: Tuple[int, int]
+    ) -> List[Move]:
+        """
+        Captures onto the en passant target. The captured pawn sits on the
+        mover's rank and the target's file; legality is checked on the
+        occupancy after the capture, which also covers rank pins.
+        """
+        target_row, target_col = en_passant
+        target = target_row * 8 + target_col
+        occupied = self.occupied
+        if occupied >> target & 1:
+            return []
+        moves = []
+        enemy_pawns = self.pieces[opponent]["p"]
+        for sq in squares(self.pieces[color]["p"]):
+            row, col = divmod(sq, 8)
+            if abs(target_row - row) != 1 or abs(target_col - col) != 1:
+                continue
+            captured = row * 8 + target_col
+            if not enemy_pawns >> captured & 1:
+                continue
+            if king is not None:
+                after = (occupied & ~(1 << sq) & ~(1 << captured)) | (1 << target)
+                if self.attackers_to(king, opponent, after) & ~(1 << captured):
+                    continue
+            moves.append((row, col, target_row, target_col, False))
+        return moves
@@ -0,0 +1,194 @@
+"""
+Shared engine for climbing card games (Big 2, Tien Len, Daifugo).
+
+Cards are ints ``rank * 4 + suit``: ranks 0..12 are 3 up to 2, suits are
+♣ ♦ ♥ ♠ from low to high, and the two jokers share rank 13 (small joker 52,
+big joker 53), so comparing codes compares cards. Hands and plays are
+bitmasks over those codes; the four bits of rank r are ``(mask >> 4r) & 15``.
+
+A play is classified from its per-rank bit groups with small tables: a
+single occupied rank is a single, pair, triple or four of a kind by its card
+count, and one card on each rank of a table of consecutive rank runs is a
+straight (a straight flush if one suit holds it). Plays of the same type and
+size compare by key; bombs beat everything else, and the rules can rank
+some types against each other (Big 2's five-card hands).
+
+Codes and decks come from games.cards; CARDS maps them to the API's
+``{"suit", "rank"}`` dicts.
+"""
+from enum import Enum
+from itertools import combinations, product
+from typing import Dict, List, NamedTuple, Optional, Tuple
+import numpy as np
+
+from games.cards import CardSet, hand_mask
+
+SUITS = ["♣", "♦", "♥", "♠"]
+RANKS = ["3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A", "2"]
+JOKER_RANK = 13
+SMALL_JOKER = JOKER_RANK * 4
+BIG_JOKER = JOKER_RANK * 4 + 1
+CARDS = CardSet(
+    [{"suit": suit, "rank": rank} for rank in RANKS for suit in SUITS]
+    + [{"suit": "", "rank": "joker"}, {"suit": "", "rank": "Joker"}]
+)
+
+
+class CardType(Enum):
+    SINGLE = 1
+    PAIR = 2
+    TRIPLE = 3
+    STRAIGHT = 4
+    FULL_HOUSE = 5
+    FOUR_OF_A_KIND = 6
+    STRAIGHT_FLUSH = 7
+
+
+class Rules(NamedTuple):
+    min_straight: int = 3
+    # Types that beat any other play; later ones beat earlier ones
+    bombs: Tuple[CardType, ...] = ()
+    # Types that beat each other, in this order, when they have as many cards
+    ranked: Tuple[CardType, ...] = ()
+
+
+class Play(NamedTuple):
+    cards: int
+    type: CardType
+    size: int
+    key: int
+
+
+SET_TYPES = {1: CardType.SINGLE, 2: CardType.PAIR, 3: CardType.TRIPLE, 4: CardType.FOUR_OF_A_KIND}
+POPCOUNT4 = [bin(nibble).count("1") for nibble in range(16)]
+# Subsets of each rank's bit group by size, for enumerating plays
+SUBSETS: List[Dict[int, List[int]]] = [
+    {
+        size: [sum(1 << b for b in chosen) for chosen in combinations([b for b in range(4) if nibble >> b & 1], size)]
+        for size in range(1, 5)
+    }
+    for nibble in range(16)
+]
+# Rank masks of consecutive runs (jokers never join one) -> (lowest rank, length)
+RUNS: Dict[int, Tuple[int, int]] = {
+    ((1 << length) - 1) << low: (low, length)
+    for length in range(2, JOKER_RANK + 1)
+    for low in range(JOKER_RANK - length + 1)
+}
+SUIT_MASKS = [sum(1 << (rank * 4 + suit) for rank in range(JOKER_RANK)) for suit in range(4)]
+
+
+def card_code(suit: str, rank: str) -> int:
+    return CARDS.code({"suit": suit, "rank": rank})
+
+
+def card_dict(code: int) -> Dict[str, str]:
+    return CARDS.faces[code]
+
+
+def new_deck(jokers: bool = False) -> np.ndarray:
+    """Every card code as a uint8 array, with or without the jokers"""
+    deck = CARDS.deck()
+    return deck if jokers else deck[:SMALL_JOKER]
+
+
+def parse_cards(cards: List[Dict[str, str]]) -> Optional[int]:
+    """Mask of a list of card dicts, or None if one is malformed or repeated"""
+    try:
+        codes = CARDS.codes(cards)
+    except ValueError:
+        return None
+    mask = hand_mask(codes)
+    return mask if codes and bin(mask).count("1") == len(codes) else None
+
+
+def card_dicts(mask: int) -> List[Dict[str, str]]:
+    return CARDS.mask_faces(mask)
+
+
+def classify(cards: int, rules: Rules) -> Optional[Play]:
+    """The play a card mask makes under the rules, or None if it is not one"""
+    if not cards:
+        return None
+    rank_mask = 0
+    counts = []
+    for rank in range(JOKER_RANK + 1):
+        count = POPCOUNT4[cards >> (4 * rank) & 15]
+        if count:
+            rank_mask |= 1 << rank
+            counts.append(count)
+    size = sum(counts)
+    top = cards.bit_length() - 1
+
+    if len(counts) == 1:
+        return Play(cards, SET_TYPES[size], size, top)
+    run = RUNS.get(rank_mask)
+    if run is not None and size == run[1] >= rules.min_straight:
+        flush = any(cards & ~suit_mask == 0 for suit_mask in SUIT_MASKS)
+        return Play(cards, CardType.STRAIGHT_FLUSH if flush else CardType.STRAIGHT, size, top)
+    if sorted(counts) == [2, 3]:
+        triple = next(r for r in range(JOKER_RANK) if POPCOUNT4[cards >> (4 * r) & 15] == 3)
+        return Play(cards, CardType.FULL_HOUSE, size, triple)
+    return None
+
+
+def _kind(card_type: CardType, rules: Rules) -> CardType:
+    # A straight flush only stands apart where the rules rank it separately
+    if card_type == CardType.STRAIGHT_FLUSH and card_type not in rules.bombs + rules.ranked:
+        return CardType.STRAIGHT
+    return card_type
+
+
+def beats(play: Play, table: Play, rules: Rules) -> bool:
+    """Whether play can be laid on table"""
+    play_kind, table_kind = _kind(play.type, rules), _kind(table.type, rules)
+    play_bomb, table_bomb = play_kind in rules.bombs, table_kind in rules.bombs
+    if play_bomb or table_bomb:
+        if not (play_bomb and table_bomb):
+            return play_bomb
+        return (rules.bombs.index(play_kind), play.key) > (rules.bombs.index(table_kind), table.key)
+    if play.size != table.size:
+        return False
+    if play_kind in rules.ranked and table_kind in rules.ranked:
+        return (rules.ranked.index(play_kind), play.key) > (rules.ranked.index(table_kind), table.key)
+    return play_kind == table_kind and play.key > table.key
+
+
+def plays(hand: int, rules: Rules) -> List[Play]:
+    """Every play that can be made from a hand"""
+    groups = [hand >> (4 * rank) & 15 for rank in range(JOKER_RANK + 1)]
+    result = []
+    sets: Dict[int, List[int]] = {2: [], 3: []}
+    for rank, group in enumerate(groups):
+        for size in range(1, POPCOUNT4[group] + 1):
+            for subset in SUBSETS[group][size]:
+                cards = subset << (4 * rank)
+                result.append(classify(cards, rules))
+                if size in sets:
+                    sets[size].append(cards)
+
+    for triple in sets[3]:
+        for pair in sets[2]:
+            if (triple.bit_length() - 1) // 4 != (pair.bit_length() - 1) // 4:
+                result.append(classify(triple | pair, rules))
+
+    for low in range(JOKER_RANK):
+        high = low
+        while high < JOKER_RANK and groups[high]:
+            high += 1
+        for end in range(low + rules.min_straight, high + 1):
+            choices = [
+                [1 << (4 * rank + b) for b in range(4) if groups[rank] >> b & 1]
+                for rank in range(low, end)
+            ]
+            for picked in product(*choices):
+                result.append(classify(sum(picked), rules))
+    return result
+
+
+def beating_plays(hand: int, table: Optional[Play], rules: Rules) -> List[Play]:
+    """Every play from a hand that can be laid on table (any play when it is empty)"""
+    candidates = plays(hand, rules)
+    if table is None:
+        return candidates
+    return [play for play in candidates if beats(play, table, rules)]
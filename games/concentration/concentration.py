@@ -1,27 +1,24 @@
 from game_abc import AbstractGame, GameMove, GameHistory
+from games.cards import CardSet, shuffled
 from typing import Dict, Any, Optional, List, Tuple, Set
 import numpy as np
 from enum import Enum
 import time
-import random
 from collections import defaultdict
 
 
-class Card:
-    def __init__(self, value: str, is_face_up: bool = False):
-        self.value = value
-        self.is_face_up = is_face_up
-
-    def to_dict(self) -> Dict[str, Any]:
-        return {"value": self.value, "is_face_up": self.is_face_up}
-
-
 class ConcentrationGame(AbstractGame):
     def __init__(self, game_id: str, board_size: int = 4):
         super().__init__(game_id)
         self.board_size = board_size
+        # One face per pair, valued "1" to "<pairs>"
+        self.cards = CardSet(
+            [{"value": str(value)} for value in range(1, (board_size * board_size) // 2 + 1)]
+        )
         self.current_player = 0
-        self.board = []
+        # Card codes and which of them are face up, per position
+        self.board = np.zeros((board_size, board_size), dtype=np.uint8)
+        self.face_up = np.zeros((board_size, board_size), dtype=bool)
         self.flipped_cards = set()
         self.matches = set()
         self.scores = defaultdict(int)
@@ -30,23 +27,16 @@ class ConcentrationGame(AbstractGame):
 
     def _init_game(self):
         """Initialize a new game"""
+        self.reset_rng()
         self.current_player = 0
         self.phase = "setup"
-        self.board = []
         self.flipped_cards = set()
         self.matches = set()
         self.scores = defaultdict(int)
 
-        # Create pairs of cards
-        values = list(range(1, (self.board_size * self.board_size) // 2 + 1))
-        cards = values + values
-        random.shuffle(cards)
-
-        # Create board
-        self.board = [
-            [Card(str(cards[i * self.board_size + j])) for j in range(self.board_size)]
-            for i in range(self.board_size)
-        ]
+        # Lay out the shuffled pairs
+        self.board = shuffled(self.cards.deck(2), self.rng).reshape(self.board_size, self.board_size)
+        self.face_up = np.zeros((self.board_size, self.board_size), dtype=bool)
 
     def validate_move(self, move_data: Dict[str, Any]) -> bool:
         """Validate if a move is legal"""
@@ -91,28 +81,26 @@ class ConcentrationGame(AbstractGame):
 
         if action == "flip":
             # Flip the card
-            self.board[x][y].is_face_up = True
+            self.face_up[x, y] = True
             self.flipped_cards.add((x, y))
 
             # If this is the second card flipped
             if len(self.flipped_cards) == 2:
                 # Check if they match
-                card1 = self.board[self.flipped_cards.pop()]
-                card2 = self.board[(x, y)]
+                first, second = self.flipped_cards
+                self.flipped_cards.clear()
 
-                if card1.value == card2.value:
+                if self.board[first] == self.board[second]:
                     # Match found!
-                    self.matches.add((x, y))
-                    self.matches.add(self.flipped_cards.pop())
+                    self.matches.update((first, second))
                     self.scores[self.current_player] += 1
 
                     # Check if game is over
-                    if len(self.matches) == (self.board_size * self.board_size) // 2:
+                    if len(self.matches) == self.board.size:
                         self.phase = "end"
                 else:
                     # No match, flip cards back
-                    card1.is_face_up = False
-                    card2.is_face_up = False
+                    self.face_up[first] = self.face_up[second] = False
 
                 # Move to next player
                 self.current_player = (self.current_player + 1) % 2
@@ -122,7 +110,10 @@ class ConcentrationGame(AbstractGame):
     def get_game_state(self) -> Dict[str, Any]:
         """Get the current game state"""
         return {
-            "board": [[card.to_dict() for card in row] for row in self.board],
+            "board": [
+                [dict(face, is_face_up=up) for face, up in zip(self.cards.to_faces(row), ups)]
+                for row, ups in zip(self.board, self.face_up.tolist())
+            ],
             "current_player": self.current_player,
             "phase": self.phase,
             "flipped_cards": list(self.flipped_cards),
@@ -1,8 +1,8 @@
 from game_abc import AbstractGame, GameMove, GameHistory
+from games.k_in_a_row import KInARow
 from typing import Dict, Any, Optional, List, Tuple, Set
 import numpy as np
 from enum import Enum
-import time
 
 
 class Connect6Piece(Enum):
@@ -12,20 +12,30 @@ class Connect6Piece(Enum):
 
 
 class Connect6Game(AbstractGame):
+    WIN_LENGTH = 6
+
     def __init__(self, game_id: str, board_size: int = 19):
-        super().__init__(game_id)
         self.board_size = board_size
-        self.board = np.zeros((board_size, board_size), dtype=int)
-        self.current_player = Connect6Piece.BLACK
-        self.turn = 1  # First turn (Black places two stones)
-        self._init_game()
+        self.lines = KInARow((board_size, board_size), self.WIN_LENGTH)
+        super().__init__(game_id)
 
     def _init_game(self):
         """Initialize a new game"""
         self.board = np.zeros((self.board_size, self.board_size), dtype=int)
+        self.lines.reset()
         self.current_player = Connect6Piece.BLACK
         self.turn = 1
 
+    def initialize_game(self) -> Dict[str, Any]:
+        """Reset the board and start a new game"""
+        self._init_game()
+        return self.get_game_state()
+
+    def _restore_game_state(self) -> None:
+        """Rebuild the position by replaying the recorded turns"""
+        self._init_game()
+        self._replay_moves()
+
     def _is_valid_position(self, x: int, y: int) -> bool:
         """Check if position is on board and empty"""
         return (
@@ -34,44 +44,23 @@ class Connect6Game(AbstractGame):
             and self.board[x, y] == Connect6Piece.EMPTY.value
         )
 
-    def _check_line(self, x: int, y: int, dx: int, dy: int) -> bool:
-        """Check if there's a line of 6 pieces in a direction"""
-        piece = self.board[x, y]
-        if piece == Connect6Piece.EMPTY.value:
-            return False
+    def _apply_move(self, positions: List[Tuple[int, int]]) -> None:
+        piece = self.current_player
+
+        # Place pieces; the lines through each new stone are checked as it lands
+        for x, y in positions:
+            self.board[x, y] = piece.value
+            self.lines.place(x * self.board_size + y, piece.name)
+            if self.lines.winner is not None:
+                return
 
-        count = 1
-        # Check forward direction
-        nx, ny = x + dx, y + dy
-        while (
-            0 <= nx < self.board_size
-            and 0 <= ny < self.board_size
-            and self.board[nx, ny] == piece
-        ):
-            count += 1
-            nx += dx
-            ny += dy
-
-        # Check backward direction
-        nx, ny = x - dx, y - dy
-        while (
-            0 <= nx < self.board_size
-            and 0 <= ny < self.board_size
-            and self.board[nx, ny] == piece
-        ):
-            count += 1
-            nx -= dx
-            ny -= dy
-
-        return count >= 6
-
-    def _check_win(self, x: int, y: int) -> bool:
-        """Check if this move wins the game"""
-        # Check all 8 directions
-        for dx, dy in [(0, 1), (1, 0), (1, 1), (1, -1)]:
-            if self._check_line(x, y, dx, dy):
-                return True
-        return False
+        # Update turn
+        self.turn += 1
+        self.current_player = (
+            Connect6Piece.WHITE
+            if self.current_player == Connect6Piece.BLACK
+            else Connect6Piece.BLACK
+        )
 
     def validate_move(self, move_data: Dict[str, Any]) -> bool:
         """Validate if a move is legal"""
@@ -93,31 +82,21 @@ class Connect6Game(AbstractGame):
             if not self._is_valid_position(x, y):
                 return False
 
-        return True
+        # Both stones of a turn must go to different points
+        if len({(x, y) for x, y in positions}) != len(positions):
+            return False
+
+        return not self.is_game_over()
 
     def make_move(self, move_data: Dict[str, Any]) -> Dict[str, Any]:
         """Make a move in the game"""
         if not self.validate_move(move_data):
             raise ValueError("Invalid move")
 
-        positions = move_data["positions"]
-        piece = self.current_player
-
-        # Place pieces
-        for x, y in positions:
-            self.board[x, y] = piece.value
-
-            # Check if this move wins
-            if self._check_win(x, y):
-                return self.get_game_state()
-
-        # Update turn
-        self.turn += 1
-        self.current_player = (
-            Connect6Piece.WHITE
-            if self.current_player == Connect6Piece.BLACK
-            else Connect6Piece.BLACK
-        )
+        positions = [(int(x), int(y)) for x, y in move_data["positions"]]
+        player = self.current_player.name
+        self._apply_move(positions)
+        self._record_move(player, {"positions": [list(p) for p in positions]})
 
         return self.get_game_state()
 
@@ -137,10 +116,4 @@ class Connect6Game(AbstractGame):
 
     def get_winner(self) -> Optional[str]:
         """Get the winner if game is over"""
-        # Check if there are any lines of 6
-        for x in range(self.board_size):
-            for y in range(self.board_size):
-                if self.board[x, y] != Connect6Piece.EMPTY.value:
-                    if self._check_win(x, y):
-                        return self.current_player.name
-        return None
+        return self.lines.winner
@@ -1,31 +1,121 @@
 from game_abc import AbstractGame, GameMove, GameHistory
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Optional, List
 import time
 
 
 class ConnectFourGame(AbstractGame):
+    """
+    Connect Four on two bitboards.
+
+    Each player's discs are one integer with bit ``col * (ROWS + 1) + height``
+    set per disc, height counted from the bottom. The spare bit on top of every
+    column keeps lines from wrapping into the next column, so a four in a row
+    in any direction is found with shifts by 1 (vertical), ROWS + 1
+    (horizontal), ROWS + 2 and ROWS (the diagonals). Column heights give O(1)
+    drops and only the lines through the last disc are checked for a win.
+    ``board`` stays the list-of-rows view used by the API and is kept in sync.
+    """
+
     ROWS = 6
     COLUMNS = 7
     WIN_LENGTH = 4
+    PLAYERS = ("R", "Y")
 
     def __init__(self, game_id: str):
+        self.stride = self.ROWS + 1
+        self.directions = (1, self.stride, self.stride + 1, self.stride - 1)
         super().__init__(game_id)
-        self.board = [[None] * self.COLUMNS for _ in range(self.ROWS)]
-        self.current_player = "R"  # Red player starts
-        self._initialize_board()
-    
+
     def _initialize_board(self):
         """Initialize the game board."""
-        self.board = [[None] * self.COLUMNS for _ in range(self.ROWS)]
+        self._board: List[List[Optional[str]]] = [
+            [None] * self.COLUMNS for _ in range(self.ROWS)
+        ]
+        self.bitboards = {player: 0 for player in self.PLAYERS}
+        self.heights = [0] * self.COLUMNS
+        self.disc_count = 0
+        self.winner: Optional[str] = None
         self.current_player = "R"
 
+    @property
+    def board(self) -> List[List[Optional[str]]]:
+        return self._board
+
+    @board.setter
+    def board(self, board: List[List[Optional[str]]]) -> None:
+        # A board assigned from outside (tests, admin edits) is re-encoded
+        self._board = board
+        self._sync_bitboards()
+
+    def _bit(self, row: int, col: int) -> int:
+        return 1 << (col * self.stride + self.ROWS - 1 - row)
+
+    def _sync_bitboards(self) -> None:
+        """Rebuild bitboards, heights and winner from the board rows"""
+        self.bitboards = {player: 0 for player in self.PLAYERS}
+        self.heights = [0] * self.COLUMNS
+        self.disc_count = 0
+        for row, cells in enumerate(self._board):
+            for col, cell in enumerate(cells):
+                if cell in self.bitboards:
+                    self.bitboards[cell] |= self._bit(row, col)
+                    self.heights[col] = max(self.heights[col], self.ROWS - row)
+                    self.disc_count += 1
+        self.winner = None
+        for player, bb in self.bitboards.items():
+            if self._has_line(bb):
+                self.winner = player
+                break
+
+    def _has_line(self, bb: int) -> bool:
+        """Whether bb holds WIN_LENGTH in a row anywhere on the board"""
+        for shift in self.directions:
+            run = bb
+            for i in range(1, self.WIN_LENGTH):
+                run &= bb >> (shift * i)
+            if run:
+                return True
+        return False
+
+    def _wins_through(self, bb: int, bit: int) -> bool:
+        """Whether the disc on bit completes WIN_LENGTH in a row in bb"""
+        for shift in self.directions:
+            length = 1
+            cursor = bit << shift
+            while cursor & bb:
+                length += 1
+                cursor <<= shift
+            cursor = bit >> shift
+            while cursor & bb:
+                length += 1
+                cursor >>= shift
+            if length >= self.WIN_LENGTH:
+                return True
+        return False
+
+    def _drop(self, col: int, player: str) -> None:
+        height = self.heights[col]
+        bit = 1 << (col * self.stride + height)
+        self.bitboards[player] |= bit
+        self.heights[col] = height + 1
+        self.disc_count += 1
+        self._board[self.ROWS - 1 - height][col] = player
+        if self.winner is None and self._wins_through(self.bitboards[player], bit):
+            self.winner = player
+
     def initialize_game(self) -> Dict[str, Any]:
         """Reset the board and start a new game"""
-        self.board = [[None] * self.COLUMNS for _ in range(self.ROWS)]
-        self.current_player = "R"
+        self._initialize_board()
         self.history = GameHistory()
         return self.get_game_state()
 
+    def _restore_game_state(self) -> None:
+        """Rebuild the position by replaying the recorded drops"""
+        self._initialize_board()
+        for move in self.history.moves:
+            self._drop(int(move.move_data["column"]), move.player)
+            self.current_player = "Y" if move.player == "R" else "R"
+
     def validate_move(self, move_data: Dict[str, Any]) -> bool:
         """Validate if a move is legal"""
         try:
@@ -34,7 +124,7 @@ class ConnectFourGame(AbstractGame):
             if not (0 <= col < self.COLUMNS):
                 return False
 
-            if self.board[0][col] is not None:  # Column is full
+            if self.heights[col] >= self.ROWS:  # Column is full
                 return False
 
             if move_data.get("player") != self.current_player:
@@ -50,12 +140,7 @@ class ConnectFourGame(AbstractGame):
             raise ValueError("Invalid move: Column is full or invalid")
 
         col = int(move_data["column"])
-
-        # Find the lowest empty row in the column
-        for row in range(self.ROWS - 1, -1, -1):
-            if self.board[row][col] is None:
-                self.board[row][col] = self.current_player
-                break
+        self._drop(col, self.current_player)
 
         # Add move to history
         move = GameMove(
@@ -71,7 +156,7 @@ class ConnectFourGame(AbstractGame):
     def get_game_state(self) -> Dict[str, Any]:
         """Get the current game state"""
         return {
-            "board": self.board,
+            "board": [list(row) for row in self.board],
             "current_player": self.current_player,
             "game_over": self.is_game_over(),
             "winner": self.get_winner(),
@@ -79,56 +164,12 @@ class ConnectFourGame(AbstractGame):
 
     def is_game_over(self) -> bool:
         """Check if the game is over"""
-        return self.get_winner() is not None or all(
-            all(cell is not None for cell in row) for row in self.board
-        )
+        return self.get_winner() is not None
 
     def get_winner(self) -> Optional[str]:
-        """Get the winner if game is over"""
-        # Check horizontal
-        for row in range(self.ROWS):
-            for col in range(self.COLUMNS - self.WIN_LENGTH + 1):
-                if self._check_sequence(row, col, (0, 1)):
-                    return self.board[row][col]
-
-        # Check vertical
-        for col in range(self.COLUMNS):
-            for row in range(self.ROWS - self.WIN_LENGTH + 1):
-                if self._check_sequence(row, col, (1, 0)):
-                    return self.board[row][col]
-
-        # Check diagonal (top-left to bottom-right)
-        for row in range(self.ROWS - self.WIN_LENGTH + 1):
-            for col in range(self.COLUMNS - self.WIN_LENGTH + 1):
-                if self._check_sequence(row, col, (1, 1)):  # Down-right
-                    return self.board[row][col]
-
-        # Check diagonal (top-right to bottom-left)
-        for row in range(self.ROWS - self.WIN_LENGTH + 1):
-            for col in range(self.WIN_LENGTH - 1, self.COLUMNS):
-                if self._check_sequence(row, col, (1, -1)):  # Down-left
-                    return self.board[row][col]
-
-        # Check for draw
-        if all(cell is not None for row in self.board for cell in row):
+        """Get the winner if game is over ("draw" once the board is full)"""
+        if self.winner is not None:
+            return self.winner
+        if self.disc_count == self.ROWS * self.COLUMNS:
             return "draw"
-            
         return None
-
-    def _check_sequence(
-        self, start_row: int, start_col: int, direction: Tuple[int, int]
-    ) -> bool:
-        """Check if there's a winning sequence in the given direction"""
-        dr, dc = direction
-        player = self.board[start_row][start_col]
-        if player is None:
-            return False
-
-        for i in range(1, self.WIN_LENGTH):
-            r = start_row + dr * i
-            c = start_col + dc * i
-            if not (0 <= r < self.ROWS and 0 <= c < self.COLUMNS):
-                return False
-            if self.board[r][c] != player:
-                return False
-        return True
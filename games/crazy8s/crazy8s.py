@@ -1,49 +1,15 @@
 from game_abc import AbstractGame, GameMove, GameHistory
+from games.cards import CardSet, draw, hand_mask, shuffled
 from typing import Dict, Any, Optional, List, Tuple, Set
 import numpy as np
 from enum import Enum
 import time
-import random
 from collections import defaultdict
 
 
-class Card:
-    def __init__(self, suit: str, rank: str):
-        self.suit = suit
-        self.rank = rank
-        self.value = self._get_card_value()
-
-    def _get_card_value(self) -> int:
-        """Get the card's value for comparison"""
-        rank_order = {
-            "2": 2,
-            "3": 3,
-            "4": 4,
-            "5": 5,
-            "6": 6,
-            "7": 7,
-            "8": 8,
-            "9": 9,
-            "10": 10,
-            "J": 11,
-            "Q": 12,
-            "K": 13,
-            "A": 14,
-        }
-        suit_order = {"♣": 0, "♦": 1, "♥": 2, "♠": 3}
-        return rank_order[self.rank] * 4 + suit_order[self.suit]
-
-    def __lt__(self, other):
-        return self.value < other.value
-
-    def __eq__(self, other):
-        return self.value == other.value
-
-    def __hash__(self):
-        return hash((self.suit, self.rank))
-
-    def to_dict(self) -> Dict[str, str]:
-        return {"suit": self.suit, "rank": self.rank}
+SUITS = ["♠", "♥", "♦", "♣"]
+RANKS = ["2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A"]
+CARDS = CardSet.product(suit=SUITS, rank=RANKS)
 
 
 class CrazyEightsGame(AbstractGame):
@@ -51,45 +17,48 @@ class CrazyEightsGame(AbstractGame):
         super().__init__(game_id)
         self.num_players = num_players
         self.current_player = 0
-        self.hands = defaultdict(list)
-        self.deck = []
+        self.hands = defaultdict(int)  # card bitmasks
+        self.deck = CARDS.deck()[:0]
         self.discard_pile = []
+        self.new_suit = None  # suit called with an 8 on top of the pile
         self._init_game()
 
     def _init_game(self):
         """Initialize a new game"""
-        self.hands = defaultdict(list)
+        self.reset_rng()
+        self.hands = defaultdict(int)
         self.current_player = 0
-        self.deck = []
-        self.discard_pile = []
+        self.new_suit = None
 
-        # Create deck
-        suits = ["♠", "♥", "♦", "♣"]
-        ranks = ["2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A"]
-        self.deck = [Card(suit, rank) for suit in suits for rank in ranks]
-        random.shuffle(self.deck)
+        self.deck = shuffled(CARDS.deck(), self.rng)
 
         # Deal cards (5 cards to each player)
         for i in range(self.num_players):
-            for _ in range(5):
-                self.hands[i].append(self.deck.pop())
+            cards, self.deck = draw(self.deck, 5)
+            self.hands[i] = hand_mask(cards)
 
         # Place first card on discard pile
-        self.discard_pile.append(self.deck.pop())
+        self.discard_pile, self.deck = draw(self.deck)
 
-    def _is_valid_play(self, card: Card) -> bool:
+    def _top_card(self) -> Dict[str, str]:
+        """Face of the top of the discard pile, with the suit called by an 8"""
+        top = CARDS.faces[self.discard_pile[-1]]
+        return top if self.new_suit is None else dict(top, suit=self.new_suit)
+
+    def _is_valid_play(self, card: int) -> bool:
         """Check if a card can be played on the discard pile"""
         if not self.discard_pile:
             return True
 
-        top_card = self.discard_pile[-1]
+        face = CARDS.faces[card]
+        top_card = self._top_card()
 
         # Can always play an 8
-        if card.rank == "8":
+        if face["rank"] == "8":
             return True
 
         # Must match suit or rank
-        return card.suit == top_card.suit or card.rank == top_card.rank
+        return face["suit"] == top_card["suit"] or face["rank"] == top_card["rank"]
 
     def validate_move(self, move_data: Dict[str, Any]) -> bool:
         """Validate if a move is legal"""
@@ -102,8 +71,11 @@ class CrazyEightsGame(AbstractGame):
             if "card" not in move_data:
                 return False
 
-            card = Card(move_data["card"]["suit"], move_data["card"]["rank"])
-            if card not in self.hands[self.current_player]:
+            try:
+                card = CARDS.code(move_data["card"])
+            except ValueError:
+                return False
+            if not self.hands[self.current_player] >> card & 1:
                 return False
 
             return self._is_valid_play(card)
@@ -121,22 +93,23 @@ class CrazyEightsGame(AbstractGame):
         action = move_data["action"]
 
         if action == "play":
-            card = Card(move_data["card"]["suit"], move_data["card"]["rank"])
-            self.hands[self.current_player].remove(card)
+            card = CARDS.code(move_data["card"])
+            self.hands[self.current_player] &= ~(1 << card)
             self.discard_pile.append(card)
+            self.new_suit = None
 
             # If playing an 8, allow suit change
-            if card.rank == "8" and "new_suit" in move_data:
-                self.discard_pile[-1].suit = move_data["new_suit"]
+            if CARDS.faces[card]["rank"] == "8" and "new_suit" in move_data:
+                self.new_suit = move_data["new_suit"]
 
         elif action == "draw":
-            if not self.deck:
+            if not len(self.deck):
                 # Shuffle discard pile (except top card) back into deck
-                self.deck = self.discard_pile[:-1]
-                random.shuffle(self.deck)
+                self.deck = shuffled(np.array(self.discard_pile[:-1], dtype=np.uint8), self.rng)
                 self.discard_pile = [self.discard_pile[-1]]
 
-            self.hands[self.current_player].append(self.deck.pop())
+            (card,), self.deck = draw(self.deck)
+            self.hands[self.current_player] |= 1 << card
 
         # Move to next player
         self.current_player = (self.current_player + 1) % self.num_players
@@ -146,13 +119,9 @@ class CrazyEightsGame(AbstractGame):
     def get_game_state(self) -> Dict[str, Any]:
         """Get the current game state"""
         return {
-            "hands": {
-                str(k): [card.to_dict() for card in v] for k, v in self.hands.items()
-            },
+            "hands": {str(k): CARDS.mask_faces(v) for k, v in self.hands.items()},
             "current_player": self.current_player,
-            "discard_pile_top": (
-                self.discard_pile[-1].to_dict() if self.discard_pile else None
-            ),
+            "discard_pile_top": self._top_card() if self.discard_pile else None,
             "game_over": self.is_game_over(),
             "winner": self.get_winner(),
         }
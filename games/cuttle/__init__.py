@@ -1,6 +1,6 @@
 from game_abc import AbstractGame, GameMove, GameHistory
+from games.cards import CardSet, draw, shuffled
 from typing import Dict, Any, Optional, List, Tuple, Set
-import random
 import time
 
 # Define card values and suits
@@ -31,32 +31,21 @@ SPECIAL_CARDS = {
 }
 
 
-class CuttleCard:
-    def __init__(self, rank: str, suite: str):
-        self.rank = rank
-        self.suite = suite
-        self.value = CARD_RANKS[rank]
-        self.is_wild = rank in SPECIAL_CARDS
-
-    def __str__(self):
-        return f"{self.rank}{self.suite}"
-
-    def __repr__(self):
-        return str(self)
-
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            "rank": self.rank,
-            "suite": self.suite,
-            "value": self.value,
-            "is_wild": self.is_wild,
-        }
+CARDS = CardSet(
+    [
+        {"rank": rank, "suite": suite, "value": value, "is_wild": rank in SPECIAL_CARDS}
+        for rank, value in CARD_RANKS.items()
+        for suite in SUITES
+    ]
+)
+FACES = CARDS.faces
 
 
 class CuttleGame(AbstractGame):
     def __init__(self, game_id: str):
         super().__init__(game_id)
-        self.deck = []
+        self.deck = CARDS.deck()[:0]
+        # Hands and the table are lists of card codes
         self.player_hand = []
         self.computer_hand = []
         self.table = []
@@ -69,6 +58,7 @@ class CuttleGame(AbstractGame):
 
     def _init_game(self):
         """Initialize a new game"""
+        self.reset_rng()
         self._create_deck()
         self._deal_initial_cards()
         self.table = []
@@ -79,61 +69,57 @@ class CuttleGame(AbstractGame):
 
     def _create_deck(self):
         """Create a standard 52-card deck"""
-        self.deck = []
-        for rank in CARD_RANKS:
-            for suite in SUITES:
-                self.deck.append(CuttleCard(rank, suite))
-        random.shuffle(self.deck)
+        self.deck = shuffled(CARDS.deck(), self.rng)
 
     def _deal_initial_cards(self):
         """Deal initial cards to players"""
         # Deal 4 cards to each player
-        self.player_hand = self.deck[:4]
-        self.computer_hand = self.deck[4:8]
-        self.deck = self.deck[8:]
+        self.player_hand, self.deck = draw(self.deck, 4)
+        self.computer_hand, self.deck = draw(self.deck, 4)
 
-    def _play_card(self, player: str, card_idx: int) -> CuttleCard:
+    def _play_card(self, player: str, card_idx: int) -> int:
         """Play a card from the specified player's hand"""
         if player == "player":
             return self.player_hand.pop(card_idx)
         else:
             return self.computer_hand.pop(card_idx)
 
-    def _find_matches(self, card: CuttleCard) -> List[int]:
+    def _find_matches(self, card: int) -> List[int]:
         """Find matching cards on the table"""
+        card = FACES[card]
         matches = []
-        for i, table_card in enumerate(self.table):
+        for i, table_card in enumerate(CARDS.to_faces(self.table)):
             # Check for exact match
-            if card.rank == table_card.rank:
+            if card["rank"] == table_card["rank"]:
                 matches.append(i)
                 continue
 
             # Check for wild cards
-            if card.is_wild or table_card.is_wild:
+            if card["is_wild"] or table_card["is_wild"]:
                 matches.append(i)
                 continue
 
             # Check for sequence (within 1)
-            if abs(card.value - table_card.value) == 1:
+            if abs(card["value"] - table_card["value"]) == 1:
                 matches.append(i)
 
         return matches
 
-    def _capture_cards(self, matches: List[int]) -> List[CuttleCard]:
+    def _capture_cards(self, matches: List[int]) -> List[int]:
         """Capture cards from the table"""
         captured = []
         for i in sorted(matches, reverse=True):
             captured.append(self.table.pop(i))
         return captured
 
-    def _score_cards(self, cards: List[CuttleCard]) -> int:
+    def _score_cards(self, cards: List[int]) -> int:
         """Score captured cards"""
         score = 0
-        for card in cards:
-            if card.rank in SPECIAL_CARDS:
+        for card in CARDS.to_faces(cards):
+            if card["rank"] in SPECIAL_CARDS:
                 score += 20  # Special cards worth 20 points
             else:
-                score += card.value  # Regular cards worth face value
+                score += card["value"]  # Regular cards worth face value
         return score
 
     def _computer_play(self) -> Dict[str, Any]:
@@ -185,8 +171,9 @@ class CuttleGame(AbstractGame):
             self.player_score += self._score_cards(captured)
 
         # Draw a new card if available
-        if self.deck:
-            self.player_hand.append(self.deck.pop(0))
+        if len(self.deck):
+            drawn, self.deck = draw(self.deck)
+            self.player_hand += drawn
 
         # Computer's turn
         computer_move = self._computer_play()
@@ -201,19 +188,20 @@ class CuttleGame(AbstractGame):
             self.computer_score += self._score_cards(captured)
 
         # Draw a new card if available
-        if self.deck:
-            self.computer_hand.append(self.deck.pop(0))
+        if len(self.deck):
+            drawn, self.deck = draw(self.deck)
+            self.computer_hand += drawn
 
         # Add move to history
         move = GameMove(
             player="player",
             move_data={
                 "round": self.round,
-                "player_card": player_card.to_dict(),
-                "computer_card": computer_card.to_dict(),
+                "player_card": FACES[player_card],
+                "computer_card": FACES[computer_card],
                 "player_score": self.player_score,
                 "computer_score": self.computer_score,
-                "table": [card.to_dict() for card in self.table],
+                "table": CARDS.to_faces(self.table),
             },
             timestamp=time.time(),
         )
@@ -227,8 +215,8 @@ class CuttleGame(AbstractGame):
             "round": self.round,
             "player_score": self.player_score,
             "computer_score": self.computer_score,
-            "player_hand": [card.to_dict() for card in self.player_hand],
-            "table": [card.to_dict() for card in self.table],
+            "player_hand": CARDS.to_faces(self.player_hand),
+            "table": CARDS.to_faces(self.table),
             "game_over": self.is_game_over(),
             "winner": self.get_winner(),
         }
@@ -236,7 +224,7 @@ class CuttleGame(AbstractGame):
     def is_game_over(self) -> bool:
         """Check if the game is over"""
         return (
-            not self.deck
+            not len(self.deck)
             and not self.player_hand
             and not self.computer_hand
             or self.round >= self.max_rounds
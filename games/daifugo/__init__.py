@@ -0,0 +1 @@
+from games.daifugo.daifugo import DaifugoGame
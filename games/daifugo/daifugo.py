@@ -1,246 +1,155 @@
 from game_abc import AbstractGame, GameMove, GameHistory
-from typing import Dict, Any, Optional, List, Tuple, Set
-import numpy as np
-from enum import Enum
-import time
-import random
-from collections import defaultdict
-
-
-class Card:
-    def __init__(self, suit: str, rank: str):
-        self.suit = suit
-        self.rank = rank
-        self.value = self._get_card_value()
-
-    def _get_card_value(self) -> int:
-        """Get the card's value for comparison"""
-        rank_order = {
-            "3": 1,
-            "4": 2,
-            "5": 3,
-            "6": 4,
-            "7": 5,
-            "8": 6,
-            "9": 7,
-            "10": 8,
-            "J": 9,
-            "Q": 10,
-            "K": 11,
-            "A": 12,
-            "2": 13,
-            "joker": 14,
-            "Joker": 15,
-        }
-        suit_order = {"♣": 0, "♦": 1, "♥": 2, "♠": 3}
-        return rank_order[self.rank] * 4 + suit_order[self.suit]
-
-    def __lt__(self, other):
-        return self.value < other.value
-
-    def __eq__(self, other):
-        return self.value == other.value
-
-    def __hash__(self):
-        return hash((self.suit, self.rank))
-
-    def to_dict(self) -> Dict[str, str]:
-        return {"suit": self.suit, "rank": self.rank}
-
-
-class CardType(Enum):
-    SINGLE = 1
-    PAIR = 2
-    TRIPLE = 3
-    STRAIGHT = 4
-    FULL_HOUSE = 5
-    FOUR_OF_A_KIND = 6
-    STRAIGHT_FLUSH = 7
+from games.climbing import (
+    Play,
+    Rules,
+    beating_plays,
+    beats,
+    card_code,
+    card_dicts,
+    classify,
+    new_deck,
+    parse_cards,
+    plays,
+)
+from games.cards import shuffled
+from typing import Dict, Any, Optional, List
+
+RULES = Rules(min_straight=3)
+FIRST_CARD = card_code("♣", "3")
+ROLES = ["Daifugo", "Fugo", "Heimin", "Chonin"]
 
 
 class DaifugoGame(AbstractGame):
     def __init__(self, game_id: str, num_players: int = 4):
-        super().__init__(game_id)
         self.num_players = num_players
-        self.current_player = 0
-        self.hands = defaultdict(list)
-        self.last_play = None
-        self.last_player = None
-        self.roles = []
+        super().__init__(game_id)
+
+    def initialize_game(self) -> Dict[str, Any]:
+        """Deal a new game"""
+        self._init_game()
+        return self.get_game_state()
+
+    def _restore_game_state(self) -> None:
+        """Deal again from the recorded seed and replay the recorded moves"""
         self._init_game()
+        self._replay_moves()
 
     def _init_game(self):
         """Initialize a new game"""
-        self.hands = defaultdict(list)
+        self.reset_rng()
+        self.hands = [0] * self.num_players  # card bitmasks, see games.climbing
         self.current_player = 0
-        self.last_play = None
+        self.last_play: Optional[Play] = None
         self.last_player = None
+        self.opened = False
         self.roles = []
 
-        # Create deck (4 suits, ranks 3-2 plus jokers)
-        suits = ["♠", "♥", "♦", "♣"]
-        ranks = ["3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A", "2"]
-        deck = [Card(suit, rank) for suit in suits for rank in ranks]
-        deck.append(Card("", "joker"))  # Small joker
-        deck.append(Card("", "Joker"))  # Big joker
-        random.shuffle(deck)
+        deck = shuffled(new_deck(jokers=True), self.rng)
 
         # Deal cards
-        for i, card in enumerate(deck):
-            self.hands[i % self.num_players].append(card)
-
-        # Sort hands
-        for player in range(self.num_players):
-            self.hands[player].sort(reverse=True)
+        for i, card in enumerate(deck.tolist()):
+            self.hands[i % self.num_players] |= 1 << card
 
         # First player is the one with the 3 of clubs
         for i in range(self.num_players):
-            if any(card.rank == "3" and card.suit == "♣" for card in self.hands[i]):
+            if self.hands[i] >> FIRST_CARD & 1:
                 self.current_player = i
                 break
 
-    def _get_card_type(self, cards: List[Card]) -> Optional[Tuple[CardType, int]]:
-        """Determine the type of card combination"""
-        if not cards:
+    def _play_for(self, cards: int) -> Optional[Play]:
+        """The play the cards make if they may be laid now"""
+        play = classify(cards, RULES)
+        if play is None:
             return None
 
-        cards.sort()
-        count = len(cards)
-
-        # Check for special cases
-        if count == 1:
-            return CardType.SINGLE, cards[0].value
-        if count == 2 and cards[0].rank == cards[1].rank:
-            return CardType.PAIR, cards[0].value
-        if count == 3 and cards[0].rank == cards[1].rank == cards[2].rank:
-            return CardType.TRIPLE, cards[0].value
-        if (
-            count == 4
-            and cards[0].rank == cards[1].rank == cards[2].rank == cards[3].rank
-        ):
-            return CardType.FOUR_OF_A_KIND, cards[0].value
-
-        # Check for straight
-        if count >= 3:
-            straight = True
-            for i in range(1, count):
-                if cards[i].value != cards[i - 1].value + 1:
-                    straight = False
-                    break
-            if straight:
-                return CardType.STRAIGHT, cards[0].value
-
-        # Check for full house
-        if count == 5:
-            counts = defaultdict(int)
-            for card in cards:
-                counts[card.rank] += 1
-            values = list(counts.values())
-            if sorted(values) == [2, 3]:
-                return CardType.FULL_HOUSE, max(cards[0].value, cards[1].value)
-
-        # Check for straight flush
-        if count >= 3:
-            straight = True
-            flush = True
-            for i in range(1, count):
-                if cards[i].value != cards[i - 1].value + 1:
-                    straight = False
-                if cards[i].suit != cards[0].suit:
-                    flush = False
-            if straight and flush:
-                return CardType.STRAIGHT_FLUSH, cards[0].value
-
-        return None
-
-    def _is_valid_play(self, cards: List[Card]) -> bool:
-        """Check if a play is valid"""
-        if not cards:
-            return False
-
-        # First play must be 3 of clubs
-        if self.last_play is None:
-            return cards[0].rank == "3" and cards[0].suit == "♣"
-
-        # Check card combination type
-        card_type = self._get_card_type(cards)
-        if not card_type:
-            return False
-
-        # Check if it beats last play
-        if self.last_play:
-            last_type = self._get_card_type(self.last_play)
-            if card_type[0] != last_type[0]:
-                return False
-            if card_type[1] <= last_type[1]:
-                return False
+        # First play must include the 3 of clubs
+        if not self.opened:
+            return play if cards >> FIRST_CARD & 1 else None
 
-        return True
+        if self.last_play is not None and not beats(play, self.last_play, RULES):
+            return None
+        return play
 
     def validate_move(self, move_data: Dict[str, Any]) -> bool:
         """Validate if a move is legal"""
+        if self.is_game_over():
+            return False
+        if move_data.get("action") == "pass":
+            # The player leading a trick cannot pass
+            return self.last_play is not None
         if "cards" not in move_data:
             return False
 
-        cards = [Card(card["suit"], card["rank"]) for card in move_data["cards"]]
-        player_hand = self.hands[self.current_player]
-
+        cards = parse_cards(move_data["cards"])
         # Check if player has these cards
-        if not all(card in player_hand for card in cards):
+        if cards is None or cards & ~self.hands[self.current_player]:
             return False
 
-        return self._is_valid_play(cards)
+        return self._play_for(cards) is not None
 
     def make_move(self, move_data: Dict[str, Any]) -> Dict[str, Any]:
         """Make a move in the game"""
         if not self.validate_move(move_data):
             raise ValueError("Invalid move")
+        player = self.current_player
 
-        cards = [Card(card["suit"], card["rank"]) for card in move_data["cards"]]
-        player_hand = self.hands[self.current_player]
+        if move_data.get("action") == "pass":
+            self.current_player = (self.current_player + 1) % self.num_players
+            # Everyone else passed, so the last player leads again
+            if self.current_player == self.last_player:
+                self.last_play = None
+            self._record_move(player, move_data)
+            return self.get_game_state()
 
-        # Remove cards from player's hand
-        for card in cards:
-            player_hand.remove(card)
+        play = self._play_for(parse_cards(move_data["cards"]))
+        self.hands[self.current_player] &= ~play.cards
 
         # Update game state
-        self.last_play = cards
+        self.last_play = play
         self.last_player = self.current_player
+        self.opened = True
 
         # Check if game is over
-        if not player_hand:
+        if not self.hands[self.current_player]:
             self._determine_roles()
 
         # Move to next player
         self.current_player = (self.current_player + 1) % self.num_players
 
+        self._record_move(player, move_data)
         return self.get_game_state()
 
     def _determine_roles(self):
         """Determine player roles based on finishing order"""
-        self.roles = ["Daifugo"] * self.num_players
-
         # Sort players by number of cards remaining
-        players = sorted(
-            range(self.num_players),
-            key=lambda x: len(self.hands[x]) if self.hands[x] else float("inf"),
-        )
+        players = sorted(range(self.num_players), key=lambda x: bin(self.hands[x]).count("1"))
 
         # Assign roles
-        self.roles[players[0]] = "Daifugo"
-        self.roles[players[1]] = "Fugo"
-        self.roles[players[2]] = "Heimin"
-        self.roles[players[3]] = "Chonin"
+        self.roles = [""] * self.num_players
+        for player, role in zip(players, ROLES):
+            self.roles[player] = role
+
+    def legal_moves(self) -> List[Dict[str, Any]]:
+        """Every move the current player can make"""
+        if self.is_game_over():
+            return []
+        hand = self.hands[self.current_player]
+        if not self.opened:
+            candidates = [play for play in plays(hand, RULES) if play.cards >> FIRST_CARD & 1]
+        else:
+            candidates = beating_plays(hand, self.last_play, RULES)
+        moves: List[Dict[str, Any]] = [{"cards": card_dicts(play.cards)} for play in candidates]
+        if self.last_play is not None:
+            moves.append({"action": "pass"})
+        return moves
 
     def get_game_state(self) -> Dict[str, Any]:
         """Get the current game state"""
         return {
-            "hands": {
-                str(k): [card.to_dict() for card in v] for k, v in self.hands.items()
-            },
+            "hands": {str(k): card_dicts(hand) for k, hand in enumerate(self.hands)},
             "current_player": self.current_player,
             "last_play": (
-                [card.to_dict() for card in self.last_play] if self.last_play else None
+                card_dicts(self.last_play.cards) if self.last_play else None
             ),
             "last_player": self.last_player,
             "roles": self.roles,
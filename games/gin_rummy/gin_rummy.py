@@ -1,109 +1,54 @@
 from game_abc import AbstractGame, GameMove, GameHistory
+from games.cards import CardSet, draw, hand_mask, shuffled
+from games.gin_rummy.melds import MELD_SET, SUITS, deadwood
 from typing import Dict, Any, Optional, List, Tuple, Set
 import numpy as np
 from enum import Enum
 import time
-import random
 from collections import defaultdict
 
 
-class Card:
-    def __init__(self, suit: str, rank: int):
-        self.suit = suit
-        self.rank = rank
-
-    def to_dict(self) -> Dict[str, Any]:
-        return {"suit": self.suit, "rank": self.rank}
+# Codes match the meld tables' suit * 13 + rank - 1
+CARDS = CardSet.product(suit=SUITS, rank=range(1, 14))
 
 
 class GinRummyGame(AbstractGame):
-    def __init__(self, game_id: str):
-        super().__init__(game_id)
-        self.current_player = 0
-        self.deck = []
-        self.discard_pile = []
-        self.hands = defaultdict(list)
-        self.deadwood = defaultdict(int)
-        self.phase = "setup"  # setup, play, end
+    def initialize_game(self) -> Dict[str, Any]:
+        """Shuffle and deal a new hand"""
         self._init_game()
+        return self.get_game_state()
+
+    def _restore_game_state(self) -> None:
+        """Deal again from the recorded seed and replay the recorded moves"""
+        self._init_game()
+        self._replay_moves()
 
     def _init_game(self):
         """Initialize a new game"""
+        self.reset_rng()
         self.current_player = 0
         self.phase = "setup"
-        self.deck = []
-        self.discard_pile = []
-        self.hands = defaultdict(list)
+        self.hands = [0, 0]  # card bitmasks, see melds
         self.deadwood = defaultdict(int)
 
         # Create deck (52 cards)
-        suits = ["♠", "♥", "♦", "♣"]
-        for suit in suits:
-            for rank in range(1, 14):
-                self.deck.append(Card(suit, rank))
-
-        random.shuffle(self.deck)
+        self.deck = shuffled(CARDS.deck(), self.rng)
 
         # Deal 10 cards to each player
-        for _ in range(10):
-            self.hands[0].append(self.deck.pop())
-            self.hands[1].append(self.deck.pop())
+        for player in (0, 1):
+            cards, self.deck = draw(self.deck, 10)
+            self.hands[player] = hand_mask(cards)
 
         # Place first card on discard pile
-        self.discard_pile.append(self.deck.pop())
-
-    def _is_meld(self, cards: List[Card]) -> bool:
-        """Check if cards form a meld (set or run)"""
-        if len(cards) < 3:
-            return False
+        self.discard_pile, self.deck = draw(self.deck)
 
-        # Check for set (same rank)
-        if len(set(card.rank for card in cards)) == 1:
-            return True
+    def _is_meld(self, cards: int) -> bool:
+        """Check if a card mask is a meld (set or run)"""
+        return cards in MELD_SET
 
-        # Check for run (consecutive ranks)
-        cards = sorted(cards, key=lambda x: x.rank)
-        if len(set(card.suit for card in cards)) != 1:
-            return False
-
-        for i in range(len(cards) - 1):
-            if cards[i].rank + 1 != cards[i + 1].rank:
-                return False
-
-        return True
-
-    def _calculate_deadwood(self, hand: List[Card]) -> int:
-        """Calculate deadwood points"""
-        # Find all possible melds
-        melds = []
-        for i in range(len(hand)):
-            for j in range(i + 1, len(hand)):
-                for k in range(j + 1, len(hand)):
-                    if self._is_meld([hand[i], hand[j], hand[k]]):
-                        melds.append([hand[i], hand[j], hand[k]])
-
-        # Find best combination of melds
-        best_deadwood = float("inf")
-        for i in range(1 << len(hand)):
-            used = set()
-            meld_count = 0
-            deadwood = 0
-
-            # Count melds
-            for meld in melds:
-                if all(card not in used for card in meld):
-                    meld_count += 1
-                    used.update(meld)
-
-            # Calculate deadwood
-            for card in hand:
-                if card not in used:
-                    deadwood += card.rank if card.rank <= 10 else 10
-
-            if meld_count >= 1 and deadwood < best_deadwood:
-                best_deadwood = deadwood
-
-        return best_deadwood
+    def _calculate_deadwood(self, hand: int) -> int:
+        """Deadwood points left by the best arrangement of the hand into melds"""
+        return deadwood(hand)
 
     def validate_move(self, move_data: Dict[str, Any]) -> bool:
         """Validate if a move is legal"""
@@ -117,20 +62,22 @@ class GinRummyGame(AbstractGame):
                 return False
 
             source = move_data["source"]
-            if source not in ["deck", "discard"]:
-                return False
-
-            return True
+            if source == "deck":
+                # An empty deck is rebuilt from the discard pile under its top card
+                return len(self.deck) > 0 or len(self.discard_pile) > 1
+            if source == "discard":
+                return len(self.discard_pile) > 0
+            return False
 
         elif action == "discard":
             if "card" not in move_data:
                 return False
 
-            card = Card(move_data["card"]["suit"], move_data["card"]["rank"])
-            if card not in self.hands[self.current_player]:
+            try:
+                card = CARDS.code(move_data["card"])
+            except ValueError:
                 return False
-
-            return True
+            return bool(self.hands[self.current_player] >> card & 1)
 
         elif action == "knock":
             # Check if player can knock
@@ -145,25 +92,25 @@ class GinRummyGame(AbstractGame):
         """Make a move in the game"""
         if not self.validate_move(move_data):
             raise ValueError("Invalid move")
+        player = self.current_player
 
         action = move_data["action"]
 
         if action == "draw":
             source = move_data["source"]
             if source == "deck":
-                if self.deck:
-                    self.hands[self.current_player].append(self.deck.pop())
-                else:
+                if not len(self.deck):
                     # Reshuffle discard pile except top card
-                    self.deck = self.discard_pile[:-1]
-                    random.shuffle(self.deck)
-                    self.hands[self.current_player].append(self.deck.pop())
+                    self.deck = shuffled(np.array(self.discard_pile[:-1], dtype=np.uint8), self.rng)
+                    self.discard_pile = self.discard_pile[-1:]
+                (card,), self.deck = draw(self.deck)
             else:  # discard
-                self.hands[self.current_player].append(self.discard_pile.pop())
+                card = self.discard_pile.pop()
+            self.hands[self.current_player] |= 1 << card
 
         elif action == "discard":
-            card = Card(move_data["card"]["suit"], move_data["card"]["rank"])
-            self.hands[self.current_player].remove(card)
+            card = CARDS.code(move_data["card"])
+            self.hands[self.current_player] &= ~(1 << card)
             self.discard_pile.append(card)
 
         elif action == "knock":
@@ -185,6 +132,7 @@ class GinRummyGame(AbstractGame):
         if self.phase != "end":
             self.current_player = 1 - self.current_player
 
+        self._record_move(player, move_data)
         return self.get_game_state()
 
     def get_game_state(self) -> Dict[str, Any]:
@@ -192,10 +140,8 @@ class GinRummyGame(AbstractGame):
         return {
             "current_player": self.current_player,
             "phase": self.phase,
-            "hands": {
-                str(k): [card.to_dict() for card in v] for k, v in self.hands.items()
-            },
-            "discard_pile": [card.to_dict() for card in self.discard_pile],
+            "hands": {str(k): CARDS.mask_faces(hand) for k, hand in enumerate(self.hands)},
+            "discard_pile": CARDS.to_faces(self.discard_pile),
             "deadwood": self.deadwood,
             "game_over": self.phase == "end",
             "winner": self.get_winner(),
@@ -0,0 +1,84 @@
+"""
+Optimal meld arrangement for gin rummy.
+
+A hand is a 52-bit mask, bit ``suit * 13 + rank - 1`` per card. Every set
+(3 or 4 cards of a rank) and run (3 or more suited cards in sequence, ace
+low) of the deck is precomputed as a mask, 329 in all. The minimum deadwood
+of a hand is then an exact-cover style recursion on its lowest card: that card
+is either deadwood or covered by one of the melds through it that fit in the
+hand. Results are memoized by hand mask, so re-solving a hand after a draw or
+while trying each possible discard mostly hits the cache.
+"""
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+SUITS = ["♠", "♥", "♦", "♣"]
+DECK_SIZE = 52
+
+
+def card_index(suit: str, rank: int) -> int:
+    return SUITS.index(suit) * 13 + rank - 1
+
+
+def card_value(index: int) -> int:
+    """Deadwood points: ace 1, number cards face value, court cards 10"""
+    return min(index % 13 + 1, 10)
+
+
+def _build_melds() -> List[int]:
+    melds = []
+    for rank in range(13):
+        cards = [suit * 13 + rank for suit in range(4)]
+        melds.append(sum(1 << card for card in cards))
+        for left_out in cards:
+            melds.append(sum(1 << card for card in cards if card != left_out))
+    for suit in range(4):
+        for start in range(13):
+            for end in range(start + 3, 14):
+                melds.append(sum(1 << (suit * 13 + rank) for rank in range(start, end)))
+    return melds
+
+
+MELDS = _build_melds()
+MELD_SET = frozenset(MELDS)
+# Melds whose lowest card is the key: a hand's lowest card can only be
+# covered by a meld that starts there, since lower cards are already decided
+MELDS_FROM: Dict[int, List[int]] = {card: [] for card in range(DECK_SIZE)}
+for _meld in MELDS:
+    MELDS_FROM[(_meld & -_meld).bit_length() - 1].append(_meld)
+VALUES = [card_value(card) for card in range(DECK_SIZE)]
+
+
+@lru_cache(maxsize=1 << 16)
+def solve(hand: int) -> Tuple[int, Tuple[int, ...]]:
+    """Minimum deadwood of a hand mask and the meld masks achieving it"""
+    if not hand:
+        return 0, ()
+    low = hand & -hand
+    card = low.bit_length() - 1
+    rest = hand ^ low
+    deadwood, melds = solve(rest)
+    best = (deadwood + VALUES[card], melds)
+    for meld in MELDS_FROM[card]:
+        if meld & hand == meld:
+            deadwood, melds = solve(hand ^ meld)
+            if deadwood < best[0]:
+                best = (deadwood, (meld,) + melds)
+    return best
+
+
+def deadwood(hand: int) -> int:
+    return solve(hand)[0]
+
+
+def best_discard(hand: int) -> Tuple[int, int]:
+    """(card index, deadwood after discarding it) minimizing the deadwood"""
+    best = (-1, 1 << 30)
+    remaining = hand
+    while remaining:
+        low = remaining & -remaining
+        remaining ^= low
+        after = deadwood(hand ^ low)
+        if after < best[1]:
+            best = (low.bit_length() - 1, after)
+    return best
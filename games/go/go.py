@@ -1,8 +1,13 @@
 from game_abc import AbstractGame, GameMove, GameHistory
-from typing import Dict, Any, Optional, List, Tuple, Set
+from typing import Dict, Any, Iterable, Optional, List, Tuple, Set
 import numpy as np
+from array import array
 from enum import Enum
-import time
+
+from games.go.scoring import DEFAULT_KOMI, TERRITORY, score_board
+from games.zobrist import KeySet, ZobristTable
+
+ZOBRIST = ZobristTable("go")
 
 
 class GoStone(Enum):
@@ -12,15 +17,20 @@ class GoStone(Enum):
 
 
 class GoGroup:
-    def __init__(self, color: GoStone, stones: Set[Tuple[int, int]]):
+    """
+    A chain of connected stones. Stones and liberties are flat point indices
+    (x * board_size + y); the group is stored under its union-find root.
+    """
+
+    def __init__(self, color: GoStone, stones: Set[int]):
         self.color = color
         self.stones = stones
         self.liberties = set()
 
-    def add_liberty(self, pos: Tuple[int, int]) -> None:
+    def add_liberty(self, pos: int) -> None:
         self.liberties.add(pos)
 
-    def remove_liberty(self, pos: Tuple[int, int]) -> None:
+    def remove_liberty(self, pos: int) -> None:
         self.liberties.discard(pos)
 
     def is_captured(self) -> bool:
@@ -32,25 +42,54 @@ class GoGroup:
 
 
 class GoGame(AbstractGame):
-    def __init__(self, game_id: str, board_size: int = 19):
-        super().__init__(game_id)
+    def __init__(
+        self,
+        game_id: str,
+        board_size: int = 19,
+        komi: float = DEFAULT_KOMI,
+        scoring: str = TERRITORY,
+    ):
+        # Set before AbstractGame.__init__, which restores saved games
         self.board_size = board_size
-        self.board = np.zeros((board_size, board_size), dtype=int)
-        self.current_player = GoStone.BLACK
-        self.groups = []
-        self.ko_position = None
-        self.history = []
-        self.captured_stones = {GoStone.BLACK: 0, GoStone.WHITE: 0}
-        self._init_game()
+        self.komi = komi
+        self.scoring = scoring  # "territory" or "area" (see games.go.scoring)
+        super().__init__(game_id)
 
     def _init_game(self):
         """Initialize a new game"""
-        self.board = np.zeros((self.board_size, self.board_size), dtype=int)
+        size = self.board_size
+        self.board = np.zeros((size, size), dtype=np.int8)
         self.current_player = GoStone.BLACK
-        self.groups = []
+        # Union-find over points: parent index per point (-1 when empty) and
+        # the GoGroup of every root
+        self.parent = [-1] * (size * size)
+        self.groups: Dict[int, GoGroup] = {}
+        self.neighbors = [
+            [nx * size + ny for nx, ny in self._get_neighbors((x, y))]
+            for x in range(size)
+            for y in range(size)
+        ]
         self.ko_position = None
-        self.history = []
         self.captured_stones = {GoStone.BLACK: 0, GoStone.WHITE: 0}
+        self.consecutive_passes = 0
+        # Positional superko: Zobrist key of the stones on the board and the
+        # keys of every position seen so far
+        self.zobrist_key = 0
+        self.position_keys = KeySet([0])
+        # Compact move diffs for undo, one record per move:
+        # point (-1 for a pass), ko point before the move (-1 for none),
+        # the captured points, then the number of captured points
+        self.move_log = array("h")
+
+    def initialize_game(self) -> Dict[str, Any]:
+        """Initialize a new game instance"""
+        self._init_game()
+        return self.get_game_state()
+
+    def _restore_game_state(self):
+        """Rebuild the game by replaying the recorded moves"""
+        self._init_game()
+        self._replay_moves()
 
     def _get_neighbors(self, pos: Tuple[int, int]) -> List[Tuple[int, int]]:
         """Get all valid neighboring positions"""
@@ -62,55 +101,152 @@ class GoGame(AbstractGame):
                 neighbors.append((nx, ny))
         return neighbors
 
+    def _find(self, point: int) -> int:
+        """Union-find root of an occupied point (with path halving)"""
+        parent = self.parent
+        while parent[point] != point:
+            parent[point] = parent[parent[point]]
+            point = parent[point]
+        return point
+
     def _find_group(self, pos: Tuple[int, int]) -> Optional[GoGroup]:
         """Find the group containing the given position"""
-        for group in self.groups:
-            if pos in group.stones:
-                return group
-        return None
-
-    def _create_group(self, pos: Tuple[int, int], color: GoStone) -> GoGroup:
-        """Create a new group with the given stone"""
-        group = GoGroup(color, {pos})
-        for neighbor in self._get_neighbors(pos):
-            if self.board[neighbor] == 0:
+        point = pos[0] * self.board_size + pos[1]
+        if self.parent[point] < 0:
+            return None
+        return self.groups[self._find(point)]
+
+    def _union(self, a: int, b: int) -> int:
+        """Merge the groups rooted at a and b; the larger one absorbs the smaller"""
+        if a == b:
+            return a
+        if len(self.groups[a].stones) < len(self.groups[b].stones):
+            a, b = b, a
+        self.parent[b] = a
+        self.groups[a].merge(self.groups.pop(b))
+        return a
+
+    def _place_stone(self, point: int, color: GoStone) -> List[int]:
+        """
+        Put a stone on an empty point, merge it with friendly neighbors and
+        remove enemy groups left without liberties. Returns the captured points.
+        """
+        size = self.board_size
+        board = self.board
+        self.board[divmod(point, size)] = color.value
+        self.zobrist_key ^= ZOBRIST[(color.value, point)]
+        self.parent[point] = point
+        group = GoGroup(color, {point})
+        self.groups[point] = group
+
+        root = point
+        enemies = []
+        occupied = []
+        for neighbor in self.neighbors[point]:
+            if board[divmod(neighbor, size)] == 0:
                 group.add_liberty(neighbor)
-        return group
-
-    def _merge_groups(self, group: GoGroup, pos: Tuple[int, int]) -> None:
-        """Merge adjacent groups of the same color"""
-        for neighbor in self._get_neighbors(pos):
-            if self.board[neighbor] == group.color:
-                neighbor_group = self._find_group(neighbor)
-                if neighbor_group and neighbor_group != group:
-                    group.merge(neighbor_group)
-                    self.groups.remove(neighbor_group)
-
-    def _capture_groups(self, pos: Tuple[int, int]) -> None:
-        """Capture any groups that are surrounded"""
-        for neighbor in self._get_neighbors(pos):
-            if (
-                self.board[neighbor] != 0
-                and self.board[neighbor] != self.current_player.value
-            ):
-                group = self._find_group(neighbor)
-                if group and group.is_captured():
-                    self.captured_stones[GoStone(self.board[neighbor])] += len(
-                        group.stones
-                    )
-                    for stone in group.stones:
-                        self.board[stone] = 0
-                    self.groups.remove(group)
-
-    def _update_liberties(self, pos: Tuple[int, int]) -> None:
-        """Update liberties for all groups affected by a move"""
-        for neighbor in self._get_neighbors(pos):
-            if self.board[neighbor] != 0:
-                group = self._find_group(neighbor)
-                if group:
-                    group.remove_liberty(pos)
-                    if self.board[pos] == 0:
-                        group.add_liberty(pos)
+            else:
+                occupied.append(neighbor)
+        for neighbor in occupied:
+            value = board[divmod(neighbor, size)]
+            neighbor_root = self._find(neighbor)
+            self.groups[neighbor_root].remove_liberty(point)
+            if value == color.value:
+                root = self._union(root, neighbor_root)
+            else:
+                enemies.append(neighbor_root)
+
+        captured = []
+        for enemy_root in enemies:
+            enemy = self.groups.get(enemy_root)
+            if enemy is not None and enemy.is_captured():
+                captured.extend(self._remove_group(enemy_root))
+        return captured
+
+    def _remove_group(self, root: int) -> Set[int]:
+        """Take a group off the board, giving its points back as liberties"""
+        size = self.board_size
+        group = self.groups.pop(root)
+        for stone in group.stones:
+            self.board[divmod(stone, size)] = 0
+            self.zobrist_key ^= ZOBRIST[(group.color.value, stone)]
+            self.parent[stone] = -1
+        for stone in group.stones:
+            for neighbor in self.neighbors[stone]:
+                if self.parent[neighbor] >= 0:
+                    self.groups[self._find(neighbor)].add_liberty(stone)
+        self.captured_stones[group.color] += len(group.stones)
+        return group.stones
+
+    def _rebuild_groups(self) -> None:
+        """Recompute every group from self.board (after loading or editing it)"""
+        board = self.board
+        size = self.board_size
+        self.parent = [-1] * (size * size)
+        self.groups = {}
+        self.zobrist_key = 0
+        for point in range(size * size):
+            value = board[divmod(point, size)]
+            if value != 0:
+                self.zobrist_key ^= ZOBRIST[(int(value), point)]
+        self._build_groups(range(size * size))
+
+    def _build_groups(self, points: Iterable[int]) -> None:
+        """
+        Group the stones on points, which must hold whole chains (every stone
+        of a chain or none) and have no parent yet. Liberties are read from
+        the board.
+        """
+        board = self.board
+        size = self.board_size
+        for point in points:
+            value = board[divmod(point, size)]
+            if value == 0:
+                continue
+            self.parent[point] = point
+            group = GoGroup(GoStone(int(value)), {point})
+            group.liberties.update(
+                neighbor
+                for neighbor in self.neighbors[point]
+                if board[divmod(neighbor, size)] == 0
+            )
+            self.groups[point] = group
+            root = point
+            for neighbor in self.neighbors[point]:
+                if board[divmod(neighbor, size)] == value and self.parent[neighbor] >= 0:
+                    root = self._union(root, self._find(neighbor))
+
+    def _is_suicide(self, point: int, color: GoStone) -> bool:
+        """A stone is suicide if it ends with no liberties and captures nothing"""
+        size = self.board_size
+        for neighbor in self.neighbors[point]:
+            value = self.board[divmod(neighbor, size)]
+            if value == 0:
+                return False
+            liberties = len(self.groups[self._find(neighbor)].liberties)
+            if value == color.value:
+                if liberties > 1:
+                    return False  # Connects to a group with another liberty
+            elif liberties == 1:
+                return False  # Captures the neighboring group
+        return True
+
+    def _key_after(self, point: int, color: GoStone) -> int:
+        """Zobrist key of the position after color plays at point, captures included"""
+        size = self.board_size
+        key = self.zobrist_key ^ ZOBRIST[(color.value, point)]
+        seen = set()
+        for neighbor in self.neighbors[point]:
+            value = self.board[divmod(neighbor, size)]
+            if value == 0 or value == color.value:
+                continue
+            root = self._find(neighbor)
+            group = self.groups[root]
+            if root not in seen and group.liberties == {point}:
+                seen.add(root)
+                for stone in group.stones:
+                    key ^= ZOBRIST[(int(value), stone)]
+        return key
 
     def validate_move(self, move_data: Dict[str, Any]) -> bool:
         """Validate if a move is legal"""
@@ -132,59 +268,117 @@ class GoGame(AbstractGame):
             return False
 
         # Check for suicide
-        test_board = np.copy(self.board)
-        test_board[x, y] = self.current_player.value
-        group = self._create_group((x, y), self.current_player)
-        self._update_liberties((x, y))
-        return not group.is_captured()
+        point = x * self.board_size + y
+        if self._is_suicide(point, self.current_player):
+            return False
+
+        # Positional superko: the move may not recreate an earlier position
+        return self._key_after(point, self.current_player) not in self.position_keys
 
     def make_move(self, move_data: Dict[str, Any]) -> Dict[str, Any]:
         """Make a move in the game"""
         if not self.validate_move(move_data):
             raise ValueError("Invalid move")
 
-        if "pass" in move_data and move_data["pass"]:
-            self.history.append(None)
-            self.current_player = (
-                GoStone.WHITE if self.current_player == GoStone.BLACK else GoStone.BLACK
-            )
-            return self.get_game_state()
-
-        x, y = move_data["x"], move_data["y"]
-
-        # Place stone
-        self.board[x, y] = self.current_player.value
-
-        # Create new group
-        group = self._create_group((x, y), self.current_player)
-        self.groups.append(group)
-
-        # Merge with adjacent groups
-        self._merge_groups(group, (x, y))
-
-        # Capture any surrounded groups
-        self._capture_groups((x, y))
+        player = self.current_player
+        self._apply_move(move_data)
+        if move_data.get("pass"):
+            recorded = {"pass": True}
+        else:
+            recorded = {"x": move_data["x"], "y": move_data["y"]}
+        self._record_move(player.name, recorded)
+        return self.get_game_state()
 
-        # Update liberties
-        self._update_liberties((x, y))
+    def _apply_move(self, move_data: Dict[str, Any]) -> None:
+        """Play a validated move without recording it"""
+        ko_before = self.ko_position
+        ko_point = -1 if ko_before is None else ko_before[0] * self.board_size + ko_before[1]
 
-        # Check for ko
-        if len(self.history) >= 2:
-            last_state = self.history[-2]
-            if last_state is not None and np.array_equal(last_state, self.board):
-                self.ko_position = (x, y)
+        if move_data.get("pass"):
+            self.consecutive_passes += 1
+            self.ko_position = None
+            self.move_log.extend((-1, ko_point, 0))
+        else:
+            self.consecutive_passes = 0
+            x, y = move_data["x"], move_data["y"]
+
+            # Place stone, merging and capturing through the union-find
+            point = x * self.board_size + y
+            captured = self._place_stone(point, self.current_player)
+
+            # Simple ko: a lone stone that captured a single stone and has that
+            # point as its only liberty may not be retaken immediately
+            group = self.groups[self._find(point)]
+            if len(captured) == 1 and len(group.stones) == 1 and group.liberties == set(captured):
+                self.ko_position = divmod(captured[0], self.board_size)
             else:
                 self.ko_position = None
 
+            self.position_keys.add(self.zobrist_key)
+            self.move_log.extend((point, ko_point))
+            self.move_log.extend(sorted(captured))
+            self.move_log.append(len(captured))
+
         # Switch player
         self.current_player = (
             GoStone.WHITE if self.current_player == GoStone.BLACK else GoStone.BLACK
         )
 
-        # Add move to history
-        self.history.append(np.copy(self.board))
-
-        return self.get_game_state()
+    def _undo_move(self) -> None:
+        """Take back the last move using its diff record (for analysis; history is not rewritten)"""
+        log = self.move_log
+        count = log[-1]
+        captured = log[len(log) - 1 - count:len(log) - 1]
+        ko_point = log[-2 - count]
+        point = log[-3 - count]
+        del log[len(log) - 3 - count:]
+
+        mover = GoStone.WHITE if self.current_player == GoStone.BLACK else GoStone.BLACK
+        self.current_player = mover
+        self.ko_position = None if ko_point < 0 else divmod(ko_point, self.board_size)
+        self.consecutive_passes = self._trailing_passes()
+        if point < 0:
+            return
+
+        opponent = GoStone.WHITE if mover == GoStone.BLACK else GoStone.BLACK
+        self.position_keys.discard(self.zobrist_key)
+        size = self.board_size
+
+        # Only the stone's chain and the captured chains change: take the
+        # chain apart, put the stones back and regroup just those points
+        chain = self.groups.pop(self._find(point)).stones
+        for stone in chain:
+            self.parent[stone] = -1
+        self.board[divmod(point, size)] = 0
+        self.zobrist_key ^= ZOBRIST[(mover.value, point)]
+        for stone in captured:
+            self.board[divmod(stone, size)] = opponent.value
+            self.zobrist_key ^= ZOBRIST[(opponent.value, stone)]
+        self.captured_stones[opponent] -= len(captured)
+        changed = chain | set(captured)
+        self._build_groups(changed - {point})
+
+        # Other chains regain the emptied point and lose the refilled ones
+        for neighbor in self.neighbors[point]:
+            if self.parent[neighbor] >= 0 and neighbor not in changed:
+                self.groups[self._find(neighbor)].add_liberty(point)
+        for stone in captured:
+            for neighbor in self.neighbors[stone]:
+                if self.parent[neighbor] >= 0 and neighbor not in changed:
+                    self.groups[self._find(neighbor)].remove_liberty(stone)
+
+    def _trailing_passes(self) -> int:
+        """Number of passes at the end of the move log (at most two matter)"""
+        log = self.move_log
+        passes = 0
+        end = len(log)
+        while end and passes < 2:
+            start = end - 3 - log[end - 1]
+            if log[start] >= 0:
+                break
+            passes += 1
+            end = start
+        return passes
 
     def get_game_state(self) -> Dict[str, Any]:
         """Get the current game state"""
@@ -200,59 +394,24 @@ class GoGame(AbstractGame):
     def is_game_over(self) -> bool:
         """Check if the game is over"""
         # Game ends when both players pass consecutively
-        if len(self.history) >= 2:
-            last_two = self.history[-2:]
-            return all(move is None for move in last_two)
-        return False
+        return self.consecutive_passes >= 2
+
+    def score(self) -> Dict[str, float]:
+        """Current score under self.scoring rules, komi included"""
+        # captured_stones counts stones lost by each color
+        prisoners = (
+            self.captured_stones[GoStone.WHITE],
+            self.captured_stones[GoStone.BLACK],
+        )
+        return score_board(self.board, prisoners, self.komi, self.scoring)
 
     def get_winner(self) -> Optional[str]:
         """Get the winner if game is over"""
         if not self.is_game_over():
             return None
 
-        # Calculate territory for each player
-        territory = {GoStone.BLACK: 0, GoStone.WHITE: 0}
-        visited = set()
-
-        for x in range(self.board_size):
-            for y in range(self.board_size):
-                if (x, y) in visited or self.board[x, y] != 0:
-                    continue
-
-                # Find territory region
-                region = set()
-                frontier = [(x, y)]
-
-                while frontier:
-                    pos = frontier.pop()
-                    if pos in visited:
-                        continue
-
-                    visited.add(pos)
-                    region.add(pos)
-
-                    for neighbor in self._get_neighbors(pos):
-                        if neighbor not in visited and self.board[neighbor] == 0:
-                            frontier.append(neighbor)
-
-                # Determine territory ownership
-                adjacent_colors = set()
-                for pos in region:
-                    for neighbor in self._get_neighbors(pos):
-                        if self.board[neighbor] != 0:
-                            adjacent_colors.add(GoStone(self.board[neighbor]))
-
-                if len(adjacent_colors) == 1:
-                    territory[list(adjacent_colors)[0]] += len(region)
-
-        # Calculate total score for each player
-        scores = {
-            GoStone.BLACK: territory[GoStone.BLACK]
-            + self.captured_stones[GoStone.BLACK],
-            GoStone.WHITE: territory[GoStone.WHITE]
-            + self.captured_stones[GoStone.WHITE]
-            + 7.5,  # Komi
-        }
+        score = self.score()
+        scores = {GoStone.BLACK: score["black"], GoStone.WHITE: score["white"]}
 
         if scores[GoStone.BLACK] > scores[GoStone.WHITE]:
             return "black"
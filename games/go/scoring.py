@@ -0,0 +1,86 @@
+"""
+Vectorized Go scoring.
+
+Empty regions are assigned by iterative dilation instead of a per-point flood
+fill: the empty points reachable from black stones (moving only through empty
+points) are grown one step at a time with array shifts until nothing changes,
+and likewise for white. An empty point reached by exactly one color is that
+color's territory, which is the same as asking whether its region borders
+only that color. Every operation works on a stack of boards, so thousands of
+archived games can be scored in one call.
+"""
+from typing import Dict, Optional, Sequence, Tuple
+import numpy as np
+
+EMPTY, BLACK, WHITE = 0, 1, 2
+AREA = "area"  # stones on the board + territory (Chinese rules)
+TERRITORY = "territory"  # territory + prisoners (Japanese rules)
+RULES = (AREA, TERRITORY)
+DEFAULT_KOMI = 7.5
+
+
+def _dilate(mask: np.ndarray) -> np.ndarray:
+    """Grow a (..., n, n) boolean mask by one point in the four directions"""
+    grown = mask.copy()
+    grown[..., 1:, :] |= mask[..., :-1, :]
+    grown[..., :-1, :] |= mask[..., 1:, :]
+    grown[..., :, 1:] |= mask[..., :, :-1]
+    grown[..., :, :-1] |= mask[..., :, 1:]
+    return grown
+
+
+def reach(stones: np.ndarray, empty: np.ndarray) -> np.ndarray:
+    """Empty points connected to stones through empty points"""
+    reached = _dilate(stones) & empty
+    while True:
+        grown = _dilate(reached) & empty | reached
+        if np.array_equal(grown, reached):
+            return reached
+        reached = grown
+
+
+def territory(boards: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Black and white territory masks for a board or a stack of boards"""
+    boards = np.asarray(boards)
+    empty = boards == EMPTY
+    black_reach = reach(boards == BLACK, empty)
+    white_reach = reach(boards == WHITE, empty)
+    return black_reach & ~white_reach, white_reach & ~black_reach
+
+
+def score_boards(
+    boards: np.ndarray,
+    prisoners: Optional[Sequence[Sequence[int]]] = None,
+    komi: float = DEFAULT_KOMI,
+    rules: str = AREA,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Score a stack of boards with shape (games, n, n). prisoners holds
+    (captured by black, captured by white) per game and only counts under
+    territory rules. Returns float arrays of black and white scores.
+    """
+    if rules not in RULES:
+        raise ValueError(f"Invalid scoring rules: {rules}")
+    boards = np.asarray(boards)
+    black_territory, white_territory = territory(boards)
+    black = black_territory.sum(axis=(-2, -1)).astype(float)
+    white = white_territory.sum(axis=(-2, -1)).astype(float)
+    if rules == AREA:
+        black += (boards == BLACK).sum(axis=(-2, -1))
+        white += (boards == WHITE).sum(axis=(-2, -1))
+    elif prisoners is not None:
+        prisoners = np.asarray(prisoners, dtype=float).reshape(black.shape + (2,))
+        black += prisoners[..., 0]
+        white += prisoners[..., 1]
+    return black, white + komi
+
+
+def score_board(
+    board: np.ndarray,
+    prisoners: Tuple[int, int] = (0, 0),
+    komi: float = DEFAULT_KOMI,
+    rules: str = AREA,
+) -> Dict[str, float]:
+    """Score a single board; returns {"black": ..., "white": ...}"""
+    black, white = score_boards(np.asarray(board)[None], [prisoners], komi, rules)
+    return {"black": float(black[0]), "white": float(white[0])}
@@ -1,25 +1,21 @@
 from game_abc import AbstractGame, GameMove, GameHistory
+from games.cards import CardSet, card_count, draw, hand_mask, shuffled
 from typing import Dict, Any, Optional, List, Tuple, Set
 import numpy as np
 from enum import Enum
 import time
-import random
 from collections import defaultdict
 
 
-class Card:
-    def __init__(self, suit: str, rank: int):
-        self.suit = suit
-        self.rank = rank
+SUITS = ["♠", "♥", "♦", "♣"]
+RANKS = range(1, 14)
+# Rank-major codes, so the four cards of a rank are one nibble of a hand mask
+CARDS = CardSet.product(rank=RANKS, suit=SUITS)
 
-    def __eq__(self, other):
-        return self.rank == other.rank
 
-    def __hash__(self):
-        return hash(self.rank)
-
-    def to_dict(self) -> Dict[str, Any]:
-        return {"suit": self.suit, "rank": self.rank}
+def rank_mask(rank: int) -> int:
+    """Hand mask of the four cards of a rank"""
+    return 0xF << 4 * (rank - 1)
 
 
 class GoFishGame(AbstractGame):
@@ -27,64 +23,49 @@ class GoFishGame(AbstractGame):
         super().__init__(game_id)
         self.num_players = num_players
         self.current_player = 0
-        self.deck = []
-        self.hands = defaultdict(list)
-        self.fish_pile = []
+        self.hands = defaultdict(int)  # card bitmasks
+        self.fish_pile = CARDS.deck()[:0]
         self.book_count = defaultdict(int)
         self._init_game()
 
     def _init_game(self):
         """Initialize a new game"""
-        self.deck = []
-        self.hands = defaultdict(list)
-        self.fish_pile = []
+        self.reset_rng()
+        self.hands = defaultdict(int)
         self.book_count = defaultdict(int)
         self.current_player = 0
 
-        # Create deck (4 suits, ranks 1-13)
-        suits = ["♠", "♥", "♦", "♣"]
-        for suit in suits:
-            for rank in range(1, 14):
-                self.deck.append(Card(suit, rank))
-        random.shuffle(self.deck)
-
-        # Deal initial cards
+        # Deal initial cards; the rest of the deck is the fish pile
+        self.fish_pile = shuffled(CARDS.deck(), self.rng)
         for i in range(self.num_players):
-            self.hands[i] = [self.deck.pop() for _ in range(7)]
+            cards, self.fish_pile = draw(self.fish_pile, 7)
+            self.hands[i] = hand_mask(cards)
             self._check_books(i)
 
-        # Place remaining cards in fish pile
-        self.fish_pile = self.deck
-
     def _check_books(self, player: int) -> None:
         """Check player's hand for books (4 of a kind)"""
         if player not in self.hands:
             return
 
-        hand = self.hands[player]
-        counts = defaultdict(int)
-
-        # Count cards
-        for card in hand:
-            counts[card.rank] += 1
-
         # Find books
-        books = [rank for rank, count in counts.items() if count == 4]
+        books = [rank for rank in RANKS if self.hands[player] & rank_mask(rank) == rank_mask(rank)]
         if not books:
             return
 
         # Remove books from hand
         for rank in books:
             self.book_count[player] += 1
-            self.hands[player] = [card for card in hand if card.rank != rank]
+            self.hands[player] &= ~rank_mask(rank)
 
         # Draw cards to replace books
-        while len(self.hands[player]) < 7 and self.fish_pile:
-            self.hands[player].append(self.fish_pile.pop())
+        count = min(7 - card_count(self.hands[player]), len(self.fish_pile))
+        if count > 0:
+            cards, self.fish_pile = draw(self.fish_pile, count)
+            self.hands[player] |= hand_mask(cards)
 
     def _has_rank(self, player: int, rank: int) -> bool:
         """Check if player has cards of the given rank"""
-        return any(card.rank == rank for card in self.hands[player])
+        return rank in RANKS and bool(self.hands[player] & rank_mask(rank))
 
     def validate_move(self, move_data: Dict[str, Any]) -> bool:
         """Validate if a move is legal"""
@@ -119,17 +100,9 @@ class GoFishGame(AbstractGame):
         # Check if target player has the rank
         if self._has_rank(target_player, rank):
             # Take cards from target player
-            self.hands[target_player] = [
-                card for card in self.hands[target_player] if card.rank != rank
-            ]
-            self.hands[self.current_player] = [
-                card for card in self.hands[self.current_player] if card.rank != rank
-            ]
-
-            # Add cards to current player's hand
-            self.hands[self.current_player].extend(
-                card for card in self.hands[target_player] if card.rank == rank
-            )
+            taken = self.hands[target_player] & rank_mask(rank)
+            self.hands[target_player] &= ~taken
+            self.hands[self.current_player] |= taken
 
             # Check for books
             self._check_books(self.current_player)
@@ -139,8 +112,9 @@ class GoFishGame(AbstractGame):
 
         else:
             # Go fish
-            if self.fish_pile:
-                self.hands[self.current_player].append(self.fish_pile.pop())
+            if len(self.fish_pile):
+                (card,), self.fish_pile = draw(self.fish_pile)
+                self.hands[self.current_player] |= 1 << card
                 self._check_books(self.current_player)
 
             # Move to next player
@@ -151,9 +125,7 @@ class GoFishGame(AbstractGame):
     def get_game_state(self) -> Dict[str, Any]:
         """Get the current game state"""
         return {
-            "hands": {
-                str(k): [card.to_dict() for card in v] for k, v in self.hands.items()
-            },
+            "hands": {str(k): CARDS.mask_faces(v) for k, v in self.hands.items()},
             "current_player": self.current_player,
             "fish_pile_size": len(self.fish_pile),
             "book_count": dict(self.book_count),
@@ -163,7 +135,7 @@ class GoFishGame(AbstractGame):
 
     def is_game_over(self) -> bool:
         """Check if the game is over"""
-        return not self.fish_pile and all(
+        return not len(self.fish_pile) and all(
             not self.hands[i] for i in range(self.num_players)
         )
 
@@ -1,40 +1,89 @@
 from game_abc import AbstractGame, GameMove, GameHistory
+from games.cards import CardSet, draw, hand_mask, shuffled
 from typing import Dict, Any, Optional, List, Tuple, Set
 import numpy as np
 from enum import Enum
 import time
-import random
 from collections import defaultdict
 
 
-class HanafudaCard:
-    def __init__(self, month: int, rank: str, points: int, suit: str):
-        self.month = month
-        self.rank = rank
-        self.points = points
-        self.suit = suit
-        self.value = self._get_card_value()
-
-    def _get_card_value(self) -> int:
-        """Get the card's value for comparison"""
-        return self.month * 100 + self.points
-
-    def __lt__(self, other):
-        return self.value < other.value
-
-    def __eq__(self, other):
-        return self.value == other.value
-
-    def __hash__(self):
-        return hash((self.month, self.rank, self.points, self.suit))
-
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            "month": self.month,
-            "rank": self.rank,
-            "points": self.points,
-            "suit": self.suit,
-        }
+# The 48 Hanafuda cards
+CARDS = CardSet(
+    [
+        # Bright cards (20 points)
+        {"month": 1, "rank": "Pine", "points": 20, "suit": "Bright"},  # January
+        {"month": 2, "rank": "Plum", "points": 20, "suit": "Bright"},  # February
+        {"month": 3, "rank": "Cherry", "points": 20, "suit": "Bright"},  # March
+        {"month": 4, "rank": "Wisteria", "points": 20, "suit": "Bright"},  # April
+        {"month": 5, "rank": "Iris", "points": 20, "suit": "Bright"},  # May
+        {"month": 6, "rank": "Peony", "points": 20, "suit": "Bright"},  # June
+        {"month": 7, "rank": "Bush Clover", "points": 20, "suit": "Bright"},  # July
+        {"month": 8, "rank": "Autumn Grass", "points": 20, "suit": "Bright"},  # August
+        {"month": 9, "rank": "Chrysanthemum", "points": 20, "suit": "Bright"},  # September
+        {"month": 10, "rank": "Maple", "points": 20, "suit": "Bright"},  # October
+        {"month": 11, "rank": "Willow", "points": 20, "suit": "Bright"},  # November
+        {"month": 12, "rank": "Paulownia", "points": 20, "suit": "Bright"},  # December
+        # Animals (10 points)
+        {"month": 1, "rank": "Crane", "points": 10, "suit": "Animal"},
+        {"month": 2, "rank": "Nightingale", "points": 10, "suit": "Animal"},
+        {"month": 3, "rank": "Kite", "points": 10, "suit": "Animal"},
+        {"month": 4, "rank": "Cuckoo", "points": 10, "suit": "Animal"},
+        {"month": 5, "rank": "Butterfly", "points": 10, "suit": "Animal"},
+        {"month": 6, "rank": "Boar", "points": 10, "suit": "Animal"},
+        {"month": 7, "rank": "Mandarin Duck", "points": 10, "suit": "Animal"},
+        {"month": 8, "rank": "Geese", "points": 10, "suit": "Animal"},
+        {"month": 9, "rank": "Swallow", "points": 10, "suit": "Animal"},
+        {"month": 10, "rank": "Deer", "points": 10, "suit": "Animal"},
+        {"month": 11, "rank": "Wild Goose", "points": 10, "suit": "Animal"},
+        {"month": 12, "rank": "Pheasant", "points": 10, "suit": "Animal"},
+        # Ribbons (5 points)
+        {"month": 1, "rank": "Red Ribbon", "points": 5, "suit": "Ribbon"},
+        {"month": 2, "rank": "Blue Ribbon", "points": 5, "suit": "Ribbon"},
+        {"month": 3, "rank": "Purple Ribbon", "points": 5, "suit": "Ribbon"},
+        {"month": 4, "rank": "Green Ribbon", "points": 5, "suit": "Ribbon"},
+        {"month": 5, "rank": "Yellow Ribbon", "points": 5, "suit": "Ribbon"},
+        {"month": 6, "rank": "Red Ribbon", "points": 5, "suit": "Ribbon"},
+        {"month": 7, "rank": "Blue Ribbon", "points": 5, "suit": "Ribbon"},
+        {"month": 8, "rank": "Purple Ribbon", "points": 5, "suit": "Ribbon"},
+        {"month": 9, "rank": "Green Ribbon", "points": 5, "suit": "Ribbon"},
+        {"month": 10, "rank": "Yellow Ribbon", "points": 5, "suit": "Ribbon"},
+        {"month": 11, "rank": "Red Ribbon", "points": 5, "suit": "Ribbon"},
+        {"month": 12, "rank": "Blue Ribbon", "points": 5, "suit": "Ribbon"},
+        # Plain cards (1 point)
+        {"month": 1, "rank": "Plain", "points": 1, "suit": "Plain"},
+        {"month": 2, "rank": "Plain", "points": 1, "suit": "Plain"},
+        {"month": 3, "rank": "Plain", "points": 1, "suit": "Plain"},
+        {"month": 4, "rank": "Plain", "points": 1, "suit": "Plain"},
+        {"month": 5, "rank": "Plain", "points": 1, "suit": "Plain"},
+        {"month": 6, "rank": "Plain", "points": 1, "suit": "Plain"},
+        {"month": 7, "rank": "Plain", "points": 1, "suit": "Plain"},
+        {"month": 8, "rank": "Plain", "points": 1, "suit": "Plain"},
+        {"month": 9, "rank": "Plain", "points": 1, "suit": "Plain"},
+        {"month": 10, "rank": "Plain", "points": 1, "suit": "Plain"},
+        {"month": 11, "rank": "Plain", "points": 1, "suit": "Plain"},
+        {"month": 12, "rank": "Plain", "points": 1, "suit": "Plain"},
+    ]
+)
+
+
+def _can_capture(card1: Dict[str, Any], card2: Dict[str, Any]) -> bool:
+    """Check if card1 can capture card2"""
+    # Same month capture
+    if card1["month"] == card2["month"]:
+        return True
+
+    # Bright card capture
+    if card1["suit"] == "Bright" and card2["points"] == 1:
+        return True
+
+    return False
+
+
+# CAPTURES[card] is the mask of the cards it captures
+CAPTURES = [
+    hand_mask(code for code, other in enumerate(CARDS.faces) if _can_capture(face, other))
+    for face in CARDS.faces
+]
 
 
 class HanafudaGame(AbstractGame):
@@ -42,116 +91,30 @@ class HanafudaGame(AbstractGame):
         super().__init__(game_id)
         self.num_players = num_players
         self.current_player = 0
-        self.hands = defaultdict(list)
-        self.deck = []
-        self.field = []
+        # Hands and the field are card bitmasks
+        self.hands = defaultdict(int)
+        self.deck = CARDS.deck()[:0]
+        self.field = 0
         self.scores = defaultdict(int)
         self._init_game()
 
     def _init_game(self):
         """Initialize a new game"""
-        self.hands = defaultdict(list)
+        self.reset_rng()
+        self.hands = defaultdict(int)
         self.current_player = 0
-        self.deck = []
-        self.field = []
         self.scores = defaultdict(int)
 
-        # Create deck (48 Hanafuda cards)
-        hanafuda_cards = [
-            # Bright cards (20 points)
-            HanafudaCard(1, "Pine", 20, "Bright"),  # January
-            HanafudaCard(2, "Plum", 20, "Bright"),  # February
-            HanafudaCard(3, "Cherry", 20, "Bright"),  # March
-            HanafudaCard(4, "Wisteria", 20, "Bright"),  # April
-            HanafudaCard(5, "Iris", 20, "Bright"),  # May
-            HanafudaCard(6, "Peony", 20, "Bright"),  # June
-            HanafudaCard(7, "Bush Clover", 20, "Bright"),  # July
-            HanafudaCard(8, "Autumn Grass", 20, "Bright"),  # August
-            HanafudaCard(9, "Chrysanthemum", 20, "Bright"),  # September
-            HanafudaCard(10, "Maple", 20, "Bright"),  # October
-            HanafudaCard(11, "Willow", 20, "Bright"),  # November
-            HanafudaCard(12, "Paulownia", 20, "Bright"),  # December
-            # Animals (10 points)
-            HanafudaCard(1, "Crane", 10, "Animal"),
-            HanafudaCard(2, "Nightingale", 10, "Animal"),
-            HanafudaCard(3, "Kite", 10, "Animal"),
-            HanafudaCard(4, "Cuckoo", 10, "Animal"),
-            HanafudaCard(5, "Butterfly", 10, "Animal"),
-            HanafudaCard(6, "Boar", 10, "Animal"),
-            HanafudaCard(7, "Mandarin Duck", 10, "Animal"),
-            HanafudaCard(8, "Geese", 10, "Animal"),
-            HanafudaCard(9, "Swallow", 10, "Animal"),
-            HanafudaCard(10, "Deer", 10, "Animal"),
-            HanafudaCard(11, "Wild Goose", 10, "Animal"),
-            HanafudaCard(12, "Pheasant", 10, "Animal"),
-            # Ribbons (5 points)
-            HanafudaCard(1, "Red Ribbon", 5, "Ribbon"),
-            HanafudaCard(2, "Blue Ribbon", 5, "Ribbon"),
-            HanafudaCard(3, "Purple Ribbon", 5, "Ribbon"),
-            HanafudaCard(4, "Green Ribbon", 5, "Ribbon"),
-            HanafudaCard(5, "Yellow Ribbon", 5, "Ribbon"),
-            HanafudaCard(6, "Red Ribbon", 5, "Ribbon"),
-            HanafudaCard(7, "Blue Ribbon", 5, "Ribbon"),
-            HanafudaCard(8, "Purple Ribbon", 5, "Ribbon"),
-            HanafudaCard(9, "Green Ribbon", 5, "Ribbon"),
-            HanafudaCard(10, "Yellow Ribbon", 5, "Ribbon"),
-            HanafudaCard(11, "Red Ribbon", 5, "Ribbon"),
-            HanafudaCard(12, "Blue Ribbon", 5, "Ribbon"),
-            # Plain cards (1 point)
-            HanafudaCard(1, "Plain", 1, "Plain"),
-            HanafudaCard(2, "Plain", 1, "Plain"),
-            HanafudaCard(3, "Plain", 1, "Plain"),
-            HanafudaCard(4, "Plain", 1, "Plain"),
-            HanafudaCard(5, "Plain", 1, "Plain"),
-            HanafudaCard(6, "Plain", 1, "Plain"),
-            HanafudaCard(7, "Plain", 1, "Plain"),
-            HanafudaCard(8, "Plain", 1, "Plain"),
-            HanafudaCard(9, "Plain", 1, "Plain"),
-            HanafudaCard(10, "Plain", 1, "Plain"),
-            HanafudaCard(11, "Plain", 1, "Plain"),
-            HanafudaCard(12, "Plain", 1, "Plain"),
-        ]
-
-        # Shuffle deck
-        random.shuffle(hanafuda_cards)
-        self.deck = hanafuda_cards
+        self.deck = shuffled(CARDS.deck(), self.rng)
 
         # Deal cards (8 cards to each player)
         for i in range(self.num_players):
-            for _ in range(8):
-                self.hands[i].append(self.deck.pop())
+            cards, self.deck = draw(self.deck, 8)
+            self.hands[i] = hand_mask(cards)
 
         # Place 8 cards on the field
-        for _ in range(8):
-            self.field.append(self.deck.pop())
-
-    def _can_capture(self, card1: HanafudaCard, card2: HanafudaCard) -> bool:
-        """Check if card1 can capture card2"""
-        # Same month capture
-        if card1.month == card2.month:
-            return True
-
-        # Bright card capture
-        if card1.suit == "Bright" and card2.points == 1:
-            return True
-
-        # Animal capture
-        if (
-            card1.suit == "Animal"
-            and card2.suit == "Animal"
-            and card1.month == card2.month
-        ):
-            return True
-
-        # Ribbon capture
-        if (
-            card1.suit == "Ribbon"
-            and card2.suit == "Ribbon"
-            and card1.month == card2.month
-        ):
-            return True
-
-        return False
+        cards, self.deck = draw(self.deck, 8)
+        self.field = hand_mask(cards)
 
     def validate_move(self, move_data: Dict[str, Any]) -> bool:
         """Validate if a move is legal"""
@@ -164,21 +127,13 @@ class HanafudaGame(AbstractGame):
             if "card" not in move_data:
                 return False
 
-            card = HanafudaCard(
-                move_data["card"]["month"],
-                move_data["card"]["rank"],
-                move_data["card"]["points"],
-                move_data["card"]["suit"],
-            )
-            if card not in self.hands[self.current_player]:
+            try:
+                card = CARDS.code(move_data["card"])
+            except ValueError:
                 return False
 
-            # Check if we can capture any field cards
-            if any(self._can_capture(card, field_card) for field_card in self.field):
-                return True
-
-            # If no capture, must place on field
-            return True
+            # Any card in hand captures or is placed on the field
+            return bool(self.hands[self.current_player] >> card & 1)
 
         return False
 
@@ -190,35 +145,29 @@ class HanafudaGame(AbstractGame):
         action = move_data["action"]
 
         if action == "play":
-            card = HanafudaCard(
-                move_data["card"]["month"],
-                move_data["card"]["rank"],
-                move_data["card"]["points"],
-                move_data["card"]["suit"],
-            )
+            card = CARDS.code(move_data["card"])
 
             # Remove card from hand
-            self.hands[self.current_player].remove(card)
+            self.hands[self.current_player] &= ~(1 << card)
 
             # Check for captures
-            captured = []
-            for field_card in self.field:
-                if self._can_capture(card, field_card):
-                    captured.append(field_card)
+            captured = self.field & CAPTURES[card]
 
             # If captured cards, add to score
             if captured:
-                for captured_card in captured:
-                    self.scores[self.current_player] += captured_card.points
-                    self.field.remove(captured_card)
-                self.scores[self.current_player] += card.points
+                self.scores[self.current_player] += sum(
+                    face["points"] for face in CARDS.mask_faces(captured)
+                )
+                self.field &= ~captured
+                self.scores[self.current_player] += CARDS.faces[card]["points"]
             else:
                 # If no capture, place on field
-                self.field.append(card)
+                self.field |= 1 << card
 
         # Draw a card if possible
-        if self.deck:
-            self.hands[self.current_player].append(self.deck.pop())
+        if len(self.deck):
+            (card,), self.deck = draw(self.deck)
+            self.hands[self.current_player] |= 1 << card
 
         # Move to next player
         self.current_player = (self.current_player + 1) % self.num_players
@@ -228,11 +177,9 @@ class HanafudaGame(AbstractGame):
     def get_game_state(self) -> Dict[str, Any]:
         """Get the current game state"""
         return {
-            "hands": {
-                str(k): [card.to_dict() for card in v] for k, v in self.hands.items()
-            },
+            "hands": {str(k): CARDS.mask_faces(v) for k, v in self.hands.items()},
             "current_player": self.current_player,
-            "field": [card.to_dict() for card in self.field],
+            "field": CARDS.mask_faces(self.field),
             "scores": self.scores,
             "game_over": self.is_game_over(),
             "winner": self.get_winner(),
@@ -240,7 +187,7 @@ class HanafudaGame(AbstractGame):
 
     def is_game_over(self) -> bool:
         """Check if the game is over"""
-        return not self.deck and all(len(hand) == 0 for hand in self.hands.values())
+        return not len(self.deck) and not any(self.hands.values())
 
     def get_winner(self) -> Optional[int]:
         """Get the winner if game is over"""
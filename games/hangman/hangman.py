@@ -3,7 +3,6 @@ from typing import Dict, Any, Optional, List, Tuple, Set
 import numpy as np
 from enum import Enum
 import time
-import random
 from collections import defaultdict
 
 
@@ -49,16 +48,17 @@ class HangmanGame(AbstractGame):
 
     def _init_game(self):
         """Initialize a new game"""
+        self.reset_rng()
         self.phase = "setup"
         self.guesses = set()
         self.incorrect_guesses = set()
 
         # Choose a random word
-        self.current_word = random.choice(self.word_list).lower()
+        self.current_word = self.rng.choice(self.word_list).lower()
 
         # Make sure word doesn't have duplicate letters
         while len(set(self.current_word)) != len(self.current_word):
-            self.current_word = random.choice(self.word_list).lower()
+            self.current_word = self.rng.choice(self.word_list).lower()
 
     def validate_move(self, move_data: Dict[str, Any]) -> bool:
         """Validate if a move is legal"""
@@ -1,19 +1,25 @@
 from game_abc import AbstractGame, GameMove, GameHistory
+from games.cards import CardSet, draw, shuffled
 from typing import Dict, Any, Optional, List, Tuple, Set
 import numpy as np
 from enum import Enum
 import time
-import random
 from collections import defaultdict
 
 
-class Card:
-    def __init__(self, type: str, value: int = 1):
-        self.type = type
-        self.value = value
-
-    def to_dict(self) -> Dict[str, Any]:
-        return {"type": self.type, "value": self.value}
+# Number of cards of each type in the deck
+GOODS = {
+    "diamond": 6,
+    "gold": 6,
+    "silver": 6,
+    "cloth": 8,
+    "spice": 8,
+    "camel": 11,
+}
+CARDS = CardSet([{"type": good, "value": 1} for good in GOODS])
+TYPES = [face["type"] for face in CARDS.faces]
+CAMEL = TYPES.index("camel")
+DECK = np.repeat(np.arange(len(GOODS), dtype=np.uint8), list(GOODS.values()))
 
 
 class JaipurGame(AbstractGame):
@@ -21,6 +27,7 @@ class JaipurGame(AbstractGame):
         super().__init__(game_id)
         self.current_player = 0
         self.camel_count = 0
+        # Market and herd cards are card codes; hands count cards by type
         self.market = []
         self.camel_market = []
         self.players = [{}, {}]  # player 0 and player 1
@@ -31,6 +38,7 @@ class JaipurGame(AbstractGame):
 
     def _init_game(self):
         """Initialize a new game"""
+        self.reset_rng()
         self.current_player = 0
         self.phase = "setup"
         self.camel_count = 0
@@ -46,45 +54,38 @@ class JaipurGame(AbstractGame):
             self.tokens[good] = token_values[:]
         self.tokens["camel"] = [1, 1, 1, 1, 1, 2, 2, 2, 3, 3, 4, 5]
 
-        # Create deck
-        goods = {
-            "diamond": 6,
-            "gold": 6,
-            "silver": 6,
-            "cloth": 8,
-            "spice": 8,
-            "camel": 11,
-        }
-
-        deck = []
-        for good, count in goods.items():
-            deck.extend([Card(good) for _ in range(count)])
-
-        random.shuffle(deck)
+        deck = shuffled(DECK, self.rng)
 
         # Deal cards
-        for _ in range(5):
-            self.players[0][deck.pop().type] = (
-                self.players[0].get(deck.pop().type, 0) + 1
-            )
-            self.players[1][deck.pop().type] = (
-                self.players[1].get(deck.pop().type, 0) + 1
-            )
+        for player in self.players:
+            cards, deck = draw(deck, 5)
+            for card in cards:
+                player[TYPES[card]] = player.get(TYPES[card], 0) + 1
 
         # Place camels in market
-        while deck[-1].type == "camel":
-            self.camel_herd.append(deck.pop())
+        while deck[-1] == CAMEL:
+            cards, deck = draw(deck)
+            self.camel_herd += cards
 
         # Place initial market cards
-        for _ in range(5):
-            card = deck.pop()
-            if card.type == "camel":
+        cards, deck = draw(deck, 5)
+        for card in cards:
+            if card == CAMEL:
                 self.camel_market.append(card)
             else:
                 self.market.append(card)
 
         self.deck = deck
 
+    def _refill_market(self, count: int) -> None:
+        """Draw count cards from the deck into the market"""
+        for _ in range(min(count, len(self.deck))):
+            (card,), self.deck = draw(self.deck)
+            if card == CAMEL:
+                self.camel_market.append(card)
+            else:
+                self.market.append(card)
+
     def validate_move(self, move_data: Dict[str, Any]) -> bool:
         """Validate if a move is legal"""
         if "action" not in move_data:
@@ -100,7 +101,7 @@ class JaipurGame(AbstractGame):
             card_type = move_data["card"]
 
             # Check if card exists in market
-            if card_type not in [card.type for card in self.market]:
+            if card_type not in [TYPES[card] for card in self.market]:
                 return False
 
             # Check if player can take card
@@ -112,7 +113,7 @@ class JaipurGame(AbstractGame):
                 return False
 
             # Check if taking multiple cards of same type
-            if len([c for c in self.market if c.type == card_type]) > 1:
+            if len([c for c in self.market if TYPES[c] == card_type]) > 1:
                 return True
 
             return False
@@ -141,11 +142,11 @@ class JaipurGame(AbstractGame):
             take = move_data["take"]
 
             # Check if player has cards to give
-            if not all(player.get(card.type, 0) >= 1 for card in give):
+            if not all(player.get(card["type"], 0) >= 1 for card in give):
                 return False
 
             # Check if taking cards from market
-            if not all(card.type in [c.type for c in self.market] for card in take):
+            if not all(card["type"] in [TYPES[c] for c in self.market] for card in take):
                 return False
 
             # Check if number of cards matches
@@ -168,8 +169,7 @@ class JaipurGame(AbstractGame):
             card_type = move_data["card"]
 
             # Find card in market
-            card = next(card for card in self.market if card.type == card_type)
-            self.market.remove(card)
+            self.market.remove(TYPES.index(card_type))
 
             # Add card to player's hand
             player[card_type] = player.get(card_type, 0) + 1
@@ -180,12 +180,7 @@ class JaipurGame(AbstractGame):
                 self.camel_market.clear()
 
             # Draw new card from deck
-            if self.deck:
-                new_card = self.deck.pop()
-                if new_card.type == "camel":
-                    self.camel_market.append(new_card)
-                else:
-                    self.market.append(new_card)
+            self._refill_market(1)
 
         elif action == "sell":
             good_type = move_data["type"]
@@ -212,21 +207,15 @@ class JaipurGame(AbstractGame):
 
             # Remove cards from player's hand
             for card in give:
-                player[card.type] -= 1
+                player[card["type"]] -= 1
 
             # Add cards to player's hand
             for card in take:
-                player[card.type] = player.get(card.type, 0) + 1
-                self.market.remove(card)
+                player[card["type"]] = player.get(card["type"], 0) + 1
+                self.market.remove(TYPES.index(card["type"]))
 
             # Draw new cards from deck
-            for _ in range(len(take)):
-                if self.deck:
-                    new_card = self.deck.pop()
-                    if new_card.type == "camel":
-                        self.camel_market.append(new_card)
-                    else:
-                        self.market.append(new_card)
+            self._refill_market(len(take))
 
         # Move to next player
         self.current_player = 1 - self.current_player
@@ -238,9 +227,9 @@ class JaipurGame(AbstractGame):
         return {
             "current_player": self.current_player,
             "phase": self.phase,
-            "market": [card.to_dict() for card in self.market],
-            "camel_market": [card.to_dict() for card in self.camel_market],
-            "camel_herd": [card.to_dict() for card in self.camel_herd],
+            "market": CARDS.to_faces(self.market),
+            "camel_market": CARDS.to_faces(self.camel_market),
+            "camel_herd": CARDS.to_faces(self.camel_herd),
             "players": [
                 {k: v for k, v in player.items() if v > 0} for player in self.players
             ],
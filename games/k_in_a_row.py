@@ -0,0 +1,108 @@
+from itertools import product
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+
+class KInARow:
+    """
+    Incremental k-in-a-row detection for boards of any dimension.
+
+    Cells are flat indices of a row-major board of the given shape. For every
+    line direction a run-length counter is kept at both ends of each run of
+    same-colored stones, so placing a stone only reads the counters of its two
+    neighbors per direction and writes the merged length at the new run ends:
+    O(directions) work per stone, independent of board size and of k. The
+    first player to reach k is cached, making winner reads O(1). Stones are
+    never removed; call reset() (or rebuild()) to start over.
+    """
+
+    def __init__(self, shape: Sequence[int], k: int):
+        self.shape = tuple(shape)
+        self.k = k
+        self.size = 1
+        for extent in self.shape:
+            self.size *= extent
+        strides = []
+        stride = 1
+        for extent in reversed(self.shape):
+            strides.insert(0, stride)
+            stride *= extent
+        self.strides = tuple(strides)
+        # One direction per line: the first non-zero component is positive
+        self.directions: List[Tuple[int, ...]] = [
+            d for d in product((-1, 0, 1), repeat=len(self.shape))
+            if any(d) and next(c for c in d if c) > 0
+        ]
+        self.offsets = [
+            sum(c * s for c, s in zip(d, self.strides)) for d in self.directions
+        ]
+        # forward[d][cell] / backward[d][cell]: neighbor index or -1 off-board
+        self.forward: List[List[int]] = []
+        self.backward: List[List[int]] = []
+        for d in self.directions:
+            self.forward.append([self._step(cell, d, 1) for cell in range(self.size)])
+            self.backward.append([self._step(cell, d, -1) for cell in range(self.size)])
+        self.reset()
+
+    def _step(self, cell: int, direction: Tuple[int, ...], sign: int) -> int:
+        coords = self.coords(cell)
+        moved = [c + sign * d for c, d in zip(coords, direction)]
+        if all(0 <= c < extent for c, extent in zip(moved, self.shape)):
+            return self.index(moved)
+        return -1
+
+    def index(self, coords: Sequence[int]) -> int:
+        return sum(c * s for c, s in zip(coords, self.strides))
+
+    def coords(self, cell: int) -> Tuple[int, ...]:
+        result = []
+        for stride in self.strides:
+            c, cell = divmod(cell, stride)
+            result.append(c)
+        return tuple(result)
+
+    def reset(self) -> None:
+        self.owner: List[Optional[Hashable]] = [None] * self.size
+        # runs[d][cell] is only meaningful at the two ends of a run
+        self.runs: List[List[int]] = [[0] * self.size for _ in self.directions]
+        self.longest: Dict[Hashable, int] = {}
+        self.filled = 0
+        self.winner: Optional[Hashable] = None
+
+    @property
+    def full(self) -> bool:
+        return self.filled == self.size
+
+    def place(self, cell: int, player: Hashable) -> int:
+        """Put player's stone on an empty cell; returns its longest run"""
+        if self.owner[cell] is not None:
+            raise ValueError("Cell is already occupied")
+        owner = self.owner
+        owner[cell] = player
+        self.filled += 1
+        best = 1
+        for d, runs in enumerate(self.runs):
+            before = self.backward[d][cell]
+            after = self.forward[d][cell]
+            back = runs[before] if before >= 0 and owner[before] == player else 0
+            ahead = runs[after] if after >= 0 and owner[after] == player else 0
+            length = back + 1 + ahead
+            offset = self.offsets[d]
+            runs[cell] = length
+            if back:
+                runs[cell - back * offset] = length
+            if ahead:
+                runs[cell + ahead * offset] = length
+            if length > best:
+                best = length
+        if best > self.longest.get(player, 0):
+            self.longest[player] = best
+        if self.winner is None and best >= self.k:
+            self.winner = player
+        return best
+
+    def rebuild(self, cells: Sequence[Optional[Hashable]]) -> None:
+        """Reload from a flat row-major sequence of owners (None and 0 are empty)"""
+        self.reset()
+        for cell, player in enumerate(cells):
+            if player is not None and player != 0:
+                self.place(cell, player)
@@ -1,6 +1,6 @@
 from game_abc import AbstractGame, GameMove, GameHistory
-from typing import Dict, Any, Optional, List, Tuple
-import time
+from games.k_in_a_row import KInARow
+from typing import Dict, Any, Optional
 
 
 class OmokGame(AbstractGame):
@@ -8,22 +8,29 @@ class OmokGame(AbstractGame):
     WIN_LENGTH = 5
 
     def __init__(self, game_id: str):
+        self.lines = KInARow((self.BOARD_SIZE, self.BOARD_SIZE), self.WIN_LENGTH)
         super().__init__(game_id)
-        self.board = [[None] * self.BOARD_SIZE for _ in range(self.BOARD_SIZE)]
-        self.current_player = "B"  # Black player starts
-        self._initialize_board()
-        
+
     def _initialize_board(self):
         """Initialize the game board."""
         self.board = [[None] * self.BOARD_SIZE for _ in range(self.BOARD_SIZE)]
+        self.lines.reset()
         self.current_player = "B"  # Black player starts
 
+    def _place(self, row: int, col: int, player: str) -> None:
+        self.board[row][col] = player
+        self.lines.place(row * self.BOARD_SIZE + col, player)
+
     def initialize_game(self) -> Dict[str, Any]:
         """Reset the board and start a new game"""
         self._initialize_board()
-        self.history = GameHistory()
         return self.get_game_state()
 
+    def _restore_game_state(self) -> None:
+        """Rebuild the position by replaying the recorded stones"""
+        self._initialize_board()
+        self._replay_moves()
+
     def validate_move(self, move_data: Dict[str, Any]) -> bool:
         """Validate if a move is legal"""
         try:
@@ -67,20 +74,15 @@ class OmokGame(AbstractGame):
                 raise ValueError("Game is already over")
             
             # Make the move
-            self.board[row][col] = player
-            
-            # Save move to history
-            move = GameMove(
-                player=player,
-                move_data={'row': row, 'col': col},
-                timestamp=time.time()
-            )
-            self.history.add_move(move)
+            self._place(row, col, player)
             
             # Switch players if game is not over
             if not self.is_game_over():
                 self.current_player = 'W' if player == 'B' else 'B'
             
+            # Save move to history
+            self._record_move(player, {'row': row, 'col': col})
+            
             return self.get_game_state()
             
         except (ValueError, TypeError) as e:
@@ -100,74 +102,13 @@ class OmokGame(AbstractGame):
     def is_game_over(self) -> bool:
         """Check if the game is over"""
         # Game is over if there's a winner or the board is full
-        if self.get_winner() is not None:
-            return True
-            
-        # Check if board is full (draw)
-        for row in self.board:
-            if None in row:
-                return False
-        return True
+        return self.get_winner() is not None
 
     def get_winner(self) -> Optional[str]:
         """Get the winner if game is over"""
-        # Check all directions from each point
-        for row in range(self.BOARD_SIZE):
-            for col in range(self.BOARD_SIZE):
-                if self.board[row][col] is None:
-                    continue
-
-                # Check horizontal (right)
-                if self._check_sequence(row, col, (0, 1)):
-                    return self.board[row][col]
-
-                # Check vertical (down)
-                if self._check_sequence(row, col, (1, 0)):
-                    return self.board[row][col]
-
-                # Check diagonal (down-right)
-                if self._check_sequence(row, col, (1, 1)):
-                    return self.board[row][col]
-                    
-                # Check diagonal (down-left)
-                if self._check_sequence(row, col, (1, -1)):
-                    return self.board[row][col]
-                    
-        # Check for draw (board is full)
-        if all(cell is not None for row in self.board for cell in row):
+        # Only lines through placed stones are checked, as they are placed
+        if self.lines.winner is not None:
+            return self.lines.winner
+        if self.lines.full:
             return "draw"
-            
         return None
-
-    def _check_sequence(
-        self, start_row: int, start_col: int, direction: Tuple[int, int]
-    ) -> bool:
-        """Check if there's a winning sequence in the given direction"""
-        dr, dc = direction
-        player = self.board[start_row][start_col]
-        if player is None:
-            return False
-
-        # Check in both directions
-        count = 1
-        for i in range(1, self.WIN_LENGTH):
-            # Check forward
-            r = start_row + dr * i
-            c = start_col + dc * i
-            if 0 <= r < self.BOARD_SIZE and 0 <= c < self.BOARD_SIZE:
-                if self.board[r][c] == player:
-                    count += 1
-                else:
-                    break
-
-        for i in range(1, self.WIN_LENGTH):
-            # Check backward
-            r = start_row - dr * i
-            c = start_col - dc * i
-            if 0 <= r < self.BOARD_SIZE and 0 <= c < self.BOARD_SIZE:
-                if self.board[r][c] == player:
-                    count += 1
-                else:
-                    break
-
-        return count >= self.WIN_LENGTH
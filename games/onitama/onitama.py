@@ -36,6 +36,7 @@ class OnitamaGame(AbstractGame):
 
     def _init_game(self):
         """Initialize a new game"""
+        self.reset_rng()
         self.board = np.zeros((self.board_size, self.board_size), dtype=int)
         self.current_player = OnitamaPiece.BLUE
 
@@ -65,7 +66,7 @@ class OnitamaGame(AbstractGame):
         ]
 
         # Shuffle cards and deal
-        random.shuffle(self.cards)
+        self.rng.shuffle(self.cards)
         self.blue_cards = self.cards[:2]
         self.red_cards = self.cards[2:4]
         self.cards = self.cards[4:]
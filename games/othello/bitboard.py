@@ -0,0 +1,93 @@
+"""
+Bitboard core for Othello.
+
+A position is two integers, one bit per square (``x * size + y``) for the
+player to move and for the opponent. Move generation and flipping shift whole
+bitboards one step in each of the eight directions, masking off the file that
+would wrap around the board edge, so no square is visited individually.
+Works for any even board size; Python ints are used for sizes above 8.
+"""
+from typing import List, Tuple
+import numpy as np
+
+
+def popcount(bb: int) -> int:
+    return bin(bb).count("1")
+
+
+class OthelloBitboard:
+    """Shift masks and move/flip generation for a size x size board"""
+
+    def __init__(self, size: int = 8):
+        self.size = size
+        self.full = (1 << (size * size)) - 1
+        first_col = sum(1 << (x * size) for x in range(size))
+        last_col = first_col << (size - 1)
+        not_first = self.full & ~first_col
+        not_last = self.full & ~last_col
+        # (shift, mask applied after shifting); positive shifts move to
+        # higher indices. A step east must not land in the first column and
+        # a step west must not land in the last one.
+        self.directions: List[Tuple[int, int]] = [
+            (1, not_first),  # east
+            (-1, not_last),  # west
+            (size, self.full),  # south
+            (-size, self.full),  # north
+            (size + 1, not_first),  # south-east
+            (size - 1, not_last),  # south-west
+            (-size + 1, not_first),  # north-east
+            (-size - 1, not_last),  # north-west
+        ]
+
+    def _shift(self, bb: int, shift: int, mask: int) -> int:
+        if shift > 0:
+            return (bb << shift) & mask & self.full
+        return (bb >> -shift) & mask
+
+    def legal_moves(self, player: int, opponent: int) -> int:
+        """Bitboard of the empty squares where player flips at least one disc"""
+        empty = self.full & ~(player | opponent)
+        moves = 0
+        for shift, mask in self.directions:
+            # Runs of opponent discs starting next to a player disc
+            run = self._shift(player, shift, mask) & opponent
+            for _ in range(self.size - 3):
+                run |= self._shift(run, shift, mask) & opponent
+            moves |= self._shift(run, shift, mask) & empty
+        return moves
+
+    def flips(self, player: int, opponent: int, square: int) -> int:
+        """Opponent discs flipped when player moves on square (0 if illegal)"""
+        flipped = 0
+        move = 1 << square
+        for shift, mask in self.directions:
+            line = 0
+            cursor = self._shift(move, shift, mask)
+            while cursor & opponent:
+                line |= cursor
+                cursor = self._shift(cursor, shift, mask)
+            if cursor & player:
+                flipped |= line
+        return flipped
+
+    def from_array(self, board: np.ndarray, value: int) -> int:
+        """Bitboard of the cells of a 2D array equal to value"""
+        bits = np.packbits(np.asarray(board).ravel() == value, bitorder="little")
+        return int.from_bytes(bits.tobytes(), "little")
+
+    def to_mask(self, bb: int) -> np.ndarray:
+        """Boolean size x size array of the set bits of bb"""
+        count = self.size * self.size
+        raw = np.frombuffer(bb.to_bytes((count + 7) // 8, "little"), dtype=np.uint8)
+        return np.unpackbits(raw, bitorder="little")[:count].astype(bool).reshape(
+            self.size, self.size
+        )
+
+    def squares(self, bb: int) -> List[Tuple[int, int]]:
+        """(x, y) of every set bit in row-major order"""
+        result = []
+        while bb:
+            low = bb & -bb
+            result.append(divmod(low.bit_length() - 1, self.size))
+            bb ^= low
+        return result
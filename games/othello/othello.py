@@ -2,7 +2,8 @@ from game_abc import AbstractGame, GameMove, GameHistory
 from typing import Dict, Any, Optional, List, Tuple, Set
 import numpy as np
 from enum import Enum
-import time
+
+from games.othello.bitboard import OthelloBitboard, popcount
 
 
 class OthelloPiece(Enum):
@@ -12,12 +13,14 @@ class OthelloPiece(Enum):
 
 
 class OthelloGame(AbstractGame):
+    # Bitboards and move masks are memoized per position
+    _CACHED_READS = AbstractGame._CACHED_READS + ("_bitboards", "_move_mask")
+
     def __init__(self, game_id: str, board_size: int = 8):
-        super().__init__(game_id)
+        # Set before AbstractGame.__init__, which restores saved games
         self.board_size = board_size
-        self.board = np.zeros((board_size, board_size), dtype=int)
-        self.current_player = OthelloPiece.BLACK
-        self._init_game()
+        self.engine = OthelloBitboard(board_size)
+        super().__init__(game_id)
 
     def _init_game(self):
         """Initialize a new game"""
@@ -31,6 +34,32 @@ class OthelloGame(AbstractGame):
         self.board[center, center - 1] = OthelloPiece.BLACK.value
         self.board[center, center] = OthelloPiece.WHITE.value
 
+    def initialize_game(self) -> Dict[str, Any]:
+        """Initialize a new game instance"""
+        self._init_game()
+        return self.get_game_state()
+
+    def _restore_game_state(self):
+        """Rebuild the game by replaying the recorded moves"""
+        self._init_game()
+        self._replay_moves()
+
+    def _bitboards(self) -> Tuple[int, int]:
+        """(player to move, opponent) bitboards derived from self.board"""
+        player = self.current_player
+        opponent = self._get_opposite_color(player)
+        return (
+            self.engine.from_array(self.board, player.value),
+            self.engine.from_array(self.board, opponent.value),
+        )
+
+    def _move_mask(self, color: OthelloPiece) -> int:
+        """Bitboard of the legal moves for color"""
+        player, opponent = self._bitboards()
+        if color != self.current_player:
+            player, opponent = opponent, player
+        return self.engine.legal_moves(player, opponent)
+
     def _get_opposite_color(self, color: OthelloPiece) -> OthelloPiece:
         """Get the opposite color"""
         return OthelloPiece.WHITE if color == OthelloPiece.BLACK else OthelloPiece.BLACK
@@ -39,60 +68,16 @@ class OthelloGame(AbstractGame):
         """Check if position is on board"""
         return 0 <= x < self.board_size and 0 <= y < self.board_size
 
-    def _get_flips(self, x: int, y: int, dx: int, dy: int) -> List[Tuple[int, int]]:
-        """Get all pieces that would be flipped in a given direction"""
-        if not self._is_valid_position(x, y):
-            return []
-
-        # Must be empty to place a piece
-        if self.board[x, y] != OthelloPiece.EMPTY.value:
-            return []
-
-        color = self.current_player
-        opposite = self._get_opposite_color(color)
-        flips = []
-
-        # Move in the given direction
-        nx, ny = x + dx, y + dy
-        while self._is_valid_position(nx, ny):
-            if self.board[nx, ny] == opposite.value:
-                flips.append((nx, ny))
-                nx += dx
-                ny += dy
-            elif self.board[nx, ny] == color.value:
-                return flips
-            else:
-                return []
-        return []
-
     def _get_all_flips(self, x: int, y: int) -> List[Tuple[int, int]]:
         """Get all pieces that would be flipped by placing a piece at (x, y)"""
-        all_flips = []
-
-        # Check all 8 directions
-        for dx, dy in [
-            (-1, -1),
-            (-1, 0),
-            (-1, 1),
-            (0, -1),
-            (0, 1),
-            (1, -1),
-            (1, 0),
-            (1, 1),
-        ]:
-            all_flips.extend(self._get_flips(x, y, dx, dy))
-
-        return all_flips
+        if self.board[x, y] != OthelloPiece.EMPTY.value:
+            return []
+        player, opponent = self._bitboards()
+        return self.engine.squares(self.engine.flips(player, opponent, x * self.board_size + y))
 
     def _get_valid_moves(self) -> List[Tuple[int, int]]:
         """Get all valid moves for the current player"""
-        moves = []
-        for x in range(self.board_size):
-            for y in range(self.board_size):
-                if self.board[x, y] == OthelloPiece.EMPTY.value:
-                    if self._get_all_flips(x, y):
-                        moves.append((x, y))
-        return moves
+        return self.engine.squares(self._move_mask(self.current_player))
 
     def validate_move(self, move_data: Dict[str, Any]) -> bool:
         """Validate if a move is legal"""
@@ -109,38 +94,35 @@ class OthelloGame(AbstractGame):
         if not self._is_valid_position(x, y):
             return False
 
-        # Check if position is empty
-        if self.board[x, y] != OthelloPiece.EMPTY.value:
-            return False
-
-        # Check if move would flip any pieces
-        return bool(self._get_all_flips(x, y))
+        # Empty and flipping at least one piece
+        return bool(self._move_mask(self.current_player) >> (x * self.board_size + y) & 1)
 
     def make_move(self, move_data: Dict[str, Any]) -> Dict[str, Any]:
         """Make a move in the game"""
         if not self.validate_move(move_data):
             raise ValueError("Invalid move")
 
-        if "pass" in move_data and move_data["pass"]:
-            # Switch player
-            self.current_player = self._get_opposite_color(self.current_player)
-            return self.get_game_state()
-
-        x, y = move_data["x"], move_data["y"]
-
-        # Place piece
-        self.board[x, y] = self.current_player.value
+        player = self.current_player
+        self._apply_move(move_data)
+        if move_data.get("pass"):
+            recorded = {"pass": True}
+        else:
+            recorded = {"x": move_data["x"], "y": move_data["y"]}
+        self._record_move(player.name, recorded)
+        return self.get_game_state()
 
-        # Flip pieces
-        flips = self._get_all_flips(x, y)
-        for fx, fy in flips:
-            self.board[fx, fy] = self.current_player.value
+    def _apply_move(self, move_data: Dict[str, Any]) -> None:
+        """Play a validated move (or a recorded one during replay) without recording it"""
+        if not move_data.get("pass"):
+            x, y = move_data["x"], move_data["y"]
+            player, opponent = self._bitboards()
+            flips = self.engine.flips(player, opponent, x * self.board_size + y)
+            self.board[self.engine.to_mask(flips)] = self.current_player.value
+            self.board[x, y] = self.current_player.value
 
         # Switch player
         self.current_player = self._get_opposite_color(self.current_player)
 
-        return self.get_game_state()
-
     def get_game_state(self) -> Dict[str, Any]:
         """Get the current game state"""
         return {
@@ -153,16 +135,9 @@ class OthelloGame(AbstractGame):
 
     def is_game_over(self) -> bool:
         """Check if the game is over"""
-        # Check if current player has any moves
-        if self._get_valid_moves():
-            return False
-
-        # Check if other player has any moves
-        self.current_player = self._get_opposite_color(self.current_player)
-        if self._get_valid_moves():
-            return False
-
-        return True
+        # Over when neither player has a move
+        opponent = self._get_opposite_color(self.current_player)
+        return not self._move_mask(self.current_player) and not self._move_mask(opponent)
 
     def get_winner(self) -> Optional[str]:
         """Get the winner if game is over"""
@@ -170,8 +145,8 @@ class OthelloGame(AbstractGame):
             return None
 
         # Count pieces
-        black_count = np.sum(self.board == OthelloPiece.BLACK.value)
-        white_count = np.sum(self.board == OthelloPiece.WHITE.value)
+        black_count = popcount(self.engine.from_array(self.board, OthelloPiece.BLACK.value))
+        white_count = popcount(self.engine.from_array(self.board, OthelloPiece.WHITE.value))
 
         if black_count > white_count:
             return "black"
@@ -0,0 +1 @@
+from games.poker.poker import PokerGame
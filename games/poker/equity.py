@@ -0,0 +1,149 @@
+"""
+Hold'em equity: win and tie probabilities for every seat.
+
+The missing board cards are enumerated when there are few enough completions
+for the sample budget (always from the turn on, usually from the flop) and
+sampled otherwise. Boards are scored in batches with evaluate_many(), and the
+batches of a large exhaustive run can be fanned out over worker processes.
+Both modes stop between batches once the time limit has passed; a cut-short
+enumeration visits the runouts in random order, so it is a fair sample.
+"""
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import chain, combinations
+from math import comb
+from typing import Any, Dict, Optional, Sequence, Tuple
+import time
+import numpy as np
+
+from games.poker.evaluator import evaluate_many
+
+DEFAULT_SAMPLES = 20000
+BATCH_SIZE = 20000
+
+
+def _validate(hands: Sequence[Sequence[int]], board: Sequence[int]) -> None:
+    if len(hands) < 1:
+        raise ValueError("At least one hand is required")
+    if any(len(hand) != 2 for hand in hands):
+        raise ValueError("Every hand must hold two cards")
+    if len(board) > 5:
+        raise ValueError("The board holds at most five cards")
+    cards = [card for hand in hands for card in hand] + list(board)
+    if len(set(cards)) != len(cards) or not all(0 <= card < 52 for card in cards):
+        raise ValueError("Cards must be distinct ints in 0..51")
+
+
+class _Tally:
+    """Running win/tie/equity counts for a fixed set of hands"""
+
+    def __init__(self, players: int):
+        self.wins = np.zeros(players, dtype=np.int64)
+        self.ties = np.zeros(players, dtype=np.int64)
+        self.shares = np.zeros(players, dtype=np.float64)
+        self.samples = 0
+
+    def add(self, hands: np.ndarray, board: np.ndarray, runouts: np.ndarray) -> None:
+        """Score (M, k) runouts completing the known board for every hand"""
+        count = len(runouts)
+        boards = np.concatenate([np.broadcast_to(board, (count, len(board))), runouts], 1)
+        seven = np.concatenate(
+            [np.broadcast_to(hands[:, None, :], (len(hands), count, 2)),
+             np.broadcast_to(boards, (len(hands), count, 5))],
+            axis=2,
+        )
+        strength = evaluate_many(seven).T  # (M, players)
+        best = strength == strength.max(axis=1, keepdims=True)
+        winners = best.sum(axis=1)
+        self.wins += (best & (winners == 1)[:, None]).sum(axis=0)
+        self.ties += (best & (winners > 1)[:, None]).sum(axis=0)
+        self.shares += (best / winners[:, None]).sum(axis=0)
+        self.samples += count
+
+    def merge(self, other: "_Tally") -> None:
+        self.wins += other.wins
+        self.ties += other.ties
+        self.shares += other.shares
+        self.samples += other.samples
+
+    def result(self, exact: bool) -> Dict[str, Any]:
+        total = max(self.samples, 1)
+        return {
+            "win": (self.wins / total).tolist(),
+            "tie": (self.ties / total).tolist(),
+            "equity": (self.shares / total).tolist(),
+            "samples": self.samples,
+            "exact": exact,
+        }
+
+
+def _score(args: Tuple[np.ndarray, np.ndarray, np.ndarray, Optional[float]]) -> _Tally:
+    """Score runouts batch by batch, stopping once the deadline has passed"""
+    hands, board, runouts, deadline = args
+    tally = _Tally(len(hands))
+    for start in range(0, len(runouts), BATCH_SIZE):
+        if deadline is not None and time.monotonic() >= deadline:
+            break
+        tally.add(hands, board, runouts[start:start + BATCH_SIZE].astype(np.int64))
+    return tally
+
+
+def equity(
+    hands: Sequence[Sequence[int]],
+    board: Sequence[int] = (),
+    samples: int = DEFAULT_SAMPLES,
+    time_limit: Optional[float] = None,
+    processes: int = 1,
+    seed: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> Dict[str, Any]:
+    """
+    Win, tie and equity (pot share) fractions per hand. Runs exhaustively when
+    the runouts fit in samples, otherwise draws up to samples random runouts;
+    either way it stops early once time_limit seconds have passed. The batches
+    of a large exhaustive run are spread over executor when given, or over a
+    pool of processes workers when processes > 1.
+    """
+    _validate(hands, board)
+    hands_array = np.array(hands, dtype=np.int64)
+    board_array = np.array(board, dtype=np.int64)
+    used = set(hands_array.ravel().tolist()) | set(board)
+    deck = [card for card in range(52) if card not in used]
+    missing = 5 - len(board)
+    deadline = None if time_limit is None else time.monotonic() + time_limit
+    rng = np.random.default_rng(seed)
+
+    total = comb(len(deck), missing)
+    if total <= samples:
+        runouts = np.fromiter(
+            chain.from_iterable(combinations(deck, missing)), dtype=np.int8, count=total * missing
+        ).reshape(total, missing)
+        if deadline is not None:
+            # A run cut short by the deadline then scores a uniform sample
+            runouts = rng.permutation(runouts)
+        if total > BATCH_SIZE and (executor is not None or processes > 1):
+            tasks = [
+                (hands_array, board_array, runouts[start:start + BATCH_SIZE], deadline)
+                for start in range(0, total, BATCH_SIZE)
+            ]
+            if executor is None:
+                with ProcessPoolExecutor(max_workers=processes) as pool:
+                    parts = list(pool.map(_score, tasks))
+            else:
+                parts = list(executor.map(_score, tasks))
+            tally = _Tally(len(hands))
+            for part in parts:
+                tally.merge(part)
+        else:
+            tally = _score((hands_array, board_array, runouts, deadline))
+        return tally.result(exact=tally.samples == total)
+
+    deck_array = np.array(deck, dtype=np.int64)
+    tally = _Tally(len(hands))
+    while tally.samples < samples:
+        batch = min(BATCH_SIZE, samples - tally.samples)
+        # A random permutation per row; its first cards are a runout without repeats
+        draws = rng.random((batch, len(deck))).argsort(axis=1)[:, :missing]
+        tally.add(hands_array, board_array, deck_array[draws])
+        if deadline is not None and time.monotonic() >= deadline:
+            break
+    return tally.result(exact=False)
@@ -0,0 +1,233 @@
+"""
+Table-driven poker hand evaluation.
+
+Cards are ints 0..51, ``rank * 4 + suit`` with rank 0 for a deuce up to 12
+for an ace. A hand's strength is one int from 1 (7-5-4-3-2 offsuit) to 7462
+(royal flush); a higher strength wins and equal strengths split, so hands
+compare directly and hand_category() recovers the PokerHandType value.
+
+As in Cactus Kev's evaluator every rank has a prime and a bit: the 7462
+five-card classes are indexed by the OR of rank bits when all ranks differ
+(FLUSHES for suited hands, UNIQUE otherwise) and by the product of rank primes
+when a rank repeats (PAIRED). The bit tables are extended to 6 and 7 card
+masks with the best 5-card subset, and products of 6 and 7 ranks are memoized
+in PAIRED on first use, so a 7-card hand is a suit count plus one lookup
+instead of 21 five-card evaluations. evaluate_many() does the same for whole
+arrays of hands with NumPy, for equity calculations.
+"""
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import combinations, combinations_with_replacement
+from typing import Dict, Iterable, List, Sequence, Tuple
+import numpy as np
+
+RANKS = "23456789TJQKA"
+SUITS = "cdhs"
+PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+HIGH_CARD, PAIR, TWO_PAIR, THREE_OF_A_KIND, STRAIGHT, FLUSH = range(6)
+FULL_HOUSE, FOUR_OF_A_KIND, STRAIGHT_FLUSH, ROYAL_FLUSH = range(6, 10)
+MAX_STRENGTH = 7462
+
+
+def _popcount(mask: int) -> int:
+    return bin(mask).count("1")
+
+
+def _descending(ranks: Iterable[int]) -> Tuple[int, ...]:
+    return tuple(sorted(ranks, reverse=True))
+
+
+def _product(ranks: Iterable[int]) -> int:
+    result = 1
+    for rank in ranks:
+        result *= PRIMES[rank]
+    return result
+
+
+# Straights from the wheel (A-2-3-4-5) up to broadway, as rank bitmasks
+_STRAIGHTS = [0b1000000001111] + [0b11111 << low for low in range(9)]
+_STRAIGHT_SET = set(_STRAIGHTS)
+# Five distinct ranks that are not a straight, weakest first
+_NO_STRAIGHT = sorted(
+    (
+        sum(1 << r for r in ranks)
+        for ranks in combinations(range(13), 5)
+        if sum(1 << r for r in ranks) not in _STRAIGHT_SET
+    ),
+    key=lambda mask: _descending(r for r in range(13) if mask >> r & 1),
+)
+
+
+def _build_tables() -> Tuple[List[int], List[int], Dict[int, int], List[int]]:
+    flushes = [0] * 8192
+    unique = [0] * 8192
+    paired: Dict[int, int] = {}
+    starts = []
+    strength = 0
+
+    def start_category() -> None:
+        starts.append(strength + 1)
+
+    def ordered_kickers(exclude: Sequence[int], count: int) -> List[Tuple[int, ...]]:
+        pool = [r for r in range(13) if r not in exclude]
+        return sorted(_descending(c) for c in combinations(pool, count))
+
+    start_category()  # high card
+    for mask in _NO_STRAIGHT:
+        strength += 1
+        unique[mask] = strength
+    start_category()  # pair
+    for pair, kickers in sorted(
+        ((p, k) for p in range(13) for k in ordered_kickers([p], 3))
+    ):
+        strength += 1
+        paired[_product((pair, pair) + kickers)] = strength
+    start_category()  # two pair
+    for high, low, kicker in sorted(
+        (h, l, k)
+        for h in range(13)
+        for l in range(h)
+        for k in range(13)
+        if k not in (h, l)
+    ):
+        strength += 1
+        paired[_product((high, high, low, low, kicker))] = strength
+    start_category()  # three of a kind
+    for trips, kickers in sorted(
+        ((t, k) for t in range(13) for k in ordered_kickers([t], 2))
+    ):
+        strength += 1
+        paired[_product((trips,) * 3 + kickers)] = strength
+    start_category()  # straight
+    for mask in _STRAIGHTS:
+        strength += 1
+        unique[mask] = strength
+    start_category()  # flush
+    for mask in _NO_STRAIGHT:
+        strength += 1
+        flushes[mask] = strength
+    start_category()  # full house
+    for trips, pair in sorted((t, p) for t in range(13) for p in range(13) if p != t):
+        strength += 1
+        paired[_product((trips,) * 3 + (pair,) * 2)] = strength
+    start_category()  # four of a kind
+    for quads, kicker in sorted((q, k) for q in range(13) for k in range(13) if k != q):
+        strength += 1
+        paired[_product((quads,) * 4 + (kicker,))] = strength
+    start_category()  # straight flush
+    for mask in _STRAIGHTS:
+        strength += 1
+        flushes[mask] = strength
+    starts.append(strength)  # royal flush: the best straight flush
+
+    # Six and seven distinct ranks: the best five-rank subset
+    for table in (flushes, unique):
+        for mask in sorted(range(8192), key=_popcount):
+            if _popcount(mask) > 5:
+                bits = [1 << r for r in range(13) if mask >> r & 1]
+                table[mask] = max(table[mask ^ bit] for bit in bits)
+    return flushes, unique, paired, starts
+
+
+FLUSHES, UNIQUE, PAIRED, _CATEGORY_STARTS = _build_tables()
+
+
+def _paired_strength(ranks: Tuple[int, ...], product: int) -> int:
+    """Strength of 6 or 7 non-flush ranks with a repeat, memoized by product"""
+    strength = PAIRED.get(product)
+    if strength is None:
+        strength = 0
+        for rank in set(ranks):
+            i = ranks.index(rank)
+            rest = ranks[:i] + ranks[i + 1:]
+            mask = 0
+            for other in rest:
+                mask |= 1 << other
+            if _popcount(mask) == len(rest):
+                candidate = UNIQUE[mask]
+            else:
+                candidate = _paired_strength(rest, product // PRIMES[rank])
+            if candidate > strength:
+                strength = candidate
+        PAIRED[product] = strength
+    return strength
+
+
+def evaluate(cards: Sequence[int]) -> int:
+    """Strength of the best five-card hand among 5 to 7 cards"""
+    suit_masks = [0, 0, 0, 0]
+    for card in cards:
+        suit_masks[card & 3] |= 1 << (card >> 2)
+    for mask in suit_masks:
+        # With at most seven cards a flush beats anything else they can make
+        if _popcount(mask) >= 5:
+            return FLUSHES[mask]
+    rank_mask = suit_masks[0] | suit_masks[1] | suit_masks[2] | suit_masks[3]
+    if _popcount(rank_mask) == len(cards):
+        return UNIQUE[rank_mask]
+    ranks = tuple(card >> 2 for card in cards)
+    product = _product(ranks)
+    strength = PAIRED.get(product)
+    if strength is None:
+        strength = _paired_strength(ranks, product)
+    return strength
+
+
+def hand_category(strength: int) -> int:
+    """HIGH_CARD .. ROYAL_FLUSH for a strength returned by evaluate()"""
+    return bisect_right(_CATEGORY_STARTS, strength) - 1
+
+
+def parse(text: str) -> List[int]:
+    """Cards from text such as "As Kd Th" (rank letter, suit letter cdhs)"""
+    return [RANKS.index(card[0].upper()) * 4 + SUITS.index(card[1]) for card in text.split()]
+
+
+def card_code(rank: str, suit: str) -> int:
+    """Card int from a rank ("2".."10", "J", "Q", "K", "A") and a suit symbol"""
+    rank = "T" if rank == "10" else rank.upper()
+    return RANKS.index(rank) * 4 + "♣♦♥♠".index(suit)
+
+
+_PRIME_ARRAY = np.array(PRIMES, dtype=np.int64)
+
+
+@lru_cache(maxsize=None)
+def _product_table(size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Sorted prime products of every non-flush multiset of size ranks, and strengths"""
+    keys = []
+    values = []
+    for ranks in combinations_with_replacement(range(13), size):
+        if any(ranks.count(rank) > 4 for rank in set(ranks)):
+            continue
+        # Consecutive suits: equal ranks never share one and no suit gets five
+        cards = [rank * 4 + i % 4 for i, rank in enumerate(ranks)]
+        keys.append(_product(ranks))
+        values.append(evaluate(cards))
+    order = np.argsort(keys)
+    return np.array(keys, dtype=np.int64)[order], np.array(values, dtype=np.int32)[order]
+
+
+_FLUSH_ARRAY = np.array(FLUSHES, dtype=np.int32)
+
+
+def evaluate_many(cards: np.ndarray) -> np.ndarray:
+    """
+    Vectorized evaluate() over an (..., n) array of n distinct cards per hand
+    (5 <= n <= 7): one prime-product search plus a flush-table gather.
+    """
+    cards = np.asarray(cards, dtype=np.int64)
+    keys, values = _product_table(cards.shape[-1])
+    ranks = cards >> 2
+    suits = cards & 3
+    products = _PRIME_ARRAY[ranks].prod(axis=-1)
+    strength = values[np.searchsorted(keys, products)]
+    bits = np.left_shift(1, ranks)
+    for suit in range(4):
+        in_suit = suits == suit
+        flush = in_suit.sum(axis=-1) >= 5
+        if flush.any():
+            mask = np.where(in_suit, bits, 0).sum(axis=-1)
+            strength = np.where(flush, _FLUSH_ARRAY[mask], strength)
+    return strength
@@ -1,49 +1,19 @@
 from game_abc import AbstractGame, GameMove, GameHistory
+from concurrent.futures import Executor
+from games.poker.equity import DEFAULT_SAMPLES, equity
+from games.cards import CardSet, draw, shuffled
+from games.poker.evaluator import evaluate, hand_category
 from typing import Dict, Any, Optional, List, Tuple, Set
 import numpy as np
 from enum import Enum
 import time
-import random
 from collections import defaultdict
 
 
-class Card:
-    def __init__(self, suit: str, rank: str):
-        self.suit = suit
-        self.rank = rank
-        self.value = self._get_card_value()
-
-    def _get_card_value(self) -> int:
-        """Get the card's value for comparison"""
-        rank_order = {
-            "2": 2,
-            "3": 3,
-            "4": 4,
-            "5": 5,
-            "6": 6,
-            "7": 7,
-            "8": 8,
-            "9": 9,
-            "10": 10,
-            "J": 11,
-            "Q": 12,
-            "K": 13,
-            "A": 14,
-        }
-        suit_order = {"♣": 0, "♦": 1, "♥": 2, "♠": 3}
-        return rank_order[self.rank] * 4 + suit_order[self.suit]
-
-    def __lt__(self, other):
-        return self.value < other.value
-
-    def __eq__(self, other):
-        return self.value == other.value
-
-    def __hash__(self):
-        return hash((self.suit, self.rank))
-
-    def to_dict(self) -> Dict[str, str]:
-        return {"suit": self.suit, "rank": self.rank}
+RANKS = ["2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A"]
+SUITS = ["♣", "♦", "♥", "♠"]
+# Codes match the hand evaluator's rank * 4 + suit
+CARDS = CardSet([{"suit": suit, "rank": rank} for rank in RANKS for suit in SUITS])
 
 
 class PokerHandType(Enum):
@@ -69,41 +39,39 @@ class PokerAction(Enum):
 
 class PokerGame(AbstractGame):
     def __init__(self, game_id: str, num_players: int = 4, small_blind: int = 10):
-        super().__init__(game_id)
         self.num_players = num_players
         self.small_blind = small_blind
         self.big_blind = small_blind * 2
-        self.current_player = 0
-        self.hands = defaultdict(list)
-        self.community_cards = []
-        self.deck = []
-        self.pot = 0
-        self.bets = defaultdict(int)
-        self.current_bet = 0
-        self.round = 0
+        super().__init__(game_id)
+
+    def initialize_game(self) -> Dict[str, Any]:
+        """Shuffle and deal a new hand"""
         self._init_game()
+        return self.get_game_state()
+
+    def _restore_game_state(self) -> None:
+        """Deal again from the recorded seed and replay the recorded moves"""
+        self._init_game()
+        self._replay_moves()
 
     def _init_game(self):
         """Initialize a new game"""
+        self.reset_rng()
         self.hands = defaultdict(list)
+        self.scores = defaultdict(int)
         self.current_player = 0
         self.community_cards = []
-        self.deck = []
         self.pot = 0
         self.bets = defaultdict(int)
         self.current_bet = 0
         self.round = 0
 
         # Create deck
-        suits = ["♠", "♥", "♦", "♣"]
-        ranks = ["2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A"]
-        self.deck = [Card(suit, rank) for suit in suits for rank in ranks]
-        random.shuffle(self.deck)
+        self.deck = shuffled(CARDS.deck(), self.rng)
 
         # Deal cards (2 cards to each player)
         for i in range(self.num_players):
-            for _ in range(2):
-                self.hands[i].append(self.deck.pop())
+            self.hands[i], self.deck = draw(self.deck, 2)
 
         # Place blinds
         self.bets[0] = self.small_blind
@@ -114,97 +82,49 @@ class PokerGame(AbstractGame):
         # Start with player after big blind
         self.current_player = 2
 
-    def _evaluate_hand(self, hand: List[Card]) -> Tuple[PokerHandType, List[int]]:
-        """Evaluate a poker hand"""
-        hand = sorted(hand, key=lambda x: x.value)
-
-        # Count ranks and suits
-        rank_counts = defaultdict(int)
-        suit_counts = defaultdict(int)
-        for card in hand:
-            rank_counts[card.rank] += 1
-            suit_counts[card.suit] += 1
-
-        # Check for straight
-        straight = False
-        straight_high = None
-        values = sorted([card.value for card in hand])
-        if len(set(values)) == 5 and values[4] - values[0] == 4:
-            straight = True
-            straight_high = values[4]
-        elif set(values) == {14, 2, 3, 4, 5}:
-            straight = True
-            straight_high = 5
-
-        # Check for flush
-        flush = any(count >= 5 for count in suit_counts.values())
-
-        # Get rank counts
-        rank_counts = sorted(rank_counts.items(), key=lambda x: x[1], reverse=True)
-
-        # Determine hand type
-        if straight and flush:
-            if straight_high == 14:
-                return PokerHandType.ROYAL_FLUSH, [14]
-            return PokerHandType.STRAIGHT_FLUSH, [straight_high]
-
-        if rank_counts[0][1] == 4:
-            return PokerHandType.FOUR_OF_A_KIND, [rank_counts[0][0], rank_counts[1][0]]
-
-        if rank_counts[0][1] == 3 and rank_counts[1][1] == 2:
-            return PokerHandType.FULL_HOUSE, [rank_counts[0][0], rank_counts[1][0]]
-
-        if flush:
-            return PokerHandType.FLUSH, [card.value for card in reversed(hand)]
-
-        if straight:
-            return PokerHandType.STRAIGHT, [straight_high]
-
-        if rank_counts[0][1] == 3:
-            return PokerHandType.THREE_OF_A_KIND, [rank_counts[0][0]] + [
-                card.value for card in reversed(hand) if card.rank != rank_counts[0][0]
-            ]
-
-        if rank_counts[0][1] == 2 and rank_counts[1][1] == 2:
-            return PokerHandType.TWO_PAIR, [
-                rank_counts[0][0],
-                rank_counts[1][0],
-                rank_counts[2][0],
-            ]
-
-        if rank_counts[0][1] == 2:
-            return PokerHandType.PAIR, [rank_counts[0][0]] + [
-                card.value for card in reversed(hand) if card.rank != rank_counts[0][0]
-            ]
-
-        return PokerHandType.HIGH_CARD, [card.value for card in reversed(hand)]
-
-    def _get_best_hand(self, player: int) -> Tuple[PokerHandType, List[int]]:
+    def _evaluate_hand(self, hand: List[int]) -> Tuple[PokerHandType, int]:
+        """Hand type and comparable strength of the best 5 of 5-7 cards"""
+        strength = evaluate(hand)
+        return PokerHandType(hand_category(strength)), strength
+
+    def _get_best_hand(self, player: int) -> Tuple[PokerHandType, int]:
         """Get the best possible hand for a player"""
-        all_cards = self.hands[player] + self.community_cards
-        best_hand = (PokerHandType.HIGH_CARD, [0])
-
-        # Try all combinations of 5 cards
-        for i in range(len(all_cards)):
-            for j in range(i + 1, len(all_cards)):
-                for k in range(j + 1, len(all_cards)):
-                    for l in range(k + 1, len(all_cards)):
-                        for m in range(l + 1, len(all_cards)):
-                            hand = [
-                                all_cards[i],
-                                all_cards[j],
-                                all_cards[k],
-                                all_cards[l],
-                                all_cards[m],
-                            ]
-                            evaluation = self._evaluate_hand(hand)
-                            if evaluation[0].value > best_hand[0].value:
-                                best_hand = evaluation
-                            elif evaluation[0].value == best_hand[0].value:
-                                if evaluation[1] > best_hand[1]:
-                                    best_hand = evaluation
-
-        return best_hand
+        return self._evaluate_hand(self.hands[player] + self.community_cards)
+
+    def _showdown_winners(self) -> List[int]:
+        """Active players holding the strongest hand (several on a split)"""
+        active_players = [i for i in range(self.num_players) if self.hands[i]]
+        if len(active_players) == 1:
+            return active_players
+        strengths = {player: self._get_best_hand(player)[1] for player in active_players}
+        best = max(strengths.values())
+        return [player for player in active_players if strengths[player] == best]
+
+    def equity(
+        self,
+        samples: int = DEFAULT_SAMPLES,
+        time_limit: Optional[float] = None,
+        processes: int = 1,
+        executor: Optional[Executor] = None,
+    ) -> Dict[str, Any]:
+        """Win/tie probabilities of the players still in the hand, by seat"""
+        seats = [i for i in range(self.num_players) if self.hands[i]]
+        result = equity(
+            [self.hands[i] for i in seats],
+            self.community_cards,
+            samples=samples,
+            time_limit=time_limit,
+            processes=processes,
+            executor=executor,
+        )
+        return {
+            "players": {
+                str(seat): {key: result[key][i] for key in ("win", "tie", "equity")}
+                for i, seat in enumerate(seats)
+            },
+            "samples": result["samples"],
+            "exact": result["exact"],
+        }
 
     def validate_move(self, move_data: Dict[str, Any]) -> bool:
         """Validate if a move is legal"""
@@ -240,6 +160,7 @@ class PokerGame(AbstractGame):
         """Make a move in the game"""
         if not self.validate_move(move_data):
             raise ValueError("Invalid move")
+        player = self.current_player
 
         action = move_data["action"]
 
@@ -277,6 +198,7 @@ class PokerGame(AbstractGame):
         ):
             self._advance_round()
 
+        self._record_move(player, move_data)
         return self.get_game_state()
 
     def _advance_round(self):
@@ -287,13 +209,13 @@ class PokerGame(AbstractGame):
 
         if self.round == 1:
             # Flop
-            self.community_cards.extend([self.deck.pop() for _ in range(3)])
+            self._deal_community(3)
         elif self.round == 2:
             # Turn
-            self.community_cards.append(self.deck.pop())
+            self._deal_community(1)
         elif self.round == 3:
             # River
-            self.community_cards.append(self.deck.pop())
+            self._deal_community(1)
         elif self.round == 4:
             # Showdown
             self._determine_winner()
@@ -301,27 +223,13 @@ class PokerGame(AbstractGame):
         # Reset to first player after big blind
         self.current_player = 2
 
+    def _deal_community(self, count: int):
+        cards, self.deck = draw(self.deck, count)
+        self.community_cards.extend(cards)
+
     def _determine_winner(self):
         """Determine the winner of the round"""
-        active_players = [i for i in range(self.num_players) if self.hands[i]]
-        if len(active_players) == 1:
-            self.scores[active_players[0]] += self.pot
-            return
-
-        # Evaluate hands
-        best_hand = (PokerHandType.HIGH_CARD, [0])
-        winners = []
-
-        for player in active_players:
-            hand = self._get_best_hand(player)
-            if hand[0].value > best_hand[0].value:
-                best_hand = hand
-                winners = [player]
-            elif hand[0].value == best_hand[0].value and hand[1] > best_hand[1]:
-                best_hand = hand
-                winners = [player]
-            elif hand[0].value == best_hand[0].value and hand[1] == best_hand[1]:
-                winners.append(player)
+        winners = self._showdown_winners()
 
         # Split pot
         pot_per_winner = self.pot // len(winners)
@@ -331,10 +239,8 @@ class PokerGame(AbstractGame):
     def get_game_state(self) -> Dict[str, Any]:
         """Get the current game state"""
         return {
-            "hands": {
-                str(k): [card.to_dict() for card in v] for k, v in self.hands.items()
-            },
-            "community_cards": [card.to_dict() for card in self.community_cards],
+            "hands": {str(k): CARDS.to_faces(v) for k, v in self.hands.items()},
+            "community_cards": CARDS.to_faces(self.community_cards),
             "current_player": self.current_player,
             "pot": self.pot,
             "bets": self.bets,
@@ -357,23 +263,5 @@ class PokerGame(AbstractGame):
         if not self.is_game_over():
             return None
 
-        active_players = [i for i in range(self.num_players) if self.hands[i]]
-        if len(active_players) == 1:
-            return active_players[0]
-
-        # Evaluate hands
-        best_hand = (PokerHandType.HIGH_CARD, [0])
-        winners = []
-
-        for player in active_players:
-            hand = self._get_best_hand(player)
-            if hand[0].value > best_hand[0].value:
-                best_hand = hand
-                winners = [player]
-            elif hand[0].value == best_hand[0].value and hand[1] > best_hand[1]:
-                best_hand = hand
-                winners = [player]
-            elif hand[0].value == best_hand[0].value and hand[1] == best_hand[1]:
-                winners.append(player)
-
+        winners = self._showdown_winners()
         return winners[0] if len(winners) == 1 else None
@@ -0,0 +1 @@
+from games.scrabble.scrabble import ScrabbleGame
@@ -0,0 +1,271 @@
+"""
+Scrabble word list stored as a minimal DAWG in a flat binary file.
+
+The DAWG is built once from a plain word list (one word per line) with
+Daciuk's incremental algorithm and written next to it as ``<list>.dawg``.
+Later loads memory-map that file, so startup does not depend on the size of
+the lexicon and several worker processes share the same pages.
+
+File layout: a 16-byte header (magic, version, edge count) followed by one
+little-endian uint32 per edge. The edges of a node are stored contiguously,
+sorted by letter, and node 0 is a placeholder so a child index of 0 means "no
+children". Each edge packs::
+
+    bits 0-4   letter (A=0 .. Z=25)
+    bit  5     the path ending with this edge spells a word
+    bit  6     last edge of its node
+    bits 7-31  index of the child node's first edge (0 for none)
+
+The root node's edges start at index 1.
+"""
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import logging
+import mmap
+import os
+import struct
+import sys
+
+MAGIC = b"DAWG"
+VERSION = 1
+HEADER = struct.Struct("<4sII4x")
+ROOT = 1
+LETTER_MASK = 0x1F
+END_OF_WORD = 1 << 5
+LAST_EDGE = 1 << 6
+CHILD_SHIFT = 7
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+ALL_LETTERS = (1 << 26) - 1
+
+DEFAULT_WORDLIST = os.path.join(os.path.dirname(__file__), "words.txt")
+
+logger = logging.getLogger(__name__)
+
+
+class _BuildNode:
+    __slots__ = ("edges", "final", "key")
+
+    def __init__(self):
+        self.edges: Dict[str, "_BuildNode"] = {}
+        self.final = False
+        self.key: Optional[Tuple] = None
+
+
+def _normalize(words: Iterable[str]) -> List[str]:
+    result = set()
+    for word in words:
+        word = word.strip().upper()
+        if word and all("A" <= c <= "Z" for c in word):
+            result.add(word)
+    return sorted(result)
+
+
+def build_edges(words: Iterable[str]) -> array:
+    """Minimal DAWG of the words as a flat uint32 edge array"""
+    root = _BuildNode()
+    register: Dict[Tuple, _BuildNode] = {}
+    unchecked: List[Tuple[_BuildNode, str, _BuildNode]] = []
+
+    def minimize(down_to: int) -> None:
+        while len(unchecked) > down_to:
+            parent, letter, child = unchecked.pop()
+            child.key = (
+                child.final,
+                tuple((c, id(n)) for c, n in sorted(child.edges.items())),
+            )
+            existing = register.get(child.key)
+            if existing is None:
+                register[child.key] = child
+            else:
+                parent.edges[letter] = existing
+
+    previous = ""
+    for word in _normalize(words):
+        common = 0
+        while common < min(len(word), len(previous)) and word[common] == previous[common]:
+            common += 1
+        minimize(common)
+        node = unchecked[-1][2] if unchecked else root
+        for letter in word[common:]:
+            child = _BuildNode()
+            node.edges[letter] = child
+            unchecked.append((node, letter, child))
+            node = child
+        node.final = True
+        previous = word
+    minimize(0)
+
+    # Lay out every distinct node with edges, parents before children
+    edges = array("I", [0])
+    offsets: Dict[int, int] = {}
+    pending = [root]
+    order = []
+    while pending:
+        node = pending.pop()
+        if id(node) in offsets or not node.edges:
+            continue
+        offsets[id(node)] = -1
+        order.append(node)
+        pending.extend(node.edges.values())
+    position = ROOT
+    for node in order:
+        offsets[id(node)] = position
+        position += len(node.edges)
+    for node in order:
+        items = sorted(node.edges.items())
+        for i, (letter, child) in enumerate(items):
+            value = ALPHABET.index(letter)
+            if child.final:
+                value |= END_OF_WORD
+            if i == len(items) - 1:
+                value |= LAST_EDGE
+            value |= offsets.get(id(child), 0) << CHILD_SHIFT
+            edges.append(value)
+    return edges
+
+
+def write_dawg(path: str, edges: array) -> None:
+    data = array("I", edges)
+    if sys.byteorder != "little":
+        data.byteswap()
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(data)))
+        data.tofile(f)
+    os.replace(tmp_path, path)
+
+
+class Lexicon:
+    """Read-only DAWG over a uint32 edge sequence (array or mapped memoryview)"""
+
+    def __init__(self, edges, mapped: Optional[mmap.mmap] = None):
+        self.edges = edges
+        self._mapped = mapped
+
+    @classmethod
+    def from_words(cls, words: Iterable[str]) -> "Lexicon":
+        return cls(build_edges(words))
+
+    @classmethod
+    def load(cls, path: str) -> "Lexicon":
+        """Memory-map a file written by write_dawg"""
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count = HEADER.unpack_from(mapped)
+        if magic != MAGIC or version != VERSION:
+            mapped.close()
+            raise ValueError(f"Not a version {VERSION} DAWG file: {path}")
+        if sys.byteorder == "little":
+            edges = memoryview(mapped)[HEADER.size:HEADER.size + 4 * count].cast("I")
+            return cls(edges, mapped)
+        edges = array("I", mapped[HEADER.size:HEADER.size + 4 * count])
+        edges.byteswap()
+        mapped.close()
+        return cls(edges)
+
+    @classmethod
+    def from_wordlist(cls, path: str, cache_path: Optional[str] = None) -> "Lexicon":
+        """Load the cached DAWG of a word list, (re)building it when stale"""
+        cache_path = cache_path or f"{path}.dawg"
+        try:
+            if os.path.getmtime(cache_path) >= os.path.getmtime(path):
+                return cls.load(cache_path)
+        except (OSError, ValueError):
+            pass
+        with open(path, encoding="utf-8") as f:
+            edges = build_edges(f)
+        try:
+            write_dawg(cache_path, edges)
+        except OSError as e:
+            logger.warning("Could not cache the DAWG at %s: %s", cache_path, e)
+            return cls(edges)
+        return cls.load(cache_path)
+
+    def edges_of(self, node: int) -> Iterator[Tuple[int, bool, int]]:
+        """(letter index, ends a word, child node) for each edge of a node"""
+        edges = self.edges
+        index = node
+        while node:
+            value = edges[index]
+            yield value & LETTER_MASK, bool(value & END_OF_WORD), value >> CHILD_SHIFT
+            if value & LAST_EDGE:
+                return
+            index += 1
+
+    def step(self, node: int, letter: int) -> Tuple[bool, int, bool]:
+        """Follow one letter: (edge exists, child node, ends a word)"""
+        edges = self.edges
+        index = node
+        while node:
+            value = edges[index]
+            if value & LETTER_MASK == letter:
+                return True, value >> CHILD_SHIFT, bool(value & END_OF_WORD)
+            if value & LAST_EDGE:
+                break
+            index += 1
+        return False, 0, False
+
+    def walk(self, letters: str, node: int = ROOT) -> Tuple[bool, int, bool]:
+        """Follow a string of letters from node; same result as step()"""
+        found, is_word = True, False
+        for letter in letters:
+            found, node, is_word = self.step(node, ord(letter) - 65)
+            if not found:
+                return False, 0, False
+        return found, node, is_word
+
+    def __contains__(self, word: str) -> bool:
+        word = word.upper()
+        if not word or not word.isalpha() or not word.isascii():
+            return False
+        found, _, is_word = self.walk(word)
+        return found and is_word
+
+    def cross_check(self, prefix: str, suffix: str) -> int:
+        """Bitmask of letters L such that prefix + L + suffix is a word"""
+        found, node, _ = self.walk(prefix.upper())
+        if not found:
+            return 0
+        mask = 0
+        suffix = suffix.upper()
+        for letter, is_word, child in self.edges_of(node):
+            if suffix:
+                found, _, is_word = self.walk(suffix, child)
+                is_word = found and is_word
+            if is_word:
+                mask |= 1 << letter
+        return mask
+
+    def close(self) -> None:
+        if self._mapped is not None:
+            self.edges.release()
+            self._mapped.close()
+            self._mapped = None
+
+
+_default_lexicon: Optional[Lexicon] = None
+
+
+def get_default_lexicon() -> Lexicon:
+    """
+    Lexicon from ARCADE_SCRABBLE_WORDLIST (default games/scrabble/words.txt),
+    loaded once per process. Raises FileNotFoundError when no word list is
+    installed, rather than letting games accept any word.
+    """
+    global _default_lexicon
+    if _default_lexicon is None:
+        path = os.environ.get("ARCADE_SCRABBLE_WORDLIST", DEFAULT_WORDLIST)
+        if not os.path.exists(path):
+            logger.error("No Scrabble word list at %s", path)
+            raise FileNotFoundError(
+                f"No Scrabble word list at {path}; set ARCADE_SCRABBLE_WORDLIST "
+                "to a file with one word per line"
+            )
+        _default_lexicon = Lexicon.from_wordlist(path)
+    return _default_lexicon
+
+
+def set_default_lexicon(lexicon: Optional[Lexicon]) -> None:
+    """Select the lexicon games use when not given one (None reloads the word list)"""
+    global _default_lexicon
+    _default_lexicon = lexicon
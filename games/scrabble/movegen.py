@@ -0,0 +1,197 @@
+"""
+Anchor-based Scrabble move generation (Appel & Jacobson) over a Lexicon DAWG.
+
+Each row and column is handled as a line of squares. Every play must cover
+an anchor, an empty square next to a tile (the centre on an empty board).
+For each anchor a left part is grown from the rack into the free squares
+before it, or read off the tiles already there, and then extended rightwards
+through the anchor, following DAWG edges only while the letters keep a
+prefix of some word. A letter may go on an empty square only if it is in
+that square's cross-check set, i.e. it forms a valid word with the tiles
+above and below it, so every generated play is legal as a whole.
+"""
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from games.scrabble.lexicon import ALL_LETTERS, ROOT, Lexicon
+from games.scrabble.scoring import decode
+
+Grid = Sequence[Sequence[int]]
+DIRECTIONS = ("horizontal", "vertical")
+
+
+def _lines(board: Grid, direction: str) -> List[List[Optional[str]]]:
+    """Board as lines of letters along the direction of play"""
+    size = len(board)
+    if direction == "horizontal":  # line y runs over x
+        return [[decode(board[x][y]) for x in range(size)] for y in range(size)]
+    return [[decode(board[x][y]) for y in range(size)] for x in range(size)]
+
+
+def _line_cross_checks(lexicon: Lexicon, lines: List[List[Optional[str]]]) -> List[List[int]]:
+    """Letters allowed on each empty square by the words across the lines"""
+    size = len(lines)
+    checks = [[ALL_LETTERS] * size for _ in range(size)]
+    for r in range(size):
+        for i in range(size):
+            if lines[r][i]:
+                continue
+            before = r
+            while before > 0 and lines[before - 1][i]:
+                before -= 1
+            after = r
+            while after < size - 1 and lines[after + 1][i]:
+                after += 1
+            if before == after == r:
+                continue
+            prefix = "".join(lines[k][i] for k in range(before, r))
+            suffix = "".join(lines[k][i] for k in range(r + 1, after + 1))
+            checks[r][i] = lexicon.cross_check(prefix, suffix)
+    return checks
+
+
+def cross_checks(lexicon: Lexicon, board: Grid, direction: str) -> List[List[int]]:
+    """Cross-check letter masks, indexed [x][y], for plays in a direction"""
+    checks = _line_cross_checks(lexicon, _lines(board, direction))
+    size = len(board)
+    if direction == "horizontal":
+        return [[checks[y][x] for y in range(size)] for x in range(size)]
+    return checks
+
+
+def generate_moves(
+    lexicon: Lexicon,
+    board: Grid,
+    rack: Sequence[str],
+    checks: Optional[Dict[str, Grid]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Every legal word placement for a rack of letters ("" for a blank) on a
+    board coded as in games.scrabble.scoring, as move dicts for
+    ScrabbleGame.make_move. checks optionally supplies the
+    cross-check masks per direction, indexed [x][y]; they are computed from
+    the board otherwise.
+    """
+    counts = [0] * 26
+    blanks = 0
+    for letter in rack:
+        if letter:
+            counts[ord(letter.upper()) - 65] += 1
+        else:
+            blanks += 1
+
+    if hasattr(board, "tolist"):
+        board = board.tolist()
+    size = len(board)
+    empty = not any(board[x][y] for x in range(size) for y in range(size))
+    moves: List[Dict[str, Any]] = []
+    for direction in DIRECTIONS:
+        lines = _lines(board, direction)
+        if checks is None:
+            line_checks = _line_cross_checks(lexicon, lines)
+        elif direction == "horizontal":
+            line_checks = [[checks[direction][x][y] for x in range(size)] for y in range(size)]
+        else:
+            line_checks = [list(column) for column in checks[direction]]
+
+        def record(r: int, start: int, word: str, blank_at: Tuple[int, ...]) -> None:
+            moves.append({
+                "action": "place_word",
+                "word": word,
+                "start": [start, r] if direction == "horizontal" else [r, start],
+                "direction": direction,
+                "blanks": list(blank_at),
+            })
+
+        for r in range(size):
+            anchors = _anchors(lines, r, empty)
+            if anchors:
+                _generate_line(
+                    lexicon, lines[r], line_checks[r], anchors, counts, blanks,
+                    lambda start, word, blank_at, r=r: record(r, start, word, blank_at),
+                )
+    return moves
+
+
+def _anchors(lines: List[List[Optional[str]]], r: int, empty: bool) -> List[int]:
+    size = len(lines)
+    if empty:
+        return [size // 2] if r == size // 2 else []
+    line = lines[r]
+    return [
+        i for i in range(size)
+        if not line[i] and (
+            (i > 0 and line[i - 1]) or (i < size - 1 and line[i + 1])
+            or (r > 0 and lines[r - 1][i]) or (r < size - 1 and lines[r + 1][i])
+        )
+    ]
+
+
+def _generate_line(
+    lexicon: Lexicon,
+    line: List[Optional[str]],
+    checks: List[int],
+    anchors: List[int],
+    counts: List[int],
+    blanks: int,
+    record: Callable[[int, str, Tuple[int, ...]], None],
+) -> None:
+    size = len(line)
+    anchor_set = set(anchors)
+    state = {"blanks": blanks}
+
+    def extend_right(word: str, blank_at: Tuple[int, ...], node: int, square: int,
+                     is_word: bool, anchor: int) -> None:
+        if square < size and line[square]:
+            found, child, ends = lexicon.step(node, ord(line[square]) - 65)
+            if found:
+                extend_right(word + line[square], blank_at, child, square + 1, ends, anchor)
+            return
+        if is_word and square > anchor and len(word) >= 2:
+            record(square - len(word), word, blank_at)
+        if square == size:
+            return
+        allowed = checks[square]
+        for letter, ends, child in lexicon.edges_of(node):
+            if not allowed >> letter & 1:
+                continue
+            char = chr(65 + letter)
+            if counts[letter]:
+                counts[letter] -= 1
+                extend_right(word + char, blank_at, child, square + 1, ends, anchor)
+                counts[letter] += 1
+            if state["blanks"]:
+                state["blanks"] -= 1
+                extend_right(word + char, blank_at + (len(word),), child, square + 1, ends, anchor)
+                state["blanks"] += 1
+
+    def left_part(word: str, blank_at: Tuple[int, ...], node: int, limit: int, anchor: int) -> None:
+        extend_right(word, blank_at, node, anchor, False, anchor)
+        if not limit:
+            return
+        for letter, _, child in lexicon.edges_of(node):
+            char = chr(65 + letter)
+            if counts[letter]:
+                counts[letter] -= 1
+                left_part(word + char, blank_at, child, limit - 1, anchor)
+                counts[letter] += 1
+            if state["blanks"]:
+                state["blanks"] -= 1
+                left_part(word + char, blank_at + (len(word),), child, limit - 1, anchor)
+                state["blanks"] += 1
+
+    for anchor in anchors:
+        if anchor > 0 and line[anchor - 1]:
+            # The left part is fixed: the tiles already before the anchor
+            start = anchor
+            while start > 0 and line[start - 1]:
+                start -= 1
+            prefix = "".join(line[start:anchor])
+            found, node, ends = lexicon.walk(prefix)
+            if found:
+                extend_right(prefix, (), node, anchor, ends, anchor)
+            continue
+        limit = 0
+        while (anchor - limit - 1 >= 0 and not line[anchor - limit - 1]
+               and anchor - limit - 1 not in anchor_set):
+            limit += 1
+        left_part("", (), ROOT, limit, anchor)
@@ -0,0 +1,185 @@
+"""
+Scrabble board encoding, premium squares and incremental cross-checks.
+
+The board is a (15, 15) int8 array indexed [x][y]: 0 for an empty square,
+1..26 for A..Z, with BLANK added when the letter was played with a blank
+tile. Premium squares are two static multiplier tables.
+
+For plays in each direction CrossChecks keeps, per empty square, the mask of
+letters that form a valid cross word there and the points of the tiles that
+cross word already has (-1 when the square has no perpendicular neighbour).
+Placing tiles only changes the squares just past the ends of the runs
+through them, so those are the only ones recomputed, and scoring a play
+reads the cross word points instead of walking the board.
+"""
+from typing import Dict, Iterable, Optional, Tuple
+import numpy as np
+
+from games.scrabble.lexicon import ALL_LETTERS, Lexicon
+
+SIZE = 15
+CENTER = (7, 7)
+BLANK = 32
+LETTER_MASK = 31
+BINGO_TILES = 7
+BINGO_BONUS = 50
+
+TILE_COUNTS = {
+    "A": 9,
+    "B": 2,
+    "C": 2,
+    "D": 4,
+    "E": 12,
+    "F": 2,
+    "G": 3,
+    "H": 2,
+    "I": 9,
+    "J": 1,
+    "K": 1,
+    "L": 4,
+    "M": 2,
+    "N": 6,
+    "O": 8,
+    "P": 2,
+    "Q": 1,
+    "R": 6,
+    "S": 4,
+    "T": 6,
+    "U": 4,
+    "V": 2,
+    "W": 2,
+    "X": 1,
+    "Y": 2,
+    "Z": 1,
+    "BLANK": 2,
+}
+TILE_POINTS = {
+    "A": 1,
+    "B": 3,
+    "C": 3,
+    "D": 2,
+    "E": 1,
+    "F": 4,
+    "G": 2,
+    "H": 4,
+    "I": 1,
+    "J": 8,
+    "K": 5,
+    "L": 1,
+    "M": 3,
+    "N": 1,
+    "O": 1,
+    "P": 3,
+    "Q": 10,
+    "R": 1,
+    "S": 1,
+    "T": 1,
+    "U": 1,
+    "V": 4,
+    "W": 4,
+    "X": 8,
+    "Y": 4,
+    "Z": 10,
+    "BLANK": 0,
+}
+# Points of a board square by its code; blanks score nothing
+CODE_POINTS = [0] * (BLANK * 2)
+for _letter, _points in TILE_POINTS.items():
+    if _letter != "BLANK":
+        CODE_POINTS[ord(_letter) - 64] = _points
+
+
+def encode(letter: str, blank: bool = False) -> int:
+    return ord(letter.upper()) - 64 + (BLANK if blank else 0)
+
+
+def decode(code: int) -> Optional[str]:
+    return chr(64 + (code & LETTER_MASK)) if code else None
+
+
+def _premium_table(quadrant: Dict[int, Iterable[Tuple[int, int]]]) -> np.ndarray:
+    """Multipliers from the upper-left quadrant, mirrored to the others"""
+    table = np.ones((SIZE, SIZE), dtype=np.int8)
+    last = SIZE - 1
+    for multiplier, squares in quadrant.items():
+        for x, y in squares:
+            for mx, my in ((x, y), (last - x, y), (x, last - y), (last - x, last - y)):
+                table[mx, my] = multiplier
+    table.setflags(write=False)
+    return table
+
+
+LETTER_MULTIPLIER = _premium_table({
+    2: [(0, 3), (3, 0), (2, 6), (6, 2), (3, 7), (7, 3), (6, 6)],
+    3: [(1, 5), (5, 1), (5, 5)],
+})
+WORD_MULTIPLIER = _premium_table({
+    2: [(1, 1), (2, 2), (3, 3), (4, 4), (7, 7)],
+    3: [(0, 0), (0, 7), (7, 0)],
+})
+
+# Plays in a direction step along (dx, dy) and form cross words along (dy, dx)
+STEPS = {"horizontal": (1, 0), "vertical": (0, 1)}
+
+
+class CrossChecks:
+    """Per-square cross-check masks and cross word points for both directions"""
+
+    def __init__(self):
+        self.masks: Dict[str, np.ndarray] = {}
+        self.points: Dict[str, np.ndarray] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        for direction in STEPS:
+            self.masks[direction] = np.full((SIZE, SIZE), ALL_LETTERS, dtype=np.int32)
+            self.points[direction] = np.full((SIZE, SIZE), -1, dtype=np.int16)
+
+    def update(
+        self, board: np.ndarray, placed: Iterable[Tuple[int, int]], lexicon: Optional[Lexicon]
+    ) -> None:
+        """Refresh the squares whose cross words changed after tiles were placed"""
+        stale = set()
+        for x, y in placed:
+            for direction in STEPS:
+                self.masks[direction][x, y] = 0
+                self.points[direction][x, y] = -1
+            for dx, dy in STEPS.values():
+                # Squares just past either end of the run through (x, y)
+                for sign in (-1, 1):
+                    cx, cy = x, y
+                    while 0 <= cx < SIZE and 0 <= cy < SIZE and board[cx, cy]:
+                        cx, cy = cx + sign * dx, cy + sign * dy
+                    if 0 <= cx < SIZE and 0 <= cy < SIZE:
+                        # This run is the cross word for plays across it
+                        stale.add((cx, cy, "vertical" if dx else "horizontal"))
+        for x, y, direction in stale:
+            self._refresh(board, x, y, direction, lexicon)
+
+    def _refresh(
+        self, board: np.ndarray, x: int, y: int, direction: str, lexicon: Optional[Lexicon]
+    ) -> None:
+        dy, dx = STEPS[direction]  # the cross word axis
+        prefix = []
+        cx, cy = x - dx, y - dy
+        while cx >= 0 and cy >= 0 and board[cx, cy]:
+            prefix.append(int(board[cx, cy]))
+            cx, cy = cx - dx, cy - dy
+        suffix = []
+        cx, cy = x + dx, y + dy
+        while cx < SIZE and cy < SIZE and board[cx, cy]:
+            suffix.append(int(board[cx, cy]))
+            cx, cy = cx + dx, cy + dy
+        if not prefix and not suffix:
+            self.masks[direction][x, y] = ALL_LETTERS
+            self.points[direction][x, y] = -1
+            return
+        prefix.reverse()
+        self.points[direction][x, y] = sum(CODE_POINTS[code] for code in prefix + suffix)
+        if lexicon is None:
+            self.masks[direction][x, y] = ALL_LETTERS
+        else:
+            self.masks[direction][x, y] = lexicon.cross_check(
+                "".join(decode(code) for code in prefix),
+                "".join(decode(code) for code in suffix),
+            )
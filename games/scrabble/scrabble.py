@@ -1,9 +1,26 @@
 from game_abc import AbstractGame, GameMove, GameHistory
+from games.scrabble.lexicon import Lexicon, get_default_lexicon
+from games.scrabble.movegen import generate_moves
+from games.scrabble.scoring import (
+    BINGO_BONUS,
+    BINGO_TILES,
+    CENTER,
+    CODE_POINTS,
+    LETTER_MASK,
+    LETTER_MULTIPLIER,
+    SIZE,
+    STEPS,
+    TILE_COUNTS,
+    TILE_POINTS,
+    WORD_MULTIPLIER,
+    CrossChecks,
+    decode,
+    encode,
+)
 from typing import Dict, Any, Optional, List, Tuple, Set
 import numpy as np
 from enum import Enum
 import time
-import random
 from collections import defaultdict
 import json
 
@@ -19,101 +36,47 @@ class Tile:
 
 
 class ScrabbleGame(AbstractGame):
-    def __init__(self, game_id: str, num_players: int = 2):
-        super().__init__(game_id)
+    def __init__(
+        self, game_id: str, num_players: int = 2, lexicon: Optional[Lexicon] = None
+    ):
         self.num_players = num_players
-        self.current_player = 0
-        self.board = np.zeros((15, 15), dtype=object)
-        self.rack = defaultdict(list)
-        self.bag = []
-        self.score = defaultdict(int)
-        self.turns = 0
-        self.phase = "setup"  # setup, play, end
+        self.lexicon = lexicon or get_default_lexicon()
+        super().__init__(game_id)
+
+    def initialize_game(self) -> Dict[str, Any]:
+        """Shuffle the bag and deal the racks"""
+        self._init_game()
+        return self.get_game_state()
+
+    def _restore_game_state(self) -> None:
+        """Deal again from the recorded seed and replay the recorded moves"""
         self._init_game()
+        self._replay_moves()
 
     def _init_game(self):
         """Initialize a new game"""
+        self.reset_rng()
         self.current_player = 0
         self.phase = "setup"
-        self.board = np.zeros((15, 15), dtype=object)
+        self.board = np.zeros((SIZE, SIZE), dtype=np.int8)
+        self.cross_checks = CrossChecks()
         self.rack = defaultdict(list)
         self.score = defaultdict(int)
         self.turns = 0
 
         # Initialize bag with tiles
         self.bag = []
-        tile_distribution = {
-            "A": 9,
-            "B": 2,
-            "C": 2,
-            "D": 4,
-            "E": 12,
-            "F": 2,
-            "G": 3,
-            "H": 2,
-            "I": 9,
-            "J": 1,
-            "K": 1,
-            "L": 4,
-            "M": 2,
-            "N": 6,
-            "O": 8,
-            "P": 2,
-            "Q": 1,
-            "R": 6,
-            "S": 4,
-            "T": 6,
-            "U": 4,
-            "V": 2,
-            "W": 2,
-            "X": 1,
-            "Y": 2,
-            "Z": 1,
-            "BLANK": 2,
-        }
-
-        # Add tiles to bag with their point values
-        tile_points = {
-            "A": 1,
-            "B": 3,
-            "C": 3,
-            "D": 2,
-            "E": 1,
-            "F": 4,
-            "G": 2,
-            "H": 4,
-            "I": 1,
-            "J": 8,
-            "K": 5,
-            "L": 1,
-            "M": 3,
-            "N": 1,
-            "O": 1,
-            "P": 3,
-            "Q": 10,
-            "R": 1,
-            "S": 1,
-            "T": 1,
-            "U": 1,
-            "V": 4,
-            "W": 4,
-            "X": 8,
-            "Y": 4,
-            "Z": 10,
-            "BLANK": 0,
-        }
-
-        for letter, count in tile_distribution.items():
+        for letter, count in TILE_COUNTS.items():
             for _ in range(count):
                 self.bag.append(
                     Tile(
                         letter if letter != "BLANK" else "",
-                        tile_points[letter],
+                        TILE_POINTS[letter],
                         letter == "BLANK",
                     )
                 )
 
-        random.shuffle(self.bag)
+        self.rng.shuffle(self.bag)
 
         # Give each player 7 tiles
         for player in range(self.num_players):
@@ -130,24 +93,37 @@ class ScrabbleGame(AbstractGame):
         return drawn
 
     def _calculate_word_score(
-        self, word: List[Tuple[int, int, str]], is_first_move: bool = False
+        self, start: Tuple[int, int], direction: str, length: int,
+        placed: List[Tuple[int, int, int, str]], blanks: List[int],
     ) -> int:
-        """Calculate the score for a word"""
-        word_multiplier = 1
-        word_score = 0
-
-        for x, y, letter in word:
-            tile = self.rack[self.current_player][0] if letter == "" else None
-            points = tile.points if tile else 1
-
-            # Check for special squares
-            if (x, y) == (7, 7):  # Center square
-                word_multiplier *= 2 if not is_first_move else 1
-
-            # Calculate letter score
-            word_score += points
-
-        return word_score * word_multiplier
+        """
+        Score of the main word and every cross word the placed tiles form.
+        Premium squares count only under new tiles, and the points of the
+        tiles each cross word already has come from the cross-check table.
+        """
+        dx, dy = STEPS[direction]
+        cross_points = self.cross_checks.points[direction]
+        new = {(x, y): (index, letter) for index, x, y, letter in placed}
+        main_score = 0
+        main_multiplier = 1
+        cross_score = 0
+        for i in range(length):
+            x, y = start[0] + dx * i, start[1] + dy * i
+            if (x, y) not in new:
+                main_score += CODE_POINTS[self.board[x, y]]
+                continue
+            index, letter = new[(x, y)]
+            points = 0 if index in blanks else TILE_POINTS[letter]
+            letter_score = points * int(LETTER_MULTIPLIER[x, y])
+            word_multiplier = int(WORD_MULTIPLIER[x, y])
+            main_score += letter_score
+            main_multiplier *= word_multiplier
+            if cross_points[x, y] >= 0:
+                cross_score += (int(cross_points[x, y]) + letter_score) * word_multiplier
+        score = main_score * main_multiplier + cross_score
+        if len(placed) == BINGO_TILES:
+            score += BINGO_BONUS
+        return score
 
     def validate_move(self, move_data: Dict[str, Any]) -> bool:
         """Validate if a move is legal"""
@@ -172,12 +148,13 @@ class ScrabbleGame(AbstractGame):
             if not self._is_valid_word(word):
                 return False
 
-            # Check if position is valid
-            if not self._is_valid_position(start, direction, word):
+            # Check if position is valid, cross words included
+            placed = self._placements(start, direction, word)
+            if placed is None:
                 return False
 
             # Check if player has the tiles
-            if not self._has_tiles(word):
+            if self._rack_tiles(placed, move_data.get("blanks")) is None:
                 return False
 
             return True
@@ -197,57 +174,110 @@ class ScrabbleGame(AbstractGame):
         return False
 
     def _is_valid_word(self, word: str) -> bool:
-        """Check if a word is valid (simple implementation, would use dictionary in real game)"""
-        return len(word) >= 2 and all(c.isalpha() or c == "" for c in word)
+        """Check a word against the lexicon"""
+        if len(word) < 2 or not word.isalpha():
+            return False
+        return word in self.lexicon
 
     def _is_valid_position(
         self, start: Tuple[int, int], direction: str, word: str
     ) -> bool:
         """Check if word can be placed at the given position"""
-        x, y = start
-        length = len(word)
+        return self._placements(start, direction, word) is not None
 
-        if direction == "horizontal":
-            # Check if word fits horizontally
-            if x + length > 15:
-                return False
-
-            # Check if position is empty
-            for i in range(length):
-                if self.board[x + i][y] is not None:
-                    return False
-
-            # Check if adjacent spaces are empty
-            if y > 0:
-                for i in range(length):
-                    if self.board[x + i][y - 1] is not None:
-                        return False
-            if y < 14:
-                for i in range(length):
-                    if self.board[x + i][y + 1] is not None:
-                        return False
-
-        else:  # vertical
-            # Check if word fits vertically
-            if y + length > 15:
-                return False
-
-            # Check if position is empty
-            for i in range(length):
-                if self.board[x][y + i] is not None:
-                    return False
-
-            # Check if adjacent spaces are empty
-            if x > 0:
-                for i in range(length):
-                    if self.board[x - 1][y + i] is not None:
-                        return False
-            if x < 14:
-                for i in range(length):
-                    if self.board[x + 1][y + i] is not None:
-                        return False
+    def _placements(
+        self, start: Tuple[int, int], direction: str, word: str
+    ) -> Optional[List[Tuple[int, int, int, str]]]:
+        """
+        New tiles (index in word, x, y, letter) the word puts on the board, or
+        None if it does not fit: it must agree with the tiles it crosses, be the
+        whole run of tiles in its line, place at least one tile, cover the
+        centre on the first move or touch existing tiles later, and every cross
+        word it forms must be valid.
+        """
+        if direction not in STEPS or len(start) != 2 or not word.isalpha():
+            return None
+        x, y = start
+        dx, dy = STEPS[direction]
+        end_x, end_y = x + dx * (len(word) - 1), y + dy * (len(word) - 1)
+        if not (0 <= x and 0 <= y and end_x < SIZE and end_y < SIZE):
+            return None
+        if self._occupied(x - dx, y - dy) or self._occupied(end_x + dx, end_y + dy):
+            return None
 
-        return True
+        masks = self.cross_checks.masks[direction]
+        cross_points = self.cross_checks.points[direction]
+        placed = []
+        touches = False
+        for i, letter in enumerate(word.upper()):
+            cx, cy = x + dx * i, y + dy * i
+            code = self.board[cx, cy]
+            if code:
+                if code & LETTER_MASK != encode(letter):
+                    return None
+                touches = True
+                continue
+            if not masks[cx, cy] >> (encode(letter) - 1) & 1:
+                return None
+            placed.append((i, cx, cy, letter))
+            touches = touches or cross_points[cx, cy] >= 0
+        if not placed:
+            return None
+        if not self.board[CENTER]:
+            # First word: it must cover the centre square
+            if not any((cx, cy) == CENTER for _, cx, cy, _ in placed):
+                return None
+        elif not touches:
+            return None
+        return placed
+
+    def _occupied(self, x: int, y: int) -> bool:
+        return 0 <= x < SIZE and 0 <= y < SIZE and bool(self.board[x, y])
+
+    def _rack_tiles(
+        self, placed: List[Tuple[int, int, int, str]], blanks: Optional[List[int]] = None
+    ) -> Optional[List[int]]:
+        """
+        Rack index of the tile playing each placed letter, or None if the rack
+        lacks them. blanks lists the word indices played with blank tiles;
+        without it a blank stands in for any letter missing from the rack.
+        """
+        rack = self.rack[self.current_player]
+        free = list(range(len(rack)))
+        used: List[Optional[int]] = [None] * len(placed)
+        for n, (index, _, _, letter) in enumerate(placed):
+            if blanks is not None and index in blanks:
+                continue
+            match = next((i for i in free if rack[i].letter.upper() == letter), None)
+            if match is None:
+                if blanks is not None:
+                    return None
+                continue
+            free.remove(match)
+            used[n] = match
+        for n in range(len(placed)):
+            if used[n] is None:
+                match = next((i for i in free if rack[i].is_blank), None)
+                if match is None:
+                    return None
+                free.remove(match)
+                used[n] = match
+        return used
+
+    def legal_moves(self) -> List[Dict[str, Any]]:
+        """Every legal word placement for the current player's rack, best scoring first"""
+        rack = [tile.letter for tile in self.rack[self.current_player]]
+        moves = generate_moves(
+            self.lexicon, self.board, rack,
+            {d: masks.tolist() for d, masks in self.cross_checks.masks.items()},
+        )
+        for move in moves:
+            placed = self._placements(move["start"], move["direction"], move["word"])
+            move["score"] = self._calculate_word_score(
+                move["start"], move["direction"], len(move["word"]), placed, move["blanks"]
+            )
+        moves.sort(key=lambda move: -move["score"])
+        return moves
 
     def _has_tiles(self, word: str) -> bool:
         """Check if player has the required tiles"""
@@ -274,6 +304,7 @@ class ScrabbleGame(AbstractGame):
         """Make a move in the game"""
         if not self.validate_move(move_data):
             raise ValueError("Invalid move")
+        player = self.current_player
 
         action = move_data["action"]
 
@@ -281,31 +312,26 @@ class ScrabbleGame(AbstractGame):
             word = move_data["word"]
             start = move_data["start"]
             direction = move_data["direction"]
+            placed = self._placements(start, direction, word)
+            used = self._rack_tiles(placed, move_data.get("blanks"))
+            rack = self.rack[self.current_player]
+            blanks = [index for (index, _, _, _), i in zip(placed, used) if rack[i].is_blank]
 
-            # Place word on board
-            x, y = start
-            for letter in word:
-                if direction == "horizontal":
-                    self.board[x][y] = letter
-                    x += 1
-                else:
-                    self.board[x][y] = letter
-                    y += 1
-
-            # Calculate score
-            score = self._calculate_word_score(word, self.turns == 0)
+            # Score before placing: the cross-check table describes this board
+            score = self._calculate_word_score(start, direction, len(word), placed, blanks)
             self.score[self.current_player] += score
 
-            # Remove used tiles from rack
-            for letter in word:
-                if letter == "":
-                    continue
+            # Place the new tiles on the board
+            for index, x, y, letter in placed:
+                self.board[x, y] = encode(letter, index in blanks)
+            self.cross_checks.update(
+                self.board, [(x, y) for _, x, y, _ in placed], self.lexicon
+            )
 
-                # Find and remove tile
-                for i, tile in enumerate(self.rack[self.current_player]):
-                    if tile.letter.lower() == letter.lower():
-                        del self.rack[self.current_player][i]
-                        break
+            # Remove used tiles from rack
+            self.rack[self.current_player] = [
+                tile for i, tile in enumerate(rack) if i not in used
+            ]
 
             # Draw new tiles
             self._draw_tiles(
@@ -330,7 +356,7 @@ class ScrabbleGame(AbstractGame):
 
             # Add tiles back to bag
             for letter in tiles:
-                self.bag.append(Tile(letter, 1))
+                self.bag.append(Tile(letter, TILE_POINTS[letter.upper() or "BLANK"], not letter))
 
             # Draw new tiles
             self._draw_tiles(self.current_player, len(tiles))
@@ -339,13 +365,14 @@ class ScrabbleGame(AbstractGame):
         self.current_player = (self.current_player + 1) % self.num_players
         self.turns += 1
 
+        self._record_move(player, move_data)
         return self.get_game_state()
 
     def get_game_state(self) -> Dict[str, Any]:
         """Get the current game state"""
         return {
             "board": [
-                [tile.letter if tile else None for tile in row] for row in self.board
+                [decode(code) for code in row] for row in self.board.tolist()
             ],
             "current_player": self.current_player,
             "phase": self.phase,
@@ -0,0 +1,331 @@
+"""
+Attack maps and legal move generation for shogi.
+
+Squares are numbered ``row * 9 + col`` using the coordinates of
+``ShogiGame.board`` (white starts on rows 6-8 and moves towards row 0). Sets of
+squares are Python ints with one bit per square. Step attacks for every piece
+kind and color are precomputed tables, sliding attacks (lance, bishop, rook)
+come from ray tables, and check, pin and drop restrictions are mask operations.
+"""
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+SIZE = 9
+SQUARES = SIZE * SIZE
+FULL = (1 << SQUARES) - 1
+COLORS = ("w", "b")
+
+# Piece kinds: unpromoted types plus "g" for every gold mover (gold and the
+# promoted pawn, lance, knight and silver), "h" (horse, promoted bishop) and
+# "d" (dragon, promoted rook)
+KINDS = ("p", "l", "n", "s", "g", "k", "b", "r", "h", "d")
+FORWARD = {"w": (-1, 0), "b": (1, 0)}
+ORTHOGONALS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+DIAGONALS = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+
+Move = Tuple[Optional[int], Optional[int], int, int, Optional[str]]
+
+
+def lsb(bb: int) -> int:
+    return (bb & -bb).bit_length() - 1
+
+
+def msb(bb: int) -> int:
+    return bb.bit_length() - 1
+
+
+def squares(bb: int):
+    """Yield the index of every set bit, lowest first"""
+    while bb:
+        low = bb & -bb
+        yield low.bit_length() - 1
+        bb ^= low
+
+
+def kind_of(piece_type: str, promoted: bool) -> str:
+    if not promoted:
+        return piece_type
+    return {"b": "h", "r": "d", "k": "k", "g": "g"}.get(piece_type, "g")
+
+
+def _step_offsets(kind: str, color: str) -> Tuple[Tuple[int, int], ...]:
+    f = FORWARD[color][0]
+    if kind == "p":
+        return ((f, 0),)
+    if kind == "n":
+        return ((2 * f, -1), (2 * f, 1))
+    if kind == "s":
+        return ((f, 0), (f, -1), (f, 1), (-f, -1), (-f, 1))
+    if kind == "g":
+        return ((f, 0), (f, -1), (f, 1), (0, -1), (0, 1), (-f, 0))
+    return ORTHOGONALS + DIAGONALS  # king
+
+
+def _table(offsets: Sequence[Tuple[int, int]]) -> List[int]:
+    table = []
+    for sq in range(SQUARES):
+        row, col = divmod(sq, SIZE)
+        bb = 0
+        for dr, dc in offsets:
+            r, c = row + dr, col + dc
+            if 0 <= r < SIZE and 0 <= c < SIZE:
+                bb |= 1 << (r * SIZE + c)
+        table.append(bb)
+    return table
+
+
+def _ray_table(dr: int, dc: int) -> List[int]:
+    table = []
+    for sq in range(SQUARES):
+        row, col = divmod(sq, SIZE)
+        bb = 0
+        r, c = row + dr, col + dc
+        while 0 <= r < SIZE and 0 <= c < SIZE:
+            bb |= 1 << (r * SIZE + c)
+            r += dr
+            c += dc
+        table.append(bb)
+    return table
+
+
+STEPS = {
+    kind: {color: _table(_step_offsets(kind, color)) for color in COLORS}
+    for kind in ("p", "n", "s", "g", "k")
+}
+RAYS = {d: _ray_table(*d) for d in ORTHOGONALS + DIAGONALS}
+POSITIVE = {d: d[0] * SIZE + d[1] > 0 for d in RAYS}
+
+
+def _between_table() -> List[List[int]]:
+    table = [[0] * SQUARES for _ in range(SQUARES)]
+    for a in range(SQUARES):
+        for rays in RAYS.values():
+            for b in squares(rays[a]):
+                table[a][b] = rays[a] & ~rays[b] & ~(1 << b)
+    return table
+
+
+BETWEEN = _between_table()
+ROWS = [sum(1 << (row * SIZE + col) for col in range(SIZE)) for row in range(SIZE)]
+FILES = [sum(1 << (row * SIZE + col) for row in range(SIZE)) for col in range(SIZE)]
+# Squares a piece dropped by color could never leave: last rank for pawns and
+# lances, last two ranks for knights
+DEAD_SQUARES = {
+    "w": {"p": ROWS[0], "l": ROWS[0], "n": ROWS[0] | ROWS[1]},
+    "b": {"p": ROWS[8], "l": ROWS[8], "n": ROWS[8] | ROWS[7]},
+}
+
+
+def nearest(d: Tuple[int, int], bb: int) -> int:
+    """The square of bb closest to the origin of a ray in direction d"""
+    return lsb(bb) if POSITIVE[d] else msb(bb)
+
+
+def ray_attacks(sq: int, occupied: int, directions: Iterable[Tuple[int, int]]) -> int:
+    attacks = 0
+    for d in directions:
+        ray = RAYS[d][sq]
+        blockers = ray & occupied
+        if blockers:
+            ray ^= RAYS[d][nearest(d, blockers)]
+        attacks |= ray
+    return attacks
+
+
+class ShogiPosition:
+    """Piece placement as per-color, per-kind square sets with lazily built attack maps"""
+
+    def __init__(self):
+        self.pieces: Dict[str, Dict[str, int]] = {
+            color: {kind: 0 for kind in KINDS} for color in COLORS
+        }
+        self.occupancy: Dict[str, int] = {color: 0 for color in COLORS}
+        self.kinds: List[Optional[Tuple[str, str]]] = [None] * SQUARES
+        self._attack_maps: Dict[str, int] = {}
+
+    @property
+    def occupied(self) -> int:
+        return self.occupancy["w"] | self.occupancy["b"]
+
+    def put(self, sq: int, color: str, kind: str) -> None:
+        bit = 1 << sq
+        self.pieces[color][kind] |= bit
+        self.occupancy[color] |= bit
+        self.kinds[sq] = (color, kind)
+        self._attack_maps.clear()
+
+    @classmethod
+    def from_board(cls, board: Sequence[Sequence[Any]]) -> "ShogiPosition":
+        """Build from a ShogiGame.board grid of ShogiPiece objects"""
+        position = cls()
+        for row, cells in enumerate(board):
+            for col, piece in enumerate(cells):
+                if piece is not None:
+                    position.put(row * SIZE + col, piece.color, kind_of(piece.piece_type, piece.promoted))
+        return position
+
+    def copy(self) -> "ShogiPosition":
+        position = ShogiPosition()
+        position.pieces = {color: dict(kinds) for color, kinds in self.pieces.items()}
+        position.occupancy = dict(self.occupancy)
+        position.kinds = list(self.kinds)
+        return position
+
+    def king_square(self, color: str) -> Optional[int]:
+        kings = self.pieces[color]["k"]
+        return lsb(kings) if kings else None
+
+    def attacks_from(self, sq: int, color: str, kind: str, occupied: Optional[int] = None) -> int:
+        """Squares attacked by a piece of color and kind standing on sq"""
+        if kind in STEPS:
+            return STEPS[kind][color][sq]
+        if occupied is None:
+            occupied = self.occupied
+        if kind == "l":
+            return ray_attacks(sq, occupied, (FORWARD[color],))
+        if kind in ("b", "h"):
+            attacks = ray_attacks(sq, occupied, DIAGONALS)
+        else:
+            attacks = ray_attacks(sq, occupied, ORTHOGONALS)
+        if kind in ("h", "d"):
+            attacks |= STEPS["k"][color][sq]
+        return attacks
+
+    def attack_map(self, color: str) -> int:
+        """Every square attacked by color, computed once per position"""
+        attacks = self._attack_maps.get(color)
+        if attacks is None:
+            attacks = 0
+            occupied = self.occupied
+            for kind, bb in self.pieces[color].items():
+                for sq in squares(bb):
+                    attacks |= self.attacks_from(sq, color, kind, occupied)
+            self._attack_maps[color] = attacks
+        return attacks
+
+    def attackers_to(self, sq: int, by_color: str, occupied: Optional[int] = None) -> int:
+        """Pieces of by_color attacking sq. Step patterns are looked up in reverse
+        with the other color's table, sliders by casting rays from sq."""
+        if occupied is None:
+            occupied = self.occupied
+        other = "b" if by_color == "w" else "w"
+        enemy = self.pieces[by_color]
+        return (
+            (STEPS["p"][other][sq] & enemy["p"])
+            | (STEPS["n"][other][sq] & enemy["n"])
+            | (STEPS["s"][other][sq] & enemy["s"])
+            | (STEPS["g"][other][sq] & enemy["g"])
+            | (STEPS["k"][other][sq] & (enemy["k"] | enemy["h"] | enemy["d"]))
+            | (ray_attacks(sq, occupied, (FORWARD[other],)) & enemy["l"])
+            | (ray_attacks(sq, occupied, DIAGONALS) & (enemy["b"] | enemy["h"]))
+            | (ray_attacks(sq, occupied, ORTHOGONALS) & (enemy["r"] | enemy["d"]))
+        )
+
+    def in_check(self, color: str) -> bool:
+        king = self.king_square(color)
+        if king is None:
+            return False
+        return bool(self.attack_map("b" if color == "w" else "w") >> king & 1)
+
+    def legal_moves(
+        self, color: str, hand: Iterable[str] = (), check_uchifuzume: bool = True
+    ) -> Tuple[Move, ...]:
+        """
+        All legal moves for color: board moves as (from_row, from_col, to_row,
+        to_col, None) and drops as (None, None, to_row, to_col, piece_type).
+        Without a king (test setups) every pseudo-legal move is legal.
+        """
+        opponent = "b" if color == "w" else "w"
+        own = self.occupancy[color]
+        occupied = self.occupied
+        king = self.king_square(color)
+        moves: List[Move] = []
+
+        def add(from_sq: int, targets: int) -> None:
+            from_row, from_col = divmod(from_sq, SIZE)
+            for to_sq in squares(targets):
+                moves.append((from_row, from_col, to_sq // SIZE, to_sq % SIZE, None))
+
+        evasion = FULL
+        pinned: Dict[int, int] = {}
+        if king is not None:
+            without_king = occupied & ~(1 << king)
+            targets = 0
+            for to_sq in squares(STEPS["k"][color][king] & ~own):
+                if not self.attackers_to(to_sq, opponent, without_king):
+                    targets |= 1 << to_sq
+            add(king, targets)
+
+            checkers = self.attackers_to(king, opponent)
+            if checkers & (checkers - 1):
+                return tuple(moves)  # Double check: only the king can move
+            if checkers:
+                evasion = checkers | BETWEEN[king][lsb(checkers)]
+            pinned = self._pins(king, color, opponent)
+
+        for kind, bb in self.pieces[color].items():
+            if kind == "k" and king is not None:
+                bb &= ~(1 << king)
+            for sq in squares(bb):
+                targets = self.attacks_from(sq, color, kind, occupied) & ~own & evasion
+                if sq in pinned:
+                    targets &= pinned[sq]
+                add(sq, targets)
+
+        # Drops can only interpose, never capture a checker
+        drop_mask = FULL & ~occupied & evasion
+        for piece_type in sorted(set(hand)):
+            if piece_type == "k":
+                continue
+            mask = drop_mask & ~DEAD_SQUARES[color].get(piece_type, 0)
+            if piece_type == "p":
+                mask = self._pawn_drop_mask(color, opponent, mask, check_uchifuzume)
+            for to_sq in squares(mask):
+                moves.append((None, None, to_sq // SIZE, to_sq % SIZE, piece_type))
+        return tuple(moves)
+
+    def _pins(self, king: int, color: str, opponent: str) -> Dict[int, int]:
+        """Map each pinned piece of color to the squares it may move to"""
+        occupied = self.occupied
+        enemy = self.pieces[opponent]
+        pinned = {}
+        for d, rays in RAYS.items():
+            blockers = rays[king] & occupied
+            if not blockers:
+                continue
+            first = nearest(d, blockers)
+            if not self.occupancy[color] >> first & 1:
+                continue
+            rest = blockers & ~(1 << first)
+            if not rest:
+                continue
+            second = nearest(d, rest)
+            if d in DIAGONALS:
+                sliders = enemy["b"] | enemy["h"]
+            else:
+                sliders = enemy["r"] | enemy["d"]
+                if FORWARD[opponent] == (-d[0], -d[1]):
+                    sliders |= enemy["l"]
+            if sliders >> second & 1:
+                pinned[first] = BETWEEN[king][second] | (1 << second)
+        return pinned
+
+    def _pawn_drop_mask(self, color: str, opponent: str, mask: int, check_uchifuzume: bool) -> int:
+        """Apply nifu (no two unpromoted pawns on a file) and uchifuzume (no mate by pawn drop)"""
+        for sq in squares(self.pieces[color]["p"]):
+            mask &= ~FILES[sq % SIZE]
+        enemy_king = self.king_square(opponent)
+        if not check_uchifuzume or enemy_king is None:
+            return mask
+        # The only pawn drop giving check is the square in front of the enemy king
+        dr = FORWARD[color][0]
+        row, col = divmod(enemy_king, SIZE)
+        row -= dr
+        if not 0 <= row < SIZE or not mask >> (row * SIZE + col) & 1:
+            return mask
+        drop_sq = row * SIZE + col
+        after = self.copy()
+        after.put(drop_sq, color, "p")
+        # A pawn check is a contact check, so the defender's drops cannot help
+        if not after.legal_moves(opponent, check_uchifuzume=False):
+            mask &= ~(1 << drop_sq)
+        return mask
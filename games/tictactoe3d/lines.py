@@ -0,0 +1,85 @@
+"""
+Winning-line tables for n x n x n tic-tac-toe.
+
+Every straight line of n cells through the cube (76 for the 4x4x4 board,
+3n^2 + 6n + 4 in general) is built once per board size as an (L, n) array of
+flat cell indices. Win checks, threat counting and position evaluation are
+then a single gather ``flat[..., lines]`` followed by a sum along the last
+axis, for one board or a whole stack of candidate boards at once.
+"""
+from functools import lru_cache
+from itertools import product
+import numpy as np
+
+
+@lru_cache(maxsize=None)
+def winning_lines(n: int) -> np.ndarray:
+    """(L, n) array with the flat indices of every line of the n^3 cube"""
+    lines = []
+    for d in product((-1, 0, 1), repeat=3):
+        # Keep one of each pair of opposite directions
+        if not any(d) or next(c for c in d if c) < 0:
+            continue
+        for start in product(range(n), repeat=3):
+            end = [s + (n - 1) * c for s, c in zip(start, d)]
+            before = [s - c for s, c in zip(start, d)]
+            if not all(0 <= c < n for c in end):
+                continue
+            if all(0 <= c < n for c in before):
+                continue  # not the first cell of its line
+            cells = [[s + i * c for s, c in zip(start, d)] for i in range(n)]
+            lines.append([(x * n + y) * n + z for x, y, z in cells])
+    table = np.array(lines, dtype=np.intp)
+    table.setflags(write=False)
+    return table
+
+
+class LineTable:
+    """Vectorized line statistics for stacks of (..., n, n, n) boards"""
+
+    def __init__(self, n: int):
+        self.n = n
+        self.lines = winning_lines(n)
+        # Score of an open line by number of stones; completed lines dominate
+        self.weights = 10 ** np.arange(n + 1, dtype=np.int64)
+        self.weights[0] = 0
+        self.weights[n] *= 100
+
+    def counts(self, boards: np.ndarray, value: int) -> np.ndarray:
+        """Stones equal to value on every line, shape (..., L)"""
+        boards = np.asarray(boards)
+        flat = boards.reshape(boards.shape[:-3] + (-1,))
+        return (flat[..., self.lines] == value).sum(axis=-1)
+
+    def winner(self, boards: np.ndarray, player: int, opponent: int) -> np.ndarray:
+        """player, opponent or 0 for each board"""
+        mine = (self.counts(boards, player) == self.n).any(axis=-1)
+        theirs = (self.counts(boards, opponent) == self.n).any(axis=-1)
+        return np.where(mine, player, np.where(theirs, opponent, 0))
+
+    def open_lines(self, boards: np.ndarray, opponent: int) -> np.ndarray:
+        """Lines still free of opponent stones, i.e. completable by the player"""
+        return (self.counts(boards, opponent) == 0).sum(axis=-1)
+
+    def threats(self, boards: np.ndarray, player: int, opponent: int) -> np.ndarray:
+        """Open lines on which player needs one more stone"""
+        mine = self.counts(boards, player)
+        theirs = self.counts(boards, opponent)
+        return ((mine == self.n - 1) & (theirs == 0)).sum(axis=-1)
+
+    def evaluate(self, boards: np.ndarray, player: int, opponent: int) -> np.ndarray:
+        """
+        Heuristic score from player's point of view: every line not yet
+        blocked is worth 10^stones, the opponent's lines count ten times as
+        much since they move next, and a completed line outweighs the rest.
+        """
+        mine = self.counts(boards, player)
+        theirs = self.counts(boards, opponent)
+        own = np.where(theirs == 0, self.weights[mine], 0).sum(axis=-1)
+        other = np.where(mine == 0, self.weights[theirs], 0).sum(axis=-1)
+        return own - 10 * other
+
+
+@lru_cache(maxsize=None)
+def line_table(n: int) -> LineTable:
+    return LineTable(n)
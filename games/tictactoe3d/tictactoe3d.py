@@ -1,8 +1,9 @@
 from game_abc import AbstractGame, GameMove, GameHistory
+from games.k_in_a_row import KInARow
+from games.tictactoe3d.lines import line_table
 from typing import Dict, Any, Optional, List, Tuple, Set
 import numpy as np
 from enum import Enum
-import time
 
 
 class TTT3DPiece(Enum):
@@ -13,19 +14,29 @@ class TTT3DPiece(Enum):
 
 class TTT3DGame(AbstractGame):
     def __init__(self, game_id: str, board_size: int = 4):
-        super().__init__(game_id)
         self.board_size = board_size
-        self.board = np.zeros((board_size, board_size, board_size), dtype=int)
-        self.current_player = TTT3DPiece.X
-        self._init_game()
+        self.lines = KInARow((board_size,) * 3, board_size)
+        self.line_table = line_table(board_size)
+        super().__init__(game_id)
 
     def _init_game(self):
         """Initialize a new game"""
         self.board = np.zeros(
             (self.board_size, self.board_size, self.board_size), dtype=int
         )
+        self.lines.reset()
         self.current_player = TTT3DPiece.X
 
+    def initialize_game(self) -> Dict[str, Any]:
+        """Reset the board and start a new game"""
+        self._init_game()
+        return self.get_game_state()
+
+    def _restore_game_state(self) -> None:
+        """Rebuild the position by replaying the recorded moves"""
+        self._init_game()
+        self._replay_moves()
+
     def _is_valid_position(self, x: int, y: int, z: int) -> bool:
         """Check if position is on board and empty"""
         return (
@@ -35,52 +46,17 @@ class TTT3DGame(AbstractGame):
             and self.board[x, y, z] == TTT3DPiece.EMPTY.value
         )
 
-    def _check_line(self, x: int, y: int, z: int, dx: int, dy: int, dz: int) -> bool:
-        """Check if there's a line of 4 pieces in a direction"""
-        piece = self.board[x, y, z]
-        if piece == TTT3DPiece.EMPTY.value:
-            return False
+    def _apply_move(self, x: int, y: int, z: int) -> None:
+        piece = self.current_player
 
-        count = 1
-        # Check forward direction
-        nx, ny, nz = x + dx, y + dy, z + dz
-        while (
-            0 <= nx < self.board_size
-            and 0 <= ny < self.board_size
-            and 0 <= nz < self.board_size
-            and self.board[nx, ny, nz] == piece
-        ):
-            count += 1
-            nx += dx
-            ny += dy
-            nz += dz
-
-        # Check backward direction
-        nx, ny, nz = x - dx, y - dy, z - dz
-        while (
-            0 <= nx < self.board_size
-            and 0 <= ny < self.board_size
-            and 0 <= nz < self.board_size
-            and self.board[nx, ny, nz] == piece
-        ):
-            count += 1
-            nx -= dx
-            ny -= dy
-            nz -= dz
-
-        return count >= 4
-
-    def _check_win(self, x: int, y: int, z: int) -> bool:
-        """Check if this move wins the game"""
-        # Check all 26 directions (excluding [0,0,0])
-        for dx in range(-1, 2):
-            for dy in range(-1, 2):
-                for dz in range(-1, 2):
-                    if dx == 0 and dy == 0 and dz == 0:
-                        continue
-                    if self._check_line(x, y, z, dx, dy, dz):
-                        return True
-        return False
+        # Place piece; only the 13 lines through it can have been completed
+        self.board[x, y, z] = piece.value
+        self.lines.place(self.lines.index((x, y, z)), piece.name)
+        if self.lines.winner is not None:
+            return
+
+        # Switch player
+        self.current_player = TTT3DPiece.O if piece == TTT3DPiece.X else TTT3DPiece.X
 
     def validate_move(self, move_data: Dict[str, Any]) -> bool:
         """Validate if a move is legal"""
@@ -92,28 +68,46 @@ class TTT3DGame(AbstractGame):
             return False
 
         x, y, z = position
-        return self._is_valid_position(x, y, z)
+        return self._is_valid_position(x, y, z) and not self.is_game_over()
 
     def make_move(self, move_data: Dict[str, Any]) -> Dict[str, Any]:
         """Make a move in the game"""
         if not self.validate_move(move_data):
             raise ValueError("Invalid move")
 
-        x, y, z = move_data["position"]
-        piece = self.current_player
-
-        # Place piece
-        self.board[x, y, z] = piece.value
-
-        # Check if this move wins
-        if self._check_win(x, y, z):
-            return self.get_game_state()
-
-        # Switch player
-        self.current_player = TTT3DPiece.O if piece == TTT3DPiece.X else TTT3DPiece.X
+        x, y, z = (int(c) for c in move_data["position"])
+        player = self.current_player.name
+        self._apply_move(x, y, z)
+        self._record_move(player, {"position": [x, y, z]})
 
         return self.get_game_state()
 
+    def count_threats(self, player: Optional[str] = None) -> int:
+        """Open lines on which player (default: to move) needs one more piece"""
+        piece = TTT3DPiece[player] if player else self.current_player
+        opponent = TTT3DPiece.O if piece == TTT3DPiece.X else TTT3DPiece.X
+        return int(self.line_table.threats(self.board, piece.value, opponent.value))
+
+    def best_move(self) -> Optional[List[int]]:
+        """
+        One-ply suggestion for the player to move: every empty cell is tried
+        on a stack of candidate boards scored in a single evaluate() call.
+        """
+        if self.is_game_over():
+            return None
+        piece = self.current_player
+        opponent = TTT3DPiece.O if piece == TTT3DPiece.X else TTT3DPiece.X
+        empty = np.flatnonzero(self.board == TTT3DPiece.EMPTY.value)
+        if not len(empty):
+            return None
+        candidates = np.repeat(self.board.reshape(1, -1), len(empty), axis=0)
+        candidates[np.arange(len(empty)), empty] = piece.value
+        scores = self.line_table.evaluate(
+            candidates.reshape((-1,) + self.board.shape), piece.value, opponent.value
+        )
+        cell = int(empty[int(np.argmax(scores))])
+        return [int(c) for c in np.unravel_index(cell, self.board.shape)]
+
     def get_game_state(self) -> Dict[str, Any]:
         """Get the current game state"""
         return {
@@ -129,11 +123,4 @@ class TTT3DGame(AbstractGame):
 
     def get_winner(self) -> Optional[str]:
         """Get the winner if game is over"""
-        # Check if there's any line of 4 pieces
-        for x in range(self.board_size):
-            for y in range(self.board_size):
-                for z in range(self.board_size):
-                    if self.board[x, y, z] != TTT3DPiece.EMPTY.value:
-                        if self._check_win(x, y, z):
-                            return self.current_player.name
-        return None
+        return self.lines.winner
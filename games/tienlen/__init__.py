@@ -0,0 +1,4 @@
+from games.tienlen.tienlen import TienLenGame
+
+# The name the game registry derives from the directory
+TienlenGame = TienLenGame
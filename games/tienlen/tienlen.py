@@ -1,231 +1,164 @@
 from game_abc import AbstractGame, GameMove, GameHistory
-from typing import Dict, Any, Optional, List, Tuple, Set
-import numpy as np
-from enum import Enum
-import time
-import random
-from collections import defaultdict
-
-
-class Card:
-    def __init__(self, suit: str, rank: str):
-        self.suit = suit
-        self.rank = rank
-        self.value = self._get_card_value()
-
-    def _get_card_value(self) -> int:
-        """Get the card's value for comparison"""
-        rank_order = {
-            "3": 1,
-            "4": 2,
-            "5": 3,
-            "6": 4,
-            "7": 5,
-            "8": 6,
-            "9": 7,
-            "10": 8,
-            "J": 9,
-            "Q": 10,
-            "K": 11,
-            "A": 12,
-            "2": 13,
-            "joker": 14,
-            "Joker": 15,
-        }
-        return rank_order[self.rank]
-
-    def __lt__(self, other):
-        return self.value < other.value
-
-    def __eq__(self, other):
-        return self.value == other.value
-
-    def __hash__(self):
-        return hash((self.suit, self.rank))
-
-    def to_dict(self) -> Dict[str, str]:
-        return {"suit": self.suit, "rank": self.rank}
-
-
-class CardType(Enum):
-    SINGLE = 1
-    PAIR = 2
-    TRIPLE = 3
-    STRAIGHT = 4
-    FULL_HOUSE = 5
-    FOUR_OF_A_KIND = 6
-    STRAIGHT_FLUSH = 7
+from games.climbing import (
+    CardType,
+    Play,
+    Rules,
+    beating_plays,
+    beats,
+    card_code,
+    card_dicts,
+    classify,
+    new_deck,
+    parse_cards,
+    plays,
+)
+from games.cards import shuffled
+from typing import Dict, Any, Optional, List
+
+RULES = Rules(min_straight=3, bombs=(CardType.FOUR_OF_A_KIND,))
+FIRST_CARD = card_code("♠", "3")
 
 
 class TienLenGame(AbstractGame):
     def __init__(self, game_id: str, num_players: int = 4):
-        super().__init__(game_id)
         self.num_players = num_players
-        self.current_player = 0
-        self.hands = defaultdict(list)
-        self.last_play = None
-        self.last_player = None
-        self.active_players = set(range(num_players))
+        super().__init__(game_id)
+
+    def initialize_game(self) -> Dict[str, Any]:
+        """Deal a new game"""
+        self._init_game()
+        return self.get_game_state()
+
+    def _restore_game_state(self) -> None:
+        """Deal again from the recorded seed and replay the recorded moves"""
         self._init_game()
+        self._replay_moves()
 
     def _init_game(self):
         """Initialize a new game"""
-        self.hands = defaultdict(list)
+        self.reset_rng()
+        self.hands = [0] * self.num_players  # card bitmasks, see games.climbing
         self.current_player = 0
-        self.last_play = None
+        self.last_play: Optional[Play] = None
         self.last_player = None
+        self.passes = 0
+        self.opened = False
         self.active_players = set(range(self.num_players))
+        self.finished: List[int] = []
 
-        # Create deck
-        suits = ["♠", "♥", "♦", "♣"]
-        ranks = ["3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A", "2"]
-        deck = [Card(suit, rank) for suit in suits for rank in ranks]
-        deck.append(Card("", "joker"))  # Small joker
-        deck.append(Card("", "Joker"))  # Big joker
-        random.shuffle(deck)
+        deck = shuffled(new_deck(jokers=True), self.rng)
 
         # Deal cards
-        for i, card in enumerate(deck):
-            self.hands[i % self.num_players].append(card)
+        for i, card in enumerate(deck.tolist()):
+            self.hands[i % self.num_players] |= 1 << card
 
-    def _get_card_type(self, cards: List[Card]) -> Optional[Tuple[CardType, int]]:
-        """Determine the type of card combination"""
-        if not cards:
+        # Find player with 3 of spades
+        for i in range(self.num_players):
+            if self.hands[i] >> FIRST_CARD & 1:
+                self.current_player = i
+                break
+
+    def _play_for(self, cards: int) -> Optional[Play]:
+        """The play the cards make if they may be laid now"""
+        play = classify(cards, RULES)
+        if play is None:
             return None
 
-        cards.sort()
-        count = len(cards)
-
-        # Check for special cases
-        if count == 1:
-            return CardType.SINGLE, cards[0].value
-        if count == 2 and cards[0].rank == cards[1].rank:
-            return CardType.PAIR, cards[0].value
-        if count == 3 and cards[0].rank == cards[1].rank == cards[2].rank:
-            return CardType.TRIPLE, cards[0].value
-        if (
-            count == 4
-            and cards[0].rank == cards[1].rank == cards[2].rank == cards[3].rank
-        ):
-            return CardType.FOUR_OF_A_KIND, cards[0].value
-
-        # Check for straight
-        if count >= 3:
-            straight = True
-            for i in range(1, count):
-                if cards[i].value != cards[i - 1].value + 1:
-                    straight = False
-                    break
-            if straight:
-                return CardType.STRAIGHT, cards[0].value
-
-        # Check for full house
-        if count == 5:
-            counts = defaultdict(int)
-            for card in cards:
-                counts[card.rank] += 1
-            values = list(counts.values())
-            if sorted(values) == [2, 3]:
-                return CardType.FULL_HOUSE, max(cards[0].value, cards[1].value)
-
-        # Check for straight flush
-        if count >= 3:
-            straight = True
-            flush = True
-            for i in range(1, count):
-                if cards[i].value != cards[i - 1].value + 1:
-                    straight = False
-                if cards[i].suit != cards[0].suit:
-                    flush = False
-            if straight and flush:
-                return CardType.STRAIGHT_FLUSH, cards[0].value
-
-        return None
-
-    def _is_valid_play(self, cards: List[Card]) -> bool:
-        """Check if a play is valid"""
-        if not cards:
-            return False
-
-        # First play must be 3 of spades
-        if self.last_play is None:
-            return cards[0].rank == "3" and cards[0].suit == "♠"
-
-        # Check card combination type
-        card_type = self._get_card_type(cards)
-        if not card_type:
-            return False
+        # First play must include the 3 of spades
+        if not self.opened:
+            return play if cards >> FIRST_CARD & 1 else None
 
-        # Check if it beats last play
-        if self.last_play:
-            last_type = self._get_card_type(self.last_play)
-            if card_type[0] != last_type[0]:
-                return False
-            if card_type[1] <= last_type[1]:
-                return False
+        if self.last_play is not None and not beats(play, self.last_play, RULES):
+            return None
+        return play
 
-        return True
+    def _next_active(self, player: int) -> int:
+        while True:
+            player = (player + 1) % self.num_players
+            if player in self.active_players:
+                return player
 
     def validate_move(self, move_data: Dict[str, Any]) -> bool:
         """Validate if a move is legal"""
+        if self.is_game_over():
+            return False
+        if move_data.get("action") == "pass":
+            # The player leading a trick cannot pass
+            return self.last_play is not None
         if "cards" not in move_data:
             return False
 
-        cards = [Card(card["suit"], card["rank"]) for card in move_data["cards"]]
-        player_hand = self.hands[self.current_player]
-
+        cards = parse_cards(move_data["cards"])
         # Check if player has these cards
-        if not all(card in player_hand for card in cards):
+        if cards is None or cards & ~self.hands[self.current_player]:
             return False
 
-        return self._is_valid_play(cards)
+        return self._play_for(cards) is not None
 
     def make_move(self, move_data: Dict[str, Any]) -> Dict[str, Any]:
         """Make a move in the game"""
         if not self.validate_move(move_data):
             raise ValueError("Invalid move")
-
-        cards = [Card(card["suit"], card["rank"]) for card in move_data["cards"]]
-        player_hand = self.hands[self.current_player]
-
-        # Remove cards from player's hand
-        for card in cards:
-            player_hand.remove(card)
+        player = self.current_player
+
+        if move_data.get("action") == "pass":
+            self.passes += 1
+            # Once everyone else still holding cards has passed, the table
+            # clears and the next player leads
+            waiting = len(self.active_players) - (self.last_player in self.active_players)
+            if self.passes >= waiting:
+                self.last_play = None
+                self.passes = 0
+            self.current_player = self._next_active(self.current_player)
+            self._record_move(player, move_data)
+            return self.get_game_state()
+
+        play = self._play_for(parse_cards(move_data["cards"]))
+        self.hands[self.current_player] &= ~play.cards
 
         # Update game state
-        self.last_play = cards
+        self.last_play = play
         self.last_player = self.current_player
+        self.passes = 0
+        self.opened = True
 
         # Check if player has finished
-        if not player_hand:
+        if not self.hands[self.current_player]:
             self.active_players.remove(self.current_player)
+            self.finished.append(self.current_player)
 
         # Move to next player
-        if self.last_play is None:
-            # First play, go to next player
-            self.current_player = (self.current_player + 1) % self.num_players
-        else:
-            # Find next player who can play
-            found = False
-            while not found:
-                self.current_player = (self.current_player + 1) % self.num_players
-                if self.current_player in self.active_players:
-                    found = True
+        if not self.is_game_over():
+            self.current_player = self._next_active(self.current_player)
 
+        self._record_move(player, move_data)
         return self.get_game_state()
 
+    def legal_moves(self) -> List[Dict[str, Any]]:
+        """Every move the current player can make"""
+        if self.is_game_over():
+            return []
+        hand = self.hands[self.current_player]
+        if not self.opened:
+            candidates = [play for play in plays(hand, RULES) if play.cards >> FIRST_CARD & 1]
+        else:
+            candidates = beating_plays(hand, self.last_play, RULES)
+        moves: List[Dict[str, Any]] = [{"cards": card_dicts(play.cards)} for play in candidates]
+        if self.last_play is not None:
+            moves.append({"action": "pass"})
+        return moves
+
     def get_game_state(self) -> Dict[str, Any]:
         """Get the current game state"""
         return {
-            "hands": {
-                str(k): [card.to_dict() for card in v] for k, v in self.hands.items()
-            },
+            "hands": {str(k): card_dicts(hand) for k, hand in enumerate(self.hands)},
             "current_player": self.current_player,
             "last_play": (
-                [card.to_dict() for card in self.last_play] if self.last_play else None
+                card_dicts(self.last_play.cards) if self.last_play else None
             ),
             "last_player": self.last_player,
-            "active_players": list(self.active_players),
+            "active_players": sorted(self.active_players),
+            "finished": list(self.finished),
             "game_over": self.is_game_over(),
             "winner": self.get_winner(),
         }
@@ -240,7 +173,4 @@ class TienLenGame(AbstractGame):
             return None
 
         # First player to finish wins
-        for i in range(self.num_players):
-            if i in self.active_players:
-                return i
-        return None
+        return self.finished[0] if self.finished else None
@@ -1,34 +1,41 @@
 from game_abc import AbstractGame, GameMove, GameHistory
+from games.cards import CardSet, draw, shuffled
 from typing import Dict, Any, Optional, List, Tuple, Set
 import numpy as np
 from enum import Enum
 import time
-import random
 from collections import defaultdict
 
 
-class UnoCard:
-    def __init__(self, color: str, value: str, special: bool = False):
-        self.color = color
-        self.value = value
-        self.special = special
-        self.wild = color == "wild"
-
-    def can_play_on(self, other: "UnoCard") -> bool:
-        """Check if this card can be played on another card"""
-        if self.wild:
-            return True
-        if other.wild:
-            return False
-        return self.color == other.color or self.value == other.value
-
-    def to_dict(self) -> Dict[str, str]:
-        return {
-            "color": self.color,
-            "value": self.value,
-            "special": self.special,
-            "wild": self.wild,
-        }
+COLORS = ["red", "yellow", "green", "blue"]
+VALUES = ["0", "1", "2", "3", "4", "5", "6", "7", "8", "9", "skip", "reverse", "draw2"]
+ACTION_VALUES = ["skip", "reverse", "draw2"]
+CARDS = CardSet(
+    [
+        {"color": color, "value": value, "special": value in ACTION_VALUES, "wild": False}
+        for color in COLORS
+        for value in VALUES
+    ]
+    + [{"color": "wild", "value": value, "special": True, "wild": True} for value in ("wild", "wild4")]
+)
+# One zero and two of every other value per color, four of each wild card
+DECK = np.array(
+    [
+        code
+        for code, face in enumerate(CARDS.faces)
+        for _ in range(4 if face["wild"] else 1 if face["value"] == "0" else 2)
+    ],
+    dtype=np.uint8,
+)
+
+
+def card_code(card: Dict[str, Any]) -> int:
+    """Code of a card dict; only its color and value matter"""
+    color, value = card["color"], card["value"]
+    wild = color == "wild"
+    return CARDS.code(
+        {"color": color, "value": value, "special": wild or value in ACTION_VALUES, "wild": wild}
+    )
 
 
 class UnoAction(Enum):
@@ -42,9 +49,10 @@ class UnoGame(AbstractGame):
         super().__init__(game_id)
         self.num_players = num_players
         self.current_player = 0
-        self.hands = defaultdict(list)
-        self.deck = []
+        self.hands = defaultdict(list)  # card codes
+        self.deck = DECK[:0]
         self.discard_pile = []
+        self.wild_color = None  # color chosen for a wild card on top of the pile
         self.direction = 1  # 1 for clockwise, -1 for counterclockwise
         self.draw_count = 0
         self.skip_count = 0
@@ -52,70 +60,47 @@ class UnoGame(AbstractGame):
 
     def _init_game(self):
         """Initialize a new game"""
+        self.reset_rng()
         self.hands = defaultdict(list)
         self.current_player = 0
-        self.deck = []
         self.discard_pile = []
+        self.wild_color = None
         self.direction = 1
         self.draw_count = 0
         self.skip_count = 0
 
-        # Create deck
-        colors = ["red", "yellow", "green", "blue"]
-        values = [
-            "0",
-            "1",
-            "2",
-            "3",
-            "4",
-            "5",
-            "6",
-            "7",
-            "8",
-            "9",
-            "skip",
-            "reverse",
-            "draw2",
-        ]
-
-        # Create regular cards
-        for color in colors:
-            self.deck.append(UnoCard(color, "0"))
-            for value in values[1:]:
-                self.deck.append(
-                    UnoCard(color, value, value in ["skip", "reverse", "draw2"])
-                )
-                self.deck.append(
-                    UnoCard(color, value, value in ["skip", "reverse", "draw2"])
-                )
-
-        # Create wild cards
-        for _ in range(4):
-            self.deck.append(UnoCard("wild", "wild", True))
-            self.deck.append(UnoCard("wild", "wild4", True))
-
-        random.shuffle(self.deck)
+        self.deck = shuffled(DECK, self.rng)
 
         # Deal cards (7 cards to each player)
         for i in range(self.num_players):
-            for _ in range(7):
-                self.hands[i].append(self.deck.pop())
+            self.hands[i], self.deck = draw(self.deck, 7)
 
         # Place first card on discard pile
         # Make sure it's not a wild card
-        while self.deck[-1].wild:
-            random.shuffle(self.deck)
-        self.discard_pile.append(self.deck.pop())
+        while CARDS.faces[self.deck[-1]]["wild"]:
+            self.deck = shuffled(self.deck, self.rng)
+        self.discard_pile, self.deck = draw(self.deck)
+
+    def _can_play(self, card: int) -> bool:
+        """Check if a card can be played on the top of the discard pile"""
+        face = CARDS.faces[card]
+        if face["wild"]:
+            return True
+        top = CARDS.faces[self.discard_pile[-1]]
+        if top["wild"]:
+            return face["color"] == self.wild_color
+        return face["color"] == top["color"] or face["value"] == top["value"]
 
-    def _process_special_cards(self, card: UnoCard) -> None:
+    def _process_special_cards(self, card: int) -> None:
         """Process special card effects"""
-        if card.value == "skip":
+        value = CARDS.faces[card]["value"]
+        if value == "skip":
             self.skip_count = 1
-        elif card.value == "reverse":
+        elif value == "reverse":
             self.direction *= -1
-        elif card.value == "draw2":
+        elif value == "draw2":
             self.draw_count += 2
-        elif card.value == "wild4":
+        elif value == "wild4":
             self.draw_count += 4
 
     def validate_move(self, move_data: Dict[str, Any]) -> bool:
@@ -129,20 +114,18 @@ class UnoGame(AbstractGame):
             if "card" not in move_data:
                 return False
 
-            card = UnoCard(
-                move_data["card"]["color"],
-                move_data["card"]["value"],
-                move_data["card"]["special"],
-            )
+            try:
+                card = card_code(move_data["card"])
+            except (KeyError, TypeError, ValueError):
+                return False
             if card not in self.hands[self.current_player]:
                 return False
 
-            top_card = self.discard_pile[-1]
-            if not card.can_play_on(top_card):
+            if not self._can_play(card):
                 return False
 
             # If playing a wild card, must choose color
-            if card.wild and "new_color" not in move_data:
+            if CARDS.faces[card]["wild"] and "new_color" not in move_data:
                 return False
 
             return True
@@ -155,11 +138,11 @@ class UnoGame(AbstractGame):
                 return False
 
             # Must be after playing a wild card
-            if not self.discard_pile[-1].wild:
+            if not CARDS.faces[self.discard_pile[-1]]["wild"]:
                 return False
 
             color = move_data["color"]
-            return color in ["red", "yellow", "green", "blue"]
+            return color in COLORS
 
         return False
 
@@ -171,11 +154,7 @@ class UnoGame(AbstractGame):
         action = move_data["action"]
 
         if action == UnoAction.PLAY.name:
-            card = UnoCard(
-                move_data["card"]["color"],
-                move_data["card"]["value"],
-                move_data["card"]["special"],
-            )
+            card = card_code(move_data["card"])
 
             # Remove card from hand
             self.hands[self.current_player].remove(card)
@@ -185,11 +164,12 @@ class UnoGame(AbstractGame):
 
             # Place on discard pile
             self.discard_pile.append(card)
+            self.wild_color = None
 
             # If playing a wild card, choose color
-            if card.wild:
+            if CARDS.faces[card]["wild"]:
                 if "new_color" in move_data:
-                    self.discard_pile[-1].color = move_data["new_color"]
+                    self.wild_color = move_data["new_color"]
                 else:
                     # Must choose color next turn
                     return self.get_game_state()
@@ -197,20 +177,18 @@ class UnoGame(AbstractGame):
         elif action == UnoAction.DRAW.name:
             # Draw cards
             for _ in range(self.draw_count + 1):
-                if self.deck:
-                    self.hands[self.current_player].append(self.deck.pop())
-                else:
+                if not len(self.deck):
                     # Reshuffle discard pile except top card
-                    self.deck = self.discard_pile[:-1]
-                    random.shuffle(self.deck)
+                    self.deck = shuffled(np.array(self.discard_pile[:-1], dtype=np.uint8), self.rng)
                     self.discard_pile = [self.discard_pile[-1]]
-                    self.hands[self.current_player].append(self.deck.pop())
+                cards, self.deck = draw(self.deck)
+                self.hands[self.current_player] += cards
 
             # Reset draw count
             self.draw_count = 0
 
         elif action == UnoAction.CHOOSE_COLOR.name:
-            self.discard_pile[-1].color = move_data["color"]
+            self.wild_color = move_data["color"]
 
         # Process skip and draw effects
         if self.skip_count > 0:
@@ -230,14 +208,13 @@ class UnoGame(AbstractGame):
 
     def get_game_state(self) -> Dict[str, Any]:
         """Get the current game state"""
+        top = CARDS.faces[self.discard_pile[-1]] if self.discard_pile else None
+        if self.wild_color is not None:
+            top = dict(top, color=self.wild_color)
         return {
-            "hands": {
-                str(k): [card.to_dict() for card in v] for k, v in self.hands.items()
-            },
+            "hands": {str(k): CARDS.to_faces(v) for k, v in self.hands.items()},
             "current_player": self.current_player,
-            "discard_pile_top": (
-                self.discard_pile[-1].to_dict() if self.discard_pile else None
-            ),
+            "discard_pile_top": top,
             "direction": self.direction,
             "draw_count": self.draw_count,
             "skip_count": self.skip_count,
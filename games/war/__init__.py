@@ -1,6 +1,7 @@
 from game_abc import AbstractGame, GameMove, GameHistory
+from games.cards import CardSet, shuffled
 from typing import Dict, Any, Optional, List, Tuple
-import random
+from collections import deque
 import time
 
 # Card ranks and their values
@@ -23,28 +24,22 @@ CARD_RANKS = {
 SUITES = ["♠", "♥", "♦", "♣"]
 
 
-class WarCard:
-    def __init__(self, rank: str, suite: str):
-        self.rank = rank
-        self.suite = suite
-        self.value = CARD_RANKS[rank]
+CARDS = CardSet(
+    [{"rank": rank, "suite": suite, "value": value} for rank, value in CARD_RANKS.items() for suite in SUITES]
+)
 
-    def __str__(self):
-        return f"{self.rank}{self.suite}"
 
-    def __repr__(self):
-        return str(self)
-
-    def to_dict(self) -> Dict[str, Any]:
-        return {"rank": self.rank, "suite": self.suite, "value": self.value}
+def card_value(card: int) -> int:
+    return CARDS.faces[card]["value"]
 
 
 class WarGame(AbstractGame):
     def __init__(self, game_id: str):
         super().__init__(game_id)
-        self.deck = []
-        self.player_deck = []
-        self.computer_deck = []
+        self.deck = CARDS.deck()
+        # Card codes, played from the left and won onto the right
+        self.player_deck = deque()
+        self.computer_deck = deque()
         self.current_battle = []
         self.war_cards = []  # Cards played during war
         self.round = 0
@@ -53,6 +48,7 @@ class WarGame(AbstractGame):
 
     def _init_game(self):
         """Initialize a new game"""
+        self.reset_rng()
         self._create_deck()
         self._deal_cards()
         self.current_battle = []
@@ -61,35 +57,31 @@ class WarGame(AbstractGame):
 
     def _create_deck(self):
         """Create a standard 52-card deck"""
-        self.deck = []
-        for rank in CARD_RANKS:
-            for suite in SUITES:
-                self.deck.append(WarCard(rank, suite))
-        random.shuffle(self.deck)
+        self.deck = shuffled(CARDS.deck(), self.rng)
 
     def _deal_cards(self):
         """Deal cards to players"""
-        self.player_deck = self.deck[:26]
-        self.computer_deck = self.deck[26:]
+        self.player_deck = deque(self.deck[:26].tolist())
+        self.computer_deck = deque(self.deck[26:].tolist())
 
-    def _play_card(self, player: str) -> WarCard:
+    def _play_card(self, player: str) -> int:
         """Play a card from the specified player's deck"""
         if player == "player":
-            return self.player_deck.pop(0)
+            return self.player_deck.popleft()
         else:
-            return self.computer_deck.pop(0)
+            return self.computer_deck.popleft()
 
     def _resolve_battle(self) -> str:
         """Resolve a battle between played cards"""
         if not self.current_battle:
             return None
 
-        player_card = self.current_battle[0]
-        computer_card = self.current_battle[1]
+        player_value = card_value(self.current_battle[0])
+        computer_value = card_value(self.current_battle[1])
 
-        if player_card.value > computer_card.value:
+        if player_value > computer_value:
             return "player"
-        elif player_card.value < computer_card.value:
+        elif player_value < computer_value:
             return "computer"
         else:
             return "war"
@@ -99,13 +91,13 @@ class WarGame(AbstractGame):
         # Each player places three cards face down
         for _ in range(3):
             if self.player_deck:
-                self.war_cards.append(self.player_deck.pop(0))
+                self.war_cards.append(self.player_deck.popleft())
             if self.computer_deck:
-                self.war_cards.append(self.computer_deck.pop(0))
+                self.war_cards.append(self.computer_deck.popleft())
 
         # Then each player places one card face up
         if self.player_deck and self.computer_deck:
-            self.current_battle = [self.player_deck.pop(0), self.computer_deck.pop(0)]
+            self.current_battle = [self.player_deck.popleft(), self.computer_deck.popleft()]
         else:
             # If either player can't play, the other wins
             if not self.player_deck:
@@ -151,21 +143,22 @@ class WarGame(AbstractGame):
         while winner == "war":
             winner = self._resolve_war()
 
-        # Distribute cards
-        self._distribute_cards(winner)
-
-        # Add move to history
+        # Record the cards before they go to the winner
         move = GameMove(
             player=winner,
             move_data={
                 "round": self.round,
-                "player_card": self.current_battle[0].to_dict(),
-                "computer_card": self.current_battle[1].to_dict(),
-                "war_cards": [card.to_dict() for card in self.war_cards],
+                "player_card": CARDS.faces[self.current_battle[0]],
+                "computer_card": CARDS.faces[self.current_battle[1]],
+                "war_cards": CARDS.to_faces(self.war_cards),
                 "winner": winner,
             },
             timestamp=time.time(),
         )
+
+        # Distribute cards
+        self._distribute_cards(winner)
+
         self.history.add_move(move)
 
         return self.get_game_state()
@@ -176,12 +169,8 @@ class WarGame(AbstractGame):
             "round": self.round,
             "player_cards": len(self.player_deck),
             "computer_cards": len(self.computer_deck),
-            "current_battle": (
-                [card.to_dict() for card in self.current_battle]
-                if self.current_battle
-                else None
-            ),
-            "war_cards": [card.to_dict() for card in self.war_cards],
+            "current_battle": CARDS.to_faces(self.current_battle) if self.current_battle else None,
+            "war_cards": CARDS.to_faces(self.war_cards),
             "game_over": self.is_game_over(),
             "winner": self.get_winner(),
         }
@@ -0,0 +1,115 @@
+from collections import Counter
+from typing import Dict, Hashable, Iterable, List, Tuple
+import hashlib
+import numpy as np
+
+
+class ZobristTable:
+    """
+    Zobrist keys for board-game positions.
+
+    Every position feature (a piece on a square, a hand count, the side to
+    move, ...) is any hashable tuple and maps to a 64-bit key derived from a
+    keyed BLAKE2 digest of its repr, so keys are stable across processes and
+    can be persisted or used as transposition-table keys. A position key is
+    the XOR of the keys of its features, which lets games update it
+    incrementally: XOR a feature out when it disappears and in when it appears.
+    """
+
+    def __init__(self, namespace: str):
+        self.namespace = namespace.encode("utf-8")[:64]
+        self._keys: Dict[Hashable, int] = {}
+
+    def __getitem__(self, feature: Hashable) -> int:
+        key = self._keys.get(feature)
+        if key is None:
+            digest = hashlib.blake2b(
+                repr(feature).encode("utf-8"), digest_size=8, key=self.namespace
+            ).digest()
+            key = self._keys[feature] = int.from_bytes(digest, "little")
+        return key
+
+
+class RepetitionIndex:
+    """Position keys in the order they occurred, with an O(1) key -> count index"""
+
+    def __init__(self):
+        self.keys: List[int] = []
+        self.counts: Counter = Counter()
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def push(self, key: int) -> int:
+        """Record an occurrence of key and return how often it has occurred"""
+        self.keys.append(key)
+        self.counts[key] += 1
+        return self.counts[key]
+
+    def pop(self) -> int:
+        """Forget the most recent occurrence (e.g. to undo a move)"""
+        key = self.keys.pop()
+        self.counts[key] -= 1
+        if not self.counts[key]:
+            del self.counts[key]
+        return key
+
+    def count(self, key: int) -> int:
+        return self.counts.get(key, 0)
+
+    def reset(self, key: int) -> None:
+        """Start a fresh index whose only position is key"""
+        self.keys = [key]
+        self.counts = Counter({key: 1})
+
+
+class KeySet:
+    """
+    A set of 64-bit position keys held in a sorted NumPy uint64 array: 8 bytes
+    per key (plus up to 2x spare capacity) instead of a Python int and a hash
+    slot each. Lookups are a binary search; inserts and removals shift the
+    tail of the array, which is cheap for the few hundred keys of a game.
+    """
+
+    def __init__(self, keys: Iterable[int] = ()):
+        self._keys = np.zeros(16, dtype=np.uint64)
+        self._size = 0
+        for key in keys:
+            self.add(key)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, key: int) -> bool:
+        return self._search(key)[1]
+
+    @property
+    def nbytes(self) -> int:
+        return self._keys.nbytes
+
+    def _search(self, key: int) -> Tuple[int, bool]:
+        keys = self._keys[:self._size]
+        key = np.uint64(key)
+        index = int(np.searchsorted(keys, key))
+        return index, index < self._size and keys[index] == key
+
+    def add(self, key: int) -> None:
+        index, found = self._search(key)
+        if found:
+            return
+        size = self._size
+        if size == len(self._keys):
+            grown = np.zeros(2 * size, dtype=np.uint64)
+            grown[:size] = self._keys
+            self._keys = grown
+        self._keys[index + 1:size + 1] = self._keys[index:size]
+        self._keys[index] = key
+        self._size = size + 1
+
+    def discard(self, key: int) -> None:
+        index, found = self._search(key)
+        if not found:
+            return
+        size = self._size
+        self._keys[index:size - 1] = self._keys[index + 1:size]
+        self._size = size - 1
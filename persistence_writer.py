@@ -0,0 +1,110 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+import threading
+import traceback
+
+from game_abc import GameHistory
+from storage import StorageBackend
+
+
+# Durability modes
+DURABILITY_NONE = "none"  # group commits, never fsync
+DURABILITY_BATCH = "batch"  # group commits, one fsync per batch
+DURABILITY_MOVE = "move"  # every move is written and fsynced before returning
+DURABILITY_MODES = (DURABILITY_NONE, DURABILITY_BATCH, DURABILITY_MOVE)
+
+
+class PersistenceWriter:
+    """
+    Background writer that coalesces pending game writes into group commits.
+
+    Histories submitted between two ticks are written together every
+    ``interval`` seconds from a daemon thread; a game that moved several times
+    in one interval is written once. In ``DURABILITY_MOVE`` mode (or when a
+    single submit asks for it) the write happens synchronously in the caller.
+    """
+
+    def __init__(self, interval: float = 0.05, durability: str = DURABILITY_BATCH):
+        if durability not in DURABILITY_MODES:
+            raise ValueError(f"Invalid durability mode: {durability}")
+        self.interval = interval
+        self.durability = durability
+        self.batches = 0
+        self._pending: Dict[int, GameHistory] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the background commit loop"""
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="persistence-writer", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the commit loop and write everything still pending"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def submit(self, history: GameHistory, durable: bool = False) -> None:
+        """Queue a dirty history; write it immediately when durability requires it"""
+        if durable or self.durability == DURABILITY_MOVE:
+            with self._lock:
+                self._pending.pop(id(history), None)
+            self._commit([history], sync=True)
+            return
+        with self._lock:
+            self._pending[id(history)] = history
+
+    def flush(self) -> int:
+        """Commit every pending history now. Returns the number of histories written."""
+        with self._lock:
+            batch = list(self._pending.values())
+            self._pending.clear()
+        if batch:
+            self._commit(batch, sync=self.durability != DURABILITY_NONE)
+        return len(batch)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.flush()
+            except Exception:
+                traceback.print_exc()
+
+    def _commit(self, histories: Iterable[GameHistory], sync: bool) -> None:
+        """Write each history, then flush (and optionally sync) each backend once"""
+        backends: Dict[int, Tuple[StorageBackend, List[str]]] = {}
+        failed: List[GameHistory] = []
+        for history in histories:
+            try:
+                history.flush()
+            except Exception:
+                traceback.print_exc()
+                failed.append(history)
+                continue
+            _, keys = backends.setdefault(id(history.backend), (history.backend, []))
+            if history.game_id:
+                keys.append(history.game_id)
+        for backend, keys in backends.values():
+            if sync:
+                backend.sync(keys)
+            else:
+                backend.flush()
+        self.batches += 1
+        if failed:
+            # Retry on the next tick rather than dropping moves
+            with self._lock:
+                for history in failed:
+                    self._pending.setdefault(id(history), history)
+            raise RuntimeError(f"Failed to persist {len(failed)} game(s)")
@@ -0,0 +1,297 @@
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Iterable, Optional, Union
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+
+class StorageBackend(ABC):
+    """
+    Abstract storage for game journals.
+
+    A journal is an append-only text blob (JSON Lines, see GameHistory) stored
+    under a string key. Backends only need to append to, replace, read and
+    delete whole journals; the record format is owned by the callers.
+    """
+
+    @abstractmethod
+    def read(self, key: str) -> Optional[str]:
+        """Return the full journal for key, or None if it does not exist"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def append(self, key: str, data: str) -> None:
+        """Append data to the journal for key, creating it if needed"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def replace(self, key: str, data: str) -> None:
+        """Atomically replace the journal for key with data"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove the journal for key if it exists"""
+        raise NotImplementedError
+
+    def flush(self) -> None:
+        """Hand buffered writes to the OS. Backends without buffering need not override."""
+
+    def sync(self, keys: Iterable[str]) -> None:
+        """Flush and make the journals for keys durable (fsync or equivalent)"""
+        self.flush()
+
+    def close(self) -> None:
+        """Release any resources held by the backend"""
+        self.flush()
+
+
+class FileSystemBackend(StorageBackend):
+    """
+    One ``<key>.jsonl`` file per game in a flat directory (the historical layout).
+
+    Legacy single-document ``<key>.json`` files are read as a snapshot and are
+    migrated to the journal format on the first write.
+    """
+
+    def __init__(self, data_dir: Union[str, Path] = "game_data"):
+        self.data_dir = Path(data_dir)
+
+    def _path(self, key: str) -> Path:
+        return self.data_dir / f"{key}.jsonl"
+
+    def _legacy_path(self, key: str) -> Path:
+        return self.data_dir / f"{key}.json"
+
+    def read(self, key: str) -> Optional[str]:
+        try:
+            with open(self._path(key), "r") as f:
+                return f.read()
+        except FileNotFoundError:
+            pass
+        try:
+            with open(self._legacy_path(key), "r") as f:
+                legacy = f.read()
+        except FileNotFoundError:
+            return None
+        try:
+            return json.dumps({"snapshot": json.loads(legacy)}) + "\n"
+        except json.JSONDecodeError:
+            return ""
+
+    def append(self, key: str, data: str) -> None:
+        path = self._path(key)
+        if not path.exists():
+            # Never start a journal with bare records: migrate the legacy
+            # document (if any) into a leading snapshot first.
+            legacy = self.read(key)
+            if legacy:
+                data = legacy + data
+        self._write(path, data, "a")
+        self._unlink(self._legacy_path(key))
+
+    def replace(self, key: str, data: str) -> None:
+        path = self._path(key)
+        tmp_path = path.with_suffix(".jsonl.tmp")
+        self._write(tmp_path, data, "w")
+        os.replace(tmp_path, path)
+        self._unlink(self._legacy_path(key))
+
+    def delete(self, key: str) -> None:
+        self._unlink(self._path(key))
+        self._unlink(self._legacy_path(key))
+
+    def sync(self, keys: Iterable[str]) -> None:
+        directories = set()
+        for key in keys:
+            path = self._path(key)
+            try:
+                self._fsync(path)
+            except FileNotFoundError:
+                continue
+            directories.add(path.parent)
+        # replace() renames a new file into place; the rename is only durable
+        # once the directory holding it has been synced too
+        for directory in directories:
+            self._fsync(directory)
+
+    @staticmethod
+    def _fsync(path: Path) -> None:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _write(path: Path, data: str, mode: str) -> None:
+        try:
+            f = open(path, mode)
+        except FileNotFoundError:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            f = open(path, mode)
+        with f:
+            f.write(data)
+
+    @staticmethod
+    def _unlink(path: Path) -> None:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class ShardedDirectoryBackend(FileSystemBackend):
+    """
+    Journals spread over hash-sharded subdirectories, e.g. ``ab/cd/<key>.jsonl``.
+
+    Keeps every directory small when there are hundreds of thousands of games.
+    """
+
+    def __init__(
+        self, data_dir: Union[str, Path] = "game_data", depth: int = 2, width: int = 2
+    ):
+        super().__init__(data_dir)
+        self.depth = depth
+        self.width = width
+
+    def _shard_dir(self, key: str) -> Path:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        parts = [
+            digest[i * self.width:(i + 1) * self.width] for i in range(self.depth)
+        ]
+        return self.data_dir.joinpath(*parts)
+
+    def _path(self, key: str) -> Path:
+        return self._shard_dir(key) / f"{key}.jsonl"
+
+    def _legacy_path(self, key: str) -> Path:
+        # Legacy files were written by the flat layout
+        return self.data_dir / f"{key}.json"
+
+
+class SQLiteBackend(StorageBackend):
+    """
+    All journals in a single SQLite database in WAL mode.
+
+    Writes are batched: a transaction is committed once ``batch_size`` writes
+    are pending or ``commit_interval`` seconds have passed since the last
+    commit, and on flush(). Reads go through the same connection, so they
+    always observe uncommitted writes. With ``synchronous="NORMAL"`` commits
+    are only fsynced at WAL checkpoints; sync() forces a full checkpoint.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path] = "game_data/games.sqlite3",
+        batch_size: int = 256,
+        commit_interval: float = 0.05,
+        synchronous: str = "NORMAL",
+    ):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self.commit_interval = commit_interval
+        self._lock = threading.RLock()
+        self._pending = 0
+        self._last_commit = time.monotonic()
+        self._conn = sqlite3.connect(
+            str(self.path), check_same_thread=False, isolation_level="DEFERRED"
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(f"PRAGMA synchronous={synchronous}")
+        self.synchronous = synchronous.upper()
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS journal ("
+            " seq INTEGER PRIMARY KEY AUTOINCREMENT,"
+            " key TEXT NOT NULL,"
+            " data TEXT NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS journal_key ON journal (key, seq)")
+        self._conn.commit()
+
+    def read(self, key: str) -> Optional[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT data FROM journal WHERE key = ? ORDER BY seq", (key,)
+            ).fetchall()
+        if not rows:
+            return None
+        return "".join(row[0] for row in rows)
+
+    def append(self, key: str, data: str) -> None:
+        with self._lock:
+            self._conn.execute("INSERT INTO journal (key, data) VALUES (?, ?)", (key, data))
+            self._wrote()
+
+    def replace(self, key: str, data: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM journal WHERE key = ?", (key,))
+            self._conn.execute("INSERT INTO journal (key, data) VALUES (?, ?)", (key, data))
+            self._wrote()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM journal WHERE key = ?", (key,))
+            self._wrote()
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._pending:
+                self._conn.commit()
+                self._pending = 0
+            self._last_commit = time.monotonic()
+
+    def sync(self, keys: Iterable[str]) -> None:
+        with self._lock:
+            self.flush()
+            if self.synchronous not in ("FULL", "EXTRA"):
+                self._conn.execute("PRAGMA wal_checkpoint(FULL)")
+
+    def close(self) -> None:
+        with self._lock:
+            self.flush()
+            self._conn.close()
+
+    def _wrote(self) -> None:
+        self._pending += 1
+        if (
+            self._pending >= self.batch_size
+            or time.monotonic() - self._last_commit >= self.commit_interval
+        ):
+            self.flush()
+
+
+BACKENDS = {
+    "files": FileSystemBackend,
+    "sharded": ShardedDirectoryBackend,
+    "sqlite": SQLiteBackend,
+}
+
+_default_backend: Optional[StorageBackend] = None
+
+
+def create_backend(name: str, path: Optional[str] = None) -> StorageBackend:
+    """Build a backend by name ("files", "sharded" or "sqlite")"""
+    if name not in BACKENDS:
+        raise ValueError(f"Invalid storage backend: {name}")
+    backend_class = BACKENDS[name]
+    return backend_class(path) if path else backend_class()
+
+
+def get_default_backend() -> StorageBackend:
+    """Backend used by GameHistory instances that are not given one explicitly"""
+    global _default_backend
+    if _default_backend is None:
+        _default_backend = FileSystemBackend()
+    return _default_backend
+
+
+def set_default_backend(backend: Optional[StorageBackend]) -> None:
+    """Select the process-wide backend; call once at startup before games are loaded"""
+    global _default_backend
+    _default_backend = backend
@@ -1,7 +1,9 @@
 """Base test class for all game tests."""
 
+import tempfile
 import unittest
 from game_abc import AbstractGame, GameMove
+from storage import FileSystemBackend, set_default_backend
 from typing import Dict, Any, Type, List, Optional
 import time
 import copy
@@ -27,7 +29,12 @@ class BaseGameTest(unittest.TestCase):
 
     def setUp(self):
         """Set up the test case."""
-        self.game = self.GAME_CLASS(game_id=f"test_game_{id(self)}")
+        # Games persist every move, so give each test its own storage
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        set_default_backend(FileSystemBackend(tmp.name))
+        self.addCleanup(set_default_backend, None)
+        self.game = self.GAME_CLASS(game_id="test_game")
         self.game.initialize_game()
 
     def make_move(self, player: str, move_data: Dict[str, Any]) -> Dict[str, Any]:
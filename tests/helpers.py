@@ -5,6 +5,8 @@ from pathlib import Path
 import random
 from datetime import datetime
 
+from games.climbing import parse_cards
+
 def load_test_data(filename: str) -> Dict[str, Any]:
     """Load test data from a JSON file."""
     path = Path(__file__).parent / 'test_data' / filename
@@ -20,6 +22,20 @@ def save_test_data(data: Dict[str, Any], filename: str) -> None:
     with open(path, 'w', encoding='utf-8') as f:
         json.dump(data, f, indent=2)
 
+def cards(*names: str) -> List[Dict[str, str]]:
+    """Card dicts for cards written like "3♣" or "joker" """
+    return [
+        {"suit": "", "rank": name} if name.lower() == "joker" else {"suit": name[-1], "rank": name[:-1]}
+        for name in names
+    ]
+
+def deal(game_class, *hands: Tuple[str, ...]):
+    """A climbing game with the given hands, player 0 to lead"""
+    game = game_class("dealt", num_players=len(hands))
+    game.hands = [parse_cards(cards(*hand)) for hand in hands]
+    game.current_player = 0
+    return game
+
 def assert_valid_game_state(state: Dict[str, Any]) -> None:
     """Assert that a game state is valid."""
     assert isinstance(state, dict), "Game state must be a dictionary"
@@ -0,0 +1,50 @@
+"""Tests for the shared card primitives."""
+import unittest
+
+import numpy as np
+
+from games.cards import CardSet, card_count, cards_of, draw, hand_mask, in_mask, shuffled
+
+UNO = CardSet.product(color=["red", "yellow", "green", "blue"], value=[str(v) for v in range(10)]) + [
+    {"color": None, "value": "wild"},
+]
+
+
+class TestCards(unittest.TestCase):
+    def test_codes_and_faces(self):
+        self.assertEqual(len(UNO), 41)
+        self.assertEqual(UNO.code({"color": "yellow", "value": "3"}), 13)
+        self.assertEqual(UNO.code({"value": "wild"}), 40)
+        self.assertEqual(UNO.faces[13], {"color": "yellow", "value": "3"})
+        self.assertEqual(UNO.codes(UNO.to_faces([4, 0, 40])), [4, 0, 40])
+        for face in ({"color": "pink", "value": "3"}, {"color": ["red"]}, "red 3", None):
+            with self.assertRaises(ValueError):
+                UNO.code(face)
+
+    def test_decks_and_shuffles(self):
+        deck = UNO.deck(copies=2)
+        self.assertEqual(deck.dtype, np.uint8)
+        self.assertEqual(np.bincount(deck).tolist(), [2] * 41)
+        first, second = shuffled(deck, seed=11), shuffled(deck, seed=11)
+        self.assertEqual(first.tolist(), second.tolist())
+        self.assertEqual(sorted(first.tolist()), sorted(deck.tolist()))
+        self.assertNotEqual(first.tolist(), deck.tolist())
+
+        top, rest = draw(np.arange(5, dtype=np.uint8), 2)
+        self.assertEqual(top, [4, 3])
+        self.assertEqual(rest.tolist(), [0, 1, 2])
+        with self.assertRaises(ValueError):
+            draw(rest, 4)
+
+    def test_masks(self):
+        mask = hand_mask([3, 40, 7])
+        self.assertEqual(cards_of(mask), [3, 7, 40])
+        self.assertEqual(card_count(mask), 3)
+        self.assertEqual(UNO.mask_faces(mask), UNO.to_faces([3, 7, 40]))
+        deck = UNO.deck()
+        self.assertEqual(deck[in_mask(deck, mask)].tolist(), [3, 7, 40])
+        self.assertEqual(len(deck[~in_mask(deck, mask)]), 38)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,6 +3,16 @@ Test template for Catan game.
 """
 import unittest
 from games.catan import CatanGame
+from games.catan.graph import (
+    EDGE_VERTICES,
+    HEX_VERTICES,
+    NUM_EDGES,
+    NUM_HEXES,
+    NUM_VERTICES,
+    VERTEX_EDGES,
+    VERTEX_NEIGHBORS,
+    longest_road,
+)
 from tests.base_test import BaseGameTest
 
 
@@ -14,12 +24,21 @@ class TestCatanGame(BaseGameTest):
     def test_initial_state(self):
         """Test the initial game state."""
         state = self.game.get_game_state()
-        self.assertValidGameState(state)
-        
-        # Add game-specific assertions here
-        # Example:
-        # self.assertEqual(state['current_player'], 'player1')
-        # self.assertIsNone(state['winner'])
+        # The board is a list of hex dicts, so check it here rather than
+        # through assertValidGameState
+        self.assertEqual(state['current_player'], 0)
+        self.assertEqual(state['phase'], 'setup')
+        self.assertFalse(state['game_over'])
+        self.assertIsNone(state['winner'])
+        self.assertEqual(len(state['board']), NUM_HEXES)
+        self.assertEqual(len(state['edges']), NUM_EDGES)
+        for hex_ in state['board']:
+            self.assertEqual(hex_['vertices'], list(HEX_VERTICES[hex_['id']]))
+        desert = state['board'][state['robber']]
+        self.assertIsNone(desert['resource'])
+        self.assertIsNone(desert['number'])
+        self.assertTrue(all(points == 0 for points in state['victory_points'].values()))
+        self.assertTrue(all(not buildings for buildings in state['buildings'].values()))
     
     def test_valid_moves(self):
         """Test valid moves."""
@@ -61,3 +80,109 @@ class TestCatanGame(BaseGameTest):
         """Test draw conditions."""
         # Add test cases for draw conditions if applicable
         pass
+
+    def play_setup(self):
+        """Place every setup settlement and road on the lowest free ids."""
+        while self.game.phase == "setup":
+            if self.game.setup_settlement is None:
+                vertex = next(v for v in range(NUM_VERTICES) if self.game._is_free_vertex(v))
+                self.game.make_move({"action": "build", "type": "settlement", "position": vertex})
+            else:
+                edge = next(
+                    e for e in VERTEX_EDGES[self.game.setup_settlement] if self.game._is_free_edge(e)
+                )
+                self.game.make_move({"action": "build", "type": "road", "position": edge})
+
+    def edge_between(self, a, b):
+        return next(e for e in VERTEX_EDGES[a] if b in EDGE_VERTICES[e])
+
+    def test_board_graph(self):
+        """The standard board has 19 hexes, 54 vertices and 72 edges."""
+        self.assertEqual((NUM_HEXES, NUM_VERTICES, NUM_EDGES), (19, 54, 72))
+        self.assertTrue(all(len(set(vertices)) == 6 for vertices in HEX_VERTICES))
+        degrees = sorted(len(neighbors) for neighbors in VERTEX_NEIGHBORS)
+        self.assertEqual(degrees.count(2), 18)  # coast corners touching one hex
+        self.assertEqual(degrees.count(3), 36)
+
+    def test_setup_and_placement_rules(self):
+        """Setup placements obey the distance rule and snake back for round two."""
+        self.assertEqual(self.game.setup_order, [0, 1, 2, 3, 3, 2, 1, 0])
+        self.game.make_move({"action": "build", "type": "settlement", "position": 0})
+        # The road must touch the settlement just placed
+        far_edge = next(e for e in range(NUM_EDGES) if 0 not in EDGE_VERTICES[e])
+        self.assertFalse(self.game.validate_move({"action": "build", "type": "road", "position": far_edge}))
+        self.game.make_move({"action": "build", "type": "road", "position": VERTEX_EDGES[0][0]})
+        neighbor = VERTEX_NEIGHBORS[0][0]
+        self.assertFalse(self.game.validate_move(
+            {"action": "build", "type": "settlement", "position": neighbor}
+        ))
+        self.play_setup()
+        self.assertEqual(self.game.phase, "play")
+        self.assertTrue(all(self.game.victory_points[p] == 2 for p in range(4)))
+
+        # In play, building needs a roll, the resources and a connected spot
+        network = {v for e in range(NUM_EDGES) if self.game.roads[0] >> e & 1 for v in EDGE_VERTICES[e]}
+        edge = next(
+            e for e in range(NUM_EDGES)
+            if self.game._is_free_edge(e) and network & set(EDGE_VERTICES[e])
+        )
+        far_edge = next(
+            e for e in range(NUM_EDGES)
+            if self.game._is_free_edge(e) and not network & set(EDGE_VERTICES[e])
+        )
+        road = {"action": "build", "type": "road", "position": edge}
+        self.game.resources[0].update(wood=5, brick=5)
+        self.assertFalse(self.game.validate_move(road))
+        self.game.make_move({"action": "roll"})
+        self.assertTrue(self.game.validate_move(road))
+        self.assertFalse(self.game.validate_move(dict(road, position=far_edge)))
+
+    def test_production_index(self):
+        """A roll pays every building on the matching hexes, cities double."""
+        self.play_setup()
+        self.game._place_city(0, (self.game.settlements[0] & -self.game.settlements[0]).bit_length() - 1)
+        for total in range(2, 13):
+            before = {p: dict(r) for p, r in self.game.resources.items()}
+            self.game._produce(total)
+            expected = {p: dict(r) for p, r in before.items()}
+            for hex_id in range(NUM_HEXES):
+                if self.game.hex_numbers[hex_id] != total or hex_id == self.game.robber:
+                    continue
+                resource = self.game.hex_resources[hex_id].name.lower()
+                for vertex in HEX_VERTICES[hex_id]:
+                    for p in range(4):
+                        if self.game.settlements[p] >> vertex & 1:
+                            expected[p][resource] += 1
+                        if self.game.cities[p] >> vertex & 1:
+                            expected[p][resource] += 2
+            self.assertEqual(self.game.resources, expected)
+
+    def test_longest_road_and_largest_army(self):
+        """Longest road grows incrementally and breaks on a rival settlement."""
+        self.game.phase = "play"
+        path = [0]
+        while len(path) < 7:
+            path.append(min(v for v in VERTEX_NEIGHBORS[path[-1]] if v not in path))
+        self.game._place_settlement(0, path[0])
+        for a, b in zip(path, path[1:]):
+            self.game._place_road(0, self.edge_between(a, b))
+        self.assertEqual(self.game.road_length[0], 6)
+        self.assertEqual(self.game.longest_road, 0)
+        self.game._update_victory_points()
+        self.assertEqual(self.game.victory_points[0], 3)
+
+        # A rival settlement in the middle leaves runs of 3 and 3
+        self.game._place_settlement(1, path[3])
+        self.assertEqual(self.game.road_length[0], 3)
+        self.assertEqual(
+            self.game.road_length[0],
+            longest_road(self.game.roads[0], self.game._opponent_buildings(0)),
+        )
+        self.assertIsNone(self.game.longest_road)
+
+        for _ in range(3):
+            self.game.rolled = True
+            self.game.make_move({"action": "use_dev_card", "card": "knight", "hex": 4})
+        self.assertEqual(self.game.largest_army, 0)
+        self.assertEqual(self.game.robber, 4)
+        self.assertEqual(self.game.victory_points[0], 3)
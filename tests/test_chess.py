@@ -1,8 +1,11 @@
 """
 Test cases for Chess game.
 """
+import os
+import tempfile
 import unittest
 from games.chess import ChessGame, ChessPiece
+from games.chess.bitboard import BitboardPosition
 from tests.base_test import BaseGameTest
 from typing import Dict, Any, List, Tuple
 import copy
@@ -306,3 +309,100 @@ class TestChessGame(BaseGameTest):
         self.assertIsNone(state['board'][3][4])  # White pawn should have moved from e5
         self.assertEqual(state['board'][2][3]['type'], 'p')  # White pawn should be at d6
         self.assertEqual(state['board'][2][3]['color'], 'w')  # It should still be a white pawn
+
+    def test_legal_moves_initial_position(self):
+        """The side to move has 20 legal moves in the initial position."""
+        moves = self.game.legal_moves()
+        self.assertEqual(len(moves), 20)
+        for move in moves:
+            self.assertTrue(self.game.validate_move(move))
+
+    def test_legal_moves_respect_pins_and_checks(self):
+        """Pinned pieces stay on the pin line and checks must be answered."""
+        self.game.board = [[None] * 8 for _ in range(8)]
+        self.game.current_player = 'w'
+        self.game.board[0][4] = ChessPiece('k', 'w')  # White king at e1
+        self.game.board[1][4] = ChessPiece('r', 'w')  # White rook at e2, pinned
+        self.game.board[7][4] = ChessPiece('r', 'b')  # Black rook at e8
+        self.game.board[7][0] = ChessPiece('k', 'b')  # Black king at a8
+
+        rook_moves = {(m['to_row'], m['to_col']) for m in self.game.legal_moves() if m['from_row'] == 1}
+        self.assertEqual(rook_moves, {(r, 4) for r in range(2, 8)})
+        self.assertFalse(self.game.validate_move(
+            {'from_row': 1, 'from_col': 4, 'to_row': 1, 'to_col': 0, 'player': 'w'}))
+
+        # Remove the rook: the king is in check and may not stay on the e-file
+        self.game.board[1][4] = None
+        self.game.invalidate_state_cache()
+        self.assertTrue(self.game._is_in_check('w'))
+        self.assertTrue(all(m['to_col'] != 4 for m in self.game.legal_moves()))
+
+    def test_stalemate(self):
+        """No legal moves without being in check is a draw."""
+        self.game.board = [[None] * 8 for _ in range(8)]
+        self.game.current_player = 'b'
+        self.game.board[7][7] = ChessPiece('k', 'b')  # Black king at h8
+        self.game.board[5][6] = ChessPiece('q', 'w')  # White queen at g6
+        self.game.board[0][0] = ChessPiece('k', 'w')  # White king at a1
+
+        self.assertEqual(self.game.legal_moves(), [])
+        state = self.game.get_game_state()
+        self.assertTrue(state['game_over'])
+        self.assertIsNone(state['winner'])
+
+    def test_bitboard_round_trip(self):
+        """The bitboard position round-trips with the game state board format."""
+        self.game.make_move({'from_row': 1, 'from_col': 4, 'to_row': 3, 'to_col': 4, 'player': 'w'})
+        board = self.game.get_game_state()['board']
+        position = BitboardPosition.from_state(board)
+        self.assertEqual(position.to_state(), board)
+        self.assertEqual(position.pieces['w']['p'] & (1 << (3 * 8 + 4)), 1 << (3 * 8 + 4))
+
+    def test_insufficient_material(self):
+        """Kings with at most a minor piece, or same-colored bishops, cannot mate."""
+        self.game.board = [[None] * 8 for _ in range(8)]
+        self.game.board[0][4] = ChessPiece('k', 'w')
+        self.game.board[7][4] = ChessPiece('k', 'b')
+        self.game.board[0][2] = ChessPiece('b', 'w')  # c1, dark square
+        self.assertTrue(self.game._is_insufficient_material())
+        self.game.board[7][5] = ChessPiece('b', 'b')  # f8, dark square
+        self.game.invalidate_state_cache()
+        self.assertTrue(self.game._is_insufficient_material())
+        self.game.board[7][5] = None
+        self.game.board[7][2] = ChessPiece('b', 'b')  # c8, light square
+        self.game.invalidate_state_cache()
+        self.assertFalse(self.game._is_insufficient_material())
+
+    def test_threefold_repetition(self):
+        """Repeating a position three times is a draw."""
+        knight_moves = [(0, 6, 2, 5, 'w'), (7, 6, 5, 5, 'b'), (2, 5, 0, 6, 'w'), (5, 5, 7, 6, 'b')]
+        for cycle in range(2):
+            for from_row, from_col, to_row, to_col, player in knight_moves:
+                self.assertFalse(self.game.is_game_over())
+                self.game.make_move({'from_row': from_row, 'from_col': from_col,
+                                     'to_row': to_row, 'to_col': to_col, 'player': player})
+                self.assertEqual(self.game.zobrist_key, self.game._compute_zobrist_key())
+        self.assertEqual(self.game.repetition_count(), 3)
+        self.assertTrue(self.game.is_game_over())
+        self.assertIsNone(self.game.get_winner())
+
+    def test_reload_replays_moves(self):
+        """A reloaded game replays its history instead of resetting."""
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp:
+            os.chdir(tmp)
+            try:
+                game = ChessGame("reloaded")
+                game.make_move({'from_row': 1, 'from_col': 4, 'to_row': 3, 'to_col': 4, 'player': 'w'})
+                game.make_move({'from_row': 6, 'from_col': 4, 'to_row': 4, 'to_col': 4, 'player': 'b'})
+                game.make_move({'from_row': 0, 'from_col': 6, 'to_row': 2, 'to_col': 5, 'player': 'w'})
+
+                loaded = ChessGame("reloaded")
+                self.assertEqual(len(loaded.history.moves), 3)
+                self.assertEqual(loaded.get_game_state(), game.get_game_state())
+                self.assertEqual(loaded.current_player, 'b')
+                self.assertIsNone(loaded.board[1][4])
+                self.assertEqual(loaded.board[3][4].piece_type, 'p')
+                self.assertEqual(loaded.zobrist_key, game.zobrist_key)
+            finally:
+                os.chdir(cwd)
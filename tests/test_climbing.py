@@ -0,0 +1,111 @@
+"""Tests for the shared climbing card engine."""
+import random
+import unittest
+from itertools import combinations
+
+from games.climbing import (
+    BIG_JOKER,
+    SMALL_JOKER,
+    CardType,
+    Rules,
+    beating_plays,
+    beats,
+    card_code,
+    card_dict,
+    classify,
+    parse_cards,
+    plays,
+)
+from games.cards import cards_of, hand_mask
+
+BIG2 = Rules(min_straight=5, ranked=(CardType.STRAIGHT, CardType.FULL_HOUSE, CardType.STRAIGHT_FLUSH))
+TIENLEN = Rules(min_straight=3, bombs=(CardType.FOUR_OF_A_KIND,))
+
+
+def mask(*cards):
+    """Mask of cards written like "3♣" or "joker" """
+    return hand_mask(
+        card_code("", card) if card.lower() == "joker" else card_code(card[-1], card[:-1])
+        for card in cards
+    )
+
+
+class TestClimbing(unittest.TestCase):
+    def test_encoding(self):
+        self.assertEqual(card_code("♣", "3"), 0)
+        self.assertEqual(card_code("♠", "2"), 51)
+        self.assertEqual(card_code("", "joker"), SMALL_JOKER)
+        for code in range(54):
+            self.assertEqual(card_code(**card_dict(code)), code)
+        self.assertEqual(cards_of(mask("5♥", "3♣")), [0, 10])
+        self.assertIsNone(parse_cards([{"suit": "♣", "rank": "3"}] * 2))
+        self.assertIsNone(parse_cards([{"suit": "x", "rank": "3"}]))
+
+    def test_classify(self):
+        cases = [
+            (("7♦",), CardType.SINGLE),
+            (("joker", "Joker"), CardType.PAIR),
+            (("9♣", "9♥", "9♠"), CardType.TRIPLE),
+            (("K♣", "K♦", "K♥", "K♠"), CardType.FOUR_OF_A_KIND),
+            (("3♣", "4♦", "5♣"), CardType.STRAIGHT),
+            (("J♥", "Q♥", "K♥"), CardType.STRAIGHT_FLUSH),
+            (("4♣", "4♦", "4♥", "8♠", "8♦"), CardType.FULL_HOUSE),
+            (("3♣", "3♦"), CardType.PAIR),
+        ]
+        for cards, card_type in cases:
+            self.assertEqual(classify(mask(*cards), TIENLEN).type, card_type, cards)
+        # Same-rank cards are not a straight, nor are gaps or jokers
+        for cards in (("3♣", "3♦", "3♥", "4♣"), ("3♣", "4♣", "6♣"), ("K♣", "A♣", "2♣", "joker")):
+            self.assertIsNone(classify(mask(*cards), TIENLEN), cards)
+        self.assertIsNone(classify(mask("3♣", "4♦", "5♣"), BIG2))
+        self.assertEqual(classify(mask("4♣", "4♦", "4♥", "8♠", "8♦"), BIG2).key, 1)
+
+    def test_beats(self):
+        def check(play, table, rules=TIENLEN):
+            return beats(classify(mask(*play), rules), classify(mask(*table), rules), rules)
+
+        self.assertTrue(check(("7♠",), ("7♥",)))
+        self.assertFalse(check(("7♥",), ("7♠",)))
+        self.assertTrue(check(("Joker",), ("joker",)))
+        self.assertFalse(check(("8♣", "8♦"), ("9♣",)))
+        self.assertTrue(check(("5♣", "6♦", "7♠"), ("5♦", "6♣", "7♥")))
+        self.assertFalse(check(("5♣", "6♦", "7♠", "8♣"), ("5♦", "6♣", "7♥")))
+        # A suited straight is just a straight unless the rules rank it
+        self.assertTrue(check(("5♥", "6♥", "7♥"), ("4♦", "5♣", "6♠")))
+        # Bombs beat anything else
+        self.assertTrue(check(("4♣", "4♦", "4♥", "4♠"), ("2♠",)))
+        self.assertFalse(check(("2♠",), ("4♣", "4♦", "4♥", "4♠")))
+        # Big 2 ranks five-card hands
+        self.assertTrue(check(("4♣", "4♦", "4♥", "8♠", "8♦"), ("9♣", "10♦", "J♠", "Q♣", "K♣"), BIG2))
+        self.assertTrue(check(("3♦", "4♦", "5♦", "6♦", "7♦"), ("A♣", "A♦", "A♥", "2♠", "2♦"), BIG2))
+        self.assertFalse(check(("4♣", "4♦", "4♥", "4♠"), ("2♠",), BIG2))
+
+    def test_plays_match_brute_force(self):
+        rng = random.Random(7)
+        for rules in (BIG2, TIENLEN):
+            for _ in range(30):
+                hand = rng.sample(range(54), 10)
+                expected = set()
+                for size in range(1, 11):
+                    for cards in combinations(hand, size):
+                        play = classify(hand_mask(cards), rules)
+                        if play is not None:
+                            expected.add(play)
+                found = plays(hand_mask(hand), rules)
+                self.assertEqual(len(found), len(set(found)))
+                self.assertEqual(set(found), expected)
+
+                table = classify(hand_mask(rng.sample(range(54), 1)), rules)
+                self.assertEqual(
+                    set(beating_plays(hand_mask(hand), table, rules)),
+                    {play for play in expected if beats(play, table, rules)},
+                )
+
+    def test_jokers(self):
+        self.assertEqual(BIG_JOKER, SMALL_JOKER + 1)
+        found = plays(mask("2♠", "joker", "Joker"), TIENLEN)
+        self.assertEqual(len(found), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
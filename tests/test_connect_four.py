@@ -166,3 +166,57 @@ class TestConnectFourGame(BaseGameTest):
         state = self.game.get_game_state()
         self.assertTrue(state['game_over'])
         self.assertEqual(state['winner'], 'R')
+
+    def test_bitboard_matches_full_scan(self):
+        """Incremental win detection agrees with scanning every line."""
+        import random
+
+        def scan(board):
+            for r in range(6):
+                for c in range(7):
+                    for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+                        cells = [
+                            board[r + dr * i][c + dc * i]
+                            for i in range(4)
+                            if 0 <= r + dr * i < 6 and 0 <= c + dc * i < 7
+                        ]
+                        if len(cells) == 4 and cells[0] and cells.count(cells[0]) == 4:
+                            return cells[0]
+            return None
+
+        rng = random.Random(7)
+        for game_index in range(50):
+            game = self.GAME_CLASS(game_id=f"test_scan_{game_index}")
+            game.initialize_game()
+            while not game.is_game_over():
+                open_columns = [c for c in range(7) if game.board[0][c] is None]
+                game.make_move(
+                    {"column": rng.choice(open_columns), "player": game.current_player}
+                )
+                expected = scan(game.board)
+                if expected:
+                    self.assertEqual(game.get_winner(), expected)
+                    break
+                self.assertIn(game.get_winner(), (None, "draw"))
+
+    def test_full_board_draw(self):
+        """A full board without four in a row is a draw."""
+        self.game.board = [
+            ["Y", "R", "Y", "Y", "R", "Y", "Y"],
+            ["R", "R", "Y", "Y", "R", "Y", "R"],
+            ["Y", "R", "Y", "Y", "Y", "R", "R"],
+            ["Y", "Y", "R", "R", "Y", "R", "Y"],
+            ["R", "Y", "R", "Y", "R", "R", "R"],
+            ["Y", "R", "R", "Y", "Y", "Y", "R"],
+        ]
+        state = self.game.get_game_state()
+        self.assertTrue(state["game_over"])
+        self.assertEqual(state["winner"], "draw")
+
+    def test_state_board_is_a_copy(self):
+        """Editing a returned board changes neither the game nor later states."""
+        state = self.game.get_game_state()
+        state["board"][5][0] = "R"
+        self.assertIsNone(self.game.board[5][0])
+        self.assertIsNone(self.game.get_game_state()["board"][5][0])
+        self.assertTrue(self.game.validate_move({"column": 0, "player": "R"}))
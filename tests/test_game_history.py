@@ -0,0 +1,110 @@
+"""Tests for GameHistory persistence (append-only journal)."""
+import json
+import os
+import tempfile
+import unittest
+
+from game_abc import GameHistory, GameMove
+
+
+class TestGameHistoryJournal(unittest.TestCase):
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def _play(self, history: GameHistory, count: int) -> None:
+        for i in range(count):
+            history.current_state = {"turn": i}
+            history.add_move(GameMove("X", {"n": i}, float(i)))
+
+    def _lines(self, game_id: str):
+        with open(f"game_data/{game_id}.jsonl") as f:
+            return [json.loads(line) for line in f]
+
+    def test_moves_are_appended(self):
+        history = GameHistory("g1")
+        self._play(history, 5)
+        lines = self._lines("g1")
+        self.assertIn("snapshot", lines[0])
+        self.assertEqual(len(lines), 5)
+        self.assertEqual(lines[-1], {"move": {"player": "X", "move_data": {"n": 4}, "timestamp": 4.0}, "state": {"turn": 4}})
+
+    def test_replay_restores_moves_and_state(self):
+        history = GameHistory("g1")
+        self._play(history, 10)
+
+        loaded = GameHistory("g1")
+        self.assertTrue(loaded.load_from_disk("g1"))
+        self.assertEqual(loaded.get_history(), history.get_history())
+        self.assertEqual(loaded.current_state, {"turn": 9})
+
+        # Appending after a reload continues the same journal
+        self._play(loaded, 1)
+        self.assertEqual(len(self._lines("g1")), 11)
+
+    def test_compaction_into_snapshot(self):
+        history = GameHistory("g1")
+        history.SNAPSHOT_INTERVAL = 4
+        self._play(history, 6)
+        lines = self._lines("g1")
+        self.assertLessEqual(len(lines), 5)
+        self.assertIn("snapshot", lines[0])
+
+        loaded = GameHistory("g1")
+        loaded.load_from_disk("g1")
+        self.assertEqual(len(loaded.moves), 6)
+        self.assertEqual(loaded.current_state, {"turn": 5})
+
+    def test_seed_is_kept_in_snapshots(self):
+        history = GameHistory("g1")
+        history.seed = 12345
+        self._play(history, 3)
+        self.assertEqual(self._lines("g1")[0]["snapshot"]["seed"], 12345)
+
+        loaded = GameHistory("g1")
+        loaded.load_from_disk("g1")
+        self.assertEqual(loaded.seed, 12345)
+        self.assertEqual(len(loaded.moves), 3)
+
+    def test_torn_tail_is_ignored(self):
+        history = GameHistory("g1")
+        self._play(history, 3)
+        with open("game_data/g1.jsonl", "a") as f:
+            f.write('{"move": {"player"')
+
+        loaded = GameHistory("g1")
+        self.assertTrue(loaded.load_from_disk("g1"))
+        self.assertEqual(len(loaded.moves), 3)
+        self._play(loaded, 1)
+        reloaded = GameHistory("g1")
+        reloaded.load_from_disk("g1")
+        self.assertEqual(len(reloaded.moves), 4)
+
+    def test_legacy_file_is_migrated(self):
+        legacy = GameHistory("g1")
+        legacy.moves = [GameMove("X", {"n": 0}, 0.0)]
+        legacy.current_state = {"turn": 0}
+        os.makedirs("game_data", exist_ok=True)
+        with open("game_data/g1.json", "w") as f:
+            f.write(legacy.serialize())
+
+        loaded = GameHistory("g1")
+        self.assertTrue(loaded.load_from_disk("g1"))
+        self.assertEqual(len(loaded.moves), 1)
+        self._play(loaded, 1)
+        self.assertFalse(os.path.exists("game_data/g1.json"))
+        lines = self._lines("g1")
+        self.assertEqual(len(lines), 2)
+        self.assertIn("snapshot", lines[0])
+
+        loaded.delete_from_disk()
+        self.assertFalse(os.path.exists("game_data/g1.jsonl"))
+
+
+if __name__ == "__main__":
+    unittest.main()
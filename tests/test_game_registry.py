@@ -0,0 +1,145 @@
+"""Tests for the in-memory live game registry."""
+import os
+import tempfile
+import time
+import unittest
+from typing import Any, Dict, Optional
+
+from game_abc import AbstractGame, GameMove
+from game_manager import GameManager
+from game_registry import GameRegistry
+
+
+class CounterGame(AbstractGame):
+    """Minimal game used to exercise the registry: each move bumps a counter."""
+
+    def _restore_game_state(self):
+        self.count = self.history.current_state.get("count", 0)
+
+    def initialize_game(self) -> Dict[str, Any]:
+        self.count = 0
+        return self.get_game_state()
+
+    def validate_move(self, move_data: Dict[str, Any]) -> bool:
+        return True
+
+    def make_move(self, move_data: Dict[str, Any]) -> Dict[str, Any]:
+        self.count += 1
+        self.history.current_state = {"count": self.count}
+        self.history.add_move(GameMove("X", move_data, time.time()))
+        return self.get_game_state()
+
+    def get_game_state(self) -> Dict[str, Any]:
+        return {"count": self.count}
+
+    def is_game_over(self) -> bool:
+        return False
+
+    def get_winner(self) -> Optional[str]:
+        return None
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestGameRegistry(unittest.TestCase):
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        self.loads = []
+        self.clock = FakeClock()
+
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def loader(self, game_type: str, game_id: str) -> AbstractGame:
+        self.loads.append(game_id)
+        return CounterGame(game_id)
+
+    def make_registry(self, **kwargs) -> GameRegistry:
+        return GameRegistry(self.loader, clock=self.clock, **kwargs)
+
+    def test_hot_games_are_served_from_memory(self):
+        registry = self.make_registry()
+        game = registry.get("counter", "g1")
+        self.assertIs(registry.get("counter", "g1"), game)
+        self.assertEqual(self.loads, ["g1"])
+
+    def test_moves_are_written_behind(self):
+        registry = self.make_registry()
+        game = registry.get("counter", "g1")
+        game.make_move({})
+        registry.mark_dirty("counter", "g1")
+        self.assertFalse(os.path.exists("game_data/g1.jsonl"))
+        self.assertEqual(registry.flush(), 1)
+        self.assertTrue(os.path.exists("game_data/g1.jsonl"))
+        self.assertEqual(registry.flush(), 0)
+
+    def test_lru_eviction_flushes_and_reloads(self):
+        registry = self.make_registry(max_games=2)
+        registry.get("counter", "g1").make_move({})
+        registry.mark_dirty("counter", "g1")
+        registry.get("counter", "g2")
+        registry.get("counter", "g3")
+        self.assertNotIn(("counter", "g1"), registry)
+        self.assertEqual(len(registry), 2)
+
+        reloaded = registry.get("counter", "g1")
+        self.assertEqual(reloaded.count, 1)
+        self.assertEqual(self.loads, ["g1", "g2", "g3", "g1"])
+
+    def test_ttl_expiry(self):
+        registry = self.make_registry(ttl_seconds=10)
+        registry.get("counter", "g1")
+        self.clock.now = 5
+        registry.get("counter", "g2")
+        self.clock.now = 12
+        registry.get("counter", "g2")
+        self.assertNotIn(("counter", "g1"), registry)
+        self.assertIn(("counter", "g2"), registry)
+
+    def test_put_flushes_the_game_it_replaces(self):
+        registry = self.make_registry()
+        registry.get("counter", "g1").make_move({})
+        registry.mark_dirty("counter", "g1")
+        registry.put("counter", "g1", CounterGame("g1"))
+        self.assertTrue(os.path.exists("game_data/g1.jsonl"))
+        self.assertEqual(CounterGame("g1").count, 1)
+
+    def test_game_ids_are_unique(self):
+        manager = GameManager()
+        ids = {manager.create_game("chess") for _ in range(5)}
+        self.assertEqual(len(ids), 5)
+
+    def test_created_games_keep_their_seed(self):
+        manager = GameManager()
+        game_id = manager.create_game("poker", seed=42)
+        state = manager.get_game("poker", game_id).get_game_state()
+        # Dropped without a flush, as if the server restarted
+        manager.registry.discard("poker", game_id)
+        reloaded = manager.get_game("poker", game_id)
+        self.assertEqual(reloaded.history.seed, 42)
+        self.assertEqual(reloaded.get_game_state(), state)
+
+        game_id = manager.create_game("poker")
+        seed = manager.get_game("poker", game_id).history.seed
+        manager.registry.discard("poker", game_id)
+        self.assertEqual(manager.get_game("poker", game_id).history.seed, seed)
+
+    def test_memory_budget(self):
+        registry = self.make_registry(max_bytes=1000)
+        for i in range(10):
+            registry.get("counter", f"g{i}")
+        self.assertLessEqual(registry.total_bytes, 1000)
+        self.assertIn(("counter", "g9"), registry)
+
+
+if __name__ == "__main__":
+    unittest.main()
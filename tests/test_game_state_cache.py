@@ -0,0 +1,103 @@
+"""Tests for the memoized state reads on AbstractGame."""
+import os
+import tempfile
+import unittest
+from typing import Any, Dict, Optional
+
+from game_abc import AbstractGame
+
+
+class CountingGame(AbstractGame):
+    """Three-in-a-row on a 1x3 strip that counts how often it scans the board."""
+
+    def _restore_game_state(self):
+        self.board = [None, None, None]
+        self.current_player = "X"
+        self.scans = 0
+
+    def initialize_game(self) -> Dict[str, Any]:
+        self._restore_game_state()
+        return self.get_game_state()
+
+    def validate_move(self, move_data: Dict[str, Any]) -> bool:
+        return not self.is_game_over() and self.board[move_data["cell"]] is None
+
+    def make_move(self, move_data: Dict[str, Any]) -> Dict[str, Any]:
+        if not self.validate_move(move_data):
+            raise ValueError("Invalid move")
+        self.board[move_data["cell"]] = "X"  # in-place mutation
+        return self.get_game_state()
+
+    def get_game_state(self) -> Dict[str, Any]:
+        return {
+            "board": list(self.board),
+            "current_player": self.current_player,
+            "game_over": self.is_game_over(),
+            "winner": self.get_winner(),
+        }
+
+    def is_game_over(self) -> bool:
+        return self.get_winner() is not None
+
+    def get_winner(self) -> Optional[str]:
+        self.scans += 1
+        return "X" if all(self.board) else None
+
+
+class TestGameStateCache(unittest.TestCase):
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        self.game = CountingGame("cache")
+        self.game.initialize_game()
+
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def test_repeated_reads_are_served_from_cache(self):
+        self.game.get_game_state()
+        scans = self.game.scans
+        for _ in range(10):
+            self.game.get_game_state()
+            self.game.is_game_over()
+        self.assertEqual(self.game.scans, scans)
+
+    def test_make_move_invalidates(self):
+        self.assertFalse(self.game.get_game_state()["game_over"])
+        for cell in range(3):
+            state = self.game.make_move({"cell": cell})
+        self.assertTrue(state["game_over"])
+        self.assertTrue(self.game.get_game_state()["game_over"])
+        self.assertEqual(self.game.get_winner(), "X")
+
+    def test_failed_move_still_invalidates(self):
+        self.game.get_game_state()
+        self.game.board[0] = "X"  # in-place, invisible to the cache
+        with self.assertRaises(ValueError):
+            self.game.make_move({"cell": 0})
+        self.assertEqual(self.game.get_game_state()["board"], ["X", None, None])
+
+    def test_attribute_assignment_invalidates(self):
+        self.game.get_game_state()
+        self.game.board = ["X", "X", "X"]
+        self.assertEqual(self.game.get_winner(), "X")
+
+    def test_returned_state_is_a_copy(self):
+        state = self.game.get_game_state()
+        state["winner"] = "O"
+        state["board"][0] = "O"
+        self.assertIsNone(self.game.get_game_state()["winner"])
+        self.assertEqual(self.game.get_game_state()["board"], [None, None, None])
+
+    def test_explicit_invalidation(self):
+        self.game.get_game_state()
+        self.game.board[:] = ["X", "X", "X"]
+        self.assertIsNone(self.game.get_winner())
+        self.game.invalidate_state_cache()
+        self.assertEqual(self.game.get_winner(), "X")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,12 @@
 """
 Test template for Gin Rummy game.
 """
+import os
+import tempfile
 import unittest
-from games.gin_rummy import GinRummyGame
+from games.gin_rummy.gin_rummy import CARDS, GinRummyGame
+from games.cards import hand_mask
+from games.gin_rummy.melds import best_discard, card_index, solve
 from tests.base_test import BaseGameTest
 
 
@@ -14,12 +18,15 @@ class TestGinRummyGame(BaseGameTest):
     def test_initial_state(self):
         """Test the initial game state."""
         state = self.game.get_game_state()
-        self.assertValidGameState(state)
-        
-        # Add game-specific assertions here
-        # Example:
-        # self.assertEqual(state['current_player'], 'player1')
-        # self.assertIsNone(state['winner'])
+        # Gin rummy has no board, only hands and the discard pile
+        self.assertEqual(state['current_player'], 0)
+        self.assertFalse(state['game_over'])
+        self.assertIsNone(state['winner'])
+        self.assertEqual(sorted(state['hands']), ['0', '1'])
+        self.assertTrue(all(len(hand) == 10 for hand in state['hands'].values()))
+        self.assertEqual(len(state['discard_pile']), 1)
+        dealt = [card for hand in state['hands'].values() for card in hand] + state['discard_pile']
+        self.assertEqual(len({(card['suit'], card['rank']) for card in dealt}), 21)
     
     def test_valid_moves(self):
         """Test valid moves."""
@@ -61,3 +68,68 @@ class TestGinRummyGame(BaseGameTest):
         """Test draw conditions."""
         # Add test cases for draw conditions if applicable
         pass
+
+    def test_optimal_deadwood(self):
+        """Melds are chosen to minimise deadwood, including runs and 4-card sets."""
+        def hand(*cards):
+            return hand_mask(card_index(suit, rank) for suit, rank in cards)
+
+        # 7-7-7 set or 5-6-7 run both need the 7 of spades; the set leaves less
+        cards = hand(("♠", 5), ("♠", 6), ("♠", 7), ("♥", 7), ("♦", 7), ("♣", 13))
+        self.assertEqual(self.game._calculate_deadwood(cards), 5 + 6 + 10)
+        # With the fourth 7 the run and a set of the other three 7s both fit
+        cards = hand(("♠", 5), ("♠", 6), ("♠", 7), ("♥", 7), ("♦", 7), ("♣", 7))
+        self.assertEqual(self.game._calculate_deadwood(cards), 0)
+        cards = hand(
+            ("♥", 1), ("♥", 2), ("♥", 3), ("♥", 4),
+            ("♠", 9), ("♥", 9), ("♦", 9), ("♣", 9),
+            ("♦", 11), ("♦", 12), ("♦", 13),
+        )
+        self.assertEqual(self.game._calculate_deadwood(cards), 0)
+        self.assertEqual(self.game._calculate_deadwood(hand(("♣", 12), ("♠", 1))), 11)
+
+        mask = cards
+        deadwood, melds = solve(mask)
+        self.assertEqual(sum(melds), mask)
+        discard, after = best_discard(mask)
+        self.assertEqual(after, 0)
+        self.assertIn(discard, [card_index("♥", 1), card_index("♥", 4)] + [card_index(s, 9) for s in "♠♥♦♣"])
+
+    def test_draw_discard_and_reshuffle(self):
+        """Cards move between the deck, hands and discard pile without duplicates."""
+        game = self.game
+        top = game.get_game_state()["discard_pile"][-1]
+        game.make_move({"action": "draw", "source": "discard"})
+        self.assertIn(top, game.get_game_state()["hands"]["0"])
+        self.assertFalse(game.validate_move({"action": "discard", "card": {"suit": "x", "rank": 1}}))
+        card = game.get_game_state()["hands"]["1"][0]
+        game.make_move({"action": "discard", "card": card})
+        self.assertEqual(game.get_game_state()["discard_pile"], [card])
+        self.assertNotIn(card, game.get_game_state()["hands"]["1"])
+
+        # Exhaust the deck into the discard pile, then draw again
+        game.discard_pile.extend(game.deck.tolist())
+        game.deck = game.deck[:0]
+        game.make_move({"action": "draw", "source": "deck"})
+        state = game.get_game_state()
+        cards = [CARDS.code(card) for pile in state["hands"].values() for card in pile]
+        cards += [CARDS.code(card) for card in state["discard_pile"]] + game.deck.tolist()
+        self.assertEqual(sorted(cards), list(range(52)))
+
+    def test_empty_discard_pile_and_replay(self):
+        """A rejected draw is not recorded, so the game still reloads."""
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp:
+            os.chdir(tmp)
+            try:
+                game = GinRummyGame("gin-replay")
+                game.make_move({"action": "draw", "source": "discard"})
+                self.assertFalse(game.validate_move({"action": "draw", "source": "discard"}))
+                with self.assertRaises(ValueError):
+                    game.make_move({"action": "draw", "source": "discard"})
+                self.assertEqual(len(game.history.moves), 1)
+
+                loaded = GinRummyGame("gin-replay")
+                self.assertEqual(loaded.get_game_state(), game.get_game_state())
+            finally:
+                os.chdir(cwd)
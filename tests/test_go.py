@@ -2,7 +2,7 @@
 Test template for Go game.
 """
 import unittest
-from games.go import GoGame
+from games.go.go import GoGame, GoStone
 from tests.base_test import BaseGameTest
 
 
@@ -14,12 +14,15 @@ class TestGoGame(BaseGameTest):
     def test_initial_state(self):
         """Test the initial game state."""
         state = self.game.get_game_state()
-        self.assertValidGameState(state)
-        
-        # Add game-specific assertions here
-        # Example:
-        # self.assertEqual(state['current_player'], 'player1')
-        # self.assertIsNone(state['winner'])
+        # The board holds GoStone values, so check it here rather than
+        # through assertValidGameState
+        self.assertEqual(state['current_player'], 'BLACK')
+        self.assertFalse(state['game_over'])
+        self.assertIsNone(state['winner'])
+        self.assertIsNone(state['ko_position'])
+        self.assertEqual(len(state['board']), 19)
+        for row in state['board']:
+            self.assertEqual(row, [GoStone.EMPTY.value] * 19)
     
     def test_valid_moves(self):
         """Test valid moves."""
@@ -61,3 +64,80 @@ class TestGoGame(BaseGameTest):
         """Test draw conditions."""
         # Add test cases for draw conditions if applicable
         pass
+
+    def _play(self, *points):
+        for x, y in points:
+            self.game.make_move({"x": x, "y": y} if x is not None else {"pass": True})
+
+    def test_capture_and_merge(self):
+        """Groups merge on contact and are removed when their last liberty is filled."""
+        # Black surrounds the white pair at (0,1)-(0,2)
+        self._play((0, 0), (0, 1), (1, 1), (0, 2), (1, 2), (None, None), (0, 3))
+        self.assertEqual(self.game.board[0, 1], 0)
+        self.assertEqual(self.game.board[0, 2], 0)
+        self.assertEqual(self.game.captured_stones[GoStone.WHITE], 2)
+        black = self.game._find_group((1, 1))
+        self.assertIs(black, self.game._find_group((1, 2)))
+        self.assertIn(0 * 19 + 1, black.liberties)
+
+    def test_suicide_and_ko(self):
+        """Suicide is illegal; a single-stone ko cannot be retaken immediately."""
+        # Black stones around (1,1); white plays inside: suicide
+        self._play((0, 1), (5, 5), (1, 0), (5, 6), (1, 2), (5, 7), (2, 1))
+        self.assertFalse(self.game.validate_move({"x": 1, "y": 1}))
+
+        # Ko: black (1,2) inside white (0,2),(2,2),(1,3); white (1,1) inside black takes it
+        self.game.initialize_game()
+        self._play((0, 1), (0, 2), (2, 1), (2, 2), (1, 2), (1, 3), (1, 0), (1, 1))
+        self.assertEqual(self.game.board[1, 2], 0)
+        self.assertEqual(self.game.ko_position, (1, 2))
+        self.assertFalse(self.game.validate_move({"x": 1, "y": 2}))
+        self._play((9, 10), (9, 11))
+        self.assertTrue(self.game.validate_move({"x": 1, "y": 2}))
+
+    def test_scoring_rules(self):
+        """Area and territory scoring with komi, for one board and a batch."""
+        import numpy as np
+        from games.go.scoring import score_board, score_boards
+
+        board = np.zeros((5, 5), dtype=int)
+        board[:, 1] = 1  # Black wall: column 0 is black territory
+        board[:, 3] = 2  # White wall: column 4 is white territory
+        self.assertEqual(score_board(board, komi=0.5), {"black": 10.0, "white": 10.5})
+        self.assertEqual(
+            score_board(board, prisoners=(3, 0), komi=0.5, rules="territory"),
+            {"black": 8.0, "white": 5.5},
+        )
+        swapped = np.where(board > 0, 3 - board, 0)
+        black, white = score_boards(np.stack([board, swapped]), komi=0)
+        self.assertEqual(list(black), [10.0, 10.0])
+        self.assertEqual(list(white), [10.0, 10.0])
+
+        self.game.komi = 0.5
+        self.game.board = np.zeros((19, 19), dtype=int)
+        self.game.board[:, 1] = 1
+        self._play((None, None), (None, None))
+        self.assertTrue(self.game.is_game_over())
+        self.assertEqual(self.game.get_winner(), "black")
+
+    def test_superko_undo_and_replay(self):
+        """Positions cannot repeat; moves can be undone and are replayed on load."""
+        self._play((0, 1), (0, 2), (2, 1), (2, 2), (1, 2), (1, 3), (1, 0), (1, 1))
+        # Even without the simple-ko marker, retaking recreates an earlier position
+        self.game.ko_position = None
+        self.assertFalse(self.game.validate_move({"x": 1, "y": 2}))
+        self.assertEqual(len(self.game.position_keys), 9)
+
+        reloaded = GoGame(game_id=self.game.game_id)
+        self.assertTrue((reloaded.board == self.game.board).all())
+        self.assertEqual(reloaded.zobrist_key, self.game.zobrist_key)
+        self.assertEqual(reloaded.captured_stones, self.game.captured_stones)
+
+        board_before = self.game.board.copy()
+        self._play((5, 5))
+        self.game._undo_move()
+        self.assertTrue((self.game.board == board_before).all())
+        self.game._undo_move()  # Restores the captured black stone
+        self.assertEqual(self.game.board[1, 2], GoStone.BLACK.value)
+        self.assertEqual(self.game.captured_stones[GoStone.BLACK], 0)
+        self.assertEqual(self.game.current_player, GoStone.WHITE)
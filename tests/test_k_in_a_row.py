@@ -0,0 +1,58 @@
+"""Tests for the incremental k-in-a-row engine."""
+import random
+import unittest
+
+from games.k_in_a_row import KInARow
+
+
+def longest_run(engine, player):
+    """Brute-force longest run of player over every cell and direction"""
+    best = 0
+    for cell in range(engine.size):
+        for d in range(len(engine.directions)):
+            length = 0
+            cursor = cell
+            while cursor >= 0 and engine.owner[cursor] == player:
+                length += 1
+                cursor = engine.forward[d][cursor]
+            best = max(best, length)
+    return best
+
+
+class TestKInARow(unittest.TestCase):
+    def test_directions(self):
+        self.assertEqual(len(KInARow((15, 15), 5).directions), 4)
+        self.assertEqual(len(KInARow((4, 4, 4), 4).directions), 13)
+
+    def test_runs_match_brute_force(self):
+        rng = random.Random(3)
+        for shape, k in (((7, 7), 4), ((4, 4, 4), 4)):
+            engine = KInARow(shape, k)
+            for _ in range(20):
+                engine.reset()
+                cells = list(range(engine.size))
+                rng.shuffle(cells)
+                for turn, cell in enumerate(cells):
+                    player = "XO"[turn % 2]
+                    engine.place(cell, player)
+                    self.assertEqual(engine.longest[player], longest_run(engine, player))
+                    if engine.winner is None:
+                        self.assertLess(engine.longest[player], k)
+                self.assertTrue(engine.full)
+
+    def test_winner_is_cached_and_rebuild(self):
+        engine = KInARow((4, 4, 4), 4)
+        for i in range(4):
+            engine.place(engine.index((i, i, 3 - i)), "O")
+        self.assertEqual(engine.winner, "O")
+        engine.place(engine.index((0, 0, 0)), "X")
+        self.assertEqual(engine.winner, "O")
+        cells = list(engine.owner)
+        engine.rebuild(cells)
+        self.assertEqual(engine.winner, "O")
+        with self.assertRaises(ValueError):
+            engine.place(engine.index((0, 0, 0)), "O")
+
+
+if __name__ == "__main__":
+    unittest.main()
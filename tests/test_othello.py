@@ -2,7 +2,7 @@
 Test template for Othello game.
 """
 import unittest
-from games.othello import OthelloGame
+from games.othello.othello import OthelloGame, OthelloPiece
 from tests.base_test import BaseGameTest
 
 
@@ -14,12 +14,18 @@ class TestOthelloGame(BaseGameTest):
     def test_initial_state(self):
         """Test the initial game state."""
         state = self.game.get_game_state()
-        self.assertValidGameState(state)
-        
-        # Add game-specific assertions here
-        # Example:
-        # self.assertEqual(state['current_player'], 'player1')
-        # self.assertIsNone(state['winner'])
+        # The board holds OthelloPiece values, so check it here rather than
+        # through assertValidGameState
+        self.assertEqual(state['current_player'], 'BLACK')
+        self.assertFalse(state['game_over'])
+        self.assertIsNone(state['winner'])
+        self.assertEqual(len(state['board']), 8)
+        self.assertEqual(state['board'][3][3], OthelloPiece.WHITE.value)
+        self.assertEqual(state['board'][3][4], OthelloPiece.BLACK.value)
+        self.assertEqual(state['board'][4][3], OthelloPiece.BLACK.value)
+        self.assertEqual(state['board'][4][4], OthelloPiece.WHITE.value)
+        self.assertEqual(sum(cell != OthelloPiece.EMPTY.value for row in state['board'] for cell in row), 4)
+        self.assertEqual(sorted(state['valid_moves']), [(2, 3), (3, 2), (4, 5), (5, 4)])
     
     def test_valid_moves(self):
         """Test valid moves."""
@@ -61,3 +67,21 @@ class TestOthelloGame(BaseGameTest):
         """Test draw conditions."""
         # Add test cases for draw conditions if applicable
         pass
+
+    def test_opening_moves_and_flips(self):
+        """Black's four opening moves each flip one disc."""
+        self.assertEqual(self.game._get_valid_moves(), [(2, 3), (3, 2), (4, 5), (5, 4)])
+        self.assertFalse(self.game.validate_move({"x": 0, "y": 0}))
+        state = self.game.make_move({"x": 2, "y": 3})
+        self.assertEqual(state["board"][3][3], OthelloPiece.BLACK.value)
+        self.assertEqual(state["current_player"], "WHITE")
+        self.assertEqual(state["valid_moves"], [(2, 2), (2, 4), (4, 2)])
+
+    def test_game_over_does_not_switch_player(self):
+        """A position where neither side can move ends the game without side effects."""
+        self.game.board[:] = OthelloPiece.BLACK.value
+        self.game.board[0, 0] = OthelloPiece.WHITE.value
+        self.game.invalidate_state_cache()
+        self.assertTrue(self.game.is_game_over())
+        self.assertEqual(self.game.current_player, OthelloPiece.BLACK)
+        self.assertEqual(self.game.get_winner(), "black")
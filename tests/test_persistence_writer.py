@@ -0,0 +1,106 @@
+"""Tests for the background group-commit persistence writer."""
+import tempfile
+import time
+import unittest
+
+from game_abc import GameHistory, GameMove
+from persistence_writer import (
+    DURABILITY_BATCH,
+    DURABILITY_MOVE,
+    DURABILITY_NONE,
+    PersistenceWriter,
+)
+from storage import FileSystemBackend
+
+
+class RecordingBackend(FileSystemBackend):
+    """File backend that records how often it was flushed and synced."""
+
+    def __init__(self, data_dir):
+        super().__init__(data_dir)
+        self.appends = 0
+        self.flushes = 0
+        self.synced = []
+
+    def append(self, key, data):
+        self.appends += 1
+        super().append(key, data)
+
+    def flush(self):
+        self.flushes += 1
+
+    def sync(self, keys):
+        self.synced.append(sorted(keys))
+        super().sync(keys)
+
+
+class TestPersistenceWriter(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.backend = RecordingBackend(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _history(self, game_id: str) -> GameHistory:
+        history = GameHistory(game_id, backend=self.backend)
+        history.write_behind = True
+        return history
+
+    def _move(self, history: GameHistory, writer: PersistenceWriter, **kwargs) -> None:
+        history.add_move(GameMove("X", {}, time.time()))
+        writer.submit(history, **kwargs)
+
+    def test_writes_are_coalesced_into_one_batch(self):
+        writer = PersistenceWriter(durability=DURABILITY_BATCH)
+        g1, g2 = self._history("g1"), self._history("g2")
+        for _ in range(3):
+            self._move(g1, writer)
+        self._move(g2, writer)
+        self.assertIsNone(self.backend.read("g1"))
+
+        self.assertEqual(writer.flush(), 2)
+        self.assertEqual(self.backend.synced, [["g1", "g2"]])
+        loaded = GameHistory("g1", backend=self.backend)
+        loaded.load_from_disk("g1")
+        self.assertEqual(len(loaded.moves), 3)
+
+    def test_no_fsync_mode(self):
+        writer = PersistenceWriter(durability=DURABILITY_NONE)
+        self._move(self._history("g1"), writer)
+        writer.flush()
+        self.assertEqual(self.backend.synced, [])
+        self.assertEqual(self.backend.flushes, 1)
+
+    def test_per_move_durability_is_synchronous(self):
+        writer = PersistenceWriter(durability=DURABILITY_MOVE)
+        self._move(self._history("g1"), writer)
+        self.assertIsNotNone(self.backend.read("g1"))
+        self.assertEqual(self.backend.synced, [["g1"]])
+        self.assertEqual(writer.flush(), 0)
+
+    def test_durable_submit_overrides_batching(self):
+        writer = PersistenceWriter(durability=DURABILITY_NONE)
+        self._move(self._history("g1"), writer, durable=True)
+        self.assertEqual(self.backend.synced, [["g1"]])
+
+    def test_background_thread_commits(self):
+        writer = PersistenceWriter(interval=0.01)
+        writer.start()
+        try:
+            self._move(self._history("g1"), writer)
+            deadline = time.time() + 2
+            while self.backend.read("g1") is None and time.time() < deadline:
+                time.sleep(0.01)
+        finally:
+            writer.stop()
+        self.assertIsNotNone(self.backend.read("g1"))
+        self.assertFalse(writer.running)
+
+    def test_invalid_durability(self):
+        with self.assertRaises(ValueError):
+            PersistenceWriter(durability="sometimes")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,7 +2,12 @@
 Test template for Poker game.
 """
 import unittest
-from games.poker import PokerGame
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+import numpy as np
+from games.poker.equity import equity
+from games.poker.evaluator import card_code, evaluate, evaluate_many, hand_category, parse
+from games.poker.poker import CARDS, PokerGame, PokerHandType
 from tests.base_test import BaseGameTest
 
 
@@ -14,12 +19,16 @@ class TestPokerGame(BaseGameTest):
     def test_initial_state(self):
         """Test the initial game state."""
         state = self.game.get_game_state()
-        self.assertValidGameState(state)
-        
-        # Add game-specific assertions here
-        # Example:
-        # self.assertEqual(state['current_player'], 'player1')
-        # self.assertIsNone(state['winner'])
+        # Poker has no board, only hands and community cards
+        self.assertEqual(state['current_player'], 2)
+        self.assertFalse(state['game_over'])
+        self.assertIsNone(state['winner'])
+        self.assertEqual(state['community_cards'], [])
+        self.assertEqual(len(state['hands']), 4)
+        self.assertTrue(all(len(hand) == 2 for hand in state['hands'].values()))
+        self.assertEqual(state['bets'], {0: 10, 1: 20})
+        self.assertEqual(state['pot'], 30)
+        self.assertEqual(state['current_bet'], 20)
     
     def test_valid_moves(self):
         """Test valid moves."""
@@ -61,3 +70,122 @@ class TestPokerGame(BaseGameTest):
         """Test draw conditions."""
         # Add test cases for draw conditions if applicable
         pass
+
+    def test_hand_strength_order(self):
+        """Evaluated strengths order hands by category and kickers."""
+        hands = [
+            "7c 5d 4h 3s 2c",  # worst possible hand
+            "Ac Kd Qh Js 9c",
+            "2c 2d 3h 4s 5c",
+            "Ac Ad Kh Qs Jc",
+            "2c 2d 3h 3s 4c",
+            "Ac Ad Kh Ks 3c",
+            "Ac Ad Kh Ks Qc",
+            "2c 2d 2h 3s 4c",
+            "Ac 2d 3h 4s 5c",  # wheel
+            "6c 2d 3h 4s 5c",
+            "Tc Jd Qh Ks Ac",
+            "2h 3h 4h 5h 7h",
+            "Ah Kh Qh Jh 9h",
+            "2c 2d 2h 3s 3c",
+            "2c 2d 2h 2s 3c",
+            "Ac 2c 3c 4c 5c",
+            "Ts Js Qs Ks As",
+        ]
+        strengths = [evaluate(parse(hand)) for hand in hands]
+        self.assertEqual(strengths, sorted(strengths))
+        self.assertEqual(len(set(strengths)), len(strengths))
+        self.assertEqual(strengths[0], 1)
+        self.assertEqual(strengths[-1], 7462)
+        self.assertEqual(hand_category(strengths[-1]), PokerHandType.ROYAL_FLUSH.value)
+        self.assertEqual(hand_category(strengths[-2]), PokerHandType.STRAIGHT_FLUSH.value)
+
+    def test_seven_card_evaluation(self):
+        """Seven cards rate as their best five, whichever suits are unused."""
+        self.assertEqual(
+            evaluate(parse("Ah Kh 2c 2d 2s Qh Jh")), evaluate(parse("2c 2d 2s Ah Kh"))
+        )
+        self.assertEqual(
+            evaluate(parse("Ah Kh 2c 2d Qh Th 3h")),
+            evaluate(parse("Ah Kh Qh Th 3h")),
+        )
+        self.assertEqual(evaluate(parse("9c 9d 5h 5s 3c 3d Kh")), evaluate(parse("9c 9d 5h 5s Kh")))
+        self.assertEqual(evaluate(parse("6c 7d 8h 9s Th 2c 2d")), evaluate(parse("6c 7d 8h 9s Th")))
+
+    def test_showdown_split_and_winner(self):
+        """The showdown compares evaluated strengths and splits ties."""
+        self.game.community_cards = parse("As Ks Qd Jd 2c")
+        self.game.hands[0] = parse("Th 3c")  # broadway
+        self.game.hands[1] = parse("Tc 4d")  # broadway
+        self.game.hands[2] = parse("Ah Ad")  # trips
+        self.game.hands[3] = []
+        self.assertEqual(self.game._get_best_hand(0)[0], PokerHandType.STRAIGHT)
+        self.assertEqual(self.game._showdown_winners(), [0, 1])
+        self.game.pot = 100
+        self.game._determine_winner()
+        self.assertEqual(self.game.scores[0], 50)
+        self.assertEqual(self.game.scores[1], 50)
+
+    def test_card_codes_match_evaluator(self):
+        """Dealt cards are evaluator codes and serialize to suit/rank dicts."""
+        for code, face in enumerate(CARDS.faces):
+            self.assertEqual(card_code(face["rank"], face["suit"]), code)
+        state = self.game.get_game_state()
+        dealt = [CARDS.code(card) for hand in state["hands"].values() for card in hand]
+        self.assertEqual(len(set(dealt)), 8)
+        self.assertEqual(len(self.game.deck), 44)
+        self.assertEqual(self.game.deck.dtype.name, "uint8")
+
+    def test_evaluate_many_matches_evaluate(self):
+        """The vectorized evaluator agrees with the scalar one."""
+        rng = np.random.default_rng(5)
+        hands = np.array([rng.permutation(52)[:7] for _ in range(2000)])
+        expected = [evaluate(hand) for hand in hands.tolist()]
+        self.assertEqual(evaluate_many(hands).tolist(), expected)
+
+    def test_equity(self):
+        """Exact equity on the flop; sampling converges to it."""
+        hands = [parse("Ah As"), parse("Kd Kc")]
+        flop = parse("2c 7d Kh")
+        exact = equity(hands, flop)
+        self.assertTrue(exact["exact"])
+        self.assertEqual(exact["samples"], 990)  # 45 choose 2 turn/river pairs
+        self.assertAlmostEqual(sum(exact["equity"]), 1.0)
+        self.assertAlmostEqual(exact["win"][1], 905 / 990)
+
+        sampled = equity(hands, flop, samples=500, seed=3)
+        self.assertFalse(sampled["exact"])
+        self.assertEqual(sampled["samples"], 500)
+        self.assertAlmostEqual(sampled["win"][1], exact["win"][1], delta=0.05)
+
+        river = equity(hands, parse("2c 7d 9h 9s 3s"))
+        self.assertEqual(river["win"], [1.0, 0.0])
+        with self.assertRaises(ValueError):
+            equity(hands, parse("Ah 7d 9h"))
+
+    def test_exhaustive_equity_batches(self):
+        """Large enumerations honour the time limit and can run on an executor."""
+        hands = [parse("Ah As"), parse("Kd Kc"), parse("Qh Qs"), parse("Jd Jc")]
+        flop = parse("2c 7d Kh")
+        runouts = 41 * 40 // 2
+        with mock.patch("games.poker.equity.BATCH_SIZE", 100):
+            exact = equity(hands, flop)
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                spread = equity(hands, flop, executor=pool)
+            self.assertEqual(spread, exact)
+            self.assertEqual(exact["samples"], runouts)
+
+            # Deadline at 3; the clock reads 1 and 2 before the third batch
+            with mock.patch("games.poker.equity.time") as clock:
+                clock.monotonic.side_effect = range(100)
+                cut = equity(hands, flop, time_limit=3, seed=1)
+        self.assertFalse(cut["exact"])
+        self.assertEqual(cut["samples"], 200)
+
+    def test_game_equity_skips_folded_seats(self):
+        """PokerGame.equity reports the seats still holding cards."""
+        self.game.hands[3] = []
+        result = self.game.equity(samples=200)
+        self.assertEqual(sorted(result["players"]), ["0", "1", "2"])
+        total = sum(seat["equity"] for seat in result["players"].values())
+        self.assertAlmostEqual(total, 1.0)
@@ -165,6 +165,43 @@ class TestShogiGame(BaseGameTest):
 
         self.fail("Game did not end in a draw by repetition as expected after 12 moves.")
     
+    def _empty_board(self):
+        self.game.board = [[None] * self.game.FILES for _ in range(self.game.RANKS)]
+        self.game.board[8][4] = ShogiPiece("k", "w")
+        self.game.current_player = "w"
+
+    def test_uchifuzume(self):
+        """Dropping a pawn to give checkmate is illegal; a pawn-drop check is not."""
+        self._empty_board()
+        self.game.board[0][4] = ShogiPiece("k", "b")
+        for col in (3, 5):
+            self.game.board[0][col] = ShogiPiece("l", "b")
+            self.game.board[1][col] = ShogiPiece("n", "b")
+        self.game.board[2][4] = ShogiPiece("g", "w")  # Protects the dropped pawn
+        self.game.hands["w"] = ["p"]
+        drop = {"to_row": 1, "to_col": 4, "piece_type": "p", "is_drop": True}
+        self.assertFalse(self.game.validate_move(drop))
+
+        # Unprotected, the king can take the pawn: the drop is legal
+        self.game.board[2][4] = None
+        self.game.invalidate_state_cache()
+        self.assertTrue(self.game.validate_move(drop))
+
+    def test_check_evasion(self):
+        """In check, only moves and drops that resolve the check are legal."""
+        self._empty_board()
+        self.game.board[0][0] = ShogiPiece("k", "b")
+        self.game.board[2][4] = ShogiPiece("r", "b")  # Checks along file 4
+        self.game.board[8][0] = ShogiPiece("g", "w")
+        self.game.hands["w"] = ["s"]
+        self.assertTrue(self.game._is_in_check("w"))
+
+        moves = self.game.legal_moves()
+        drops = {(m["to_row"], m["to_col"]) for m in moves if m.get("is_drop")}
+        self.assertEqual(drops, {(r, 4) for r in range(3, 8)})
+        self.assertFalse(any(m.get("from_col") == 0 for m in moves))  # Gold can't help
+        self.assertFalse(self.game._is_stalemate())
+
     def test_win_condition(self):
         """Test win conditions."""
         # Add test cases for win conditions
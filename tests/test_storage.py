@@ -0,0 +1,111 @@
+"""Tests for the pluggable game storage backends."""
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from game_abc import GameHistory, GameMove
+from storage import (
+    FileSystemBackend,
+    ShardedDirectoryBackend,
+    SQLiteBackend,
+    create_backend,
+)
+
+
+class StorageBackendTests:
+    """Behaviour shared by every backend; mixed into a TestCase per backend."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.backend = self.make_backend(self._tmp.name)
+
+    def tearDown(self):
+        self.backend.close()
+        self._tmp.cleanup()
+
+    def test_append_replace_read_delete(self):
+        self.assertIsNone(self.backend.read("g1"))
+        self.backend.append("g1", "a\n")
+        self.backend.append("g1", "b\n")
+        self.assertEqual(self.backend.read("g1"), "a\nb\n")
+        self.backend.replace("g1", "c\n")
+        self.assertEqual(self.backend.read("g1"), "c\n")
+        self.backend.delete("g1")
+        self.assertIsNone(self.backend.read("g1"))
+
+    def test_history_round_trip(self):
+        history = GameHistory("g1", backend=self.backend)
+        for i in range(5):
+            history.current_state = {"turn": i}
+            history.add_move(GameMove("X", {"n": i}, float(i)))
+        self.backend.flush()
+
+        loaded = GameHistory("g1", backend=self.backend)
+        self.assertTrue(loaded.load_from_disk("g1"))
+        self.assertEqual(loaded.get_history(), history.get_history())
+        self.assertEqual(loaded.current_state, {"turn": 4})
+
+
+class TestFileSystemBackend(StorageBackendTests, unittest.TestCase):
+    def make_backend(self, root):
+        return FileSystemBackend(root)
+
+    def test_legacy_document_is_migrated_on_append(self):
+        legacy = GameHistory("g1", backend=self.backend)
+        legacy.moves = [GameMove("X", {"n": 0}, 0.0)]
+        with open(os.path.join(self._tmp.name, "g1.json"), "w") as f:
+            f.write(legacy.serialize())
+
+        self.backend.append("g1", '{"state": {}}\n')
+        self.assertFalse(os.path.exists(os.path.join(self._tmp.name, "g1.json")))
+        loaded = GameHistory("g1", backend=self.backend)
+        loaded.load_from_disk("g1")
+        self.assertEqual(len(loaded.moves), 1)
+
+
+    def test_sync_fsyncs_journals_and_their_directory(self):
+        self.backend.replace("g1", "a\n")
+        self.backend.replace("g2", "b\n")
+        with mock.patch.object(FileSystemBackend, "_fsync", wraps=FileSystemBackend._fsync) as fsync:
+            self.backend.sync(["g1", "g2", "missing"])
+        synced = [call.args[0] for call in fsync.call_args_list]
+        root = Path(self._tmp.name)
+        # A missing journal is skipped, and the directory is synced once
+        self.assertCountEqual(
+            synced, [root / "g1.jsonl", root / "g2.jsonl", root / "missing.jsonl", root]
+        )
+
+
+class TestShardedDirectoryBackend(StorageBackendTests, unittest.TestCase):
+    def make_backend(self, root):
+        return ShardedDirectoryBackend(root)
+
+    def test_games_are_sharded(self):
+        self.backend.append("g1", "a\n")
+        path = self.backend._path("g1")
+        self.assertTrue(path.exists())
+        self.assertEqual(len(path.relative_to(self._tmp.name).parts), 3)
+
+
+class TestSQLiteBackend(StorageBackendTests, unittest.TestCase):
+    def make_backend(self, root):
+        return SQLiteBackend(os.path.join(root, "games.sqlite3"), batch_size=3)
+
+    def test_writes_survive_reopen_after_flush(self):
+        self.backend.append("g1", "a\n")
+        self.backend.flush()
+        reopened = SQLiteBackend(self.backend.path)
+        self.assertEqual(reopened.read("g1"), "a\n")
+        reopened.close()
+
+
+class TestCreateBackend(unittest.TestCase):
+    def test_invalid_backend(self):
+        with self.assertRaises(ValueError):
+            create_backend("tape")
+
+
+if __name__ == "__main__":
+    unittest.main()
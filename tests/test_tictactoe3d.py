@@ -2,24 +2,26 @@
 Test template for Tictactoe3D game.
 """
 import unittest
-from games.tictactoe3d import Tictactoe3DGame
+import numpy as np
+from games.tictactoe3d.tictactoe3d import TTT3DGame
 from tests.base_test import BaseGameTest
 
 
 class TestTictactoe3DGame(BaseGameTest):
     """Test cases for Tictactoe3D game."""
     
-    GAME_CLASS = Tictactoe3DGame
+    GAME_CLASS = TTT3DGame
     
     def test_initial_state(self):
         """Test the initial game state."""
         state = self.game.get_game_state()
-        self.assertValidGameState(state)
-        
-        # Add game-specific assertions here
-        # Example:
-        # self.assertEqual(state['current_player'], 'player1')
-        # self.assertIsNone(state['winner'])
+        # The board is a 4x4x4 cube of ints, so check it here rather than
+        # through assertValidGameState
+        self.assertEqual(state['current_player'], 'X')
+        self.assertFalse(state['game_over'])
+        self.assertIsNone(state['winner'])
+        self.assertEqual(np.array(state['board']).shape, (4, 4, 4))
+        self.assertFalse(np.any(state['board']))
     
     def test_valid_moves(self):
         """Test valid moves."""
@@ -61,3 +63,44 @@ class TestTictactoe3DGame(BaseGameTest):
         """Test draw conditions."""
         # Add test cases for draw conditions if applicable
         pass
+
+    def test_space_diagonal_win(self):
+        """A line through all four layers wins."""
+        for i in range(3):
+            self.game.make_move({"position": [i, i, i]})
+            self.game.make_move({"position": [i, 0, 3]})
+        state = self.game.make_move({"position": [3, 3, 3]})
+        self.assertTrue(state["game_over"])
+        self.assertEqual(state["winner"], "X")
+
+    def test_winning_line_table(self):
+        """The cube has 3n^2 + 6n + 4 distinct lines of n cells."""
+        from games.tictactoe3d.lines import winning_lines
+
+        for n, expected in ((3, 49), (4, 76), (5, 109)):
+            lines = winning_lines(n)
+            self.assertEqual(lines.shape, (expected, n))
+            self.assertEqual(len({tuple(sorted(line)) for line in lines.tolist()}), expected)
+
+    def test_threats_and_best_move(self):
+        """The suggested move completes a line, or else blocks a threat."""
+        for i in range(3):
+            self.game.make_move({"position": [0, 0, i]})
+            self.game.make_move({"position": [1, i, 0]})
+        self.assertEqual(self.game.count_threats("X"), 1)
+        self.assertEqual(self.game.count_threats("O"), 1)
+        self.assertEqual(self.game.best_move(), [0, 0, 3])
+
+        self.game = self.GAME_CLASS(game_id="test_ttt3d_block")
+        self.game.initialize_game()
+        for position in ([0, 0, 0], [3, 1, 2], [0, 0, 1], [2, 3, 1], [0, 0, 2]):
+            self.game.make_move({"position": position})
+        self.assertEqual(self.game.count_threats("O"), 0)
+        self.assertEqual(self.game.best_move(), [0, 0, 3])
+
+        table = self.game.line_table
+        board = self.game.board.copy()
+        board[0, 0, 3] = 1
+        self.assertEqual(table.winner(np.stack([self.game.board, board]), 1, 2).tolist(), [0, 1])
+        free_of_x = [line for line in table.lines.tolist() if 1 not in board.ravel()[line]]
+        self.assertEqual(int(table.open_lines(board, 1)), len(free_of_x))
@@ -0,0 +1,44 @@
+"""Tests for Zobrist keys and the repetition index."""
+import unittest
+
+from games.zobrist import KeySet, RepetitionIndex, ZobristTable
+
+
+class TestZobrist(unittest.TestCase):
+    def test_keys_are_stable_and_namespaced(self):
+        table = ZobristTable("chess")
+        self.assertEqual(table[("p", "w", 1, 4)], ZobristTable("chess")[("p", "w", 1, 4)])
+        self.assertNotEqual(table[("p", "w", 1, 4)], table[("p", "w", 1, 5)])
+        self.assertNotEqual(table[("p", "w", 1, 4)], ZobristTable("shogi")[("p", "w", 1, 4)])
+        self.assertLess(table["black_to_move"], 1 << 64)
+
+    def test_repetition_index(self):
+        index = RepetitionIndex()
+        self.assertEqual(index.push(1), 1)
+        index.push(2)
+        self.assertEqual(index.push(1), 2)
+        self.assertEqual(index.count(1), 2)
+        self.assertEqual(index.pop(), 1)
+        self.assertEqual(index.count(1), 1)
+        self.assertEqual(index.count(3), 0)
+        index.reset(5)
+        self.assertEqual(len(index), 1)
+        self.assertEqual(index.count(1), 0)
+
+    def test_key_set(self):
+        keys = KeySet([5, 1 << 63, 0])
+        keys.add(5)
+        self.assertEqual(len(keys), 3)
+        self.assertIn(1 << 63, keys)
+        self.assertNotIn(7, keys)
+        for key in range(100, 140):
+            keys.add(key)
+        keys.discard(5)
+        keys.discard(6)
+        self.assertNotIn(5, keys)
+        self.assertEqual(len(keys), 42)
+        self.assertTrue(all(key in keys for key in range(100, 140)))
+
+
+if __name__ == "__main__":
+    unittest.main()